@@ -1,3 +1,5 @@
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 import os
 from pathlib import Path
 import signal
@@ -15,10 +17,18 @@ from src.modules.deduper.config import validate_startup_env
 from src.modules.ai_approver.config import validate_ai_approver_startup_env
 from src.modules.location_scorer.config import validate_location_scorer_startup_env
 from src.modules.queue.config import validate_queue_startup_env
+from src.modules.queue.global_queue import (
+    global_queue_engine,
+    global_queue_process_pool,
+    global_queue_retention_compactor,
+    global_queue_scheduler,
+    global_queue_watchdog,
+)
 from src.routes.ai_approver import router as ai_approver_router
 from src.routes.deduper import router as deduper_router
 from src.routes.index import router as index_router
 from src.routes.location_scorer import router as location_scorer_router
+from src.routes.metrics import router as metrics_router
 from src.routes.queue_info import router as queue_info_router
 
 
@@ -75,11 +85,51 @@ except Exception as exc:
     _terminate_uvicorn_reloader_parent()
     raise SystemExit(1) from exc
 
-logger.info("event=startup_complete")
 
-app = FastAPI(title="NewsNexus Python Queuer", version="0.2.0")
+def _start_queue_services() -> None:
+    global_queue_retention_compactor.start()
+    if global_queue_process_pool is not None:
+        global_queue_process_pool.warm()
+    # Route modules register their job factories on import, above.
+    recovered_job_ids = global_queue_engine.recover_incomplete_jobs()
+    if recovered_job_ids:
+        logger.info(
+            "event=queue_jobs_recovered count={} job_ids={}",
+            len(recovered_job_ids),
+            ",".join(recovered_job_ids),
+        )
+    global_queue_scheduler.start()
+    global_queue_watchdog.start()
+
+
+def _stop_queue_services() -> None:
+    global_queue_watchdog.stop()
+    global_queue_scheduler.stop()
+    global_queue_retention_compactor.stop()
+    if global_queue_process_pool is not None:
+        global_queue_process_pool.shutdown()
+
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
+    # Test clients run the lifespan too; the suite drives the queue services itself.
+    if _is_testing_environment():
+        yield
+        return
+
+    _start_queue_services()
+    logger.info("event=startup_complete")
+    try:
+        yield
+    finally:
+        _stop_queue_services()
+        logger.info("event=shutdown_complete")
+
+
+app = FastAPI(title="NewsNexus Python Queuer", version="0.2.0", lifespan=lifespan)
 app.include_router(index_router)
 app.include_router(ai_approver_router)
 app.include_router(deduper_router)
 app.include_router(location_scorer_router)
+app.include_router(metrics_router)
 app.include_router(queue_info_router)
@@ -0,0 +1,304 @@
+"""In-process Prometheus-style metrics for worker-python.
+
+Counters and histograms live in one module-level registry and are rendered in
+the Prometheus text exposition format by `GET /metrics`. Jobs that run in the
+queue's worker processes record into that process's registry; the process pool
+drains it after every task and merges the deltas into the API process.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from functools import wraps
+from threading import Lock
+from time import perf_counter
+from typing import Any, TypeVar
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+DEFAULT_LATENCY_BUCKETS = (
+    0.001,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+    300.0,
+    900.0,
+    3600.0,
+)
+
+LabelValues = tuple[str, ...]
+MetricsSnapshot = dict[str, dict[LabelValues, Any]]
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+def _escape_label_value(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: tuple[str, ...], values: LabelValues, extra: str = "") -> str:
+    pairs = [f'{name}="{_escape_label_value(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    return repr(float(value))
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(
+        self,
+        registry: MetricsRegistry,
+        name: str,
+        help_text: str,
+        labelnames: tuple[str, ...],
+    ) -> None:
+        self._registry = registry
+        self.name = name
+        self.help_text = help_text
+        self.labelnames = labelnames
+
+    def _label_values(self, labels: dict[str, object]) -> LabelValues:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def __init__(
+        self,
+        registry: MetricsRegistry,
+        name: str,
+        help_text: str,
+        labelnames: tuple[str, ...],
+    ) -> None:
+        super().__init__(registry, name, help_text, labelnames)
+        self._values: dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: object) -> None:
+        if amount < 0:
+            raise ValueError("Counter increments must not be negative")
+
+        key = self._label_values(labels)
+        with self._registry.lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: object) -> float:
+        with self._registry.lock:
+            return self._values.get(self._label_values(labels), 0.0)
+
+    def _drain_locked(self) -> dict[LabelValues, float]:
+        drained, self._values = self._values, {}
+        return drained
+
+    def _merge_locked(self, values: dict[LabelValues, float]) -> None:
+        for key, amount in values.items():
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def _render_locked(self) -> list[str]:
+        return [
+            f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}"
+            for key, value in sorted(self._values.items())
+        ]
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(
+        self,
+        registry: MetricsRegistry,
+        name: str,
+        help_text: str,
+        labelnames: tuple[str, ...],
+        buckets: tuple[float, ...] = DEFAULT_LATENCY_BUCKETS,
+    ) -> None:
+        super().__init__(registry, name, help_text, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # Per label set: non-cumulative bucket counts (last slot is +Inf), sum, count.
+        self._values: dict[LabelValues, tuple[list[int], float, int]] = {}
+
+    def observe(self, value: float, **labels: object) -> None:
+        key = self._label_values(labels)
+        bucket_index = bisect_left(self.buckets, value)
+        with self._registry.lock:
+            bucket_counts, total, count = self._values.get(key) or self._empty_state()
+            bucket_counts[bucket_index] += 1
+            self._values[key] = (bucket_counts, total + value, count + 1)
+
+    @contextmanager
+    def time(self, **labels: object) -> Iterator[None]:
+        started = perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(perf_counter() - started, **labels)
+
+    def count(self, **labels: object) -> int:
+        with self._registry.lock:
+            state = self._values.get(self._label_values(labels))
+            return state[2] if state is not None else 0
+
+    def _empty_state(self) -> tuple[list[int], float, int]:
+        return [0] * (len(self.buckets) + 1), 0.0, 0
+
+    def _drain_locked(self) -> dict[LabelValues, tuple[list[int], float, int]]:
+        drained, self._values = self._values, {}
+        return drained
+
+    def _merge_locked(self, values: dict[LabelValues, tuple[list[int], float, int]]) -> None:
+        for key, (bucket_counts, total, count) in values.items():
+            current_counts, current_total, current_count = (
+                self._values.get(key) or self._empty_state()
+            )
+            merged_counts = [left + right for left, right in zip(current_counts, bucket_counts)]
+            self._values[key] = (merged_counts, current_total + total, current_count + count)
+
+    def _render_locked(self) -> list[str]:
+        lines: list[str] = []
+        for key, (bucket_counts, total, count) in sorted(self._values.items()):
+            cumulative = 0
+            for upper_bound, bucket_count in zip((*self.buckets, float("inf")), bucket_counts):
+                cumulative += bucket_count
+                le = "+Inf" if upper_bound == float("inf") else _format_value(upper_bound)
+                labels = _format_labels(self.labelnames, key, f'le="{le}"')
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            labels = _format_labels(self.labelnames, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(total)}")
+            lines.append(f"{self.name}_count{labels} {count}")
+        return lines
+
+
+class MetricsRegistry:
+    def __init__(self) -> None:
+        self.lock = Lock()
+        self._metrics: dict[str, Counter | Histogram] = {}
+
+    def counter(self, name: str, help_text: str, labelnames: tuple[str, ...] = ()) -> Counter:
+        return self._register(Counter(self, name, help_text, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        help_text: str,
+        labelnames: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_LATENCY_BUCKETS,
+    ) -> Histogram:
+        return self._register(Histogram(self, name, help_text, labelnames, buckets))
+
+    def render(self) -> str:
+        lines: list[str] = []
+        with self.lock:
+            for metric in self._metrics.values():
+                lines.append(f"# HELP {metric.name} {metric.help_text}")
+                lines.append(f"# TYPE {metric.name} {metric.kind}")
+                lines.extend(metric._render_locked())
+        return "\n".join(lines) + "\n"
+
+    def drain(self) -> MetricsSnapshot:
+        with self.lock:
+            snapshot = {name: metric._drain_locked() for name, metric in self._metrics.items()}
+        return {name: values for name, values in snapshot.items() if values}
+
+    def merge(self, snapshot: MetricsSnapshot) -> None:
+        with self.lock:
+            for name, values in snapshot.items():
+                metric = self._metrics.get(name)
+                if metric is not None:
+                    metric._merge_locked(values)
+
+    def reset(self) -> None:
+        self.drain()
+
+    def _register(self, metric: Counter | Histogram) -> Any:
+        with self.lock:
+            if metric.name in self._metrics:
+                raise ValueError(f"Metric already registered: {metric.name}")
+            self._metrics[metric.name] = metric
+        return metric
+
+
+def timed(histogram: Histogram, **labels: object) -> Callable[[F], F]:
+    def decorator(function: F) -> F:
+        @wraps(function)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            with histogram.time(**labels):
+                return function(*args, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+metrics = MetricsRegistry()
+
+QUEUE_JOB_WAIT_SECONDS = metrics.histogram(
+    "worker_queue_job_wait_seconds",
+    "Time a queue job spent queued before it started running.",
+    ("endpoint",),
+)
+QUEUE_JOB_RUN_SECONDS = metrics.histogram(
+    "worker_queue_job_run_seconds",
+    "Time a queue job spent running, per run (a yielded job runs more than once).",
+    ("endpoint",),
+)
+QUEUE_JOBS_FINISHED_TOTAL = metrics.counter(
+    "worker_queue_jobs_finished_total",
+    "Queue jobs that reached a terminal status.",
+    ("endpoint", "status"),
+)
+QUEUE_STORE_OPERATION_SECONDS = metrics.histogram(
+    "worker_queue_store_operation_seconds",
+    "Latency of queue job store reads and writes.",
+    ("backend", "operation"),
+)
+PIPELINE_STEP_SECONDS = metrics.histogram(
+    "worker_pipeline_step_seconds",
+    "Duration of one pipeline step.",
+    ("pipeline", "step"),
+)
+PIPELINE_STEP_ROWS_TOTAL = metrics.counter(
+    "worker_pipeline_step_rows_total",
+    "Rows processed by pipeline steps.",
+    ("pipeline", "step"),
+)
+LOCATION_SCORER_INFERENCE_SECONDS = metrics.histogram(
+    "worker_location_scorer_inference_seconds",
+    "Latency of one zero-shot classifier inference.",
+)
+OPENAI_REQUEST_SECONDS = metrics.histogram(
+    "worker_openai_request_seconds",
+    "Latency of OpenAI chat completion calls.",
+    ("model", "outcome"),
+)
+OPENAI_TOKENS_TOTAL = metrics.counter(
+    "worker_openai_tokens_total",
+    "OpenAI tokens reported in usage, by kind.",
+    ("model", "kind"),
+)
+QUEUE_SCHEDULE_RUNS_TOTAL = metrics.counter(
+    "worker_queue_schedule_runs_total",
+    "Scheduled queue runs that came due, by outcome.",
+    ("schedule", "outcome"),
+)
+QUEUE_WATCHDOG_ACTIONS_TOTAL = metrics.counter(
+    "worker_queue_watchdog_actions_total",
+    "Running queue jobs the watchdog canceled or abandoned, by reason.",
+    ("endpoint", "reason", "action"),
+)
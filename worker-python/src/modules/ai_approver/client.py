@@ -3,10 +3,14 @@
 from __future__ import annotations
 
 import json
+import time
 from typing import Any
 
+from src.metrics import OPENAI_REQUEST_SECONDS, OPENAI_TOKENS_TOTAL
 from src.modules.ai_approver.config import AiApproverConfig
 
+USAGE_TOKEN_KINDS = ("prompt_tokens", "completion_tokens")
+
 
 class AiApproverOpenAIClient:
     def __init__(self, config: AiApproverConfig) -> None:
@@ -15,12 +19,30 @@ class AiApproverOpenAIClient:
     def score_article(self, prompt: str) -> dict[str, Any]:
         from openai import OpenAI  # Imported lazily so tests/builds don't require runtime import until used.
 
-        client = OpenAI(api_key=self.config.openai_api_key)
-        response = client.chat.completions.create(
+        # Bounds each attempt, so one hung call fails instead of outliving the job deadline.
+        client = OpenAI(
+            api_key=self.config.openai_api_key,
+            timeout=self.config.request_timeout_seconds,
+        )
+        request_started = time.perf_counter()
+        try:
+            response = client.chat.completions.create(
+                model=self.config.model_name,
+                messages=[{"role": "user", "content": prompt}],
+                temperature=0.2,
+                response_format={"type": "json_object"},
+            )
+        except Exception:
+            OPENAI_REQUEST_SECONDS.observe(
+                time.perf_counter() - request_started,
+                model=self.config.model_name,
+                outcome="error",
+            )
+            raise
+        OPENAI_REQUEST_SECONDS.observe(
+            time.perf_counter() - request_started,
             model=self.config.model_name,
-            messages=[{"role": "user", "content": prompt}],
-            temperature=0.2,
-            response_format={"type": "json_object"},
+            outcome="ok",
         )
 
         raw_content = response.choices[0].message.content if response.choices else None
@@ -29,6 +51,10 @@ class AiApproverOpenAIClient:
 
         payload = json.loads(raw_content)
         usage = getattr(response, "usage", None)
+        for kind in USAGE_TOKEN_KINDS:
+            tokens = getattr(usage, kind, None)
+            if isinstance(tokens, int):
+                OPENAI_TOKENS_TOTAL.inc(tokens, model=self.config.model_name, kind=kind)
 
         return {
             "payload": payload,
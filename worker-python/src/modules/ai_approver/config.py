@@ -36,6 +36,8 @@ class AiApproverConfig:
     openai_api_key: str
     model_name: str
     batch_size: int
+    request_timeout_seconds: int = 60
+    checkpoint_interval: int = 10
 
     @property
     def sqlite_path(self) -> str:
@@ -64,6 +66,14 @@ class AiApproverConfig:
                 os.getenv("AI_APPROVER_BATCH_SIZE", "10"),
                 "AI_APPROVER_BATCH_SIZE",
             ),
+            request_timeout_seconds=_parse_positive_int(
+                os.getenv("AI_APPROVER_REQUEST_TIMEOUT_SECONDS", "60"),
+                "AI_APPROVER_REQUEST_TIMEOUT_SECONDS",
+            ),
+            checkpoint_interval=_parse_positive_int(
+                os.getenv("AI_APPROVER_CHECKPOINT_INTERVAL", "10"),
+                "AI_APPROVER_CHECKPOINT_INTERVAL",
+            ),
         )
 
 
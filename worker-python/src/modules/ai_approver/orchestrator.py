@@ -3,8 +3,10 @@
 from __future__ import annotations
 
 import json
+import time
 from typing import Any
 
+from src.metrics import PIPELINE_STEP_ROWS_TOTAL, PIPELINE_STEP_SECONDS
 from src.modules.ai_approver.client import AiApproverOpenAIClient
 from src.modules.ai_approver.errors import AiApproverProcessorError
 from src.modules.ai_approver.repository import AiApproverRepository
@@ -34,7 +36,10 @@ class AiApproverOrchestrator:
         state_ids: list[int] | None,
         job_id: str | None,
         should_cancel,
+        should_yield=None,
+        on_article_scored=None,
     ) -> dict[str, Any]:
+        yield_check = should_yield or (lambda: False)
         prompt_versions = self.repository.get_active_prompt_versions()
         articles = self.repository.get_eligible_articles(
             limit=limit,
@@ -48,8 +53,16 @@ class AiApproverOrchestrator:
             "total_tokens": 0,
         }
         attempts = 0
+        scored_articles = 0
+        yielded = False
+        score_started = time.perf_counter()
 
         for article in articles:
+            # Yield only between articles: any score row makes an article ineligible on resume.
+            if scored_articles > 0 and yield_check():
+                yielded = True
+                break
+
             for prompt_version in prompt_versions:
                 if should_cancel():
                     raise RuntimeError("AI approver pipeline cancelled")
@@ -110,11 +123,29 @@ class AiApproverOrchestrator:
 
                 attempts += 1
 
+            scored_articles += 1
+            if on_article_scored is not None:
+                on_article_scored(
+                    {
+                        "promptCount": len(prompt_versions),
+                        "articleCount": scored_articles,
+                        "attemptCount": attempts,
+                        "usage": dict(usage_totals),
+                    }
+                )
+
+        PIPELINE_STEP_SECONDS.observe(
+            time.perf_counter() - score_started,
+            pipeline="ai_approver",
+            step="score",
+        )
+        PIPELINE_STEP_ROWS_TOTAL.inc(scored_articles, pipeline="ai_approver", step="score")
         return {
             "promptCount": len(prompt_versions),
-            "articleCount": len(articles),
+            "articleCount": scored_articles,
             "attemptCount": attempts,
             "usage": usage_totals,
+            "yielded": yielded,
         }
 
     def run_single_score(
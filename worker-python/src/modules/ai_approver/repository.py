@@ -8,6 +8,8 @@ from typing import Any
 from src.modules.ai_approver.config import AiApproverConfig
 from src.modules.ai_approver.errors import AiApproverProcessorError
 
+SQLITE_BUSY_TIMEOUT_SECONDS = 30
+
 
 class AiApproverRepository:
     def __init__(self, config: AiApproverConfig) -> None:
@@ -16,7 +18,10 @@ class AiApproverRepository:
 
     def get_connection(self) -> sqlite3.Connection:
         if self._connection is None:
-            self._connection = sqlite3.connect(self.config.sqlite_path)
+            self._connection = sqlite3.connect(
+                self.config.sqlite_path,
+                timeout=SQLITE_BUSY_TIMEOUT_SECONDS,
+            )
             self._connection.row_factory = sqlite3.Row
         return self._connection
 
@@ -67,7 +72,68 @@ class AiApproverRepository:
         state_ids: list[int] | None,
     ) -> list[dict[str, Any]]:
         conn = self.get_connection()
+        where_clause, params = self._build_eligible_article_filter(
+            require_state_assignment=require_state_assignment,
+            state_ids=state_ids,
+        )
+        params.append(limit)
 
+        rows = conn.execute(
+            f"""
+            SELECT
+                a.id,
+                a.title,
+                COALESCE(
+                    (
+                        SELECT ac2.content
+                        FROM ArticleContents02 ac2
+                        WHERE ac2.articleId = a.id
+                        ORDER BY
+                            CASE WHEN ac2.status = 'success' THEN 2 ELSE 0 END DESC,
+                            LENGTH(TRIM(COALESCE(ac2.content, ''))) DESC,
+                            ac2.id DESC
+                        LIMIT 1
+                    ),
+                    a.description,
+                    ''
+                ) AS content
+            FROM Articles a
+            WHERE {where_clause}
+            ORDER BY a.id DESC
+            LIMIT ?
+            """,
+            params,
+        ).fetchall()
+
+        return [dict(row) for row in rows]
+
+    def get_eligible_article_watermark(
+        self,
+        *,
+        require_state_assignment: bool,
+        state_ids: list[int] | None,
+    ) -> tuple[int, int] | None:
+        where_clause, params = self._build_eligible_article_filter(
+            require_state_assignment=require_state_assignment,
+            state_ids=state_ids,
+        )
+        row = self.get_connection().execute(
+            f"""
+            SELECT COUNT(*) AS articleCount, MAX(a.id) AS maxArticleId
+            FROM Articles a
+            WHERE {where_clause}
+            """,
+            params,
+        ).fetchone()
+        article_count = int(row["articleCount"])
+        return (article_count, int(row["maxArticleId"])) if article_count else None
+
+    def _build_eligible_article_filter(
+        self,
+        *,
+        require_state_assignment: bool,
+        state_ids: list[int] | None,
+    ) -> tuple[str, list[Any]]:
         filters = [
             "NOT EXISTS (SELECT 1 FROM AiApproverArticleScores aas WHERE aas.articleId = a.id)",
             """
@@ -117,37 +183,7 @@ class AiApproverRepository:
             )
             params.extend(state_ids)
 
-        where_clause = " AND ".join(filters) if filters else "1=1"
-        params.append(limit)
-
-        rows = conn.execute(
-            f"""
-            SELECT
-                a.id,
-                a.title,
-                COALESCE(
-                    (
-                        SELECT ac2.content
-                        FROM ArticleContents02 ac2
-                        WHERE ac2.articleId = a.id
-                        ORDER BY
-                            CASE WHEN ac2.status = 'success' THEN 2 ELSE 0 END DESC,
-                            LENGTH(TRIM(COALESCE(ac2.content, ''))) DESC,
-                            ac2.id DESC
-                        LIMIT 1
-                    ),
-                    a.description,
-                    ''
-                ) AS content
-            FROM Articles a
-            WHERE {where_clause}
-            ORDER BY a.id DESC
-            LIMIT ?
-            """,
-            params,
-        ).fetchall()
-
-        return [dict(row) for row in rows]
+        return " AND ".join(filters) if filters else "1=1", params
 
     def get_article_for_prompt_run(self, article_id: int) -> dict[str, Any] | None:
         conn = self.get_connection()
@@ -6,6 +6,7 @@ import os
 from dataclasses import dataclass
 
 from src.modules.deduper.errors import DeduperConfigError
+from src.modules.deduper.types import BlockingRule, LoadMode
 
 
 TRUE_VALUES = {"1", "true", "yes", "on"}
@@ -37,6 +38,34 @@ def _parse_positive_int(value: str, key: str) -> int:
     return parsed
 
 
+def _parse_load_mode(value: str, key: str) -> LoadMode:
+    try:
+        return LoadMode(value.strip().lower())
+    except ValueError as exc:
+        allowed = ", ".join(mode.value for mode in LoadMode)
+        raise DeduperConfigError(f"{key} must be one of: {allowed}") from exc
+
+
+def _parse_blocking_rules(value: str, key: str) -> tuple[BlockingRule, ...]:
+    rules: list[BlockingRule] = []
+    for raw_rule in value.split(","):
+        normalized = raw_rule.strip().lower()
+        if not normalized:
+            continue
+        try:
+            rule = BlockingRule(normalized)
+        except ValueError as exc:
+            allowed = ", ".join(rule.value for rule in BlockingRule)
+            raise DeduperConfigError(f"{key} entries must be one of: {allowed}") from exc
+        if rule not in rules:
+            rules.append(rule)
+
+    if not rules:
+        raise DeduperConfigError(f"{key} must list at least one rule")
+
+    return tuple(rules)
+
+
 @dataclass(slots=True)
 class DeduperConfig:
     path_to_database: str
@@ -50,6 +79,11 @@ class DeduperConfig:
     batch_size_embedding: int
     cache_max_entries: int
     checkpoint_interval: int
+    load_mode: LoadMode = LoadMode.PYTHON
+    blocking_enabled: bool = False
+    blocking_rules: tuple[BlockingRule, ...] = tuple(BlockingRule)
+    blocking_date_window_days: int = 3
+    simhash_max_distance: int = 3
 
     @property
     def sqlite_path(self) -> str:
@@ -67,6 +101,20 @@ class DeduperConfig:
 
         path_to_csv_raw = os.getenv("PATH_TO_CSV", "").strip()
         enable_embedding_raw = os.getenv("DEDUPER_ENABLE_EMBEDDING", "true")
+        load_mode = _parse_load_mode(os.getenv("DEDUPER_LOAD_MODE", "python"), "DEDUPER_LOAD_MODE")
+        blocking_enabled = _parse_bool(
+            os.getenv("DEDUPER_BLOCKING_ENABLED", "false"),
+            "DEDUPER_BLOCKING_ENABLED",
+        )
+        simhash_max_distance = _parse_positive_int(
+            os.getenv("DEDUPER_SIMHASH_MAX_DISTANCE", "3"),
+            "DEDUPER_SIMHASH_MAX_DISTANCE",
+        )
+        if simhash_max_distance >= 64:
+            raise DeduperConfigError("DEDUPER_SIMHASH_MAX_DISTANCE must be < 64")
+        # Blocked pairs are generated by the set-based load only.
+        if blocking_enabled and load_mode != LoadMode.SQL:
+            raise DeduperConfigError("DEDUPER_BLOCKING_ENABLED requires DEDUPER_LOAD_MODE=sql")
 
         return cls(
             path_to_database=path_to_database,
@@ -92,6 +140,17 @@ class DeduperConfig:
                 os.getenv("DEDUPER_CHECKPOINT_INTERVAL", "250"),
                 "DEDUPER_CHECKPOINT_INTERVAL",
             ),
+            load_mode=load_mode,
+            blocking_enabled=blocking_enabled,
+            blocking_rules=_parse_blocking_rules(
+                os.getenv("DEDUPER_BLOCKING_RULES", ",".join(BlockingRule)),
+                "DEDUPER_BLOCKING_RULES",
+            ),
+            blocking_date_window_days=_parse_positive_int(
+                os.getenv("DEDUPER_BLOCKING_DATE_WINDOW_DAYS", "3"),
+                "DEDUPER_BLOCKING_DATE_WINDOW_DAYS",
+            ),
+            simhash_max_distance=simhash_max_distance,
         )
 
 
@@ -0,0 +1,144 @@
+"""Persisted per-article content fingerprints for deduper content comparison."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+from src.modules.deduper.repository import DeduperRepository
+from src.modules.deduper.utils.simhash_batch import content_similarities, simhashes_from_normalized
+from src.modules.deduper.utils.text_norm import prepare_content, sha1_from_normalized
+
+# Bump when normalization or hashing changes, so stored fingerprints are recomputed.
+FINGERPRINT_VERSION = 1
+SIMHASH_BITS = 64
+
+
+def to_signed_simhash(simhash: int) -> int:
+    # SQLite integers are signed 64-bit.
+    return simhash - (1 << SIMHASH_BITS) if simhash >= 1 << (SIMHASH_BITS - 1) else simhash
+
+
+def from_signed_simhash(value: int) -> int:
+    return value % (1 << SIMHASH_BITS)
+
+
+def get_content_digest(headline: str | None, text: str | None) -> str:
+    return hashlib.blake2b(
+        json.dumps([headline, text]).encode("utf-8"),
+        digest_size=16,
+    ).hexdigest()
+
+
+@dataclass(frozen=True, slots=True)
+class ArticleFingerprint:
+    articleId: int
+    contentDigest: str
+    contentSha1: str
+    simhash: int
+    # Headline and text are both missing.
+    isMissing: bool
+    # Nothing is left after normalization.
+    isBlank: bool
+
+
+def fingerprint_articles(articles: Sequence[dict[str, Any]]) -> list[ArticleFingerprint]:
+    """Fingerprint rows with `articleId`, `headline` and `text`, hashing them as one batch."""
+    normalized = [prepare_content(article["headline"], article["text"]) for article in articles]
+    simhashes = simhashes_from_normalized(normalized)
+    return [
+        ArticleFingerprint(
+            articleId=article["articleId"],
+            contentDigest=get_content_digest(article["headline"], article["text"]),
+            contentSha1=sha1_from_normalized(content),
+            simhash=simhash,
+            isMissing=article["headline"] is None and article["text"] is None,
+            isBlank=not content.replace("|||", "").strip(),
+        )
+        for article, content, simhash in zip(articles, normalized, simhashes)
+    ]
+
+
+def compare_fingerprint_pairs(
+    pairs: Sequence[tuple[ArticleFingerprint, ArticleFingerprint]],
+) -> list[float]:
+    """
+    Content similarity of each (new, approved) pair, computed as one batch.
+
+    Two missing articles score 1.0 and one missing article 0.0. Equal
+    normalized SHA-1s score 1.0, two empty simhashes 0.0, and anything else
+    the simhash Hamming similarity.
+    """
+    return content_similarities(
+        [left.simhash for left, _ in pairs],
+        [right.simhash for _, right in pairs],
+        [left.isMissing for left, _ in pairs],
+        [right.isMissing for _, right in pairs],
+        [bool(left.contentSha1) and left.contentSha1 == right.contentSha1 for left, right in pairs],
+    )
+
+
+class ArticleFingerprintStore:
+    """
+    Article fingerprints kept in the `DeduperArticleFingerprints` sidecar table.
+
+    Each row stores a digest of the raw headline and text it was computed
+    from. A stored fingerprint is reused while the digest and
+    `FINGERPRINT_VERSION` still match, so an article is normalized and
+    hashed once until its content changes, however many pairs and runs it
+    takes part in.
+    """
+
+    def __init__(self, repository: DeduperRepository) -> None:
+        self.repository = repository
+        self._schema_ready = False
+
+    def get_fingerprints(self, articles: Iterable[dict[str, Any]]) -> dict[int, ArticleFingerprint]:
+        """Return fingerprints for rows with `articleId`, `headline` and `text`."""
+        if not self._schema_ready:
+            self.repository.ensure_article_fingerprint_schema()
+            self._schema_ready = True
+
+        contents = {article["articleId"]: article for article in articles}
+        if not contents:
+            return {}
+
+        fingerprints: dict[int, ArticleFingerprint] = {}
+        for row in self.repository.get_article_fingerprints(list(contents)):
+            article = contents[row["articleId"]]
+            if row["fingerprintVersion"] == FINGERPRINT_VERSION and row[
+                "contentDigest"
+            ] == get_content_digest(article["headline"], article["text"]):
+                fingerprints[row["articleId"]] = ArticleFingerprint(
+                    articleId=row["articleId"],
+                    contentDigest=row["contentDigest"],
+                    contentSha1=row["contentSha1"],
+                    simhash=from_signed_simhash(row["simhash"]),
+                    isMissing=bool(row["isMissing"]),
+                    isBlank=bool(row["isBlank"]),
+                )
+
+        computed = fingerprint_articles(
+            [article for article_id, article in contents.items() if article_id not in fingerprints]
+        )
+        if computed:
+            self.repository.upsert_article_fingerprints(
+                [
+                    (
+                        fingerprint.articleId,
+                        fingerprint.contentDigest,
+                        fingerprint.contentSha1,
+                        to_signed_simhash(fingerprint.simhash),
+                        int(fingerprint.isMissing),
+                        int(fingerprint.isBlank),
+                        FINGERPRINT_VERSION,
+                    )
+                    for fingerprint in computed
+                ]
+            )
+            fingerprints.update((fingerprint.articleId, fingerprint) for fingerprint in computed)
+
+        return fingerprints
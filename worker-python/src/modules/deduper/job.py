@@ -0,0 +1,145 @@
+"""Deduper queue job body, importable without the FastAPI app or global queue."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from datetime import datetime, timezone
+
+from loguru import logger
+
+from src.modules.deduper.config import DeduperConfig
+from src.modules.deduper.errors import DeduperProcessorError
+from src.modules.deduper.orchestrator import DeduperOrchestrator
+from src.modules.deduper.repository import DeduperRepository
+from src.modules.deduper.types import PipelineStep
+from src.modules.queue.context import QueueExecutionContext, QueueJobCanceledError
+
+
+OrchestratorFactory = Callable[[], tuple[DeduperOrchestrator, DeduperRepository]]
+
+
+def utc_now_iso() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+def create_deduper_orchestrator() -> tuple[DeduperOrchestrator, DeduperRepository]:
+    config = DeduperConfig.from_env()
+    repository = DeduperRepository(config)
+    orchestrator = DeduperOrchestrator(repository, config)
+    return orchestrator, repository
+
+
+def _append_job_log(context: QueueExecutionContext, event: str, report_id: int | None = None) -> None:
+    message = f"{utc_now_iso()} event={event} job_id={context.jobId} report_id={report_id}"
+
+    context.append_log(message)
+    logger.info(message)
+
+
+def _update_job_result(
+    context: QueueExecutionContext,
+    *,
+    exit_code: int,
+    stdout: str,
+    stderr: str,
+    error: str | None,
+) -> None:
+    context.update_result(
+        {
+            "exitCode": exit_code,
+            "stdout": stdout,
+            "stderr": stderr,
+            "error": error,
+        }
+    )
+
+
+def _get_completed_steps(context: QueueExecutionContext) -> list[PipelineStep]:
+    completed_steps = (context.resumeCursor or {}).get("completedSteps", [])
+    return [PipelineStep(step) for step in completed_steps]
+
+
+def run_deduper_job(
+    context: QueueExecutionContext,
+    report_id: int | None,
+    create_orchestrator: OrchestratorFactory = create_deduper_orchestrator,
+) -> None:
+    # A job resumed after a restart keeps the analysis rows of the steps it
+    # had already finished and continues with the next one.
+    completed_steps = _get_completed_steps(context)
+    if completed_steps:
+        _append_job_log(
+            context,
+            f"job_resumed completed_steps={','.join(step.value for step in completed_steps)}",
+            report_id,
+        )
+    else:
+        _append_job_log(context, "job_started", report_id)
+    orchestrator, repository = create_orchestrator()
+
+    def _save_step_checkpoint(step: PipelineStep) -> None:
+        completed_steps.append(step)
+        context.save_checkpoint({"completedSteps": [step.value for step in completed_steps]})
+
+    try:
+        summary = orchestrator.run_analyze_fast(
+            report_id=report_id,
+            should_cancel=context.is_cancel_requested,
+            clear_first=not completed_steps,
+            on_step_start=lambda step: context.enter_stage(step.value),
+            skip_steps=tuple(completed_steps),
+            on_step_complete=_save_step_checkpoint,
+        )
+    except DeduperProcessorError as exc:
+        _update_job_result(
+            context,
+            exit_code=1,
+            stdout="",
+            stderr=str(exc),
+            error=str(exc),
+        )
+        _append_job_log(context, "job_cancelled", report_id)
+        raise QueueJobCanceledError() from exc
+    except Exception as exc:
+        _update_job_result(
+            context,
+            exit_code=1,
+            stdout="",
+            stderr=str(exc),
+            error=str(exc),
+        )
+        _append_job_log(context, f"job_failed error={exc}", report_id)
+        raise
+    finally:
+        repository.close()
+
+    if summary.status == "cancelled" or context.is_cancel_requested():
+        _update_job_result(
+            context,
+            exit_code=1,
+            stdout="",
+            stderr="Pipeline cancelled",
+            error="Pipeline cancelled",
+        )
+        _append_job_log(context, "job_cancelled", report_id)
+        raise QueueJobCanceledError()
+
+    if summary.status != "completed":
+        _update_job_result(
+            context,
+            exit_code=1,
+            stdout="",
+            stderr="deduper_failed",
+            error="deduper_failed",
+        )
+        _append_job_log(context, "job_failed", report_id)
+        raise RuntimeError("deduper_failed")
+
+    _update_job_result(
+        context,
+        exit_code=0,
+        stdout="Deduper processed in-process inside worker-python",
+        stderr="",
+        error=None,
+    )
+    _append_job_log(context, "job_completed", report_id)
@@ -4,10 +4,11 @@ from __future__ import annotations
 
 from datetime import datetime, timezone
 import time
-from typing import Any, Callable
+from typing import Any, Callable, Collection
 
 from loguru import logger
 
+from src.metrics import PIPELINE_STEP_ROWS_TOTAL, PIPELINE_STEP_SECONDS
 from src.modules.deduper.config import DeduperConfig
 from src.modules.deduper.errors import DeduperProcessorError
 from src.modules.deduper.processors.content_hash import ContentHashProcessor
@@ -104,6 +105,9 @@ class DeduperOrchestrator:
         report_id: int | None = None,
         should_cancel: Callable[[], bool] | None = None,
         clear_first: bool = True,
+        on_step_start: Callable[[PipelineStep], None] | None = None,
+        skip_steps: Collection[PipelineStep] = (),
+        on_step_complete: Callable[[PipelineStep], None] | None = None,
     ) -> PipelineSummary:
         summary = self.new_summary(PipelineRunMode.ANALYZE_FAST)
         summary.report_id = report_id
@@ -138,8 +142,16 @@ class DeduperOrchestrator:
                 ),
             ),
         ]
-
-        self._execute_pipeline_steps(summary, steps, should_cancel)
+        # Steps a resumed job already finished keep their rows in the analysis table.
+        steps = [(step, fn) for step, fn in steps if step not in skip_steps]
+
+        self._execute_pipeline_steps(
+            summary,
+            steps,
+            should_cancel,
+            on_step_start,
+            on_step_complete,
+        )
         return summary
 
     def run_clear_table(self, skip_confirmation: bool = True) -> dict[str, Any]:
@@ -162,8 +174,12 @@ class DeduperOrchestrator:
         summary: PipelineSummary,
         steps: list[tuple[PipelineStep, Callable[[], dict[str, Any]]]],
         should_cancel: Callable[[], bool] | None,
+        on_step_start: Callable[[PipelineStep], None] | None = None,
+        on_step_complete: Callable[[PipelineStep], None] | None = None,
     ) -> None:
         cancel_check = should_cancel or (lambda: False)
+        notify_step_start = on_step_start or (lambda step: None)
+        notify_step_complete = on_step_complete or (lambda step: None)
 
         try:
             for step, fn in steps:
@@ -176,6 +192,7 @@ class DeduperOrchestrator:
                     started_at=_utc_now_iso(),
                 )
                 summary.steps.append(progress)
+                notify_step_start(step)
                 self.logger.info(
                     "event=step_start step={} report_id={}",
                     step,
@@ -190,13 +207,21 @@ class DeduperOrchestrator:
                 progress.processed = int(result.get("processed", 0))
                 progress.total = progress.processed
                 progress.message = str(result)
-                duration_ms = int((time.perf_counter() - step_started) * 1000)
+                step_seconds = time.perf_counter() - step_started
+                duration_ms = int(step_seconds * 1000)
+                PIPELINE_STEP_SECONDS.observe(step_seconds, pipeline="deduper", step=step.value)
+                PIPELINE_STEP_ROWS_TOTAL.inc(
+                    progress.processed,
+                    pipeline="deduper",
+                    step=step.value,
+                )
                 self.logger.info(
                     "event=step_complete step={} processed={} duration_ms={}",
                     step,
                     progress.processed,
                     duration_ms,
                 )
+                notify_step_complete(step)
 
             summary.status = "completed"
             self.logger.info(
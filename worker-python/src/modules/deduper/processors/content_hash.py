@@ -2,18 +2,20 @@
 
 from __future__ import annotations
 
+from collections import OrderedDict
+from typing import Any
+
 from loguru import logger
 
 from src.modules.deduper.config import DeduperConfig
 from src.modules.deduper.errors import DeduperProcessorError
-from src.modules.deduper.repository import DeduperRepository
-from src.modules.deduper.utils.text_norm import (
-    hamming_distance,
-    prepare_content,
-    sha1_from_normalized,
-    similarity_from_hamming,
-    simhash_from_normalized,
+from src.modules.deduper.fingerprints import (
+    ArticleFingerprint,
+    ArticleFingerprintStore,
+    compare_fingerprint_pairs,
+    get_content_digest,
 )
+from src.modules.deduper.repository import DeduperRepository
 
 
 class ContentHashProcessor:
@@ -21,7 +23,9 @@ class ContentHashProcessor:
         self.repository = repository
         self.config = config
         self.logger = logger
-        self.norm_cache: dict[int, str] = {}
+        self.fingerprints = ArticleFingerprintStore(repository)
+        # LRU of fingerprints already loaded this run; approved articles recur in every batch.
+        self.fingerprint_cache: OrderedDict[int, ArticleFingerprint] = OrderedDict()
 
     def execute(self, should_cancel=None) -> dict[str, int]:
         cancel_check = should_cancel or (lambda: False)
@@ -41,25 +45,48 @@ class ContentHashProcessor:
         checkpoint_interval = self.config.checkpoint_interval
         self.logger.info("event=content_hash_start total={}", len(total_candidates))
 
+        last_id = 0
         while True:
             if processed % checkpoint_interval == 0 and cancel_check():
                 raise DeduperProcessorError("Content hash processor cancelled")
-            records = self.repository.get_analysis_records_for_content_hash_update_with_contents(limit=batch_size)
+            # Paging by id: a pair that scores 0.0 stays at contentHash = 0.
+            records = self.repository.get_analysis_records_for_content_hash_update_with_contents(
+                limit=batch_size,
+                after_id=last_id,
+            )
             if not records:
                 break
 
-            updates: list[dict] = []
-            for record in records:
-                similarity = self._compare_content_with_details(
-                    record["headlineNew"],
-                    record["textNew"],
-                    record["headlineApproved"],
-                    record["textApproved"],
-                    record["articleIdNew"],
-                    record["articleIdApproved"],
-                )
-                updates.append({"id": record["id"], "contentHash": similarity})
-                processed += 1
+            fingerprints = self._get_fingerprints(
+                [
+                    article
+                    for record in records
+                    for article in (
+                        {
+                            "articleId": record["articleIdNew"],
+                            "headline": record["headlineNew"],
+                            "text": record["textNew"],
+                        },
+                        {
+                            "articleId": record["articleIdApproved"],
+                            "headline": record["headlineApproved"],
+                            "text": record["textApproved"],
+                        },
+                    )
+                ]
+            )
+            similarities = compare_fingerprint_pairs(
+                [
+                    (fingerprints[record["articleIdNew"]], fingerprints[record["articleIdApproved"]])
+                    for record in records
+                ]
+            )
+            updates = [
+                {"id": record["id"], "contentHash": similarity}
+                for record, similarity in zip(records, similarities)
+            ]
+            processed += len(records)
+            last_id = records[-1]["id"]
 
             self.repository.update_analysis_content_hash_batch(updates)
 
@@ -68,55 +95,28 @@ class ContentHashProcessor:
         self.logger.info("event=content_hash_complete processed={}", processed)
         return stats
 
-    def _compare_content_with_details(
-        self,
-        headline_new: str | None,
-        text_new: str | None,
-        headline_approved: str | None,
-        text_approved: str | None,
-        article_id_new: int,
-        article_id_approved: int,
-    ) -> float:
-        if (headline_new is None and text_new is None) and (
-            headline_approved is None and text_approved is None
-        ):
-            return 1.0
-        if (headline_new is None and text_new is None) or (
-            headline_approved is None and text_approved is None
-        ):
-            return 0.0
-
-        norm1 = self.norm_cache.get(article_id_new)
-        if norm1 is None:
-            norm1 = prepare_content(headline_new, text_new)
-            self._set_cache(article_id_new, norm1)
-
-        norm2 = self.norm_cache.get(article_id_approved)
-        if norm2 is None:
-            norm2 = prepare_content(headline_approved, text_approved)
-            self._set_cache(article_id_approved, norm2)
-
-        hash1 = sha1_from_normalized(norm1)
-        hash2 = sha1_from_normalized(norm2)
-
-        if hash1 == hash2 and hash1:
-            return 1.0
-
-        simhash1 = simhash_from_normalized(norm1)
-        simhash2 = simhash_from_normalized(norm2)
-
-        if simhash1 == 0 and simhash2 == 0:
-            return 0.0
-
-        distance = hamming_distance(simhash1, simhash2)
-        return similarity_from_hamming(distance)
-
-    def _set_cache(self, article_id: int, value: str) -> None:
-        if len(self.norm_cache) >= self.config.cache_max_entries:
-            self.logger.warning(
-                "event=content_hash_cache_reset size=%s max=%s",
-                len(self.norm_cache),
-                self.config.cache_max_entries,
-            )
-            self.norm_cache.clear()
-        self.norm_cache[article_id] = value
+    def _get_fingerprints(self, articles: list[dict[str, Any]]) -> dict[int, ArticleFingerprint]:
+        fingerprints: dict[int, ArticleFingerprint] = {}
+        missing: dict[int, dict[str, Any]] = {}
+        for article in articles:
+            article_id = article["articleId"]
+            if article_id in fingerprints or article_id in missing:
+                continue
+            cached = self.fingerprint_cache.get(article_id)
+            if cached is not None and cached.contentDigest == get_content_digest(
+                article["headline"],
+                article["text"],
+            ):
+                self.fingerprint_cache.move_to_end(article_id)
+                fingerprints[article_id] = cached
+            else:
+                missing[article_id] = article
+
+        for article_id, fingerprint in self.fingerprints.get_fingerprints(missing.values()).items():
+            fingerprints[article_id] = fingerprint
+            self.fingerprint_cache[article_id] = fingerprint
+            self.fingerprint_cache.move_to_end(article_id)
+            if len(self.fingerprint_cache) > self.config.cache_max_entries:
+                self.fingerprint_cache.popitem(last=False)
+
+        return fingerprints
@@ -7,6 +7,13 @@ from loguru import logger
 from src.modules.deduper.config import DeduperConfig
 from src.modules.deduper.errors import DeduperProcessorError
 from src.modules.deduper.repository import DeduperRepository
+from src.modules.deduper.simhash_index import SimhashBandIndex
+from src.modules.deduper.types import BlockingRule, LoadMode
+from src.modules.deduper.utils.blocking import (
+    BLOCKING_SIDE_APPROVED,
+    BLOCKING_SIDE_NEW,
+    iter_blocking_keys,
+)
 from src.modules.deduper.utils.csv_input import read_article_ids_from_csv
 
 
@@ -34,24 +41,131 @@ class LoadProcessor:
         if not new_article_ids:
             return {"processed": 0, "new_articles": 0, "approved_articles": 0, "empty": True}
 
-        approved_article_ids = self.repository.get_all_approved_article_ids()
-        if not approved_article_ids:
+        if self.config.load_mode == LoadMode.SQL:
+            approved_count = self.repository.count_approved_articles()
+        else:
+            approved_article_ids = self.repository.get_all_approved_article_ids()
+            approved_count = len(approved_article_ids)
+        if not approved_count:
             return {"processed": 0, "new_articles": len(new_article_ids), "approved_articles": 0, "empty": True}
 
         self.repository.clear_existing_analysis_for_articles(new_article_ids)
 
-        batch_size = self.config.batch_size_load
-        batch: list[dict] = []
-        processed = 0
-        checkpoint_interval = self.config.checkpoint_interval
-
         self.logger.info(
-            "event=load_start report_id=%s new_articles=%s approved_articles=%s",
+            "event=load_start report_id={} mode={} new_articles={} approved_articles={}",
             report_id,
+            self.config.load_mode,
             len(new_article_ids),
-            len(approved_article_ids),
+            approved_count,
         )
 
+        if self.config.load_mode == LoadMode.SQL:
+            processed = self._load_pairs_sql(new_article_ids, approved_count, report_id, cancel_check)
+            if self.config.blocking_enabled:
+                total_pairs = len(new_article_ids) * approved_count
+                self.logger.info(
+                    "event=blocking_complete rules={} candidate_pairs={} total_pairs={} pruned_ratio={:.4f}",
+                    ",".join(self.config.blocking_rules),
+                    processed,
+                    total_pairs,
+                    1 - processed / total_pairs,
+                )
+        else:
+            processed = self._load_pairs_python(
+                new_article_ids,
+                approved_article_ids,
+                report_id,
+                cancel_check,
+            )
+
+        self.logger.info("event=load_complete processed={}", processed)
+
+        summary: dict[str, int | bool] = {
+            "processed": processed,
+            "new_articles": len(new_article_ids),
+            "approved_articles": approved_count,
+            "empty": False,
+        }
+        if self.config.blocking_enabled:
+            summary["total_pairs"] = len(new_article_ids) * approved_count
+            summary["pruned_pairs"] = summary["total_pairs"] - processed
+        return summary
+
+    def _load_pairs_sql(
+        self,
+        new_article_ids: list[int],
+        approved_count: int,
+        report_id: int | None,
+        cancel_check,
+    ) -> int:
+        # Pairs are generated inside SQLite, a range of staged new articles per
+        # statement sized to roughly batch_size_load rows, so no pair ever
+        # becomes a Python object and cancellation is checked between ranges.
+        articles_per_chunk = max(1, self.config.batch_size_load // approved_count)
+        processed = 0
+        self.repository.stage_new_article_ids(new_article_ids)
+        try:
+            if self.config.blocking_enabled:
+                self._stage_blocking_keys(cancel_check)
+                insert_pairs = self.repository.insert_blocked_article_duplicate_analysis_pairs
+            else:
+                insert_pairs = self.repository.insert_article_duplicate_analysis_pairs
+
+            for start_position in range(0, len(new_article_ids), articles_per_chunk):
+                if cancel_check():
+                    raise DeduperProcessorError("Load processor cancelled")
+                processed += insert_pairs(
+                    report_id,
+                    start_position,
+                    start_position + articles_per_chunk,
+                )
+        finally:
+            self.repository.drop_staged_new_article_ids()
+
+        return processed
+
+    def _stage_blocking_keys(self, cancel_check) -> None:
+        rules = self.config.blocking_rules
+        window = self.config.blocking_date_window_days
+        keys = [
+            (side, key, article["articleId"])
+            for side, articles in (
+                (BLOCKING_SIDE_NEW, self.repository.get_new_article_blocking_attributes()),
+                (BLOCKING_SIDE_APPROVED, self.repository.get_approved_article_blocking_attributes()),
+            )
+            for article in articles
+            for key in iter_blocking_keys(article, side, rules, window)
+        ]
+
+        use_simhash = BlockingRule.SIMHASH in rules
+        if use_simhash:
+            index = SimhashBandIndex(self.repository, self.config)
+            index.sync(should_cancel=cancel_check)
+            new_fingerprints = index.fingerprints.get_fingerprints(
+                self.repository.get_new_article_contents()
+            )
+            keys.extend(
+                (BLOCKING_SIDE_NEW, key, fingerprint.articleId)
+                for fingerprint in new_fingerprints.values()
+                for key in index.get_band_keys(fingerprint)
+            )
+
+        self.repository.stage_blocking_keys(keys)
+        if use_simhash:
+            self.repository.stage_simhash_band_blocking_keys()
+
+    def _load_pairs_python(
+        self,
+        new_article_ids: list[int],
+        approved_article_ids: list[int],
+        report_id: int | None,
+        cancel_check,
+    ) -> int:
+        batch_size = self.config.batch_size_load
+        batch: list[dict] = []
+        processed = 0
+        checkpoint_interval = self.config.checkpoint_interval
+
         for new_article_id in new_article_ids:
             for approved_article_id in approved_article_ids:
                 if processed % checkpoint_interval == 0 and cancel_check():
@@ -79,11 +193,4 @@ class LoadProcessor:
         if batch:
             self.repository.insert_article_duplicate_analysis_batch(batch)
 
-        self.logger.info("event=load_complete processed={}", processed)
-
-        return {
-            "processed": processed,
-            "new_articles": len(new_article_ids),
-            "approved_articles": len(approved_article_ids),
-            "empty": False,
-        }
+        return processed
@@ -10,6 +10,10 @@ from src.modules.deduper.config import DeduperConfig
 from src.modules.deduper.errors import DeduperDatabaseError
 
 
+# Wait for a concurrent writer instead of failing with "database is locked".
+SQLITE_BUSY_TIMEOUT_SECONDS = 30
+
+
 class DeduperRepository:
     def __init__(self, config: DeduperConfig) -> None:
         self.config = config
@@ -20,7 +24,10 @@ class DeduperRepository:
         if self._connection is None:
             if not self.sqlite_path.exists():
                 raise DeduperDatabaseError(f"Database not found at {self.sqlite_path}")
-            self._connection = sqlite3.connect(str(self.sqlite_path))
+            self._connection = sqlite3.connect(
+                str(self.sqlite_path),
+                timeout=SQLITE_BUSY_TIMEOUT_SECONDS,
+            )
             self._connection.row_factory = sqlite3.Row
 
         return self._connection
@@ -134,6 +141,182 @@ class DeduperRepository:
 
         return self.execute_many(query, params_list)
 
+    def count_approved_articles(self) -> int:
+        rows = self.execute_query(
+            """
+            SELECT COUNT(DISTINCT articleId) AS approvedCount
+            FROM ArticleApproveds
+            WHERE isApproved = 1
+            """
+        )
+        return rows[0]["approvedCount"]
+
+    def stage_new_article_ids(self, article_ids: list[int]) -> None:
+        # Temp tables live on this repository's connection only.
+        try:
+            conn = self.get_connection()
+            cursor = conn.cursor()
+            cursor.execute(
+                """
+                CREATE TEMP TABLE IF NOT EXISTS DeduperLoadNewArticles (
+                    position INTEGER PRIMARY KEY,
+                    articleId INTEGER NOT NULL
+                )
+                """
+            )
+            cursor.execute("DELETE FROM DeduperLoadNewArticles")
+            cursor.executemany(
+                "INSERT INTO DeduperLoadNewArticles (position, articleId) VALUES (?, ?)",
+                list(enumerate(article_ids)),
+            )
+            conn.commit()
+        except sqlite3.Error as exc:
+            raise DeduperDatabaseError(f"Failed to stage new article ids: {exc}") from exc
+
+    def insert_article_duplicate_analysis_pairs(
+        self,
+        report_id: int | None,
+        start_position: int,
+        end_position: int,
+    ) -> int:
+        query = """
+        INSERT INTO ArticleDuplicateAnalyses (
+            articleIdNew, articleIdApproved, reportId, sameArticleIdFlag,
+            articleNewState, articleApprovedState, sameStateFlag,
+            urlCheck, contentHash, embeddingSearch,
+            createdAt, updatedAt
+        )
+        SELECT
+            n.articleId,
+            a.articleId,
+            ?,
+            CASE WHEN n.articleId = a.articleId THEN 1 ELSE 0 END,
+            '', '', 0,
+            0, 0, 0,
+            datetime('now'), datetime('now')
+        FROM DeduperLoadNewArticles n
+        CROSS JOIN (
+            SELECT DISTINCT articleId
+            FROM ArticleApproveds
+            WHERE isApproved = 1
+        ) a
+        WHERE n.position >= ? AND n.position < ?
+        ORDER BY n.position
+        """
+        try:
+            conn = self.get_connection()
+            cursor = conn.cursor()
+            cursor.execute(query, (report_id, start_position, end_position))
+            conn.commit()
+            return cursor.rowcount
+        except sqlite3.Error as exc:
+            raise DeduperDatabaseError(f"Failed to insert analysis pairs: {exc}") from exc
+
+    def get_new_article_blocking_attributes(self) -> list[dict[str, Any]]:
+        return self._get_blocking_attributes("SELECT articleId FROM temp.DeduperLoadNewArticles")
+
+    def get_approved_article_blocking_attributes(self) -> list[dict[str, Any]]:
+        return self._get_blocking_attributes(
+            "SELECT DISTINCT articleId FROM ArticleApproveds WHERE isApproved = 1"
+        )
+
+    def _get_blocking_attributes(self, article_id_query: str) -> list[dict[str, Any]]:
+        return self.execute_query(
+            f"""
+            SELECT
+                ids.articleId,
+                ar.url,
+                ar.title,
+                CAST(julianday(ar.publishedDate) AS INTEGER) AS publishedDay,
+                (
+                    SELECT GROUP_CONCAT(s.abbreviation)
+                    FROM ArticleStateContracts asc
+                    JOIN States s ON s.id = asc.stateId
+                    WHERE asc.articleId = ids.articleId
+                ) AS states
+            FROM ({article_id_query}) ids
+            LEFT JOIN Articles ar ON ar.id = ids.articleId
+            """
+        )
+
+    def stage_blocking_keys(self, keys: list[tuple[str, str, int]]) -> None:
+        try:
+            conn = self.get_connection()
+            cursor = conn.cursor()
+            cursor.execute(
+                """
+                CREATE TEMP TABLE IF NOT EXISTS DeduperBlockingKeys (
+                    side TEXT NOT NULL,
+                    blockKey TEXT NOT NULL,
+                    articleId INTEGER NOT NULL
+                )
+                """
+            )
+            cursor.execute(
+                """
+                CREATE INDEX IF NOT EXISTS temp.idxDeduperBlockingKeysSideKey
+                ON DeduperBlockingKeys (side, blockKey, articleId)
+                """
+            )
+            cursor.execute("DELETE FROM DeduperBlockingKeys")
+            cursor.executemany(
+                "INSERT INTO DeduperBlockingKeys (side, blockKey, articleId) VALUES (?, ?, ?)",
+                keys,
+            )
+            conn.commit()
+        except sqlite3.Error as exc:
+            raise DeduperDatabaseError(f"Failed to stage blocking keys: {exc}") from exc
+
+    def insert_blocked_article_duplicate_analysis_pairs(
+        self,
+        report_id: int | None,
+        start_position: int,
+        end_position: int,
+    ) -> int:
+        query = """
+        INSERT INTO ArticleDuplicateAnalyses (
+            articleIdNew, articleIdApproved, reportId, sameArticleIdFlag,
+            articleNewState, articleApprovedState, sameStateFlag,
+            urlCheck, contentHash, embeddingSearch,
+            createdAt, updatedAt
+        )
+        SELECT
+            pairs.articleIdNew,
+            pairs.articleIdApproved,
+            ?,
+            CASE WHEN pairs.articleIdNew = pairs.articleIdApproved THEN 1 ELSE 0 END,
+            '', '', 0,
+            0, 0, 0,
+            datetime('now'), datetime('now')
+        FROM (
+            SELECT DISTINCT n.position, n.articleId AS articleIdNew, ka.articleId AS articleIdApproved
+            FROM DeduperLoadNewArticles n
+            JOIN DeduperBlockingKeys kn
+                ON kn.side = 'new' AND kn.articleId = n.articleId
+            JOIN DeduperBlockingKeys ka
+                ON ka.side = 'approved' AND ka.blockKey = kn.blockKey
+            WHERE n.position >= ? AND n.position < ?
+        ) pairs
+        ORDER BY pairs.position, pairs.articleIdApproved
+        """
+        try:
+            conn = self.get_connection()
+            cursor = conn.cursor()
+            cursor.execute(query, (report_id, start_position, end_position))
+            conn.commit()
+            return cursor.rowcount
+        except sqlite3.Error as exc:
+            raise DeduperDatabaseError(f"Failed to insert blocked analysis pairs: {exc}") from exc
+
+    def drop_staged_new_article_ids(self) -> None:
+        try:
+            conn = self.get_connection()
+            conn.execute("DROP TABLE IF EXISTS temp.DeduperLoadNewArticles")
+            conn.execute("DROP TABLE IF EXISTS temp.DeduperBlockingKeys")
+            conn.commit()
+        except sqlite3.Error as exc:
+            raise DeduperDatabaseError(f"Failed to drop staged new article ids: {exc}") from exc
+
     def clear_existing_analysis_for_articles(self, article_ids: list[int]) -> None:
         if not article_ids:
             return
@@ -265,7 +448,11 @@ class DeduperRepository:
             """
         )
 
-    def get_analysis_records_for_content_hash_update_with_contents(self, limit: int) -> list[dict[str, Any]]:
+    def get_analysis_records_for_content_hash_update_with_contents(
+        self,
+        limit: int,
+        after_id: int = 0,
+    ) -> list[dict[str, Any]]:
         return self.execute_query(
             """
             SELECT
@@ -279,10 +466,11 @@ class DeduperRepository:
             FROM ArticleDuplicateAnalyses adr
             JOIN ArticleApproveds aa1 ON aa1.articleId = adr.articleIdNew
             JOIN ArticleApproveds aa2 ON aa2.articleId = adr.articleIdApproved
-            WHERE adr.contentHash = 0
+            WHERE adr.contentHash = 0 AND adr.id > ?
+            ORDER BY adr.id
             LIMIT ?
             """,
-            (limit,),
+            (after_id, limit),
         )
 
     def get_article_content(self, article_id: int) -> str | None:
@@ -352,6 +540,211 @@ class DeduperRepository:
 
         return self._count_queries(queries)
 
+    def ensure_simhash_index_schema(self) -> None:
+        try:
+            conn = self.get_connection()
+            conn.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS DeduperSimhashIndexMeta (
+                    key TEXT PRIMARY KEY,
+                    value TEXT NOT NULL
+                );
+
+                CREATE TABLE IF NOT EXISTS DeduperSimhashes (
+                    articleId INTEGER PRIMARY KEY,
+                    simhash INTEGER NOT NULL,
+                    contentDigest TEXT NOT NULL DEFAULT '',
+                    indexedAt TEXT NOT NULL
+                );
+
+                CREATE TABLE IF NOT EXISTS DeduperSimhashBands (
+                    band INTEGER NOT NULL,
+                    bandValue INTEGER NOT NULL,
+                    articleId INTEGER NOT NULL,
+                    PRIMARY KEY (band, bandValue, articleId)
+                ) WITHOUT ROWID;
+
+                CREATE INDEX IF NOT EXISTS idxDeduperSimhashBandsArticleId
+                ON DeduperSimhashBands (articleId);
+                """
+            )
+            columns = {row["name"] for row in conn.execute("PRAGMA table_info(DeduperSimhashes)")}
+            if "contentDigest" not in columns:
+                # Indexes built before digests were stored get re-indexed once.
+                conn.execute(
+                    "ALTER TABLE DeduperSimhashes ADD COLUMN contentDigest TEXT NOT NULL DEFAULT ''"
+                )
+                conn.commit()
+        except sqlite3.Error as exc:
+            raise DeduperDatabaseError(f"Failed to create simhash index tables: {exc}") from exc
+
+    def get_simhash_index_meta(self) -> dict[str, str]:
+        rows = self.execute_query("SELECT key, value FROM DeduperSimhashIndexMeta")
+        return {row["key"]: row["value"] for row in rows}
+
+    def reset_simhash_index(self, meta: dict[str, str]) -> None:
+        try:
+            conn = self.get_connection()
+            cursor = conn.cursor()
+            cursor.execute("DELETE FROM DeduperSimhashBands")
+            cursor.execute("DELETE FROM DeduperSimhashes")
+            cursor.execute("DELETE FROM DeduperSimhashIndexMeta")
+            cursor.executemany(
+                "INSERT INTO DeduperSimhashIndexMeta (key, value) VALUES (?, ?)",
+                list(meta.items()),
+            )
+            conn.commit()
+        except sqlite3.Error as exc:
+            raise DeduperDatabaseError(f"Failed to reset simhash index: {exc}") from exc
+
+    def remove_unapproved_simhash_entries(self) -> int:
+        """Drop index rows of articles that are no longer approved; returns the rows deleted."""
+        approved_query = "SELECT articleId FROM ArticleApproveds WHERE isApproved = 1"
+        try:
+            conn = self.get_connection()
+            cursor = conn.cursor()
+            cursor.execute(
+                f"DELETE FROM DeduperSimhashBands WHERE articleId NOT IN ({approved_query})"
+            )
+            removed = cursor.rowcount
+            cursor.execute(f"DELETE FROM DeduperSimhashes WHERE articleId NOT IN ({approved_query})")
+            removed += cursor.rowcount
+            conn.commit()
+            return removed
+        except sqlite3.Error as exc:
+            raise DeduperDatabaseError(f"Failed to prune simhash index: {exc}") from exc
+
+    def get_approved_article_contents_for_simhash_index(
+        self,
+        limit: int,
+        after_id: int = 0,
+    ) -> list[dict[str, Any]]:
+        # An article approved more than once is indexed from its first approved row.
+        # indexedDigest is NULL for articles that are not in the index yet.
+        return self.execute_query(
+            """
+            SELECT aa.articleId, aa.headlineForPdfReport AS headline, aa.textForPdfReport AS text,
+                   sh.contentDigest AS indexedDigest
+            FROM (
+                SELECT MIN(rowid) AS approvedRowId
+                FROM ArticleApproveds
+                WHERE isApproved = 1 AND articleId > ?
+                GROUP BY articleId
+            ) first_approved
+            JOIN ArticleApproveds aa ON aa.rowid = first_approved.approvedRowId
+            LEFT JOIN DeduperSimhashes sh ON sh.articleId = aa.articleId
+            ORDER BY aa.articleId
+            LIMIT ?
+            """,
+            (after_id, limit),
+        )
+
+    def insert_simhash_index_entries(
+        self,
+        simhashes: list[tuple[int, int, str]],
+        bands: list[tuple[int, int, int]],
+    ) -> None:
+        """Write (articleId, simhash, contentDigest) rows, replacing any bands the articles had."""
+        try:
+            conn = self.get_connection()
+            cursor = conn.cursor()
+            cursor.executemany(
+                "DELETE FROM DeduperSimhashBands WHERE articleId = ?",
+                [(article_id,) for article_id, _, _ in simhashes],
+            )
+            cursor.executemany(
+                """
+                INSERT OR REPLACE INTO DeduperSimhashes (articleId, simhash, contentDigest, indexedAt)
+                VALUES (?, ?, ?, datetime('now'))
+                """,
+                simhashes,
+            )
+            cursor.executemany(
+                """
+                INSERT OR IGNORE INTO DeduperSimhashBands (band, bandValue, articleId)
+                VALUES (?, ?, ?)
+                """,
+                bands,
+            )
+            conn.commit()
+        except sqlite3.Error as exc:
+            raise DeduperDatabaseError(f"Failed to write simhash index entries: {exc}") from exc
+
+    def get_new_article_contents(self) -> list[dict[str, Any]]:
+        return self.execute_query(
+            """
+            SELECT n.articleId, aa.headlineForPdfReport AS headline, aa.textForPdfReport AS text
+            FROM temp.DeduperLoadNewArticles n
+            JOIN ArticleApproveds aa ON aa.rowid = (
+                SELECT MIN(rowid) FROM ArticleApproveds WHERE articleId = n.articleId
+            )
+            """
+        )
+
+    def stage_simhash_band_blocking_keys(self) -> None:
+        # Approved-side band keys come straight from the persistent index.
+        try:
+            conn = self.get_connection()
+            conn.execute(
+                """
+                INSERT INTO DeduperBlockingKeys (side, blockKey, articleId)
+                SELECT 'approved', 'band:' || band || ':' || bandValue, articleId
+                FROM DeduperSimhashBands
+                """
+            )
+            conn.commit()
+        except sqlite3.Error as exc:
+            raise DeduperDatabaseError(f"Failed to stage simhash blocking keys: {exc}") from exc
+
+    def ensure_article_fingerprint_schema(self) -> None:
+        try:
+            conn = self.get_connection()
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS DeduperArticleFingerprints (
+                    articleId INTEGER PRIMARY KEY,
+                    contentDigest TEXT NOT NULL,
+                    contentSha1 TEXT NOT NULL,
+                    simhash INTEGER NOT NULL,
+                    isMissing INTEGER NOT NULL,
+                    isBlank INTEGER NOT NULL,
+                    fingerprintVersion INTEGER NOT NULL,
+                    updatedAt TEXT NOT NULL
+                )
+                """
+            )
+            conn.commit()
+        except sqlite3.Error as exc:
+            raise DeduperDatabaseError(f"Failed to create fingerprint table: {exc}") from exc
+
+    def get_article_fingerprints(self, article_ids: list[int]) -> list[dict[str, Any]]:
+        rows: list[dict[str, Any]] = []
+        # Stays well under SQLite's bound-parameter limit.
+        for start in range(0, len(article_ids), 500):
+            chunk = article_ids[start : start + 500]
+            placeholders = ",".join(["?"] * len(chunk))
+            rows.extend(
+                self.execute_query(
+                    f"""
+                    SELECT articleId, contentDigest, contentSha1, simhash,
+                           isMissing, isBlank, fingerprintVersion
+                    FROM DeduperArticleFingerprints
+                    WHERE articleId IN ({placeholders})
+                    """,
+                    tuple(chunk),
+                )
+            )
+        return rows
+
+    def upsert_article_fingerprints(self, rows: list[tuple[int, str, str, int, int, int, int]]) -> int:
+        query = """
+        INSERT OR REPLACE INTO DeduperArticleFingerprints (
+            articleId, contentDigest, contentSha1, simhash,
+            isMissing, isBlank, fingerprintVersion, updatedAt
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, datetime('now'))
+        """
+        return self.execute_many(query, rows)
+
     def _count_queries(self, queries: dict[str, str]) -> dict[str, int]:
         try:
             conn = self.get_connection()
@@ -0,0 +1,99 @@
+"""Persistent banded simhash index over approved articles."""
+
+from __future__ import annotations
+
+from loguru import logger
+
+from src.modules.deduper.config import DeduperConfig
+from src.modules.deduper.errors import DeduperProcessorError
+from src.modules.deduper.fingerprints import (
+    FINGERPRINT_VERSION,
+    ArticleFingerprint,
+    ArticleFingerprintStore,
+    get_content_digest,
+    to_signed_simhash,
+)
+from src.modules.deduper.repository import DeduperRepository
+from src.modules.deduper.utils.text_norm import simhash_band_values
+
+
+class SimhashBandIndex:
+    """
+    Simhashes of approved articles, split into bands and stored in the deduper DB.
+
+    With `simhash_max_distance` k the 64 bits are split into k + 1 bands, so
+    any two articles within Hamming distance k share at least one band value
+    and are found by an equality lookup instead of a scan over every pair.
+    `sync` brings the index up to date incrementally: it drops articles that
+    are no longer approved, and indexes approved ones it has not seen yet or
+    whose content digest no longer matches the one they were indexed with.
+    Only those articles are hashed again; the rest cost one digest each.
+    Changing k or the hash version rebuilds the index from scratch.
+    """
+
+    def __init__(self, repository: DeduperRepository, config: DeduperConfig) -> None:
+        self.repository = repository
+        self.config = config
+        self.bands = config.simhash_max_distance + 1
+        self.fingerprints = ArticleFingerprintStore(repository)
+        self.logger = logger
+
+    def sync(self, should_cancel=None) -> dict[str, int]:
+        cancel_check = should_cancel or (lambda: False)
+        self.repository.ensure_simhash_index_schema()
+
+        meta = {"version": str(FINGERPRINT_VERSION), "bands": str(self.bands)}
+        if self.repository.get_simhash_index_meta() != meta:
+            self.logger.info("event=simhash_index_reset bands={}", self.bands)
+            self.repository.reset_simhash_index(meta)
+
+        removed = self.repository.remove_unapproved_simhash_entries()
+        indexed = 0
+        last_id = 0
+        while True:
+            if cancel_check():
+                raise DeduperProcessorError("Simhash index sync cancelled")
+            page = self.repository.get_approved_article_contents_for_simhash_index(
+                limit=self.config.batch_size_content_hash,
+                after_id=last_id,
+            )
+            if not page:
+                break
+            last_id = page[-1]["articleId"]
+
+            articles = [
+                article
+                for article in page
+                if article["indexedDigest"] != get_content_digest(article["headline"], article["text"])
+            ]
+            if not articles:
+                continue
+
+            simhashes: list[tuple[int, int, str]] = []
+            bands: list[tuple[int, int, int]] = []
+            for fingerprint in self.fingerprints.get_fingerprints(articles).values():
+                simhashes.append(
+                    (
+                        fingerprint.articleId,
+                        to_signed_simhash(fingerprint.simhash),
+                        fingerprint.contentDigest,
+                    )
+                )
+                bands.extend(
+                    (band, value, fingerprint.articleId)
+                    for band, value in self._get_band_values(fingerprint)
+                )
+            self.repository.insert_simhash_index_entries(simhashes, bands)
+            indexed += len(articles)
+
+        self.logger.info("event=simhash_index_synced indexed={} removed={}", indexed, removed)
+        return {"indexed": indexed, "removed": removed}
+
+    def get_band_keys(self, fingerprint: ArticleFingerprint) -> list[str]:
+        return [f"band:{band}:{value}" for band, value in self._get_band_values(fingerprint)]
+
+    def _get_band_values(self, fingerprint: ArticleFingerprint) -> list[tuple[int, int]]:
+        # A blank article has no content to match on.
+        if fingerprint.isBlank:
+            return []
+        return list(enumerate(simhash_band_values(fingerprint.simhash, self.bands)))
@@ -15,6 +15,19 @@ class PipelineStep(StrEnum):
     EMBEDDING = "embedding"
 
 
+class LoadMode(StrEnum):
+    SQL = "sql"
+    PYTHON = "python"
+
+
+class BlockingRule(StrEnum):
+    STATE = "state"
+    DATE = "date"
+    HOST = "host"
+    FINGERPRINT = "fingerprint"
+    SIMHASH = "simhash"
+
+
 class PipelineRunMode(StrEnum):
     ANALYZE = "analyze"
     ANALYZE_FAST = "analyze_fast"
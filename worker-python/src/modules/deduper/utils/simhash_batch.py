@@ -0,0 +1,143 @@
+"""NumPy-vectorized simhash and Hamming similarity over batches of articles."""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+from src.modules.deduper.utils.text_norm import (
+    hamming_distance,
+    similarity_from_hamming,
+    simhash_from_normalized,
+    stable_token_hash,
+)
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None  # type: ignore
+
+SIMHASH_BITS = 64
+# Bounds the (tokens x 64) bit matrix built per chunk to a few tens of MB.
+MAX_TOKENS_PER_CHUNK = 100_000
+
+
+def simhashes_from_normalized(normalized_contents: Sequence[str]) -> list[int]:
+    """Batch `simhash_from_normalized`; the results are identical, bit for bit."""
+    if np is None:
+        return [simhash_from_normalized(content) for content in normalized_contents]
+
+    simhashes: list[int] = []
+    chunk: list[list[str]] = []
+    chunk_tokens = 0
+    for content in normalized_contents:
+        tokens = content.split() if content else []
+        chunk.append(tokens)
+        chunk_tokens += len(tokens)
+        if chunk_tokens >= MAX_TOKENS_PER_CHUNK:
+            simhashes.extend(_simhash_chunk(chunk))
+            chunk, chunk_tokens = [], 0
+    if chunk:
+        simhashes.extend(_simhash_chunk(chunk))
+    return simhashes
+
+
+def _simhash_chunk(token_lists: list[list[str]]) -> list[int]:
+    lengths = np.fromiter((len(tokens) for tokens in token_lists), dtype=np.int64, count=len(token_lists))
+    total_tokens = int(lengths.sum())
+    simhashes = np.zeros(len(token_lists), dtype=np.uint64)
+    if total_tokens == 0:
+        return simhashes.tolist()
+
+    # Each distinct token is hashed once per chunk; the rest is a gather.
+    vocabulary: dict[str, int] = {}
+    token_ids = np.fromiter(
+        (vocabulary.setdefault(token, len(vocabulary)) for tokens in token_lists for token in tokens),
+        dtype=np.int64,
+        count=total_tokens,
+    )
+    vocabulary_hashes = np.fromiter(
+        (stable_token_hash(token) for token in vocabulary),
+        dtype=np.uint64,
+        count=len(vocabulary),
+    )
+    hashes = vocabulary_hashes[token_ids]
+    bit_positions = np.arange(SIMHASH_BITS, dtype=np.uint64)
+    bits = ((hashes[:, None] >> bit_positions) & np.uint64(1)).astype(np.int32)
+
+    # reduceat needs strictly increasing offsets, so empty articles are skipped.
+    non_empty = lengths > 0
+    offsets = (np.cumsum(lengths) - lengths)[non_empty]
+    ones = np.add.reduceat(bits, offsets, axis=0)
+    # A bit is set when more tokens have it set than clear.
+    set_bits = 2 * ones > lengths[non_empty, None]
+    simhashes[non_empty] = np.bitwise_or.reduce(
+        np.where(set_bits, np.uint64(1) << bit_positions, np.uint64(0)),
+        axis=1,
+    )
+    return simhashes.tolist()
+
+
+def popcount64(values):
+    if hasattr(np, "bitwise_count"):
+        return np.bitwise_count(values)
+
+    # SWAR popcount for NumPy < 2.0.
+    values = values - ((values >> np.uint64(1)) & np.uint64(0x5555555555555555))
+    values = (values & np.uint64(0x3333333333333333)) + (
+        (values >> np.uint64(2)) & np.uint64(0x3333333333333333)
+    )
+    values = (values + (values >> np.uint64(4))) & np.uint64(0x0F0F0F0F0F0F0F0F)
+    return (values * np.uint64(0x0101010101010101)) >> np.uint64(56)
+
+
+def hamming_similarities(left: Sequence[int], right: Sequence[int]) -> list[float]:
+    """Pairwise `similarity_from_hamming(hamming_distance(l, r))` for aligned sequences."""
+    if np is None:
+        return [
+            similarity_from_hamming(hamming_distance(left_hash, right_hash))
+            for left_hash, right_hash in zip(left, right)
+        ]
+
+    distances = popcount64(np.asarray(left, dtype=np.uint64) ^ np.asarray(right, dtype=np.uint64))
+    return (1.0 - distances / SIMHASH_BITS).tolist()
+
+
+def content_similarities(
+    left_simhashes: Sequence[int],
+    right_simhashes: Sequence[int],
+    left_missing: Sequence[bool],
+    right_missing: Sequence[bool],
+    same_sha1: Sequence[bool],
+) -> list[float]:
+    """
+    Vectorized `compare_fingerprint_pairs` over aligned per-pair columns.
+
+    Rules apply in the same precedence: missing content first, then equal
+    SHA-1, then two empty simhashes, then simhash Hamming similarity.
+    """
+    if np is None:
+        results: list[float] = []
+        for left_hash, right_hash, left_gone, right_gone, same in zip(
+            left_simhashes, right_simhashes, left_missing, right_missing, same_sha1
+        ):
+            if left_gone or right_gone:
+                results.append(1.0 if left_gone and right_gone else 0.0)
+            elif same:
+                results.append(1.0)
+            elif left_hash == 0 and right_hash == 0:
+                results.append(0.0)
+            else:
+                results.append(similarity_from_hamming(hamming_distance(left_hash, right_hash)))
+        return results
+
+    left = np.asarray(left_simhashes, dtype=np.uint64)
+    right = np.asarray(right_simhashes, dtype=np.uint64)
+    left_gone = np.asarray(left_missing, dtype=bool)
+    right_gone = np.asarray(right_missing, dtype=bool)
+
+    similarities = 1.0 - popcount64(left ^ right) / SIMHASH_BITS
+    similarities[(left == 0) & (right == 0)] = 0.0
+    similarities[np.asarray(same_sha1, dtype=bool)] = 1.0
+    similarities[left_gone | right_gone] = 0.0
+    similarities[left_gone & right_gone] = 1.0
+    return similarities.tolist()
@@ -8,6 +8,8 @@ import re
 HTML_TAG_REGEX = re.compile(r"<[^>]+>")
 NON_WORD_SPACE_REGEX = re.compile(r"[^\w\s]")
 WHITESPACE_REGEX = re.compile(r"\s+")
+# Personalizes the token hash, so simhashes only ever match other deduper simhashes.
+TOKEN_HASH_PERSON = b"deduper-simhash"
 
 STOP_WORDS = {
     "the",
@@ -74,6 +76,16 @@ def sha1_from_normalized(normalized_content: str) -> str:
     return hashlib.sha1(normalized_content.encode("utf-8")).hexdigest()
 
 
+def stable_token_hash(token: str, hash_bits: int = 64) -> int:
+    # Unlike hash(), stable across processes, so simhashes can be persisted.
+    digest = hashlib.blake2b(
+        token.encode("utf-8"),
+        digest_size=(hash_bits + 7) // 8,
+        person=TOKEN_HASH_PERSON,
+    ).digest()
+    return int.from_bytes(digest, "big") % (2**hash_bits)
+
+
 def simhash_from_normalized(normalized_content: str, hash_bits: int = 64) -> int:
     if not normalized_content:
         return 0
@@ -84,7 +96,7 @@ def simhash_from_normalized(normalized_content: str, hash_bits: int = 64) -> int
 
     bit_vector = [0] * hash_bits
     for word in words:
-        word_hash = hash(word) % (2**hash_bits)
+        word_hash = stable_token_hash(word, hash_bits)
         for i in range(hash_bits):
             if word_hash & (1 << i):
                 bit_vector[i] += 1
@@ -99,6 +111,22 @@ def simhash_from_normalized(normalized_content: str, hash_bits: int = 64) -> int
     return simhash
 
 
+def simhash_band_values(simhash: int, bands: int, hash_bits: int = 64) -> list[int]:
+    """
+    Split a simhash into `bands` contiguous bit ranges, widest first.
+
+    Two simhashes within Hamming distance `bands - 1` agree on at least one
+    band, so equal band values find every such pair.
+    """
+    values: list[int] = []
+    shift = 0
+    for band in range(bands):
+        width = hash_bits // bands + (1 if band < hash_bits % bands else 0)
+        values.append((simhash >> shift) & ((1 << width) - 1))
+        shift += width
+    return values
+
+
 def hamming_distance(hash1: int, hash2: int) -> int:
     return bin(hash1 ^ hash2).count("1")
 
@@ -0,0 +1,170 @@
+"""Location scorer queue job body, importable without the FastAPI app or global queue."""
+
+from __future__ import annotations
+
+from loguru import logger
+
+from src.modules.location_scorer.config import LocationScorerConfig
+from src.modules.location_scorer.errors import (
+    LocationScorerConfigError,
+    LocationScorerProcessorError,
+)
+from src.modules.location_scorer.orchestrator import LocationScorerOrchestrator
+from src.modules.location_scorer.repository import LocationScorerRepository
+from src.modules.location_scorer.types import PipelineSummary
+from src.modules.queue.context import (
+    QueueExecutionContext,
+    QueueJobCanceledError,
+    QueueJobYieldedError,
+)
+
+
+def _append_job_log(context: QueueExecutionContext, event: str, limit: int | None = None) -> None:
+    message = f"event={event} job_id={context.jobId} limit={limit}"
+    context.append_log(message)
+    logger.info(message)
+
+
+def _persist_progress(context: QueueExecutionContext, summary: PipelineSummary) -> None:
+    current_step = summary.steps[-1] if summary.steps else None
+    if current_step is not None:
+        context.enter_stage(current_step.step.value)
+    context.update_result(
+        {
+            "workflow": "location_scorer",
+            "summaryStatus": summary.status,
+            "limit": summary.limit,
+            "completedStepCount": len(
+                [step for step in summary.steps if step.status == "completed"]
+            ),
+            "currentStep": current_step.step.value if current_step is not None else None,
+            "currentStepStatus": current_step.status if current_step is not None else None,
+            "currentStepProcessed": current_step.processed if current_step is not None else 0,
+        }
+    )
+
+
+def probe_location_scorer_work() -> tuple[int, int] | None:
+    """Return (unscored article count, highest unscored id), or None when all are scored."""
+    config = LocationScorerConfig.from_env()
+    repository = LocationScorerRepository(config)
+    try:
+        entity_id = repository.get_entity_who_categorized_article_id(config.ai_entity_name)
+        if entity_id is None:
+            return None
+        return repository.get_unscored_article_watermark(entity_id)
+    finally:
+        repository.close()
+
+
+def run_location_scorer_job(context: QueueExecutionContext, limit: int | None) -> None:
+    if context.resumeCursor is not None:
+        limit = context.resumeCursor.get("remainingLimit", limit)
+        _append_job_log(context, "job_resumed", limit)
+    else:
+        _append_job_log(context, "job_started", limit)
+    repository: LocationScorerRepository | None = None
+    checkpointed_limit: int | None = None
+
+    def _on_progress(current_summary: PipelineSummary) -> None:
+        nonlocal checkpointed_limit
+        _persist_progress(context, current_summary)
+        # Once scores are written, a restarted run must only score what is left.
+        remaining_limit = current_summary.remaining_limit
+        if remaining_limit is not None and remaining_limit != checkpointed_limit:
+            checkpointed_limit = remaining_limit
+            context.save_checkpoint({"remainingLimit": remaining_limit})
+
+    try:
+        config = LocationScorerConfig.from_env()
+        repository = LocationScorerRepository(config)
+        orchestrator = LocationScorerOrchestrator(repository, config)
+        summary = orchestrator.run_score(
+            limit=limit,
+            should_cancel=context.is_cancel_requested,
+            on_progress=_on_progress,
+            should_yield=context.is_yield_requested,
+        )
+    except LocationScorerProcessorError as exc:
+        context.update_result(
+            {
+                "exitCode": 1,
+                "error": str(exc),
+                "stderr": str(exc),
+                "stdout": "",
+                "statusText": "cancelled" if context.is_cancel_requested() else "failed",
+            }
+        )
+        if context.is_cancel_requested() or "cancelled" in str(exc).lower():
+            _append_job_log(context, "job_cancelled", limit)
+            raise QueueJobCanceledError() from exc
+        _append_job_log(context, "job_failed", limit)
+        raise
+    except LocationScorerConfigError as exc:
+        context.update_result(
+            {
+                "exitCode": 1,
+                "error": str(exc),
+                "stderr": str(exc),
+                "stdout": "",
+                "statusText": "failed",
+            }
+        )
+        _append_job_log(context, "job_failed", limit)
+        raise
+    except Exception as exc:
+        context.update_result(
+            {
+                "exitCode": 1,
+                "error": str(exc),
+                "stderr": str(exc),
+                "stdout": "",
+                "statusText": "failed",
+            }
+        )
+        _append_job_log(context, "job_failed", limit)
+        raise
+    finally:
+        if repository is not None:
+            repository.close()
+
+    if summary.status == "cancelled" or context.is_cancel_requested():
+        context.update_result(
+            {
+                "exitCode": 1,
+                "error": "Pipeline cancelled",
+                "stderr": "Pipeline cancelled",
+                "stdout": "",
+                "statusText": "cancelled",
+            }
+        )
+        _append_job_log(context, "job_cancelled", limit)
+        raise QueueJobCanceledError()
+
+    if summary.status == "yielded":
+        _append_job_log(context, "job_yielded", summary.remaining_limit)
+        raise QueueJobYieldedError({"remainingLimit": summary.remaining_limit})
+
+    if summary.status != "completed":
+        context.update_result(
+            {
+                "exitCode": 1,
+                "error": "location_scorer_failed",
+                "stderr": "location_scorer_failed",
+                "stdout": "",
+                "statusText": "failed",
+            }
+        )
+        _append_job_log(context, "job_failed", limit)
+        raise RuntimeError("location_scorer_failed")
+
+    context.update_result(
+        {
+            "exitCode": 0,
+            "error": None,
+            "stderr": "",
+            "stdout": "Location scorer processed in worker-python",
+            "statusText": "completed",
+        }
+    )
+    _append_job_log(context, "job_completed", limit)
@@ -10,6 +10,7 @@ from typing import Any
 
 from loguru import logger
 
+from src.metrics import PIPELINE_STEP_ROWS_TOTAL, PIPELINE_STEP_SECONDS
 from src.modules.location_scorer.config import LocationScorerConfig
 from src.modules.location_scorer.errors import LocationScorerProcessorError
 from src.modules.location_scorer.processors.classify import ClassifyProcessor
@@ -49,6 +50,7 @@ class LocationScorerOrchestrator:
         limit: int | None = None,
         should_cancel: Callable[[], bool] | None = None,
         on_progress: Callable[[PipelineSummary], None] | None = None,
+        should_yield: Callable[[], bool] | None = None,
     ) -> PipelineSummary:
         summary = self.new_summary(LocationScorerRunMode.SCORE)
         summary.limit = limit
@@ -68,6 +70,7 @@ class LocationScorerOrchestrator:
             return ClassifyProcessor(self.repository, self.config).execute(
                 load_result.get("articles", []),
                 should_cancel=should_cancel,
+                should_yield=should_yield,
             )
 
         classify_result: dict[str, Any] = {}
@@ -78,11 +81,18 @@ class LocationScorerOrchestrator:
             return classify_result
 
         def run_write() -> dict[str, Any]:
-            return WriteProcessor(self.repository, self.config).execute(
+            write_result = WriteProcessor(self.repository, self.config).execute(
                 int(load_result["entity_id"]),
                 list(classify_result.get("scores", [])),
                 should_cancel=should_cancel,
             )
+            # Scores classified so far are written, so a resumed run loads only the rest.
+            if limit is not None:
+                consumed = int(classify_result.get("processed", 0)) + int(
+                    classify_result.get("skipped", 0)
+                )
+                summary.remaining_limit = max(limit - consumed, 0)
+            return write_result
 
         steps = [
             (LocationScorerStep.LOAD, run_load),
@@ -91,6 +101,15 @@ class LocationScorerOrchestrator:
         ]
 
         self._execute_pipeline_steps(summary, steps, should_cancel, on_progress)
+        if classify_result.get("yielded"):
+            summary.status = "yielded"
+            if on_progress is not None:
+                on_progress(deepcopy(summary))
+            self.logger.info(
+                "event=location_scorer_pipeline_yielded limit={} remaining_limit={}",
+                summary.limit,
+                summary.remaining_limit,
+            )
         return summary
 
     def _execute_pipeline_steps(
@@ -131,7 +150,18 @@ class LocationScorerOrchestrator:
                 progress.total = int(result.get("total", progress.processed))
                 progress.message = str(result)
                 emit_progress(deepcopy(summary))
-                duration_ms = int((time.perf_counter() - step_started) * 1000)
+                step_seconds = time.perf_counter() - step_started
+                duration_ms = int(step_seconds * 1000)
+                PIPELINE_STEP_SECONDS.observe(
+                    step_seconds,
+                    pipeline="location_scorer",
+                    step=step.value,
+                )
+                PIPELINE_STEP_ROWS_TOTAL.inc(
+                    progress.processed,
+                    pipeline="location_scorer",
+                    step=step.value,
+                )
                 self.logger.info(
                     "event=location_scorer_step_complete step={} processed={} duration_ms={}",
                     step,
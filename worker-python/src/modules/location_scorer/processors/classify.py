@@ -7,6 +7,7 @@ from typing import Any
 
 from loguru import logger
 
+from src.metrics import LOCATION_SCORER_INFERENCE_SECONDS
 from src.modules.location_scorer.config import LocationScorerConfig
 from src.modules.location_scorer.errors import LocationScorerProcessorError
 from src.modules.location_scorer.repository import LocationScorerRepository
@@ -44,15 +45,18 @@ class ClassifyProcessor:
         self,
         articles: list[dict[str, Any]],
         should_cancel: Callable[[], bool] | None = None,
+        should_yield: Callable[[], bool] | None = None,
     ) -> dict[str, object]:
         cancel_check = should_cancel or (lambda: False)
+        yield_check = should_yield or (lambda: False)
         if not articles:
-            return {"processed": 0, "scores": [], "skipped": 0}
+            return {"processed": 0, "scores": [], "skipped": 0, "yielded": False}
 
         classifier = _get_classifier()
         processed = 0
         skipped = 0
         scores: list[dict[str, Any]] = []
+        yielded = False
         checkpoint_interval = self.config.checkpoint_interval
 
         self.logger.info(
@@ -61,8 +65,17 @@ class ClassifyProcessor:
         )
 
         for index, article in enumerate(articles, start=1):
-            if index % checkpoint_interval == 0 and cancel_check():
-                raise LocationScorerProcessorError("Classify processor cancelled")
+            if index % checkpoint_interval == 0:
+                if cancel_check():
+                    raise LocationScorerProcessorError("Classify processor cancelled")
+                if yield_check():
+                    yielded = True
+                    self.logger.info(
+                        "event=location_scorer_classify_yielded consumed={} total={}",
+                        index - 1,
+                        len(articles),
+                    )
+                    break
 
             title = str(article.get("title") or "").strip()
             description = str(article.get("description") or "").strip()
@@ -71,7 +84,8 @@ class ClassifyProcessor:
                 continue
 
             text = f"{title}\n\n{description}".strip()
-            result = classifier(text, CLASSIFICATION_LABELS)
+            with LOCATION_SCORER_INFERENCE_SECONDS.time():
+                result = classifier(text, CLASSIFICATION_LABELS)
             labels = list(result["labels"])
             scores_raw = list(result["scores"])
 
@@ -97,4 +111,9 @@ class ClassifyProcessor:
             skipped,
         )
 
-        return {"processed": processed, "scores": scores, "skipped": skipped}
+        return {
+            "processed": processed,
+            "scores": scores,
+            "skipped": skipped,
+            "yielded": yielded,
+        }
@@ -10,6 +10,20 @@ from src.modules.location_scorer.config import LocationScorerConfig
 from src.modules.location_scorer.errors import LocationScorerDatabaseError
 
 
+UNSCORED_ARTICLE_FILTER = """
+NOT EXISTS (
+    SELECT 1
+    FROM ArticleEntityWhoCategorizedArticleContracts contract
+    WHERE contract.articleId = a.id
+      AND contract.entityWhoCategorizesId = ?
+)
+"""
+
+
+# Seconds to wait on a lock held by another queue job before raising.
+SQLITE_BUSY_TIMEOUT_SECONDS = 30
+
+
 class LocationScorerRepository:
     def __init__(self, config: LocationScorerConfig) -> None:
         self.config = config
@@ -22,7 +36,10 @@ class LocationScorerRepository:
                 raise LocationScorerDatabaseError(
                     f"Database not found at {self.sqlite_path}"
                 )
-            self._connection = sqlite3.connect(str(self.sqlite_path))
+            self._connection = sqlite3.connect(
+                str(self.sqlite_path),
+                timeout=SQLITE_BUSY_TIMEOUT_SECONDS,
+            )
             self._connection.row_factory = sqlite3.Row
 
         return self._connection
@@ -76,15 +93,10 @@ class LocationScorerRepository:
         entity_id: int,
         limit: int | None = None,
     ) -> list[dict[str, Any]]:
-        query = """
+        query = f"""
         SELECT a.id, a.title, a.description
         FROM Articles a
-        WHERE NOT EXISTS (
-            SELECT 1
-            FROM ArticleEntityWhoCategorizedArticleContracts contract
-            WHERE contract.articleId = a.id
-              AND contract.entityWhoCategorizesId = ?
-        )
+        WHERE {UNSCORED_ARTICLE_FILTER}
         ORDER BY a.id
         """
 
@@ -97,6 +109,18 @@ class LocationScorerRepository:
 
         return self.execute_query(query, params)
 
+    def get_unscored_article_watermark(self, entity_id: int) -> tuple[int, int] | None:
+        rows = self.execute_query(
+            f"""
+            SELECT COUNT(*) AS articleCount, MAX(a.id) AS maxArticleId
+            FROM Articles a
+            WHERE {UNSCORED_ARTICLE_FILTER}
+            """,
+            (entity_id,),
+        )
+        article_count = int(rows[0]["articleCount"])
+        return (article_count, int(rows[0]["maxArticleId"])) if article_count else None
+
     def write_scores_batch(
         self,
         entity_id: int,
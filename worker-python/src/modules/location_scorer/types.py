@@ -36,3 +36,4 @@ class PipelineSummary:
     steps: list[StepProgress] = field(default_factory=list)
     status: str = "pending"
     limit: int | None = None
+    remaining_limit: int | None = None
@@ -0,0 +1,175 @@
+from __future__ import annotations
+
+import json
+import re
+from collections.abc import Iterable
+from dataclasses import asdict
+from pathlib import Path
+from threading import Lock
+
+from src.modules.queue.config import (
+    DEFAULT_QUEUE_ARCHIVE_MAX_SEGMENTS,
+    DEFAULT_QUEUE_ARCHIVE_SEGMENT_MAX_JOBS,
+)
+from src.modules.queue.errors import QueueStoreError
+from src.modules.queue.records import parse_job_record
+from src.modules.queue.types import QueueJobRecord
+
+
+ARCHIVE_SEGMENT_PREFIX = "queue-jobs-archive-"
+ARCHIVE_SEGMENT_SUFFIX = ".jsonl"
+ARCHIVE_SEGMENT_PATTERN = re.compile(
+    rf"^{re.escape(ARCHIVE_SEGMENT_PREFIX)}(\d+){re.escape(ARCHIVE_SEGMENT_SUFFIX)}$"
+)
+
+
+def format_archive_segment_name(segment_number: int) -> str:
+    return f"{ARCHIVE_SEGMENT_PREFIX}{segment_number:06d}{ARCHIVE_SEGMENT_SUFFIX}"
+
+
+class QueueJobArchive:
+    """
+    Append-only archive for jobs pruned from the live queue store.
+
+    Jobs are written one per line into numbered JSONL segments. A segment is
+    rotated once it holds `segment_max_jobs` jobs and only the newest
+    `max_segments` segments are kept. Lookups scan segments newest first, so
+    they cost nothing until an archived job is actually requested.
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        segment_max_jobs: int = DEFAULT_QUEUE_ARCHIVE_SEGMENT_MAX_JOBS,
+        max_segments: int = DEFAULT_QUEUE_ARCHIVE_MAX_SEGMENTS,
+    ) -> None:
+        if segment_max_jobs <= 0:
+            raise ValueError("segment_max_jobs must be greater than 0")
+        if max_segments <= 0:
+            raise ValueError("max_segments must be greater than 0")
+
+        self._directory = directory
+        self._segment_max_jobs = segment_max_jobs
+        self._max_segments = max_segments
+        self._lock = Lock()
+        self._current_segment_number: int | None = None
+        self._current_segment_jobs = 0
+
+    @property
+    def directory(self) -> Path:
+        return self._directory
+
+    def get_segment_paths(self) -> list[Path]:
+        with self._lock:
+            return [path for _, path in self._list_segments_locked()]
+
+    def archive_jobs(self, jobs: Iterable[QueueJobRecord]) -> int:
+        pending_jobs = list(jobs)
+        archived_count = len(pending_jobs)
+        if archived_count == 0:
+            return 0
+
+        with self._lock:
+            self._load_current_segment_locked()
+            try:
+                self._directory.mkdir(parents=True, exist_ok=True)
+                while pending_jobs:
+                    if self._current_segment_jobs >= self._segment_max_jobs:
+                        self._rotate_locked()
+
+                    capacity = self._segment_max_jobs - self._current_segment_jobs
+                    batch, pending_jobs = pending_jobs[:capacity], pending_jobs[capacity:]
+                    payload = "".join(json.dumps(asdict(job)) + "\n" for job in batch)
+                    with self._current_segment_path_locked().open("a", encoding="utf-8") as segment:
+                        segment.write(payload)
+                    self._current_segment_jobs += len(batch)
+            except OSError as exc:
+                raise QueueStoreError(f"Failed to write queue job archive: {exc}") from exc
+
+            self._drop_expired_segments_locked()
+
+        return archived_count
+
+    def get_job_by_id(self, job_id: str) -> QueueJobRecord | None:
+        # Cheap substring probe before parsing, since most lines will not match.
+        needle = json.dumps({"jobId": job_id})[1:-1]
+        with self._lock:
+            segments = self._list_segments_locked()
+
+        for _, segment_path in reversed(segments):
+            try:
+                lines = segment_path.read_text(encoding="utf-8").splitlines()
+            except FileNotFoundError:
+                continue
+            except OSError as exc:
+                raise QueueStoreError(f"Failed to read queue job archive: {exc}") from exc
+
+            for line in reversed(lines):
+                if needle not in line:
+                    continue
+                try:
+                    job = parse_job_record(json.loads(line))
+                except json.JSONDecodeError:
+                    continue
+                if job.jobId == job_id:
+                    return job
+
+        return None
+
+    def _list_segments_locked(self) -> list[tuple[int, Path]]:
+        if not self._directory.exists():
+            return []
+
+        segments: list[tuple[int, Path]] = []
+        for path in self._directory.iterdir():
+            match = ARCHIVE_SEGMENT_PATTERN.match(path.name)
+            if match is not None:
+                segments.append((int(match.group(1)), path))
+        return sorted(segments)
+
+    def _load_current_segment_locked(self) -> None:
+        if self._current_segment_number is not None:
+            return
+
+        segments = self._list_segments_locked()
+        if not segments:
+            self._current_segment_number = 1
+            self._current_segment_jobs = 0
+            return
+
+        segment_number, segment_path = segments[-1]
+        try:
+            with segment_path.open("r", encoding="utf-8") as segment:
+                line_count = sum(1 for line in segment if line.strip() != "")
+        except OSError as exc:
+            raise QueueStoreError(f"Failed to read queue job archive: {exc}") from exc
+
+        self._current_segment_number = segment_number
+        self._current_segment_jobs = line_count
+
+    def _current_segment_path_locked(self) -> Path:
+        return self._directory / format_archive_segment_name(self._current_segment_number or 1)
+
+    def _rotate_locked(self) -> None:
+        self._current_segment_number = (self._current_segment_number or 0) + 1
+        self._current_segment_jobs = 0
+
+    def _drop_expired_segments_locked(self) -> None:
+        segments = self._list_segments_locked()
+        for _, segment_path in segments[: max(0, len(segments) - self._max_segments)]:
+            try:
+                segment_path.unlink(missing_ok=True)
+            except OSError as exc:
+                raise QueueStoreError(f"Failed to rotate queue job archive: {exc}") from exc
+
+
+def create_queue_job_archive(
+    directory: Path,
+    segment_max_jobs: int = DEFAULT_QUEUE_ARCHIVE_SEGMENT_MAX_JOBS,
+    max_segments: int = DEFAULT_QUEUE_ARCHIVE_MAX_SEGMENTS,
+) -> QueueJobArchive:
+    return QueueJobArchive(
+        directory=directory,
+        segment_max_jobs=segment_max_jobs,
+        max_segments=max_segments,
+    )
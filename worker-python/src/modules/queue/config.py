@@ -1,14 +1,134 @@
 from __future__ import annotations
 
+import json
 import os
+from dataclasses import dataclass, field
+from enum import StrEnum
 from pathlib import Path
+from typing import Any
 
+from src.modules.queue.cron import CronSchedule
 from src.modules.queue.errors import QueueConfigError
 
 
 QUEUE_UTILITIES_ENV_KEY = "PATH_UTILTIES"
 QUEUE_JOBS_FILENAME = "queue-jobs.json"
+QUEUE_SQLITE_FILENAME = "queue-jobs.sqlite3"
+QUEUE_STORE_BACKEND_ENV_KEY = "QUEUE_STORE_BACKEND"
 QUEUE_WORKER_SUBDIR = "worker-python"
+QUEUE_JOURNAL_COMPACT_THRESHOLD_ENV_KEY = "QUEUE_JOURNAL_COMPACT_THRESHOLD"
+DEFAULT_QUEUE_JOURNAL_COMPACT_THRESHOLD = 1000
+QUEUE_ARCHIVE_SUBDIR = "queue-archive"
+QUEUE_RETENTION_MAX_AGE_HOURS_ENV_KEY = "QUEUE_RETENTION_MAX_AGE_HOURS"
+QUEUE_RETENTION_FAILED_MAX_AGE_HOURS_ENV_KEY = "QUEUE_RETENTION_FAILED_MAX_AGE_HOURS"
+QUEUE_RETENTION_MAX_JOBS_PER_ENDPOINT_ENV_KEY = "QUEUE_RETENTION_MAX_JOBS_PER_ENDPOINT"
+QUEUE_RETENTION_INTERVAL_SECONDS_ENV_KEY = "QUEUE_RETENTION_INTERVAL_SECONDS"
+QUEUE_ARCHIVE_SEGMENT_MAX_JOBS_ENV_KEY = "QUEUE_ARCHIVE_SEGMENT_MAX_JOBS"
+QUEUE_ARCHIVE_MAX_SEGMENTS_ENV_KEY = "QUEUE_ARCHIVE_MAX_SEGMENTS"
+# Retention is opt-in: 0 keeps every finished job.
+DEFAULT_QUEUE_RETENTION_MAX_AGE_HOURS = 0
+DEFAULT_QUEUE_RETENTION_FAILED_MAX_AGE_HOURS = 0
+DEFAULT_QUEUE_RETENTION_MAX_JOBS_PER_ENDPOINT = 0
+DEFAULT_QUEUE_RETENTION_INTERVAL_SECONDS = 300
+DEFAULT_QUEUE_ARCHIVE_SEGMENT_MAX_JOBS = 1000
+DEFAULT_QUEUE_ARCHIVE_MAX_SEGMENTS = 20
+QUEUE_MAX_WORKERS_ENV_KEY = "QUEUE_MAX_WORKERS"
+QUEUE_ENDPOINT_CONCURRENCY_ENV_KEY = "QUEUE_ENDPOINT_CONCURRENCY"
+QUEUE_EXCLUSIVE_GROUPS_ENV_KEY = "QUEUE_EXCLUSIVE_GROUPS"
+# One job at a time against the shared database unless a deployment opts in.
+DEFAULT_QUEUE_MAX_WORKERS = 1
+DEFAULT_QUEUE_ENDPOINT_CONCURRENCY = 1
+DEFAULT_QUEUE_MAX_PRIORITY_BYPASSES = 5
+# Both AI approver jobs write the same score tables.
+DEFAULT_QUEUE_EXCLUSIVE_GROUPS = (
+    frozenset({"/ai-approver/start-job", "/ai-approver/review-page/start-job"}),
+)
+QUEUE_PROCESS_ENDPOINTS_ENV_KEY = "QUEUE_PROCESS_ENDPOINTS"
+QUEUE_PROCESS_POOL_SIZE_ENV_KEY = "QUEUE_PROCESS_POOL_SIZE"
+# Process mode is opt-in, e.g. "/deduper/start-job,/location-scorer/start-job".
+DEFAULT_QUEUE_PROCESS_ENDPOINTS: tuple[str, ...] = ()
+DEFAULT_QUEUE_PROCESS_POOL_SIZE = 2
+QUEUE_PROGRESS_FLUSH_INTERVAL_SECONDS_ENV_KEY = "QUEUE_PROGRESS_FLUSH_INTERVAL_SECONDS"
+DEFAULT_QUEUE_PROGRESS_FLUSH_INTERVAL_SECONDS = 1.0
+QUEUE_SCHEDULES_ENV_KEY = "QUEUE_SCHEDULES"
+QUEUE_SCHEDULER_TICK_SECONDS_ENV_KEY = "QUEUE_SCHEDULER_TICK_SECONDS"
+DEFAULT_QUEUE_SCHEDULER_TICK_SECONDS = 30
+QUEUE_JOB_TIMEOUT_SECONDS_ENV_KEY = "QUEUE_JOB_TIMEOUT_SECONDS"
+QUEUE_JOB_TIMEOUTS_ENV_KEY = "QUEUE_JOB_TIMEOUTS"
+QUEUE_JOB_HEARTBEAT_TIMEOUT_SECONDS_ENV_KEY = "QUEUE_JOB_HEARTBEAT_TIMEOUT_SECONDS"
+QUEUE_JOB_CANCEL_GRACE_SECONDS_ENV_KEY = "QUEUE_JOB_CANCEL_GRACE_SECONDS"
+QUEUE_WATCHDOG_INTERVAL_SECONDS_ENV_KEY = "QUEUE_WATCHDOG_INTERVAL_SECONDS"
+# The watchdog is opt-in: 0 leaves jobs to run as long as they need.
+DEFAULT_QUEUE_JOB_TIMEOUT_SECONDS = 0
+DEFAULT_QUEUE_JOB_HEARTBEAT_TIMEOUT_SECONDS = 0
+DEFAULT_QUEUE_JOB_CANCEL_GRACE_SECONDS = 60
+DEFAULT_QUEUE_WATCHDOG_INTERVAL_SECONDS = 15
+
+
+class QueueStoreBackend(StrEnum):
+    JSON = "json"
+    SQLITE = "sqlite"
+
+
+@dataclass(slots=True)
+class QueueRetentionPolicy:
+    """Limits on finished job history; 0 disables a limit."""
+
+    max_age_hours: int = DEFAULT_QUEUE_RETENTION_MAX_AGE_HOURS
+    failed_max_age_hours: int = DEFAULT_QUEUE_RETENTION_FAILED_MAX_AGE_HOURS
+    max_jobs_per_endpoint: int = DEFAULT_QUEUE_RETENTION_MAX_JOBS_PER_ENDPOINT
+    interval_seconds: int = DEFAULT_QUEUE_RETENTION_INTERVAL_SECONDS
+
+    @property
+    def enabled(self) -> bool:
+        return (
+            self.max_age_hours > 0
+            or self.failed_max_age_hours > 0
+            or self.max_jobs_per_endpoint > 0
+        )
+
+
+@dataclass(slots=True)
+class QueueConcurrencyPolicy:
+    max_workers: int = 1
+    default_endpoint_limit: int = DEFAULT_QUEUE_ENDPOINT_CONCURRENCY
+    endpoint_limits: dict[str, int] = field(default_factory=dict)
+    exclusive_groups: list[frozenset[str]] = field(default_factory=list)
+    max_priority_bypasses: int = DEFAULT_QUEUE_MAX_PRIORITY_BYPASSES
+
+    def get_endpoint_limit(self, endpoint_name: str) -> int:
+        return self.endpoint_limits.get(endpoint_name, self.default_endpoint_limit)
+
+
+@dataclass(slots=True)
+class QueueTimeoutPolicy:
+    """Run deadlines and heartbeat limits enforced by the watchdog; 0 disables a limit."""
+
+    default_timeout_seconds: float = DEFAULT_QUEUE_JOB_TIMEOUT_SECONDS
+    endpoint_timeouts: dict[str, int] = field(default_factory=dict)
+    heartbeat_timeout_seconds: float = DEFAULT_QUEUE_JOB_HEARTBEAT_TIMEOUT_SECONDS
+    cancel_grace_seconds: float = DEFAULT_QUEUE_JOB_CANCEL_GRACE_SECONDS
+    interval_seconds: int = DEFAULT_QUEUE_WATCHDOG_INTERVAL_SECONDS
+
+    @property
+    def enabled(self) -> bool:
+        return (
+            self.default_timeout_seconds > 0
+            or self.heartbeat_timeout_seconds > 0
+            or any(timeout > 0 for timeout in self.endpoint_timeouts.values())
+        )
+
+    def get_timeout_seconds(self, endpoint_name: str) -> float:
+        return self.endpoint_timeouts.get(endpoint_name, self.default_timeout_seconds)
+
+
+@dataclass(slots=True)
+class QueueScheduleDefinition:
+    name: str
+    endpoint_name: str
+    parameters: dict[str, Any] = field(default_factory=dict)
+    interval_seconds: int | None = None
+    cron: CronSchedule | None = None
 
 
 def get_path_utilities() -> Path:
@@ -23,8 +143,298 @@ def resolve_queue_jobs_path() -> Path:
     return get_path_utilities() / QUEUE_WORKER_SUBDIR / QUEUE_JOBS_FILENAME
 
 
+def resolve_queue_sqlite_path() -> Path:
+    return get_path_utilities() / QUEUE_WORKER_SUBDIR / QUEUE_SQLITE_FILENAME
+
+
+def resolve_queue_archive_dir() -> Path:
+    return get_path_utilities() / QUEUE_WORKER_SUBDIR / QUEUE_ARCHIVE_SUBDIR
+
+
+def resolve_queue_store_backend() -> QueueStoreBackend:
+    raw_value = os.getenv(QUEUE_STORE_BACKEND_ENV_KEY, "").strip().lower()
+    if raw_value == "":
+        return QueueStoreBackend.JSON
+
+    try:
+        return QueueStoreBackend(raw_value)
+    except ValueError as exc:
+        allowed_values = ", ".join(backend.value for backend in QueueStoreBackend)
+        raise QueueConfigError(
+            f"{QUEUE_STORE_BACKEND_ENV_KEY} must be one of: {allowed_values}"
+        ) from exc
+
+
+def _parse_positive_int_env(key: str, default: int) -> int:
+    raw_value = os.getenv(key, "").strip()
+    if raw_value == "":
+        return default
+
+    try:
+        parsed = int(raw_value)
+    except ValueError as exc:
+        raise QueueConfigError(f"{key} must be an integer") from exc
+
+    if parsed <= 0:
+        raise QueueConfigError(f"{key} must be > 0")
+
+    return parsed
+
+
+def _parse_non_negative_int_env(key: str, default: int) -> int:
+    raw_value = os.getenv(key, "").strip()
+    if raw_value == "":
+        return default
+
+    try:
+        parsed = int(raw_value)
+    except ValueError as exc:
+        raise QueueConfigError(f"{key} must be an integer") from exc
+
+    if parsed < 0:
+        raise QueueConfigError(f"{key} must be >= 0")
+
+    return parsed
+
+
+def _parse_non_negative_float_env(key: str, default: float) -> float:
+    raw_value = os.getenv(key, "").strip()
+    if raw_value == "":
+        return default
+
+    try:
+        parsed = float(raw_value)
+    except ValueError as exc:
+        raise QueueConfigError(f"{key} must be a number") from exc
+
+    if parsed < 0:
+        raise QueueConfigError(f"{key} must be >= 0")
+
+    return parsed
+
+
+def resolve_queue_journal_compact_threshold() -> int:
+    return _parse_positive_int_env(
+        QUEUE_JOURNAL_COMPACT_THRESHOLD_ENV_KEY,
+        DEFAULT_QUEUE_JOURNAL_COMPACT_THRESHOLD,
+    )
+
+
+def resolve_queue_retention_policy() -> QueueRetentionPolicy:
+    return QueueRetentionPolicy(
+        max_age_hours=_parse_non_negative_int_env(
+            QUEUE_RETENTION_MAX_AGE_HOURS_ENV_KEY,
+            DEFAULT_QUEUE_RETENTION_MAX_AGE_HOURS,
+        ),
+        failed_max_age_hours=_parse_non_negative_int_env(
+            QUEUE_RETENTION_FAILED_MAX_AGE_HOURS_ENV_KEY,
+            DEFAULT_QUEUE_RETENTION_FAILED_MAX_AGE_HOURS,
+        ),
+        max_jobs_per_endpoint=_parse_non_negative_int_env(
+            QUEUE_RETENTION_MAX_JOBS_PER_ENDPOINT_ENV_KEY,
+            DEFAULT_QUEUE_RETENTION_MAX_JOBS_PER_ENDPOINT,
+        ),
+        interval_seconds=_parse_positive_int_env(
+            QUEUE_RETENTION_INTERVAL_SECONDS_ENV_KEY,
+            DEFAULT_QUEUE_RETENTION_INTERVAL_SECONDS,
+        ),
+    )
+
+
+def resolve_queue_archive_segment_max_jobs() -> int:
+    return _parse_positive_int_env(
+        QUEUE_ARCHIVE_SEGMENT_MAX_JOBS_ENV_KEY,
+        DEFAULT_QUEUE_ARCHIVE_SEGMENT_MAX_JOBS,
+    )
+
+
+def resolve_queue_archive_max_segments() -> int:
+    return _parse_positive_int_env(
+        QUEUE_ARCHIVE_MAX_SEGMENTS_ENV_KEY,
+        DEFAULT_QUEUE_ARCHIVE_MAX_SEGMENTS,
+    )
+
+
+def _parse_endpoint_limits_env(key: str) -> dict[str, int]:
+    endpoint_limits: dict[str, int] = {}
+    raw_value = os.getenv(key, "").strip()
+    for raw_entry in raw_value.split(","):
+        if raw_entry.strip() == "":
+            continue
+
+        endpoint_name, separator, raw_limit = raw_entry.partition("=")
+        if separator == "" or endpoint_name.strip() == "":
+            raise QueueConfigError(f"{key} entries must look like <endpointName>=<limit>")
+
+        try:
+            limit = int(raw_limit.strip())
+        except ValueError as exc:
+            raise QueueConfigError(f"{key} limits must be integers") from exc
+
+        if limit <= 0:
+            raise QueueConfigError(f"{key} limits must be > 0")
+
+        endpoint_limits[endpoint_name.strip()] = limit
+
+    return endpoint_limits
+
+
+def _parse_exclusive_groups_env(key: str) -> list[frozenset[str]]:
+    raw_value = os.getenv(key)
+    if raw_value is None:
+        return list(DEFAULT_QUEUE_EXCLUSIVE_GROUPS)
+
+    exclusive_groups: list[frozenset[str]] = []
+    raw_value = raw_value.strip()
+    for raw_group in raw_value.split(";"):
+        members = frozenset(
+            member.strip() for member in raw_group.split(",") if member.strip() != ""
+        )
+        if members:
+            exclusive_groups.append(members)
+
+    return exclusive_groups
+
+
+def resolve_queue_concurrency_policy() -> QueueConcurrencyPolicy:
+    return QueueConcurrencyPolicy(
+        max_workers=_parse_positive_int_env(QUEUE_MAX_WORKERS_ENV_KEY, DEFAULT_QUEUE_MAX_WORKERS),
+        endpoint_limits=_parse_endpoint_limits_env(QUEUE_ENDPOINT_CONCURRENCY_ENV_KEY),
+        exclusive_groups=_parse_exclusive_groups_env(QUEUE_EXCLUSIVE_GROUPS_ENV_KEY),
+    )
+
+
+def resolve_queue_timeout_policy() -> QueueTimeoutPolicy:
+    return QueueTimeoutPolicy(
+        default_timeout_seconds=_parse_non_negative_float_env(
+            QUEUE_JOB_TIMEOUT_SECONDS_ENV_KEY,
+            DEFAULT_QUEUE_JOB_TIMEOUT_SECONDS,
+        ),
+        endpoint_timeouts=_parse_endpoint_limits_env(QUEUE_JOB_TIMEOUTS_ENV_KEY),
+        heartbeat_timeout_seconds=_parse_non_negative_float_env(
+            QUEUE_JOB_HEARTBEAT_TIMEOUT_SECONDS_ENV_KEY,
+            DEFAULT_QUEUE_JOB_HEARTBEAT_TIMEOUT_SECONDS,
+        ),
+        cancel_grace_seconds=_parse_non_negative_float_env(
+            QUEUE_JOB_CANCEL_GRACE_SECONDS_ENV_KEY,
+            DEFAULT_QUEUE_JOB_CANCEL_GRACE_SECONDS,
+        ),
+        interval_seconds=_parse_positive_int_env(
+            QUEUE_WATCHDOG_INTERVAL_SECONDS_ENV_KEY,
+            DEFAULT_QUEUE_WATCHDOG_INTERVAL_SECONDS,
+        ),
+    )
+
+
+def resolve_queue_process_endpoints() -> frozenset[str]:
+    raw_value = os.getenv(QUEUE_PROCESS_ENDPOINTS_ENV_KEY, "").strip()
+    if raw_value == "":
+        return frozenset(DEFAULT_QUEUE_PROCESS_ENDPOINTS)
+
+    return frozenset(
+        endpoint_name.strip() for endpoint_name in raw_value.split(",") if endpoint_name.strip() != ""
+    )
+
+
+def resolve_queue_process_pool_size() -> int:
+    return _parse_positive_int_env(QUEUE_PROCESS_POOL_SIZE_ENV_KEY, DEFAULT_QUEUE_PROCESS_POOL_SIZE)
+
+
+def resolve_queue_progress_flush_interval_seconds() -> float:
+    return _parse_non_negative_float_env(
+        QUEUE_PROGRESS_FLUSH_INTERVAL_SECONDS_ENV_KEY,
+        DEFAULT_QUEUE_PROGRESS_FLUSH_INTERVAL_SECONDS,
+    )
+
+
+def _parse_schedule_entry(raw_entry: object) -> QueueScheduleDefinition:
+    key = QUEUE_SCHEDULES_ENV_KEY
+    if not isinstance(raw_entry, dict):
+        raise QueueConfigError(f"{key} entries must be objects")
+
+    endpoint_name = raw_entry.get("endpointName")
+    if not isinstance(endpoint_name, str) or endpoint_name.strip() == "":
+        raise QueueConfigError(f"{key} entries need a non-empty endpointName")
+
+    name = raw_entry.get("name", endpoint_name)
+    if not isinstance(name, str) or name.strip() == "":
+        raise QueueConfigError(f"{key} entry names must be non-empty strings")
+
+    parameters = raw_entry.get("parameters", {})
+    if not isinstance(parameters, dict):
+        raise QueueConfigError(f"{key} entry {name} parameters must be an object")
+
+    interval_seconds = raw_entry.get("intervalSeconds")
+    raw_cron = raw_entry.get("cron")
+    if (interval_seconds is None) == (raw_cron is None):
+        raise QueueConfigError(f"{key} entry {name} needs exactly one of intervalSeconds or cron")
+
+    if interval_seconds is not None and (
+        isinstance(interval_seconds, bool)
+        or not isinstance(interval_seconds, int)
+        or interval_seconds <= 0
+    ):
+        raise QueueConfigError(f"{key} entry {name} intervalSeconds must be an integer > 0")
+
+    cron: CronSchedule | None = None
+    if raw_cron is not None:
+        if not isinstance(raw_cron, str):
+            raise QueueConfigError(f"{key} entry {name} cron must be a string")
+        try:
+            cron = CronSchedule.parse(raw_cron)
+        except ValueError as exc:
+            raise QueueConfigError(f"{key} entry {name} has an invalid cron: {exc}") from exc
+
+    return QueueScheduleDefinition(
+        name=name.strip(),
+        endpoint_name=endpoint_name.strip(),
+        parameters=parameters,
+        interval_seconds=interval_seconds,
+        cron=cron,
+    )
+
+
+def resolve_queue_schedules() -> list[QueueScheduleDefinition]:
+    raw_value = os.getenv(QUEUE_SCHEDULES_ENV_KEY, "").strip()
+    if raw_value == "":
+        return []
+
+    try:
+        raw_entries = json.loads(raw_value)
+    except json.JSONDecodeError as exc:
+        raise QueueConfigError(f"{QUEUE_SCHEDULES_ENV_KEY} must be a JSON array") from exc
+
+    if not isinstance(raw_entries, list):
+        raise QueueConfigError(f"{QUEUE_SCHEDULES_ENV_KEY} must be a JSON array")
+
+    schedules = [_parse_schedule_entry(raw_entry) for raw_entry in raw_entries]
+    schedule_names = [schedule.name for schedule in schedules]
+    if len(set(schedule_names)) != len(schedule_names):
+        raise QueueConfigError(f"{QUEUE_SCHEDULES_ENV_KEY} schedule names must be unique")
+
+    return schedules
+
+
+def resolve_queue_scheduler_tick_seconds() -> int:
+    return _parse_positive_int_env(
+        QUEUE_SCHEDULER_TICK_SECONDS_ENV_KEY,
+        DEFAULT_QUEUE_SCHEDULER_TICK_SECONDS,
+    )
+
+
 def validate_queue_startup_env() -> None:
     get_path_utilities()
+    resolve_queue_store_backend()
+    resolve_queue_journal_compact_threshold()
+    resolve_queue_retention_policy()
+    resolve_queue_archive_segment_max_jobs()
+    resolve_queue_archive_max_segments()
+    resolve_queue_concurrency_policy()
+    resolve_queue_timeout_policy()
+    resolve_queue_process_pool_size()
+    resolve_queue_progress_flush_interval_seconds()
+    resolve_queue_schedules()
+    resolve_queue_scheduler_tick_seconds()
 
 
 def resolve_default_queue_store_path() -> Path:
@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass
+from multiprocessing.synchronize import Event as ProcessEvent
+from threading import Event
+from typing import Any, Protocol
+
+
+JobResultFields = dict[str, str | int | float | bool | None]
+QueueResumeCursor = dict[str, Any]
+
+
+def get_error_message(error: Exception) -> str:
+    message = str(error).strip()
+    if message != "":
+        return message
+
+    return "job_failed"
+
+
+class QueueJobCanceledError(Exception):
+    """Raised when a running queue job exits because cancellation was requested."""
+
+
+class QueueJobYieldedError(Exception):
+    """Raised when a preemptible job stops at a checkpoint so higher priority work can run."""
+
+    def __init__(self, cursor: QueueResumeCursor | None = None) -> None:
+        super().__init__("job_yielded")
+        self.cursor = cursor
+
+
+class QueueJobReporter(Protocol):
+    def append_log(self, message: str) -> None: ...
+
+    def update_result(self, fields: JobResultFields) -> None: ...
+
+    def save_checkpoint(self, cursor: QueueResumeCursor) -> None: ...
+
+
+@dataclass(slots=True)
+class QueueExecutionContext:
+    jobId: str
+    endpointName: str
+    cancelEvent: Event | ProcessEvent
+    reporter: QueueJobReporter | None = None
+    yieldEvent: Event | ProcessEvent | None = None
+    resumeCursor: QueueResumeCursor | None = None
+    onStage: Callable[[str], None] | None = None
+    onHeartbeat: Callable[[], None] | None = None
+
+    def heartbeat(self) -> None:
+        """
+        Tell the queue watchdog this job is still making progress.
+
+        Logging, result updates, checkpoints, stage changes and cancellation
+        checks all count, so handlers only need to call this directly around
+        long stretches that do none of those.
+        """
+        if self.onHeartbeat is not None:
+            self.onHeartbeat()
+
+    def is_cancel_requested(self) -> bool:
+        self.heartbeat()
+        return self.cancelEvent.is_set()
+
+    def is_yield_requested(self) -> bool:
+        return self.yieldEvent is not None and self.yieldEvent.is_set()
+
+    def enter_stage(self, stage: str) -> None:
+        self.heartbeat()
+        if self.onStage is not None:
+            self.onStage(stage)
+
+    def append_log(self, message: str) -> None:
+        self.heartbeat()
+        if self.reporter is not None:
+            self.reporter.append_log(message)
+
+    def update_result(self, fields: JobResultFields) -> None:
+        self.heartbeat()
+        if self.reporter is not None:
+            self.reporter.update_result(fields)
+
+    def save_checkpoint(self, cursor: QueueResumeCursor) -> None:
+        """Persist the point a restarted worker should resume this job from."""
+        self.heartbeat()
+        if self.reporter is not None:
+            self.reporter.save_checkpoint(cursor)
@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+
+
+# (minimum, maximum) per field: minute, hour, day of month, month, day of week.
+CRON_FIELD_RANGES = ((0, 59), (0, 23), (1, 31), (1, 12), (0, 7))
+CRON_FIELD_NAMES = ("minute", "hour", "day of month", "month", "day of week")
+# Far enough ahead for any satisfiable expression, including Feb 29 on a given weekday.
+CRON_SEARCH_HORIZON = timedelta(days=366 * 28)
+
+
+def _parse_cron_value(raw_value: str, field_name: str, minimum: int, maximum: int) -> int:
+    if not raw_value.isdigit():
+        raise ValueError(f"cron {field_name} must be a number, got {raw_value!r}")
+
+    value = int(raw_value)
+    if value < minimum or value > maximum:
+        raise ValueError(f"cron {field_name} must be between {minimum} and {maximum}")
+
+    return value
+
+
+def _parse_cron_field(
+    raw_field: str,
+    field_name: str,
+    minimum: int,
+    maximum: int,
+) -> frozenset[int]:
+    values: set[int] = set()
+    for item in raw_field.split(","):
+        range_part, separator, raw_step = item.partition("/")
+        step = _parse_cron_value(raw_step, field_name, 1, maximum) if separator else 1
+
+        if range_part == "*":
+            start, end = minimum, maximum
+        elif "-" in range_part:
+            raw_start, _, raw_end = range_part.partition("-")
+            start = _parse_cron_value(raw_start, field_name, minimum, maximum)
+            end = _parse_cron_value(raw_end, field_name, minimum, maximum)
+            if start > end:
+                raise ValueError(f"cron {field_name} range {range_part!r} is reversed")
+        else:
+            start = _parse_cron_value(range_part, field_name, minimum, maximum)
+            end = maximum if separator else start
+
+        values.update(range(start, end + 1, step))
+
+    return frozenset(values)
+
+
+@dataclass(frozen=True, slots=True)
+class CronSchedule:
+    """
+    Five-field cron expression: minute, hour, day of month, month, day of week.
+
+    Fields accept `*`, numbers, `a-b` ranges, `/n` steps and comma lists; day
+    of week runs from 0 (Sunday) to 7 (Sunday again). As in cron, when both
+    day fields are restricted a day matching either one fires. Times are
+    evaluated in the timezone of the datetime passed to `next_after`.
+    """
+
+    expression: str
+    minutes: frozenset[int]
+    hours: frozenset[int]
+    days: frozenset[int]
+    months: frozenset[int]
+    weekdays: frozenset[int]
+    daysRestricted: bool
+    weekdaysRestricted: bool
+
+    @classmethod
+    def parse(cls, expression: str) -> CronSchedule:
+        raw_fields = expression.split()
+        if len(raw_fields) != len(CRON_FIELD_RANGES):
+            raise ValueError("cron expression must have 5 fields")
+
+        minutes, hours, days, months, weekdays = (
+            _parse_cron_field(raw_field, field_name, minimum, maximum)
+            for raw_field, field_name, (minimum, maximum) in zip(
+                raw_fields,
+                CRON_FIELD_NAMES,
+                CRON_FIELD_RANGES,
+            )
+        )
+        return cls(
+            expression=" ".join(raw_fields),
+            minutes=minutes,
+            hours=hours,
+            days=days,
+            months=months,
+            weekdays=frozenset(weekday % 7 for weekday in weekdays),
+            daysRestricted=raw_fields[2] != "*",
+            weekdaysRestricted=raw_fields[4] != "*",
+        )
+
+    def next_after(self, moment: datetime) -> datetime:
+        candidate = moment.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        horizon = candidate + CRON_SEARCH_HORIZON
+        while candidate < horizon:
+            if candidate.month not in self.months:
+                candidate = (candidate.replace(day=1) + timedelta(days=32)).replace(
+                    day=1,
+                    hour=0,
+                    minute=0,
+                )
+            elif not self._matches_day(candidate):
+                candidate = candidate.replace(hour=0, minute=0) + timedelta(days=1)
+            elif candidate.hour not in self.hours:
+                candidate = candidate.replace(minute=0) + timedelta(hours=1)
+            elif candidate.minute not in self.minutes:
+                candidate += timedelta(minutes=1)
+            else:
+                return candidate
+
+        raise ValueError("cron expression never fires")
+
+    def _matches_day(self, candidate: datetime) -> bool:
+        day_matches = candidate.day in self.days
+        # datetime.weekday() counts from Monday; cron counts from Sunday.
+        weekday_matches = (candidate.weekday() + 1) % 7 in self.weekdays
+        if self.daysRestricted and self.weekdaysRestricted:
+            return day_matches or weekday_matches
+
+        return day_matches and weekday_matches
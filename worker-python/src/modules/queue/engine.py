@@ -1,43 +1,53 @@
 from __future__ import annotations
 
+import asyncio
+import json
+from collections import deque
 from collections.abc import Callable
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from threading import Condition, Event, Lock, Thread
+from time import monotonic
 
-from src.modules.queue.job_ids import get_next_job_id
+from src.metrics import QUEUE_JOB_RUN_SECONDS, QUEUE_JOB_WAIT_SECONDS, QUEUE_JOBS_FINISHED_TOTAL
+from src.modules.queue.archive import QueueJobArchive
+from src.modules.queue.config import QueueConcurrencyPolicy
+from src.modules.queue.events import QueueEventBus, QueueJobEventType
+from src.modules.queue.handlers import QueueJobHandlerRegistry
+from src.modules.queue.context import (
+    QueueExecutionContext,
+    QueueJobCanceledError,
+    QueueJobYieldedError,
+    QueueResumeCursor,
+    get_error_message,
+)
+from src.modules.queue.job_logs import QueueJobLogPage, slice_job_log_page
+from src.modules.queue.listing import QueueJobListQuery, QueueJobPage
+from src.modules.queue.process_pool import QueueProcessPool, QueueProcessTarget
+from src.modules.queue.progress import BufferedJobReporter
 from src.modules.queue.status import QueueStatusView, get_check_status_by_job_id, get_queue_status
-from src.modules.queue.store import QueueJobStore
-from src.modules.queue.types import QueueJobRecord, QueueJobStatus
+from src.modules.queue.store import QueueJobStoreBackend
+from src.modules.queue.types import (
+    QUEUE_PRIORITY_ORDER,
+    TERMINAL_JOB_STATUSES,
+    QueueJobPriority,
+    QueueJobRecord,
+    QueueJobStatus,
+)
 
 
 def utc_now_iso() -> str:
     return datetime.now(timezone.utc).isoformat()
 
 
-def _get_error_message(error: Exception) -> str:
-    message = str(error).strip()
-    if message != "":
-        return message
-
-    return "job_failed"
-
-
-class QueueJobCanceledError(Exception):
-    """Raised when a running queue job exits because cancellation was requested."""
-
-
-@dataclass(slots=True)
-class QueueExecutionContext:
-    jobId: str
-    endpointName: str
-    cancelEvent: Event
-
-    def is_cancel_requested(self) -> bool:
-        return self.cancelEvent.is_set()
+QueueJobHandler = Callable[[QueueExecutionContext], None]
 
 
-QueueJobHandler = Callable[[QueueExecutionContext], None]
+def build_coalesce_key(
+    endpoint_name: str,
+    parameters: dict[str, str | int | float | bool | None] | None,
+) -> str:
+    return f"{endpoint_name} {json.dumps(parameters or {}, sort_keys=True)}"
 
 
 @dataclass(slots=True)
@@ -45,12 +55,18 @@ class EnqueueJobInput:
     endpointName: str
     run: QueueJobHandler
     parameters: dict[str, str | int | float | bool | None] | None = None
+    processTarget: QueueProcessTarget | None = None
+    priority: QueueJobPriority = QueueJobPriority.NORMAL
+    preemptible: bool = False
+    coalesce: bool = False
+    coalesceUntilStage: str | None = None
 
 
 @dataclass(slots=True)
 class EnqueueJobResult:
     jobId: str
     status: str
+    coalesced: bool = False
 
 
 @dataclass(slots=True)
@@ -59,230 +75,732 @@ class CancelJobResult:
     outcome: str
 
 
+@dataclass(slots=True)
+class WaitJobResult:
+    job: QueueJobRecord
+    changed: bool
+
+
+@dataclass(slots=True)
+class JobStatusWaiter:
+    condition: Condition
+    status: QueueJobStatus | None = None
+    waiterCount: int = 0
+
+
 @dataclass(slots=True)
 class PendingQueueItem:
     jobId: str
     endpointName: str
     run: QueueJobHandler
     parameters: dict[str, str | int | float | bool | None] | None
+    processTarget: QueueProcessTarget | None = None
+    priority: QueueJobPriority = QueueJobPriority.NORMAL
+    preemptible: bool = False
+    resumeCursor: QueueResumeCursor | None = None
+    coalesceKey: str | None = None
+    coalesceUntilStage: str | None = None
+    sequence: int = 0
+    readyAt: float = 0.0
+    canceled: bool = False
 
 
 @dataclass(slots=True)
 class ActiveJobState:
     jobId: str
+    endpointName: str
     cancelEvent: Event
     cancelRequested: bool = False
+    priority: QueueJobPriority = QueueJobPriority.NORMAL
+    preemptible: bool = False
+    yieldEvent: Event = field(default_factory=Event)
+    coalesceKey: str | None = None
+    startedAt: float = field(default_factory=monotonic)
+    lastHeartbeatAt: float = field(default_factory=monotonic)
+    expiredAt: float | None = None
+    expireReason: str | None = None
+    abandonEvent: Event = field(default_factory=Event)
+    outcomeLock: Lock = field(default_factory=Lock)
+    finished: bool = False
+    runsInProcess: bool = False
+    reporter: BufferedJobReporter | None = None
+
+    def record_heartbeat(self) -> None:
+        self.lastHeartbeatAt = monotonic()
+
+
+@dataclass(slots=True)
+class ActiveJobHealth:
+    jobId: str
+    endpointName: str
+    startedAt: float
+    lastHeartbeatAt: float
+    expiredAt: float | None = None
+    expireReason: str | None = None
 
 
 class GlobalQueueEngine:
+    """
+    Queue engine that runs up to `concurrency.max_workers` jobs at once.
+
+    A pending job starts only while its endpoint is below its concurrency
+    limit and no other member of one of its exclusive groups is running.
+
+    Pending jobs sit in one deque per (priority, endpoint) plus a jobId map,
+    so enqueue, dequeue and cancel are O(1) in the queue length; canceled
+    entries are dropped lazily when they reach the head of their deque. Higher
+    priority classes run first and each class is FIFO. A lower class that has
+    been passed over `max_priority_bypasses` times in a row gets the next slot,
+    so bulk work cannot starve.
+
+    When a pending job is blocked only by a running preemptible job of a lower
+    priority class, that job's yield event is set. A handler that stops at its
+    next checkpoint raises `QueueJobYieldedError` with a resume cursor; the job
+    goes back to the head of its class as queued and its next run receives the
+    cursor through `QueueExecutionContext.resumeCursor`.
+
+    Jobs enqueued with `coalesce=True` are keyed by endpoint and canonical
+    parameters. While a job with the same key is queued, or running and has
+    not yet entered its `coalesceUntilStage`, enqueue returns that job instead
+    of starting another run.
+
+    Without `handlers`, jobs a previous process left queued or running are
+    marked failed on construction. With `handlers`, `recover_incomplete_jobs`
+    rebuilds them from their endpoint's registered factory and re-enqueues
+    them with the last checkpoint the job saved through
+    `QueueExecutionContext.save_checkpoint`.
+    """
+
     def __init__(
         self,
-        store: QueueJobStore,
+        store: QueueJobStoreBackend,
         now: Callable[[], str] = utc_now_iso,
+        archive: QueueJobArchive | None = None,
+        concurrency: QueueConcurrencyPolicy | None = None,
+        process_pool: QueueProcessPool | None = None,
+        progress_flush_interval_seconds: float = 0.0,
+        events: QueueEventBus | None = None,
+        handlers: QueueJobHandlerRegistry | None = None,
     ) -> None:
         self._store = store
+        self._archive = archive
         self._now = now
+        self._concurrency = concurrency or QueueConcurrencyPolicy()
+        self._process_pool = process_pool
+        self._progress_flush_interval_seconds = progress_flush_interval_seconds
+        self._events = events or QueueEventBus()
+        self._handlers = handlers
         self._state_lock = Lock()
         self._idle_condition = Condition(self._state_lock)
-        self._pending_queue: list[PendingQueueItem] = []
-        self._active_job: ActiveJobState | None = None
-        self._worker_thread: Thread | None = None
-        self._reconcile_incomplete_jobs()
+        self._status_lock = Lock()
+        self._status_waiters: dict[str, JobStatusWaiter] = {}
+        self._pending_by_priority: dict[QueueJobPriority, dict[str, deque[PendingQueueItem]]] = {
+            priority: {} for priority in QUEUE_PRIORITY_ORDER
+        }
+        self._pending_by_id: dict[str, PendingQueueItem] = {}
+        self._priority_bypasses = {priority: 0 for priority in QUEUE_PRIORITY_ORDER}
+        self._next_sequence = 0
+        self._active_jobs: dict[str, ActiveJobState] = {}
+        # Abandoned thread jobs keep their slot until the handler returns.
+        self._abandoned_jobs: dict[str, ActiveJobState] = {}
+        self._coalescing_job_ids: dict[str, str] = {}
+        if handlers is None:
+            self._reconcile_incomplete_jobs()
 
     def enqueue_job(self, input_data: EnqueueJobInput) -> EnqueueJobResult:
         self._store.ensure_initialized()
-        job_id = get_next_job_id([job.jobId for job in self._store.get_jobs()])
-        now_iso = self._now()
+        coalesce_key = (
+            build_coalesce_key(input_data.endpointName, input_data.parameters)
+            if input_data.coalesce
+            else None
+        )
 
-        self._store.append_job(
-                QueueJobRecord(
-                    jobId=job_id,
-                    endpointName=input_data.endpointName,
-                    status=QueueJobStatus.QUEUED,
-                    createdAt=now_iso,
-                    parameters=input_data.parameters,
-                    result=None,
-                )
+        # The coalescing check and the append share the lock so two identical
+        # requests cannot both start a run.
+        with self._state_lock:
+            if coalesce_key is not None:
+                existing_job_id = self._coalescing_job_ids.get(coalesce_key)
+                if existing_job_id is not None:
+                    existing_status = (
+                        QueueJobStatus.RUNNING
+                        if existing_job_id in self._active_jobs
+                        else QueueJobStatus.QUEUED
+                    )
+                    return EnqueueJobResult(
+                        jobId=existing_job_id,
+                        status=existing_status.value,
+                        coalesced=True,
+                    )
+
+            job_id = self._store.allocate_job_id()
+            queued_job = QueueJobRecord(
+                jobId=job_id,
+                endpointName=input_data.endpointName,
+                status=QueueJobStatus.QUEUED,
+                createdAt=self._now(),
+                parameters=input_data.parameters,
+                result=None,
+                priority=input_data.priority,
+                coalesceKey=coalesce_key,
             )
+            self._store.append_job(queued_job)
+            self._events.publish_status(queued_job)
+            if coalesce_key is not None:
+                self._coalescing_job_ids[coalesce_key] = job_id
 
-        with self._state_lock:
-            self._pending_queue.append(
+            self._push_pending_locked(
                 PendingQueueItem(
                     jobId=job_id,
                     endpointName=input_data.endpointName,
                     run=input_data.run,
                     parameters=input_data.parameters,
+                    processTarget=input_data.processTarget,
+                    priority=input_data.priority,
+                    preemptible=input_data.preemptible,
+                    coalesceKey=coalesce_key,
+                    coalesceUntilStage=input_data.coalesceUntilStage,
                 )
             )
-            self._ensure_worker_thread_locked()
+            self._start_eligible_jobs_locked()
+            self._request_yields_locked()
 
         return EnqueueJobResult(jobId=job_id, status=QueueJobStatus.QUEUED.value)
 
+    @property
+    def events(self) -> QueueEventBus:
+        return self._events
+
     def get_check_status(self, job_id: str) -> QueueJobRecord | None:
-        return get_check_status_by_job_id(self._store, job_id)
+        return get_check_status_by_job_id(self._store, job_id, self._archive)
 
     def get_latest_job_by_endpoint_name(self, endpoint_name: str) -> QueueJobRecord | None:
         return self._store.get_latest_job_by_endpoint_name(endpoint_name)
 
-    def get_queue_status_view(self) -> QueueStatusView:
-        return get_queue_status(self._store)
+    def get_job_logs(self, job_id: str, offset: int, limit: int) -> QueueJobLogPage | None:
+        page = self._store.get_job_logs(job_id, offset, limit)
+        if page is not None or self._archive is None:
+            return page
+
+        archived_job = self._archive.get_job_by_id(job_id)
+        if archived_job is None:
+            return None
+
+        return slice_job_log_page(job_id, archived_job.logs, offset, limit)
+
+    def get_queue_status_view(self, include_logs: bool = True) -> QueueStatusView:
+        return get_queue_status(self._store, include_logs=include_logs)
+
+    def list_jobs(self, query: QueueJobListQuery) -> QueueJobPage:
+        return self._store.list_jobs(query)
+
+    def get_store_version(self) -> str:
+        return self._store.get_version()
 
     def cancel_job(self, job_id: str) -> CancelJobResult:
         with self._state_lock:
-            queued_index = next(
-                (
-                    index
-                    for index, pending_job in enumerate(self._pending_queue)
-                    if pending_job.jobId == job_id
-                ),
-                None,
-            )
-
-            if queued_index is not None:
-                self._pending_queue.pop(queued_index)
-                self._store.update_job(
-                    job_id,
-                    lambda job: QueueJobRecord(
-                        jobId=job.jobId,
-                        endpointName=job.endpointName,
-                        status=QueueJobStatus.CANCELED,
-                        createdAt=job.createdAt,
-                        startedAt=job.startedAt,
-                        endedAt=self._now(),
-                        failureReason="canceled_before_start",
-                        logs=job.logs,
-                        parameters=job.parameters,
-                        result=job.result,
-                    ),
+            pending_job = self._pending_by_id.pop(job_id, None)
+            if pending_job is not None:
+                pending_job.canceled = True
+                self._release_coalescing_locked(pending_job)
+                self._publish_status(
+                    self._store.update_job(
+                        job_id,
+                        lambda job: QueueJobRecord(
+                            jobId=job.jobId,
+                            endpointName=job.endpointName,
+                            status=QueueJobStatus.CANCELED,
+                            createdAt=job.createdAt,
+                            startedAt=job.startedAt,
+                            endedAt=self._now(),
+                            failureReason="canceled_before_start",
+                            logs=job.logs,
+                            parameters=job.parameters,
+                            result=job.result,
+                        ),
+                    )
                 )
                 self._notify_idle_waiters_locked()
                 return CancelJobResult(jobId=job_id, outcome="canceled")
 
-            if self._active_job is not None and self._active_job.jobId == job_id:
-                self._active_job.cancelRequested = True
-                self._active_job.cancelEvent.set()
+            active_job = self._active_jobs.get(job_id)
+            if active_job is not None:
+                active_job.cancelRequested = True
+                active_job.cancelEvent.set()
                 return CancelJobResult(jobId=job_id, outcome="cancel_requested")
 
         return CancelJobResult(jobId=job_id, outcome="not_found")
 
     def on_idle(self, timeout: float | None = None) -> bool:
         with self._idle_condition:
-            if not self._pending_queue and self._active_job is None:
-                return True
+            return self._idle_condition.wait_for(self._is_idle_locked, timeout=timeout)
 
-            self._idle_condition.wait_for(
-                lambda: not self._pending_queue and self._active_job is None,
-                timeout=timeout,
+    def wait_for_job_change(
+        self,
+        job_id: str,
+        since: QueueJobStatus | None = None,
+        timeout: float | None = None,
+    ) -> WaitJobResult | None:
+        """
+        Block until the job's status differs from `since` or `timeout` expires.
+
+        Without `since` the status at call time is the baseline, and a job that
+        has already finished is returned immediately. Waiters share one
+        condition per job, which `_publish_status` notifies on each transition.
+        """
+        # The waiter is registered before the job is read, so a transition
+        # published in between still lands in `waiter.status`. The read itself
+        # runs outside `_status_lock`, which `_publish_status` also takes.
+        with self._status_lock:
+            waiter = self._status_waiters.get(job_id)
+            if waiter is None:
+                waiter = JobStatusWaiter(condition=Condition(self._status_lock))
+                self._status_waiters[job_id] = waiter
+            waiter.waiterCount += 1
+
+        try:
+            job = self.get_check_status(job_id)
+            if job is None:
+                return None
+
+            baseline = since or job.status
+            if since is None and job.status in TERMINAL_JOB_STATUSES:
+                return WaitJobResult(job=job, changed=False)
+
+            with self._status_lock:
+                if waiter.status is None:
+                    waiter.status = job.status
+                changed = waiter.condition.wait_for(
+                    lambda: waiter.status != baseline,
+                    timeout=timeout,
+                )
+        finally:
+            with self._status_lock:
+                waiter.waiterCount -= 1
+                if waiter.waiterCount == 0:
+                    del self._status_waiters[job_id]
+
+        latest_job = self.get_check_status(job_id) or job
+        return WaitJobResult(job=latest_job, changed=changed)
+
+    async def get_check_status_async(self, job_id: str) -> QueueJobRecord | None:
+        snapshot = self._store.get_snapshot()
+        job = snapshot.get_job(job_id)
+        if job is None:
+            if self._archive is None:
+                return None
+            return await asyncio.to_thread(self._archive.get_job_by_id, job_id)
+        if not snapshot.has_logs_for((job_id,)):
+            return await asyncio.to_thread(self.get_check_status, job_id)
+        return job
+
+    async def get_latest_job_by_endpoint_name_async(
+        self,
+        endpoint_name: str,
+    ) -> QueueJobRecord | None:
+        snapshot = self._store.get_snapshot()
+        job = snapshot.get_latest_job_by_endpoint_name(endpoint_name)
+        if job is not None and not snapshot.has_logs_for((job.jobId,)):
+            return await asyncio.to_thread(self.get_latest_job_by_endpoint_name, endpoint_name)
+        return job
+
+    async def get_job_logs_async(
+        self,
+        job_id: str,
+        offset: int,
+        limit: int,
+    ) -> QueueJobLogPage | None:
+        page = self._store.get_snapshot().get_job_log_page(job_id, offset, limit)
+        if page is not None:
+            return page
+        return await asyncio.to_thread(self.get_job_logs, job_id, offset, limit)
+
+    async def get_queue_status_view_async(self, include_logs: bool = True) -> QueueStatusView:
+        snapshot = self._store.get_snapshot()
+        view = get_queue_status(snapshot, include_logs=include_logs)
+        if include_logs and not snapshot.has_logs_for(
+            job.jobId for job in [*view.runningJobs, *view.queuedJobs]
+        ):
+            return await asyncio.to_thread(self.get_queue_status_view, include_logs)
+        return view
+
+    async def list_jobs_async(self, query: QueueJobListQuery) -> QueueJobPage:
+        snapshot = self._store.get_snapshot()
+        page = snapshot.list_jobs(query)
+        if query.includeLogs and not snapshot.has_logs_for(job.jobId for job in page.jobs):
+            return await asyncio.to_thread(self.list_jobs, query)
+        return page
+
+    async def get_store_version_async(self) -> str:
+        return self._store.get_snapshot().version
+
+    async def wait_for_job_change_async(
+        self,
+        job_id: str,
+        since: QueueJobStatus | None = None,
+        timeout: float | None = None,
+    ) -> WaitJobResult | None:
+        """
+        Awaitable `wait_for_job_change` for async routes.
+
+        Status transitions are awaited on the event bus, so a waiting request
+        holds no thread, and the job itself is read from the store snapshot.
+        """
+        sequence = self._events.last_sequence
+        job = await self.get_check_status_async(job_id)
+        if job is None:
+            return None
+
+        baseline = since or job.status
+        if since is None and job.status in TERMINAL_JOB_STATUSES:
+            return WaitJobResult(job=job, changed=False)
+
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+        changed = job.status != baseline
+        while not changed:
+            remaining = None if deadline is None else deadline - loop.time()
+            if remaining is not None and remaining <= 0:
+                break
+
+            events = await self._events.wait_for_events_async(
+                sequence,
+                job_id=job_id,
+                timeout=remaining,
             )
-            return not self._pending_queue and self._active_job is None
+            for event in events:
+                sequence = event.sequence
+                if event.type == QueueJobEventType.STATUS and event.status != baseline:
+                    changed = True
+
+        latest_job = await self.get_check_status_async(job_id) or job
+        return WaitJobResult(job=latest_job, changed=changed)
 
     def get_running_job_id(self) -> str | None:
         with self._state_lock:
-            return self._active_job.jobId if self._active_job is not None else None
+            return next(iter(self._active_jobs), None)
+
+    def get_running_job_ids(self) -> list[str]:
+        with self._state_lock:
+            return list(self._active_jobs)
+
+    def _runs_in_process(self, item: PendingQueueItem) -> bool:
+        return (
+            item.processTarget is not None
+            and self._process_pool is not None
+            and self._process_pool.handles(item.endpointName)
+        )
+
+    def _count_slot_holders_locked(
+        self,
+        excluded: ActiveJobState | None = None,
+    ) -> tuple[int, dict[str, int]]:
+        running_by_endpoint: dict[str, int] = {}
+        for active_job in (*self._active_jobs.values(), *self._abandoned_jobs.values()):
+            if active_job is not excluded:
+                running_by_endpoint[active_job.endpointName] = (
+                    running_by_endpoint.get(active_job.endpointName, 0) + 1
+                )
+        return sum(running_by_endpoint.values()), running_by_endpoint
+
+    def _start_eligible_jobs_locked(self) -> None:
+        while self._count_slot_holders_locked()[0] < self._concurrency.max_workers:
+            claimed = self._claim_next_job_locked()
+            if claimed is None:
+                return
+
+            Thread(target=self._process_queue_loop, args=claimed, daemon=True).start()
+
+    def _claim_next_job_locked(self) -> tuple[PendingQueueItem, ActiveJobState] | None:
+        slot_count, running_by_endpoint = self._count_slot_holders_locked()
+        if slot_count >= self._concurrency.max_workers:
+            return None
+
+        candidates: dict[QueueJobPriority, PendingQueueItem] = {}
+        for priority in QUEUE_PRIORITY_ORDER:
+            candidate = self._peek_class_candidate_locked(priority, running_by_endpoint)
+            if candidate is not None:
+                candidates[priority] = candidate
+
+        if not candidates:
+            return None
 
-    def _ensure_worker_thread_locked(self) -> None:
-        if self._worker_thread is not None and self._worker_thread.is_alive():
+        chosen_priority = self._choose_priority_locked(candidates)
+        pending_job = candidates[chosen_priority]
+        self._pending_by_priority[chosen_priority][pending_job.endpointName].popleft()
+        self._pending_by_id.pop(pending_job.jobId, None)
+        if pending_job.coalesceUntilStage is None:
+            self._release_coalescing_locked(pending_job)
+
+        active_job = ActiveJobState(
+            jobId=pending_job.jobId,
+            endpointName=pending_job.endpointName,
+            cancelEvent=Event(),
+            priority=pending_job.priority,
+            preemptible=pending_job.preemptible,
+            coalesceKey=pending_job.coalesceKey,
+            runsInProcess=self._runs_in_process(pending_job),
+        )
+        self._active_jobs[pending_job.jobId] = active_job
+        return pending_job, active_job
+
+    def _push_pending_locked(self, item: PendingQueueItem) -> None:
+        item.sequence = self._next_sequence
+        item.readyAt = monotonic()
+        self._next_sequence += 1
+        self._pending_by_priority[item.priority].setdefault(item.endpointName, deque()).append(item)
+        self._pending_by_id[item.jobId] = item
+
+    def _release_coalescing_locked(self, item: PendingQueueItem | ActiveJobState) -> None:
+        if (
+            item.coalesceKey is not None
+            and self._coalescing_job_ids.get(item.coalesceKey) == item.jobId
+        ):
+            del self._coalescing_job_ids[item.coalesceKey]
+
+    def _on_job_stage(self, item: PendingQueueItem, stage: str) -> None:
+        if item.coalesceUntilStage is None or stage != item.coalesceUntilStage:
             return
 
-        self._worker_thread = Thread(target=self._process_queue_loop, daemon=True)
-        self._worker_thread.start()
+        with self._state_lock:
+            self._release_coalescing_locked(item)
 
-    def _process_queue_loop(self) -> None:
-        while True:
-            with self._state_lock:
-                if not self._pending_queue:
-                    self._notify_idle_waiters_locked()
-                    self._worker_thread = None
-                    return
+    def _requeue_yielded_locked(self, item: PendingQueueItem) -> None:
+        # Keeps the original sequence so the job resumes ahead of its class.
+        item.readyAt = monotonic()
+        self._pending_by_priority[item.priority].setdefault(item.endpointName, deque()).appendleft(
+            item
+        )
+        self._pending_by_id[item.jobId] = item
 
-                next_item = self._pending_queue.pop(0)
-                active_job = ActiveJobState(jobId=next_item.jobId, cancelEvent=Event())
-                self._active_job = active_job
+    def _request_yields_locked(self) -> None:
+        for priority in QUEUE_PRIORITY_ORDER:
+            for pending_jobs in self._pending_by_priority[priority].values():
+                head = next((item for item in pending_jobs if not item.canceled), None)
+                if head is not None:
+                    self._request_yield_for_locked(head)
 
-            self._execute_job(next_item, active_job)
+    def _request_yield_for_locked(self, item: PendingQueueItem) -> None:
+        rank = QUEUE_PRIORITY_ORDER.index(item.priority)
+        blockers = sorted(
+            (
+                active_job
+                for active_job in self._active_jobs.values()
+                if QUEUE_PRIORITY_ORDER.index(active_job.priority) > rank
+            ),
+            key=lambda active_job: QUEUE_PRIORITY_ORDER.index(active_job.priority),
+            reverse=True,
+        )
+        for active_job in blockers:
+            if not self._is_unblocked_without_locked(item, active_job):
+                continue
+            if active_job.yieldEvent.is_set():
+                return
+            if active_job.preemptible:
+                active_job.yieldEvent.set()
+                return
 
-            with self._state_lock:
-                self._active_job = None
-                self._notify_idle_waiters_locked()
+    def _is_unblocked_without_locked(
+        self,
+        item: PendingQueueItem,
+        active_job: ActiveJobState,
+    ) -> bool:
+        slot_count, running_by_endpoint = self._count_slot_holders_locked(excluded=active_job)
+        return slot_count < self._concurrency.max_workers and self._can_start_locked(
+            item.endpointName,
+            running_by_endpoint,
+        )
 
-    def _execute_job(self, item: PendingQueueItem, active_job: ActiveJobState) -> None:
-        self._store.update_job(
-            item.jobId,
-            lambda job: QueueJobRecord(
-                jobId=job.jobId,
-                endpointName=job.endpointName,
-                status=QueueJobStatus.RUNNING,
-                createdAt=job.createdAt,
-                startedAt=self._now(),
-                endedAt=job.endedAt,
-                failureReason=job.failureReason,
-                logs=job.logs,
-                parameters=job.parameters,
-                result=job.result,
+    def _peek_class_candidate_locked(
+        self,
+        priority: QueueJobPriority,
+        running_by_endpoint: dict[str, int],
+    ) -> PendingQueueItem | None:
+        candidate: PendingQueueItem | None = None
+        pending_by_endpoint = self._pending_by_priority[priority]
+        for endpoint_name in list(pending_by_endpoint):
+            pending_jobs = pending_by_endpoint[endpoint_name]
+            while pending_jobs and pending_jobs[0].canceled:
+                pending_jobs.popleft()
+            if not pending_jobs:
+                del pending_by_endpoint[endpoint_name]
+                continue
+            if not self._can_start_locked(endpoint_name, running_by_endpoint):
+                continue
+
+            head = pending_jobs[0]
+            if candidate is None or head.sequence < candidate.sequence:
+                candidate = head
+
+        return candidate
+
+    def _can_start_locked(self, endpoint_name: str, running_by_endpoint: dict[str, int]) -> bool:
+        if running_by_endpoint.get(endpoint_name, 0) >= self._concurrency.get_endpoint_limit(
+            endpoint_name
+        ):
+            return False
+
+        return not any(
+            endpoint_name in group
+            and any(running_endpoint in group for running_endpoint in running_by_endpoint)
+            for group in self._concurrency.exclusive_groups
+        )
+
+    def _choose_priority_locked(
+        self,
+        candidates: dict[QueueJobPriority, PendingQueueItem],
+    ) -> QueueJobPriority:
+        chosen_priority = next(
+            (
+                priority
+                for priority in candidates
+                if self._priority_bypasses[priority] >= self._concurrency.max_priority_bypasses
             ),
+            next(iter(candidates)),
         )
 
-        try:
-            item.run(
-                QueueExecutionContext(
-                    jobId=item.jobId,
-                    endpointName=item.endpointName,
-                    cancelEvent=active_job.cancelEvent,
-                )
-            )
+        chosen_rank = QUEUE_PRIORITY_ORDER.index(chosen_priority)
+        for priority in candidates:
+            if QUEUE_PRIORITY_ORDER.index(priority) > chosen_rank:
+                self._priority_bypasses[priority] += 1
+        self._priority_bypasses[chosen_priority] = 0
+        return chosen_priority
 
-            if active_job.cancelRequested or active_job.cancelEvent.is_set():
-                self._store.update_job(
-                    item.jobId,
-                    lambda job: QueueJobRecord(
-                        jobId=job.jobId,
-                        endpointName=job.endpointName,
-                        status=QueueJobStatus.CANCELED,
-                        createdAt=job.createdAt,
-                        startedAt=job.startedAt,
-                        endedAt=self._now(),
-                        failureReason="cancel_requested",
-                        logs=job.logs,
-                        parameters=job.parameters,
-                        result=job.result,
-                    ),
-                )
-                return
+    def _process_queue_loop(self, item: PendingQueueItem, active_job: ActiveJobState) -> None:
+        while True:
+            run_started = monotonic()
+            QUEUE_JOB_WAIT_SECONDS.observe(run_started - item.readyAt, endpoint=item.endpointName)
+            yielded = self._execute_job(item, active_job)
+            QUEUE_JOB_RUN_SECONDS.observe(monotonic() - run_started, endpoint=item.endpointName)
+
+            with self._state_lock:
+                if active_job.abandonEvent.is_set():
+                    # The watchdog already failed this job; a thread job still held its slot.
+                    if self._abandoned_jobs.pop(item.jobId, None) is not None:
+                        self._start_eligible_jobs_locked()
+                        self._notify_idle_waiters_locked()
+                    return
+                self._active_jobs.pop(item.jobId, None)
+                if yielded:
+                    self._requeue_yielded_locked(item)
+                else:
+                    self._release_coalescing_locked(item)
+                claimed = self._claim_next_job_locked()
+                self._start_eligible_jobs_locked()
+                self._request_yields_locked()
+                self._notify_idle_waiters_locked()
+                if claimed is None:
+                    return
 
+            item, active_job = claimed
+
+    def _execute_job(self, item: PendingQueueItem, active_job: ActiveJobState) -> bool:
+        self._publish_status(
             self._store.update_job(
                 item.jobId,
                 lambda job: QueueJobRecord(
                     jobId=job.jobId,
                     endpointName=job.endpointName,
-                    status=QueueJobStatus.COMPLETED,
+                    status=QueueJobStatus.RUNNING,
                     createdAt=job.createdAt,
-                    startedAt=job.startedAt,
-                    endedAt=self._now(),
-                    failureReason=None,
+                    startedAt=self._now(),
+                    endedAt=job.endedAt,
+                    failureReason=job.failureReason,
                     logs=job.logs,
                     parameters=job.parameters,
                     result=job.result,
+                    resumeCursor=job.resumeCursor,
+                    priority=job.priority,
+                    coalesceKey=job.coalesceKey,
                 ),
             )
-        except QueueJobCanceledError:
-            self._store.update_job(
-                item.jobId,
+        )
+
+        reporter = BufferedJobReporter(
+            self._store,
+            item.jobId,
+            self._progress_flush_interval_seconds,
+            events=self._events,
+            endpoint_name=item.endpointName,
+        )
+        active_job.reporter = reporter
+        try:
+            try:
+                if active_job.runsInProcess:
+                    self._process_pool.run(
+                        item.jobId,
+                        item.endpointName,
+                        item.processTarget,
+                        active_job.cancelEvent,
+                        reporter,
+                        yield_event=active_job.yieldEvent,
+                        resume_cursor=item.resumeCursor,
+                        on_stage=lambda stage: self._on_job_stage(item, stage),
+                        on_heartbeat=active_job.record_heartbeat,
+                        abandon_event=active_job.abandonEvent,
+                    )
+                else:
+                    item.run(
+                        QueueExecutionContext(
+                            jobId=item.jobId,
+                            endpointName=item.endpointName,
+                            cancelEvent=active_job.cancelEvent,
+                            reporter=reporter,
+                            yieldEvent=active_job.yieldEvent,
+                            resumeCursor=item.resumeCursor,
+                            onStage=lambda stage: self._on_job_stage(item, stage),
+                            onHeartbeat=active_job.record_heartbeat,
+                        )
+                    )
+            finally:
+                reporter.flush()
+
+            if active_job.cancelRequested or active_job.cancelEvent.is_set():
+                self._record_canceled(active_job)
+                return False
+
+            self._record_outcome(
+                active_job,
                 lambda job: QueueJobRecord(
                     jobId=job.jobId,
                     endpointName=job.endpointName,
-                    status=QueueJobStatus.CANCELED,
+                    status=QueueJobStatus.COMPLETED,
                     createdAt=job.createdAt,
                     startedAt=job.startedAt,
                     endedAt=self._now(),
-                    failureReason="cancel_requested",
+                    failureReason=None,
                     logs=job.logs,
                     parameters=job.parameters,
                     result=job.result,
                 ),
             )
+        except QueueJobYieldedError as yielded:
+            if not active_job.cancelRequested:
+                item.resumeCursor = yielded.cursor
+                return self._record_outcome(
+                    active_job,
+                    lambda job: QueueJobRecord(
+                        jobId=job.jobId,
+                        endpointName=job.endpointName,
+                        status=QueueJobStatus.QUEUED,
+                        createdAt=job.createdAt,
+                        startedAt=job.startedAt,
+                        endedAt=job.endedAt,
+                        failureReason=job.failureReason,
+                        logs=job.logs,
+                        parameters=job.parameters,
+                        result=job.result,
+                        resumeCursor=yielded.cursor,
+                        priority=job.priority,
+                        coalesceKey=job.coalesceKey,
+                    ),
+                )
+
+            self._record_canceled(active_job)
+        except QueueJobCanceledError:
+            self._record_canceled(active_job)
         except Exception as error:
-            self._store.update_job(
-                item.jobId,
+            self._record_outcome(
+                active_job,
                 lambda job: QueueJobRecord(
                     jobId=job.jobId,
                     endpointName=job.endpointName,
@@ -290,23 +808,241 @@ class GlobalQueueEngine:
                     createdAt=job.createdAt,
                     startedAt=job.startedAt,
                     endedAt=self._now(),
-                    failureReason=_get_error_message(error),
+                    failureReason=get_error_message(error),
                     logs=job.logs,
                     parameters=job.parameters,
                     result=job.result,
                 ),
             )
 
+        return False
+
+    def _record_outcome(
+        self,
+        active_job: ActiveJobState,
+        updater: Callable[[QueueJobRecord], QueueJobRecord],
+    ) -> bool:
+        # A job the watchdog abandoned already has its final status; whatever
+        # the stuck handler does once it returns must not overwrite it.
+        with active_job.outcomeLock:
+            if active_job.finished:
+                return False
+
+            active_job.finished = True
+            self._publish_status(self._store.update_job(active_job.jobId, updater))
+            return True
+
+    def _record_canceled(self, active_job: ActiveJobState) -> None:
+        expire_reason = active_job.expireReason
+        self._record_outcome(
+            active_job,
+            lambda job: QueueJobRecord(
+                jobId=job.jobId,
+                endpointName=job.endpointName,
+                status=QueueJobStatus.FAILED if expire_reason else QueueJobStatus.CANCELED,
+                createdAt=job.createdAt,
+                startedAt=job.startedAt,
+                endedAt=self._now(),
+                failureReason=expire_reason or "cancel_requested",
+                logs=job.logs,
+                parameters=job.parameters,
+                result=job.result,
+            ),
+        )
+
+    def get_active_job_health(self) -> list[ActiveJobHealth]:
+        with self._state_lock:
+            return [
+                ActiveJobHealth(
+                    jobId=active_job.jobId,
+                    endpointName=active_job.endpointName,
+                    startedAt=active_job.startedAt,
+                    lastHeartbeatAt=active_job.lastHeartbeatAt,
+                    expiredAt=active_job.expiredAt,
+                    expireReason=active_job.expireReason,
+                )
+                for active_job in self._active_jobs.values()
+            ]
+
+    def expire_job(self, job_id: str, reason: str, expired_at: float | None = None) -> bool:
+        """
+        Cancel a running job that overran its deadline or stopped heartbeating.
+
+        The job's cancel event is set, so a cooperative handler stops at its
+        next check and the job ends `failed` with `reason` as its failure
+        reason. `expired_at` is a `monotonic()` reading and defaults to now.
+        Returns False when the job is not running or already expired.
+        """
+        with self._state_lock:
+            active_job = self._active_jobs.get(job_id)
+            if active_job is None or active_job.expiredAt is not None:
+                return False
+
+            active_job.expiredAt = monotonic() if expired_at is None else expired_at
+            active_job.expireReason = reason
+            active_job.cancelRequested = True
+            active_job.cancelEvent.set()
+
+        self._append_engine_log(active_job, f"event=job_expired reason={reason}")
+        return True
+
+    def abandon_job(self, job_id: str) -> bool:
+        """
+        Give up on an expired job that did not stop after being canceled.
+
+        The job is marked failed. A process job's worker process is
+        terminated and its slot is handed to the next pending job right away.
+        A thread cannot be stopped, so a thread job's handler keeps running
+        detached and holds its slot until it returns; nothing it reports
+        afterwards changes the job's final status.
+        """
+        with self._state_lock:
+            active_job = self._active_jobs.get(job_id)
+            if active_job is None or active_job.expiredAt is None:
+                return False
+
+            with active_job.outcomeLock:
+                if active_job.finished:
+                    return False
+                active_job.finished = True
+                active_job.abandonEvent.set()
+
+            self._active_jobs.pop(job_id, None)
+            if not active_job.runsInProcess:
+                self._abandoned_jobs[job_id] = active_job
+            self._release_coalescing_locked(active_job)
+            if active_job.reporter is not None:
+                active_job.reporter.close()
+            self._append_engine_log(active_job, "event=job_abandoned")
+            self._publish_status(
+                self._store.update_job(
+                    job_id,
+                    lambda job: QueueJobRecord(
+                        jobId=job.jobId,
+                        endpointName=job.endpointName,
+                        status=QueueJobStatus.FAILED,
+                        createdAt=job.createdAt,
+                        startedAt=job.startedAt,
+                        endedAt=self._now(),
+                        failureReason=active_job.expireReason,
+                        logs=job.logs,
+                        parameters=job.parameters,
+                        result=job.result,
+                    ),
+                )
+            )
+            self._start_eligible_jobs_locked()
+            self._request_yields_locked()
+            self._notify_idle_waiters_locked()
+
+        return True
+
+    def _append_engine_log(self, active_job: ActiveJobState, message: str) -> None:
+        if self._store.append_job_log(active_job.jobId, message):
+            self._events.publish_log(active_job.jobId, active_job.endpointName, message)
+
+    def recover_incomplete_jobs(self) -> list[str]:
+        """
+        Re-enqueue jobs a previous process left queued or running.
+
+        Interrupted running jobs go first, then queued ones, each in store
+        order. A job whose endpoint has no registered factory, or whose
+        factory rejects it, is marked failed instead. Returns the ids of the
+        jobs that were re-enqueued.
+        """
+        self._store.ensure_initialized()
+        incomplete_jobs = [
+            job
+            for status in (QueueJobStatus.RUNNING, QueueJobStatus.QUEUED)
+            for job in self._store.get_jobs_by_status(status)
+        ]
+
+        recovered_job_ids: list[str] = []
+        with self._state_lock:
+            for job in incomplete_jobs:
+                if job.jobId in self._pending_by_id or job.jobId in self._active_jobs:
+                    continue
+
+                input_data = self._rebuild_job_input(job)
+                if input_data is None:
+                    self._fail_interrupted_job(job.jobId)
+                    continue
+
+                # Factories rebuild from parameters alone; the record keeps how it was enqueued.
+                coalesce_key = job.coalesceKey
+                if coalesce_key is not None:
+                    self._coalescing_job_ids.setdefault(coalesce_key, job.jobId)
+
+                self._publish_status(
+                    self._store.update_job(
+                        job.jobId,
+                        lambda record: QueueJobRecord(
+                            jobId=record.jobId,
+                            endpointName=record.endpointName,
+                            status=QueueJobStatus.QUEUED,
+                            createdAt=record.createdAt,
+                            startedAt=record.startedAt,
+                            endedAt=record.endedAt,
+                            failureReason=record.failureReason,
+                            logs=[
+                                *record.logs,
+                                f"event=job_recovered previous_status={record.status.value} "
+                                f"resumed={record.resumeCursor is not None}",
+                            ],
+                            parameters=record.parameters,
+                            result=record.result,
+                            resumeCursor=record.resumeCursor,
+                            priority=record.priority,
+                            coalesceKey=record.coalesceKey,
+                        ),
+                    )
+                )
+                self._push_pending_locked(
+                    PendingQueueItem(
+                        jobId=job.jobId,
+                        endpointName=job.endpointName,
+                        run=input_data.run,
+                        parameters=job.parameters,
+                        processTarget=input_data.processTarget,
+                        priority=job.priority or input_data.priority,
+                        preemptible=input_data.preemptible,
+                        resumeCursor=job.resumeCursor,
+                        coalesceKey=coalesce_key,
+                        coalesceUntilStage=(
+                            input_data.coalesceUntilStage if coalesce_key is not None else None
+                        ),
+                    )
+                )
+                recovered_job_ids.append(job.jobId)
+
+            self._start_eligible_jobs_locked()
+            self._request_yields_locked()
+
+        return recovered_job_ids
+
+    def _rebuild_job_input(self, job: QueueJobRecord) -> EnqueueJobInput | None:
+        factory = self._handlers.get(job.endpointName) if self._handlers is not None else None
+        if factory is None:
+            return None
+
+        try:
+            return factory(job.parameters or {})
+        except Exception:
+            return None
+
     def _reconcile_incomplete_jobs(self) -> None:
         self._store.ensure_initialized()
-        jobs = self._store.get_jobs()
         incomplete_job_ids = [
             job.jobId
-            for job in jobs
-            if job.status in {QueueJobStatus.QUEUED, QueueJobStatus.RUNNING}
+            for status in (QueueJobStatus.QUEUED, QueueJobStatus.RUNNING)
+            for job in self._store.get_jobs_by_status(status)
         ]
 
         for job_id in incomplete_job_ids:
+            self._fail_interrupted_job(job_id)
+
+    def _fail_interrupted_job(self, job_id: str) -> None:
+        self._publish_status(
             self._store.update_job(
                 job_id,
                 lambda job: QueueJobRecord(
@@ -322,7 +1058,24 @@ class GlobalQueueEngine:
                     result=job.result,
                 ),
             )
+        )
+
+    def _publish_status(self, job: QueueJobRecord | None) -> None:
+        if job is None:
+            return
+
+        self._events.publish_status(job)
+        if job.status in TERMINAL_JOB_STATUSES:
+            QUEUE_JOBS_FINISHED_TOTAL.inc(endpoint=job.endpointName, status=job.status.value)
+        with self._status_lock:
+            waiter = self._status_waiters.get(job.jobId)
+            if waiter is not None:
+                waiter.status = job.status
+                waiter.condition.notify_all()
+
+    def _is_idle_locked(self) -> bool:
+        return not self._pending_by_id and not self._active_jobs and not self._abandoned_jobs
 
     def _notify_idle_waiters_locked(self) -> None:
-        if not self._pending_queue and self._active_job is None:
+        if self._is_idle_locked():
             self._idle_condition.notify_all()
@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from enum import StrEnum
+from itertools import islice
+from threading import Condition
+
+from src.modules.queue.types import QueueJobRecord
+
+
+DEFAULT_QUEUE_EVENT_BUFFER_SIZE = 1000
+
+
+def _resolve_wakeup(wakeup: asyncio.Future[None]) -> None:
+    if not wakeup.done():
+        wakeup.set_result(None)
+
+
+class QueueJobEventType(StrEnum):
+    STATUS = "status"
+    LOG = "log"
+    RESULT = "result"
+
+
+@dataclass(slots=True)
+class QueueJobEvent:
+    sequence: int
+    type: QueueJobEventType
+    jobId: str
+    endpointName: str
+    createdAt: str
+    status: str | None = None
+    failureReason: str | None = None
+    line: str | None = None
+    fields: dict[str, str | int | float | bool | None] | None = None
+
+
+class QueueEventBus:
+    """
+    In-memory feed of queue job events with monotonically increasing sequences.
+
+    The engine publishes status transitions and job reporters publish log lines
+    and result fields as they happen, before they are flushed to the store.
+    Readers ask for events after the last sequence they saw and may block on
+    the bus condition until new ones arrive, or await `wait_for_events_async`,
+    which parks a future on the caller's event loop instead of a thread. Only
+    the newest `max_events` are kept; a reader that falls further behind
+    starts again from the oldest retained event.
+    """
+
+    def __init__(self, max_events: int = DEFAULT_QUEUE_EVENT_BUFFER_SIZE) -> None:
+        if max_events <= 0:
+            raise ValueError("max_events must be greater than 0")
+
+        self._events: deque[QueueJobEvent] = deque(maxlen=max_events)
+        self._condition = Condition()
+        self._last_sequence = 0
+        self._async_waiters: dict[asyncio.Future[None], asyncio.AbstractEventLoop] = {}
+
+    @property
+    def last_sequence(self) -> int:
+        with self._condition:
+            return self._last_sequence
+
+    def publish_status(self, job: QueueJobRecord) -> QueueJobEvent:
+        return self._publish(
+            QueueJobEventType.STATUS,
+            job.jobId,
+            job.endpointName,
+            status=job.status.value,
+            failureReason=job.failureReason,
+        )
+
+    def publish_log(self, job_id: str, endpoint_name: str, line: str) -> QueueJobEvent:
+        return self._publish(QueueJobEventType.LOG, job_id, endpoint_name, line=line)
+
+    def publish_result(
+        self,
+        job_id: str,
+        endpoint_name: str,
+        fields: dict[str, str | int | float | bool | None],
+    ) -> QueueJobEvent:
+        return self._publish(QueueJobEventType.RESULT, job_id, endpoint_name, fields=dict(fields))
+
+    def get_events_since(self, since: int, job_id: str | None = None) -> list[QueueJobEvent]:
+        with self._condition:
+            return self._get_events_since_locked(since, job_id)
+
+    def wait_for_events(
+        self,
+        since: int,
+        job_id: str | None = None,
+        timeout: float | None = None,
+    ) -> list[QueueJobEvent]:
+        with self._condition:
+            events: list[QueueJobEvent] = []
+
+            def has_events() -> bool:
+                nonlocal events, since
+                events = self._get_events_since_locked(since, job_id)
+                # Events for other jobs are not rescanned on the next wakeup.
+                since = self._last_sequence
+                return bool(events)
+
+            self._condition.wait_for(has_events, timeout=timeout)
+            return events
+
+    async def wait_for_events_async(
+        self,
+        since: int,
+        job_id: str | None = None,
+        timeout: float | None = None,
+    ) -> list[QueueJobEvent]:
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+        while True:
+            wakeup: asyncio.Future[None] = loop.create_future()
+            with self._condition:
+                events = self._get_events_since_locked(since, job_id)
+                if events:
+                    return events
+                since = self._last_sequence
+                self._async_waiters[wakeup] = loop
+
+            try:
+                remaining = None if deadline is None else deadline - loop.time()
+                if remaining is not None and remaining <= 0:
+                    return []
+                await asyncio.wait_for(wakeup, timeout=remaining)
+            except TimeoutError:
+                return []
+            finally:
+                with self._condition:
+                    self._async_waiters.pop(wakeup, None)
+
+    def _publish(
+        self,
+        event_type: QueueJobEventType,
+        job_id: str,
+        endpoint_name: str,
+        **payload: object,
+    ) -> QueueJobEvent:
+        with self._condition:
+            self._last_sequence += 1
+            event = QueueJobEvent(
+                sequence=self._last_sequence,
+                type=event_type,
+                jobId=job_id,
+                endpointName=endpoint_name,
+                createdAt=datetime.now(timezone.utc).isoformat(),
+                **payload,
+            )
+            self._events.append(event)
+            self._condition.notify_all()
+            async_waiters, self._async_waiters = self._async_waiters, {}
+
+        for wakeup, loop in async_waiters.items():
+            try:
+                loop.call_soon_threadsafe(_resolve_wakeup, wakeup)
+            except RuntimeError:
+                # The waiter's loop already closed; nobody is left to wake.
+                continue
+        return event
+
+    def _get_events_since_locked(self, since: int, job_id: str | None) -> list[QueueJobEvent]:
+        if not self._events or since >= self._last_sequence:
+            return []
+
+        # Sequences are contiguous, so the first newer event is found by offset.
+        start = max(0, since - self._events[0].sequence + 1)
+        events = list(islice(self._events, start, None))
+        if job_id is None:
+            return events
+
+        return [event for event in events if event.jobId == job_id]
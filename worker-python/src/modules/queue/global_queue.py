@@ -1,9 +1,81 @@
 from __future__ import annotations
 
-from src.modules.queue.config import resolve_default_queue_store_path
+from src.modules.queue.archive import QueueJobArchive
+from src.modules.queue.config import (
+    QueueStoreBackend,
+    resolve_default_queue_store_path,
+    resolve_queue_archive_dir,
+    resolve_queue_archive_max_segments,
+    resolve_queue_archive_segment_max_jobs,
+    resolve_queue_concurrency_policy,
+    resolve_queue_journal_compact_threshold,
+    resolve_queue_process_endpoints,
+    resolve_queue_process_pool_size,
+    resolve_queue_progress_flush_interval_seconds,
+    resolve_queue_retention_policy,
+    resolve_queue_schedules,
+    resolve_queue_scheduler_tick_seconds,
+    resolve_queue_sqlite_path,
+    resolve_queue_store_backend,
+    resolve_queue_timeout_policy,
+)
 from src.modules.queue.engine import GlobalQueueEngine
-from src.modules.queue.store import QueueJobStore
+from src.modules.queue.handlers import QueueJobHandlerRegistry
+from src.modules.queue.process_pool import QueueProcessPool
+from src.modules.queue.retention import QueueRetentionCompactor
+from src.modules.queue.scheduler import QueueScheduler
+from src.modules.queue.sqlite_store import SqliteQueueJobStore
+from src.modules.queue.store import QueueJobStore, QueueJobStoreBackend
+from src.modules.queue.watchdog import QueueJobWatchdog
 
 
-global_queue_store = QueueJobStore(resolve_default_queue_store_path())
-global_queue_engine = GlobalQueueEngine(global_queue_store)
+def create_default_queue_job_store() -> QueueJobStoreBackend:
+    if resolve_queue_store_backend() == QueueStoreBackend.SQLITE:
+        return SqliteQueueJobStore(resolve_queue_sqlite_path())
+
+    return QueueJobStore(
+        resolve_default_queue_store_path(),
+        compact_threshold=resolve_queue_journal_compact_threshold(),
+    )
+
+
+def create_default_queue_job_archive() -> QueueJobArchive:
+    return QueueJobArchive(
+        resolve_queue_archive_dir(),
+        segment_max_jobs=resolve_queue_archive_segment_max_jobs(),
+        max_segments=resolve_queue_archive_max_segments(),
+    )
+
+
+def create_default_queue_process_pool() -> QueueProcessPool | None:
+    endpoint_names = resolve_queue_process_endpoints()
+    if not endpoint_names:
+        return None
+
+    return QueueProcessPool(endpoint_names, size=resolve_queue_process_pool_size())
+
+
+global_queue_store = create_default_queue_job_store()
+global_queue_archive = create_default_queue_job_archive()
+global_queue_process_pool = create_default_queue_process_pool()
+global_queue_handlers = QueueJobHandlerRegistry()
+global_queue_engine = GlobalQueueEngine(
+    global_queue_store,
+    archive=global_queue_archive,
+    concurrency=resolve_queue_concurrency_policy(),
+    process_pool=global_queue_process_pool,
+    progress_flush_interval_seconds=resolve_queue_progress_flush_interval_seconds(),
+    handlers=global_queue_handlers,
+)
+global_queue_retention_compactor = QueueRetentionCompactor(
+    global_queue_store,
+    global_queue_archive,
+    resolve_queue_retention_policy(),
+)
+global_queue_scheduler = QueueScheduler(
+    global_queue_engine,
+    global_queue_handlers,
+    resolve_queue_schedules(),
+    tick_seconds=resolve_queue_scheduler_tick_seconds(),
+)
+global_queue_watchdog = QueueJobWatchdog(global_queue_engine, resolve_queue_timeout_policy())
@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from threading import Lock
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from src.modules.queue.engine import EnqueueJobInput
+
+
+QueueJobParameters = dict[str, Any]
+QueueJobFactory = Callable[[QueueJobParameters], "EnqueueJobInput"]
+# Returns a cheap marker of the work waiting for a job, or None when there is none.
+QueueWorkProbe = Callable[[QueueJobParameters], object | None]
+
+
+class QueueJobHandlerRegistry:
+    """
+    Endpoint name to job factory map used to replay persisted jobs.
+
+    A factory rebuilds the `EnqueueJobInput` for an endpoint from stored job
+    `parameters`, so the engine can re-enqueue jobs that a restart
+    interrupted and the scheduler can start recurring runs. Endpoints without
+    a factory cannot be resumed or scheduled. An optional work probe lets the
+    scheduler skip runs when nothing changed since the previous one.
+    """
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._factories: dict[str, QueueJobFactory] = {}
+        self._probes: dict[str, QueueWorkProbe] = {}
+
+    def register(
+        self,
+        endpoint_name: str,
+        factory: QueueJobFactory,
+        probe: QueueWorkProbe | None = None,
+    ) -> None:
+        with self._lock:
+            self._factories[endpoint_name] = factory
+            if probe is not None:
+                self._probes[endpoint_name] = probe
+            else:
+                self._probes.pop(endpoint_name, None)
+
+    def get(self, endpoint_name: str) -> QueueJobFactory | None:
+        with self._lock:
+            return self._factories.get(endpoint_name)
+
+    def get_probe(self, endpoint_name: str) -> QueueWorkProbe | None:
+        with self._lock:
+            return self._probes.get(endpoint_name)
@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+from src.modules.queue.types import QueueJobRecord, QueueJobStatus
+
+
+class QueueJobIndex:
+    """
+    In-memory read model for queue jobs.
+
+    Keeps jobs by `jobId` in store order, the job ids currently in each status
+    and a per-endpoint pointer to the latest job, so lookups, status counts and
+    latest-job reads never scan the full history.
+    """
+
+    def __init__(self, jobs: list[QueueJobRecord] | None = None) -> None:
+        self._jobs_by_id: dict[str, QueueJobRecord] = {}
+        self._positions: dict[str, int] = {}
+        self._next_position = 0
+        self._job_ids_by_status: dict[QueueJobStatus, dict[str, None]] = {
+            status: {} for status in QueueJobStatus
+        }
+        self._latest_job_id_by_endpoint: dict[str, str] = {}
+        for job in jobs or []:
+            self.put(job)
+
+    def __len__(self) -> int:
+        return len(self._jobs_by_id)
+
+    def get(self, job_id: str) -> QueueJobRecord | None:
+        return self._jobs_by_id.get(job_id)
+
+    def values(self) -> list[QueueJobRecord]:
+        return list(self._jobs_by_id.values())
+
+    def get_by_status(self, status: QueueJobStatus) -> list[QueueJobRecord]:
+        job_ids = sorted(
+            self._job_ids_by_status[status],
+            key=lambda job_id: self._positions[job_id],
+        )
+        return [self._jobs_by_id[job_id] for job_id in job_ids]
+
+    def get_positioned(
+        self,
+        statuses: tuple[QueueJobStatus, ...] = (),
+    ) -> list[tuple[int, QueueJobRecord]]:
+        if statuses:
+            job_ids = [
+                job_id
+                for status in dict.fromkeys(statuses)
+                for job_id in self._job_ids_by_status[status]
+            ]
+        else:
+            job_ids = list(self._jobs_by_id)
+        return sorted(
+            ((self._positions[job_id], self._jobs_by_id[job_id]) for job_id in job_ids),
+            key=lambda positioned_job: positioned_job[0],
+        )
+
+    def count_by_status(self) -> dict[QueueJobStatus, int]:
+        return {status: len(job_ids) for status, job_ids in self._job_ids_by_status.items()}
+
+    def get_latest_by_endpoint_name(self, endpoint_name: str) -> QueueJobRecord | None:
+        latest_job_id = self._latest_job_id_by_endpoint.get(endpoint_name)
+        return self._jobs_by_id.get(latest_job_id) if latest_job_id is not None else None
+
+    def copy(self) -> QueueJobIndex:
+        copied = QueueJobIndex()
+        copied._jobs_by_id = dict(self._jobs_by_id)
+        copied._positions = dict(self._positions)
+        copied._next_position = self._next_position
+        copied._job_ids_by_status = {
+            status: dict(job_ids) for status, job_ids in self._job_ids_by_status.items()
+        }
+        copied._latest_job_id_by_endpoint = dict(self._latest_job_id_by_endpoint)
+        return copied
+
+    def put(self, job: QueueJobRecord, position: int | None = None) -> None:
+        """Insert or replace a job; `position` pins a new job's listing position (e.g. a rowid)."""
+        previous_job = self._jobs_by_id.get(job.jobId)
+        if previous_job is None:
+            self._positions[job.jobId] = self._next_position if position is None else position
+            self._next_position = max(self._next_position, self._positions[job.jobId]) + 1
+        else:
+            self._job_ids_by_status[previous_job.status].pop(job.jobId, None)
+
+        self._jobs_by_id[job.jobId] = job
+        self._job_ids_by_status[job.status][job.jobId] = None
+
+        if previous_job is not None and (
+            previous_job.endpointName != job.endpointName
+            or previous_job.createdAt != job.createdAt
+        ):
+            self._recompute_latest(previous_job.endpointName)
+            self._recompute_latest(job.endpointName)
+            return
+
+        self._track_latest(job)
+
+    def remove(self, job_id: str) -> QueueJobRecord | None:
+        removed_job = self._jobs_by_id.pop(job_id, None)
+        if removed_job is None:
+            return None
+
+        self._positions.pop(job_id, None)
+        self._job_ids_by_status[removed_job.status].pop(job_id, None)
+        if self._latest_job_id_by_endpoint.get(removed_job.endpointName) == job_id:
+            self._recompute_latest(removed_job.endpointName)
+        return removed_job
+
+    def _track_latest(self, job: QueueJobRecord) -> None:
+        latest_job = self.get_latest_by_endpoint_name(job.endpointName)
+        if latest_job is None or self._is_newer(job, latest_job):
+            self._latest_job_id_by_endpoint[job.endpointName] = job.jobId
+
+    def _recompute_latest(self, endpoint_name: str) -> None:
+        self._latest_job_id_by_endpoint.pop(endpoint_name, None)
+        for job in self._jobs_by_id.values():
+            if job.endpointName == endpoint_name:
+                self._track_latest(job)
+
+    def _is_newer(self, candidate: QueueJobRecord, current: QueueJobRecord) -> bool:
+        # Ties on createdAt keep the earliest stored job, matching max() over store order.
+        if candidate.createdAt != current.createdAt:
+            return candidate.createdAt > current.createdAt
+        return self._positions[candidate.jobId] < self._positions[current.jobId]
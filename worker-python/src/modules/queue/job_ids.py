@@ -27,9 +27,13 @@ def parse_job_id(job_id: str) -> int:
     return parsed
 
 
-def get_next_job_id(existing_job_ids: Iterable[str]) -> str:
+def get_highest_job_sequence(existing_job_ids: Iterable[str]) -> int:
     highest_sequence = 0
     for existing_job_id in existing_job_ids:
         highest_sequence = max(highest_sequence, parse_job_id(existing_job_id))
 
-    return format_job_id(highest_sequence + 1)
+    return highest_sequence
+
+
+def get_next_job_id(existing_job_ids: Iterable[str]) -> str:
+    return format_job_id(get_highest_job_sequence(existing_job_ids) + 1)
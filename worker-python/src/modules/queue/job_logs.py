@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+import json
+import shutil
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+
+from src.modules.queue.errors import QueueStoreError
+
+
+DEFAULT_JOB_LOG_LIMIT = 200
+MAX_JOB_LOG_LIMIT = 1000
+JOB_LOG_SEGMENT_SUFFIX = ".log"
+
+
+def resolve_job_log_directory(file_path: Path) -> Path:
+    return file_path.with_name(f"{file_path.stem}-logs")
+
+
+@dataclass(slots=True)
+class QueueJobLogPage:
+    jobId: str
+    lines: list[str]
+    offset: int
+    nextOffset: int
+    total: int
+
+
+def slice_job_log_page(job_id: str, lines: Sequence[str], offset: int, limit: int) -> QueueJobLogPage:
+    start = min(offset, len(lines))
+    page_lines = list(lines[start : start + limit])
+    return QueueJobLogPage(
+        jobId=job_id,
+        lines=page_lines,
+        offset=start,
+        nextOffset=start + len(page_lines),
+        total=len(lines),
+    )
+
+
+class QueueJobLogView(Sequence[str]):
+    """
+    Read-only view of the lines a job had when the view was taken.
+
+    The store only ever appends to a job's line list, so the first `len(view)`
+    lines never change and later appends stay invisible to the view.
+    """
+
+    __slots__ = ("_lines", "_count")
+
+    def __init__(self, lines: list[str]) -> None:
+        self._lines = lines
+        self._count = len(lines)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self._lines[slice(*index.indices(self._count))]
+        if not -self._count <= index < self._count:
+            raise IndexError("queue job log index out of range")
+        return self._lines[index % self._count]
+
+
+class QueueJobLogSegments:
+    """
+    Append-only per-job log files for the JSON queue store.
+
+    Each job gets `<jobId>.log` with one JSON-encoded line per log entry, so
+    appending costs one write and never touches the job record. The byte
+    offset of every line is indexed the first time a job's log is read or
+    appended to, which lets offset reads seek straight to the requested
+    lines. Callers serialize access; the JSON store calls in under its lock.
+    """
+
+    def __init__(self, directory: Path) -> None:
+        self._directory = directory
+        # Per job: start offset of every line followed by the end of the file.
+        self._line_offsets: dict[str, list[int]] = {}
+
+    @property
+    def directory(self) -> Path:
+        return self._directory
+
+    def count(self, job_id: str) -> int:
+        return len(self._load_line_offsets(job_id)) - 1
+
+    def append(self, job_id: str, lines: Iterable[str]) -> None:
+        encoded_lines = [(json.dumps(line) + "\n").encode("utf-8") for line in lines]
+        if not encoded_lines:
+            return
+
+        line_offsets = self._load_line_offsets(job_id)
+        try:
+            self._directory.mkdir(parents=True, exist_ok=True)
+            with self._segment_path(job_id).open("ab") as segment:
+                segment.write(b"".join(encoded_lines))
+        except OSError as exc:
+            self._line_offsets.pop(job_id, None)
+            raise QueueStoreError(f"Failed to write queue job log: {exc}") from exc
+
+        for encoded_line in encoded_lines:
+            line_offsets.append(line_offsets[-1] + len(encoded_line))
+
+    def read(self, job_id: str, offset: int = 0, limit: int | None = None) -> list[str]:
+        line_offsets = self._load_line_offsets(job_id)
+        total = len(line_offsets) - 1
+        start = min(max(offset, 0), total)
+        end = total if limit is None else min(start + limit, total)
+        if start >= end:
+            return []
+
+        try:
+            with self._segment_path(job_id).open("rb") as segment:
+                segment.seek(line_offsets[start])
+                payload = segment.read(line_offsets[end] - line_offsets[start])
+        except OSError as exc:
+            raise QueueStoreError(f"Failed to read queue job log: {exc}") from exc
+
+        return [json.loads(raw_line) for raw_line in payload.decode("utf-8").splitlines()]
+
+    def remove(self, job_ids: Iterable[str]) -> None:
+        for job_id in job_ids:
+            self._line_offsets.pop(job_id, None)
+            try:
+                self._segment_path(job_id).unlink(missing_ok=True)
+            except OSError as exc:
+                raise QueueStoreError(f"Failed to remove queue job log: {exc}") from exc
+
+    def clear(self) -> None:
+        self._line_offsets.clear()
+        try:
+            shutil.rmtree(self._directory)
+        except FileNotFoundError:
+            return
+        except OSError as exc:
+            raise QueueStoreError(f"Failed to clear queue job logs: {exc}") from exc
+
+    def _segment_path(self, job_id: str) -> Path:
+        return self._directory / f"{job_id}{JOB_LOG_SEGMENT_SUFFIX}"
+
+    def _load_line_offsets(self, job_id: str) -> list[int]:
+        line_offsets = self._line_offsets.get(job_id)
+        if line_offsets is not None:
+            return line_offsets
+
+        line_offsets = [0]
+        segment_path = self._segment_path(job_id)
+        try:
+            with segment_path.open("rb") as segment:
+                for raw_line in segment:
+                    if not raw_line.endswith(b"\n"):
+                        break
+                    line_offsets.append(line_offsets[-1] + len(raw_line))
+            # A torn final line is what an interrupted append leaves behind.
+            if segment_path.stat().st_size != line_offsets[-1]:
+                with segment_path.open("r+b") as segment:
+                    segment.truncate(line_offsets[-1])
+        except FileNotFoundError:
+            pass
+        except OSError as exc:
+            raise QueueStoreError(f"Failed to read queue job log: {exc}") from exc
+
+        self._line_offsets[job_id] = line_offsets
+        return line_offsets
@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+from collections.abc import Iterable
+from dataclasses import dataclass, fields
+from datetime import datetime, timezone
+from typing import Any
+
+from src.modules.queue.types import QueueJobRecord, QueueJobStatus
+
+
+DEFAULT_JOB_LIST_LIMIT = 50
+MAX_JOB_LIST_LIMIT = 500
+QUEUE_JOB_FIELDS = tuple(job_field.name for job_field in fields(QueueJobRecord))
+
+
+@dataclass(slots=True)
+class QueueJobListQuery:
+    """
+    Filters and page window for listing queue jobs.
+
+    Jobs are listed in store order. `cursor` is the opaque `nextCursor` of the
+    previous page; `createdAfter` is inclusive and `createdBefore` exclusive.
+    `includeLogs=False` lets the store skip loading log lines altogether.
+    """
+
+    statuses: tuple[QueueJobStatus, ...] = ()
+    endpointName: str | None = None
+    createdAfter: str | None = None
+    createdBefore: str | None = None
+    reportId: int | None = None
+    cursor: int | None = None
+    limit: int | None = None
+    includeLogs: bool = True
+
+
+@dataclass(slots=True)
+class QueueJobPage:
+    jobs: list[QueueJobRecord]
+    nextCursor: str | None
+    version: str
+
+
+def matches_job_list_query(job: QueueJobRecord, query: QueueJobListQuery) -> bool:
+    if query.statuses and job.status not in query.statuses:
+        return False
+    if query.endpointName is not None and job.endpointName != query.endpointName:
+        return False
+    if query.createdAfter is not None and job.createdAt < query.createdAfter:
+        return False
+    if query.createdBefore is not None and job.createdAt >= query.createdBefore:
+        return False
+    if query.reportId is not None:
+        report_id = (job.parameters or {}).get("reportId")
+        if isinstance(report_id, bool) or report_id != query.reportId:
+            return False
+
+    return True
+
+
+def select_job_page(
+    positioned_jobs: Iterable[tuple[int, QueueJobRecord]],
+    query: QueueJobListQuery,
+) -> tuple[list[tuple[int, QueueJobRecord]], str | None]:
+    selected: list[tuple[int, QueueJobRecord]] = []
+    for position, job in positioned_jobs:
+        if query.cursor is not None and position <= query.cursor:
+            continue
+        if not matches_job_list_query(job, query):
+            continue
+        if query.limit is not None and len(selected) >= query.limit:
+            return selected, encode_job_cursor(selected[-1][0])
+        selected.append((position, job))
+
+    return selected, None
+
+
+def encode_job_cursor(position: int) -> str:
+    return str(position)
+
+
+def parse_job_cursor(value: str | None) -> int | None:
+    if value is None or value.strip() == "":
+        return None
+
+    normalized_value = value.strip()
+    if not normalized_value.isdigit():
+        raise ValueError("cursor must be a value returned as nextCursor")
+
+    return int(normalized_value)
+
+
+def parse_job_fields(value: str | None) -> tuple[str, ...] | None:
+    if value is None or value.strip() == "":
+        return None
+
+    requested_fields = tuple(
+        dict.fromkeys(name.strip() for name in value.split(",") if name.strip() != "")
+    )
+    unknown_fields = [name for name in requested_fields if name not in QUEUE_JOB_FIELDS]
+    if unknown_fields:
+        raise ValueError(f"Unknown job fields: {', '.join(unknown_fields)}")
+
+    return requested_fields
+
+
+def format_created_at_bound(value: datetime | None) -> str | None:
+    if value is None:
+        return None
+
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc).isoformat()
+
+
+def project_job(job: QueueJobRecord, job_fields: tuple[str, ...] | None) -> dict[str, Any]:
+    selected_fields = job_fields if job_fields is not None else QUEUE_JOB_FIELDS
+    return {name: getattr(job, name) for name in selected_fields}
+
+
+def format_etag(version: str) -> str:
+    return f'"{version}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if if_none_match is None:
+        return False
+
+    candidates = [candidate.strip() for candidate in if_none_match.split(",")]
+    return any(
+        candidate == "*" or candidate.removeprefix("W/") == etag
+        for candidate in candidates
+    )
@@ -0,0 +1,307 @@
+from __future__ import annotations
+
+import importlib
+import multiprocessing
+import queue
+import time
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from multiprocessing.context import BaseContext
+from threading import Event, Lock
+from typing import Any
+
+from src.metrics import metrics
+from src.modules.queue.context import (
+    JobResultFields,
+    QueueExecutionContext,
+    QueueJobCanceledError,
+    QueueJobReporter,
+    QueueJobYieldedError,
+    QueueResumeCursor,
+    get_error_message,
+)
+
+
+PROCESS_EVENT_LOG = "log"
+PROCESS_EVENT_RESULT = "result"
+PROCESS_EVENT_STAGE = "stage"
+PROCESS_EVENT_CHECKPOINT = "checkpoint"
+PROCESS_EVENT_HEARTBEAT = "heartbeat"
+PROCESS_EVENT_METRICS = "metrics"
+PROCESS_EVENT_COMPLETED = "completed"
+PROCESS_EVENT_CANCELED = "canceled"
+PROCESS_EVENT_YIELDED = "yielded"
+PROCESS_EVENT_FAILED = "failed"
+PROCESS_POLL_INTERVAL_SECONDS = 0.1
+PROCESS_STOP_TIMEOUT_SECONDS = 5.0
+# Every event counts as a heartbeat, so bare heartbeats only need to trickle.
+PROCESS_HEARTBEAT_INTERVAL_SECONDS = 1.0
+
+
+@dataclass(slots=True)
+class QueueProcessTarget:
+    """Importable `module:function` job body and the keyword arguments it is called with."""
+
+    callablePath: str
+    kwargs: dict[str, Any] = field(default_factory=dict)
+
+
+def resolve_process_target(callable_path: str) -> Callable[..., None]:
+    module_name, separator, attribute_name = callable_path.partition(":")
+    if separator == "" or module_name == "" or attribute_name == "":
+        raise ValueError("callablePath must look like <module>:<function>")
+
+    return getattr(importlib.import_module(module_name), attribute_name)
+
+
+class _ProcessReporter:
+    def __init__(self, event_queue: Any) -> None:
+        self._event_queue = event_queue
+        self._last_heartbeat_at = 0.0
+
+    def append_log(self, message: str) -> None:
+        self._event_queue.put((PROCESS_EVENT_LOG, message))
+
+    def update_result(self, fields: JobResultFields) -> None:
+        self._event_queue.put((PROCESS_EVENT_RESULT, dict(fields)))
+
+    def save_checkpoint(self, cursor: QueueResumeCursor) -> None:
+        self._event_queue.put((PROCESS_EVENT_CHECKPOINT, dict(cursor)))
+
+    def enter_stage(self, stage: str) -> None:
+        self._event_queue.put((PROCESS_EVENT_STAGE, stage))
+
+    def heartbeat(self) -> None:
+        now = time.monotonic()
+        if now - self._last_heartbeat_at >= PROCESS_HEARTBEAT_INTERVAL_SECONDS:
+            self._last_heartbeat_at = now
+            self._event_queue.put((PROCESS_EVENT_HEARTBEAT, None))
+
+
+def _process_worker_main(
+    task_queue: Any,
+    event_queue: Any,
+    cancel_event: Any,
+    yield_event: Any,
+) -> None:
+    while True:
+        task = task_queue.get()
+        if task is None:
+            return
+
+        job_id, endpoint_name, target, resume_cursor = task
+        reporter = _ProcessReporter(event_queue)
+        context = QueueExecutionContext(
+            jobId=job_id,
+            endpointName=endpoint_name,
+            cancelEvent=cancel_event,
+            reporter=reporter,
+            yieldEvent=yield_event,
+            resumeCursor=resume_cursor,
+            onStage=reporter.enter_stage,
+            onHeartbeat=reporter.heartbeat,
+        )
+        try:
+            resolve_process_target(target.callablePath)(context, **target.kwargs)
+        except QueueJobCanceledError:
+            outcome = (PROCESS_EVENT_CANCELED, None)
+        except QueueJobYieldedError as exc:
+            outcome = (PROCESS_EVENT_YIELDED, exc.cursor)
+        except Exception as exc:
+            outcome = (PROCESS_EVENT_FAILED, get_error_message(exc))
+        else:
+            outcome = (PROCESS_EVENT_COMPLETED, None)
+
+        # Metrics recorded by the job only exist in this process until shipped.
+        event_queue.put((PROCESS_EVENT_METRICS, metrics.drain()))
+        event_queue.put(outcome)
+
+
+class _ProcessSlot:
+    def __init__(self, mp_context: BaseContext) -> None:
+        self.task_queue = mp_context.Queue()
+        self.event_queue = mp_context.Queue()
+        self.cancel_event = mp_context.Event()
+        self.yield_event = mp_context.Event()
+        self.process = mp_context.Process(
+            target=_process_worker_main,
+            args=(self.task_queue, self.event_queue, self.cancel_event, self.yield_event),
+            daemon=True,
+        )
+        self.process.start()
+
+    def stop(self) -> None:
+        if self.process.is_alive():
+            self.task_queue.put(None)
+            self.process.join(timeout=PROCESS_STOP_TIMEOUT_SECONDS)
+        if self.process.is_alive():
+            self.process.terminate()
+            self.process.join(timeout=PROCESS_STOP_TIMEOUT_SECONDS)
+
+
+class QueueProcessPool:
+    """
+    Warm pool of worker processes for CPU-bound queue endpoints.
+
+    Each slot is a long-lived spawned process with its own task queue, event
+    queue, cancel event and yield event. The engine thread that owns a job
+    hands the slot a `QueueProcessTarget` and resume cursor, mirrors its thread
+    cancel and yield events onto the slot's process events, and replays
+    streamed log lines, result fields and checkpoints into the store through
+    the job's reporter. Metrics the job recorded in the worker process are merged into
+    this process's registry when the job ends. A slot whose process dies is
+    replaced, and so is one whose job the engine abandons: its process is
+    terminated, which is how a stuck process job actually gets stopped.
+    """
+
+    def __init__(
+        self,
+        endpoint_names: Iterable[str],
+        size: int,
+        start_method: str = "spawn",
+    ) -> None:
+        if size <= 0:
+            raise ValueError("size must be greater than 0")
+
+        self._endpoint_names = frozenset(endpoint_names)
+        self._size = size
+        self._mp_context = multiprocessing.get_context(start_method)
+        self._lock = Lock()
+        self._idle_slots: queue.Queue[_ProcessSlot] = queue.Queue()
+        self._slot_count = 0
+        self._closed = False
+
+    @property
+    def endpoint_names(self) -> frozenset[str]:
+        return self._endpoint_names
+
+    def handles(self, endpoint_name: str) -> bool:
+        return endpoint_name in self._endpoint_names
+
+    def warm(self) -> None:
+        with self._lock:
+            while not self._closed and self._slot_count < self._size:
+                self._idle_slots.put(_ProcessSlot(self._mp_context))
+                self._slot_count += 1
+
+    def shutdown(self) -> None:
+        with self._lock:
+            self._closed = True
+
+        while True:
+            try:
+                slot = self._idle_slots.get_nowait()
+            except queue.Empty:
+                return
+
+            slot.stop()
+            with self._lock:
+                self._slot_count -= 1
+
+    def run(
+        self,
+        job_id: str,
+        endpoint_name: str,
+        target: QueueProcessTarget,
+        cancel_event: Event,
+        reporter: QueueJobReporter,
+        yield_event: Event | None = None,
+        resume_cursor: QueueResumeCursor | None = None,
+        on_stage: Callable[[str], None] | None = None,
+        on_heartbeat: Callable[[], None] | None = None,
+        abandon_event: Event | None = None,
+    ) -> None:
+        slot = self._acquire_slot(cancel_event)
+        healthy = True
+        try:
+            slot.cancel_event.clear()
+            slot.yield_event.clear()
+            slot.task_queue.put((job_id, endpoint_name, target, resume_cursor))
+            while True:
+                if cancel_event.is_set():
+                    slot.cancel_event.set()
+                if yield_event is not None and yield_event.is_set():
+                    slot.yield_event.set()
+                if abandon_event is not None and abandon_event.is_set():
+                    healthy = False
+                    slot.process.terminate()
+                    raise RuntimeError("process_worker_abandoned")
+
+                try:
+                    kind, payload = slot.event_queue.get(timeout=PROCESS_POLL_INTERVAL_SECONDS)
+                except queue.Empty:
+                    if not slot.process.is_alive():
+                        healthy = False
+                        raise RuntimeError(
+                            f"process_worker_exited exit_code={slot.process.exitcode}"
+                        )
+                    continue
+
+                if on_heartbeat is not None:
+                    on_heartbeat()
+                if kind == PROCESS_EVENT_HEARTBEAT:
+                    continue
+                if kind == PROCESS_EVENT_LOG:
+                    reporter.append_log(payload)
+                elif kind == PROCESS_EVENT_RESULT:
+                    reporter.update_result(payload)
+                elif kind == PROCESS_EVENT_CHECKPOINT:
+                    reporter.save_checkpoint(payload)
+                elif kind == PROCESS_EVENT_STAGE:
+                    if on_stage is not None:
+                        on_stage(payload)
+                elif kind == PROCESS_EVENT_METRICS:
+                    metrics.merge(payload)
+                elif kind == PROCESS_EVENT_COMPLETED:
+                    return
+                elif kind == PROCESS_EVENT_CANCELED:
+                    raise QueueJobCanceledError()
+                elif kind == PROCESS_EVENT_YIELDED:
+                    raise QueueJobYieldedError(payload)
+                else:
+                    raise RuntimeError(payload)
+        finally:
+            self._release_slot(slot, healthy)
+
+    def _acquire_slot(self, cancel_event: Event) -> _ProcessSlot:
+        while True:
+            try:
+                return self._idle_slots.get_nowait()
+            except queue.Empty:
+                pass
+
+            with self._lock:
+                if self._closed:
+                    raise RuntimeError("process_pool_closed")
+                if self._slot_count < self._size:
+                    self._slot_count += 1
+                    create_slot = True
+                else:
+                    create_slot = False
+
+            if create_slot:
+                try:
+                    return _ProcessSlot(self._mp_context)
+                except Exception:
+                    with self._lock:
+                        self._slot_count -= 1
+                    raise
+
+            if cancel_event.is_set():
+                raise QueueJobCanceledError()
+
+            try:
+                return self._idle_slots.get(timeout=PROCESS_POLL_INTERVAL_SECONDS)
+            except queue.Empty:
+                continue
+
+    def _release_slot(self, slot: _ProcessSlot, healthy: bool) -> None:
+        with self._lock:
+            keep_slot = healthy and not self._closed and slot.process.is_alive()
+            if not keep_slot:
+                self._slot_count -= 1
+
+        if keep_slot:
+            self._idle_slots.put(slot)
+        else:
+            slot.stop()
@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from threading import Lock, Timer
+from time import monotonic
+
+from src.modules.queue.context import JobResultFields, QueueResumeCursor
+from src.modules.queue.events import QueueEventBus
+from src.modules.queue.store import QueueJobStoreBackend
+from src.modules.queue.types import QueueJobRecord
+
+
+class BufferedJobReporter:
+    """
+    Per-job progress channel that coalesces log lines and result fields in memory.
+
+    Buffered updates reach the store as one `update_job` write once
+    `flush_interval_seconds` has passed since the previous write, either on
+    the next update or from a timer, and always on `flush()`. The engine
+    flushes before it records a terminal status, so readers never see a
+    finished job with missing progress. An interval of 0 writes every update
+    straight through. Every update is also published to the event bus right
+    away, so streaming readers do not wait for the flush. Checkpoints are
+    never buffered: `save_checkpoint` writes the resume cursor together with
+    any pending progress immediately. After `close()` every update is
+    dropped, so a handler the engine gave up on cannot write to its job.
+    """
+
+    def __init__(
+        self,
+        store: QueueJobStoreBackend,
+        job_id: str,
+        flush_interval_seconds: float = 0.0,
+        clock: Callable[[], float] = monotonic,
+        events: QueueEventBus | None = None,
+        endpoint_name: str = "",
+    ) -> None:
+        self._store = store
+        self._job_id = job_id
+        self._events = events
+        self._endpoint_name = endpoint_name
+        self._flush_interval_seconds = flush_interval_seconds
+        self._clock = clock
+        self._lock = Lock()
+        self._pending_logs: list[str] = []
+        self._pending_fields: JobResultFields = {}
+        self._pending_cursor: QueueResumeCursor | None = None
+        self._last_flush_at: float | None = None
+        self._timer: Timer | None = None
+        self._closed = False
+
+    def append_log(self, message: str) -> None:
+        with self._lock:
+            if self._closed:
+                return
+            self._pending_logs.append(message)
+            self._flush_if_due_locked()
+        if self._events is not None:
+            self._events.publish_log(self._job_id, self._endpoint_name, message)
+
+    def update_result(self, fields: JobResultFields) -> None:
+        with self._lock:
+            if self._closed:
+                return
+            self._pending_fields.update(fields)
+            self._flush_if_due_locked()
+        if self._events is not None:
+            self._events.publish_result(self._job_id, self._endpoint_name, fields)
+
+    def save_checkpoint(self, cursor: QueueResumeCursor) -> None:
+        with self._lock:
+            if self._closed:
+                return
+            self._pending_cursor = dict(cursor)
+            self._flush_locked()
+
+    def flush(self) -> None:
+        with self._lock:
+            self._flush_locked()
+
+    def close(self) -> None:
+        with self._lock:
+            self._flush_locked()
+            self._closed = True
+
+    def _flush_if_due_locked(self) -> None:
+        now = self._clock()
+        if (
+            self._last_flush_at is None
+            or now - self._last_flush_at >= self._flush_interval_seconds
+        ):
+            self._flush_locked()
+            return
+
+        if self._timer is None:
+            self._timer = Timer(
+                self._flush_interval_seconds - (now - self._last_flush_at),
+                self.flush,
+            )
+            self._timer.daemon = True
+            self._timer.start()
+
+    def _flush_locked(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        if not self._pending_logs and not self._pending_fields and self._pending_cursor is None:
+            return
+
+        pending_logs, self._pending_logs = self._pending_logs, []
+        pending_fields, self._pending_fields = self._pending_fields, {}
+        pending_cursor, self._pending_cursor = self._pending_cursor, None
+        self._last_flush_at = self._clock()
+        self._store.update_job(
+            self._job_id,
+            lambda job: QueueJobRecord(
+                jobId=job.jobId,
+                endpointName=job.endpointName,
+                status=job.status,
+                createdAt=job.createdAt,
+                startedAt=job.startedAt,
+                endedAt=job.endedAt,
+                failureReason=job.failureReason,
+                logs=[*job.logs, *pending_logs],
+                parameters=job.parameters,
+                result=(
+                    {**(job.result or {}), **pending_fields}
+                    if pending_fields
+                    else job.result
+                ),
+                resumeCursor=pending_cursor if pending_cursor is not None else job.resumeCursor,
+                priority=job.priority,
+                coalesceKey=job.coalesceKey,
+            ),
+        )
@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+from dataclasses import replace
+
+from src.modules.queue.errors import QueueStoreError
+from src.modules.queue.types import QueueJobPriority, QueueJobRecord, QueueJobStatus
+
+
+def parse_job_status(value: object) -> QueueJobStatus:
+    if not isinstance(value, str):
+        raise QueueStoreError("Queue job record status is invalid")
+
+    try:
+        return QueueJobStatus(value)
+    except ValueError as exc:
+        raise QueueStoreError("Queue job record status is invalid") from exc
+
+
+def parse_job_priority(value: object) -> QueueJobPriority | None:
+    if value is None:
+        return None
+    if not isinstance(value, str):
+        raise QueueStoreError("Queue job record priority is invalid")
+
+    try:
+        return QueueJobPriority(value)
+    except ValueError as exc:
+        raise QueueStoreError("Queue job record priority is invalid") from exc
+
+
+def parse_job_record(value: object) -> QueueJobRecord:
+    if not isinstance(value, dict):
+        raise QueueStoreError("Queue job record must be an object")
+
+    job_id = value.get("jobId")
+    endpoint_name = value.get("endpointName")
+    status = value.get("status")
+    created_at = value.get("createdAt")
+    started_at = value.get("startedAt")
+    ended_at = value.get("endedAt")
+    failure_reason = value.get("failureReason")
+    logs = value.get("logs", [])
+    parameters = value.get("parameters")
+    result = value.get("result")
+    resume_cursor = value.get("resumeCursor")
+    priority = value.get("priority")
+    coalesce_key = value.get("coalesceKey")
+
+    if not isinstance(job_id, str) or job_id.strip() == "":
+        raise QueueStoreError("Queue job record jobId must be a non-empty string")
+    if not isinstance(endpoint_name, str) or endpoint_name.strip() == "":
+        raise QueueStoreError("Queue job record endpointName must be a non-empty string")
+    if not isinstance(created_at, str) or created_at.strip() == "":
+        raise QueueStoreError("Queue job record createdAt must be a non-empty string")
+    if started_at is not None and not isinstance(started_at, str):
+        raise QueueStoreError("Queue job record startedAt must be a string when provided")
+    if ended_at is not None and not isinstance(ended_at, str):
+        raise QueueStoreError("Queue job record endedAt must be a string when provided")
+    if failure_reason is not None and not isinstance(failure_reason, str):
+        raise QueueStoreError("Queue job record failureReason must be a string when provided")
+    if not isinstance(logs, list) or not all(isinstance(line, str) for line in logs):
+        raise QueueStoreError("Queue job record logs must be an array of strings")
+    if parameters is not None and not isinstance(parameters, dict):
+        raise QueueStoreError("Queue job record parameters must be an object when provided")
+    if result is not None and not isinstance(result, dict):
+        raise QueueStoreError("Queue job record result must be an object when provided")
+    if resume_cursor is not None and not isinstance(resume_cursor, dict):
+        raise QueueStoreError("Queue job record resumeCursor must be an object when provided")
+    if coalesce_key is not None and not isinstance(coalesce_key, str):
+        raise QueueStoreError("Queue job record coalesceKey must be a string when provided")
+
+    return QueueJobRecord(
+        jobId=job_id,
+        endpointName=endpoint_name,
+        status=parse_job_status(status),
+        createdAt=created_at,
+        startedAt=started_at,
+        endedAt=ended_at,
+        failureReason=failure_reason,
+        logs=logs,
+        parameters=parameters,
+        result=result,
+        resumeCursor=resume_cursor,
+        priority=parse_job_priority(priority),
+        coalesceKey=coalesce_key,
+    )
+
+
+def copy_job_record(job: QueueJobRecord, include_logs: bool = True) -> QueueJobRecord:
+    return replace(
+        job,
+        logs=list(job.logs) if include_logs else [],
+        parameters=dict(job.parameters) if job.parameters is not None else None,
+        result=dict(job.result) if job.result is not None else None,
+        resumeCursor=dict(job.resumeCursor) if job.resumeCursor is not None else None,
+    )
@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from datetime import datetime, timedelta, timezone
+from threading import Event, Lock, Thread
+
+from loguru import logger
+
+from src.modules.queue.archive import QueueJobArchive
+from src.modules.queue.config import QueueRetentionPolicy
+from src.modules.queue.store import QueueJobStoreBackend
+from src.modules.queue.types import TERMINAL_JOB_STATUSES, QueueJobRecord, QueueJobStatus
+
+
+def utc_now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def _parse_timestamp(value: str | None) -> datetime | None:
+    if value is None:
+        return None
+
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        return None
+
+    return parsed if parsed.tzinfo is not None else parsed.replace(tzinfo=timezone.utc)
+
+
+def select_jobs_to_prune(
+    jobs: list[QueueJobRecord],
+    policy: QueueRetentionPolicy,
+    now: datetime,
+) -> list[QueueJobRecord]:
+    """
+    Pick terminal jobs that fall outside the retention policy.
+
+    The newest job per endpoint is always kept so `latest-job` keeps answering.
+    Completed and canceled jobs are pruned past `max_age_hours` or beyond the
+    newest `max_jobs_per_endpoint`; failed jobs are only pruned past
+    `failed_max_age_hours`. A limit of 0 is not applied. Jobs with unreadable
+    timestamps are kept.
+    """
+    max_age = timedelta(hours=policy.max_age_hours) if policy.max_age_hours > 0 else None
+    failed_max_age = (
+        timedelta(hours=policy.failed_max_age_hours) if policy.failed_max_age_hours > 0 else None
+    )
+    max_jobs = policy.max_jobs_per_endpoint
+
+    jobs_by_endpoint: dict[str, list[QueueJobRecord]] = {}
+    for job in jobs:
+        if job.status in TERMINAL_JOB_STATUSES:
+            jobs_by_endpoint.setdefault(job.endpointName, []).append(job)
+
+    pruned_jobs: list[QueueJobRecord] = []
+    for endpoint_jobs in jobs_by_endpoint.values():
+        endpoint_jobs.sort(key=lambda job: job.createdAt, reverse=True)
+        kept_count = 1
+        for job in endpoint_jobs[1:]:
+            finished_at = _parse_timestamp(job.endedAt) or _parse_timestamp(job.createdAt)
+            if finished_at is None:
+                continue
+
+            age = now - finished_at
+            if job.status == QueueJobStatus.FAILED:
+                if failed_max_age is not None and age > failed_max_age:
+                    pruned_jobs.append(job)
+                continue
+
+            if (max_age is not None and age > max_age) or (0 < max_jobs <= kept_count):
+                pruned_jobs.append(job)
+                continue
+
+            kept_count += 1
+
+    return pruned_jobs
+
+
+class QueueRetentionCompactor:
+    """
+    Background compactor that moves expired queue jobs into the archive.
+
+    Pruned jobs are written to the archive before they are removed from the
+    store, so an interrupted pass can only leave a duplicate behind, never a
+    lost job.
+    """
+
+    def __init__(
+        self,
+        store: QueueJobStoreBackend,
+        archive: QueueJobArchive,
+        policy: QueueRetentionPolicy,
+        now: Callable[[], datetime] = utc_now,
+    ) -> None:
+        self._store = store
+        self._archive = archive
+        self._policy = policy
+        self._now = now
+        self._run_lock = Lock()
+        self._stop_event = Event()
+        self._thread: Thread | None = None
+
+    def run_once(self) -> int:
+        with self._run_lock:
+            terminal_jobs = [
+                job
+                for status in TERMINAL_JOB_STATUSES
+                for job in self._store.get_jobs_by_status(status)
+            ]
+            pruned_jobs = select_jobs_to_prune(terminal_jobs, self._policy, self._now())
+            if not pruned_jobs:
+                return 0
+
+            self._archive.archive_jobs(pruned_jobs)
+            removed_jobs = self._store.remove_jobs(job.jobId for job in pruned_jobs)
+            logger.info(
+                "event=queue_retention_pruned removed_jobs={} archive_dir={}",
+                len(removed_jobs),
+                self._archive.directory,
+            )
+            return len(removed_jobs)
+
+    def start(self) -> None:
+        if not self._policy.enabled:
+            return
+        if self._thread is not None and self._thread.is_alive():
+            return
+
+        self._stop_event.clear()
+        self._thread = Thread(target=self._run_loop, daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float | None = None) -> None:
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=timeout)
+            self._thread = None
+
+    def _run_loop(self) -> None:
+        while True:
+            try:
+                self.run_once()
+            except Exception as exc:
+                logger.warning("event=queue_retention_failed error={}", exc)
+
+            if self._stop_event.wait(timeout=self._policy.interval_seconds):
+                return
@@ -0,0 +1,201 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass, replace
+from datetime import datetime, timedelta, timezone
+from enum import StrEnum
+from threading import Event, Lock, Thread
+from typing import Any
+
+from loguru import logger
+
+from src.metrics import QUEUE_SCHEDULE_RUNS_TOTAL
+from src.modules.queue.config import DEFAULT_QUEUE_SCHEDULER_TICK_SECONDS, QueueScheduleDefinition
+from src.modules.queue.engine import GlobalQueueEngine
+from src.modules.queue.handlers import QueueJobHandlerRegistry
+from src.modules.queue.types import TERMINAL_JOB_STATUSES, QueueJobStatus
+
+
+def utc_now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+class QueueScheduleOutcome(StrEnum):
+    ENQUEUED = "enqueued"
+    COALESCED = "coalesced"
+    SKIPPED_NO_NEW_WORK = "skipped_no_new_work"
+    SKIPPED_PREVIOUS_RUN_ACTIVE = "skipped_previous_run_active"
+    FAILED = "failed"
+
+
+@dataclass(slots=True)
+class QueueScheduleState:
+    nextRunAt: datetime
+    lastRunAt: datetime | None = None
+    lastOutcome: QueueScheduleOutcome | None = None
+    lastJobId: str | None = None
+    lastJobWatermark: object | None = None
+    completedWatermark: object | None = None
+
+
+class QueueScheduler:
+    """
+    Background scheduler that enqueues recurring jobs on intervals or cron times.
+
+    Each due schedule builds its job from the endpoint's registered factory and
+    enqueues it with `coalesce=True`. A schedule is skipped while the job it
+    last started is still queued or running, and when the endpoint's work
+    probe returns None or the same watermark as before the last run that
+    completed, so an idle cycle costs one cheap query. A failed run does not
+    count, so the next cycle tries the same work again.
+    """
+
+    def __init__(
+        self,
+        engine: GlobalQueueEngine,
+        handlers: QueueJobHandlerRegistry,
+        schedules: list[QueueScheduleDefinition],
+        tick_seconds: int = DEFAULT_QUEUE_SCHEDULER_TICK_SECONDS,
+        now: Callable[[], datetime] = utc_now,
+    ) -> None:
+        self._engine = engine
+        self._handlers = handlers
+        self._schedules = schedules
+        self._tick_seconds = tick_seconds
+        self._now = now
+        self._run_lock = Lock()
+        self._stop_event = Event()
+        self._thread: Thread | None = None
+        started_at = now()
+        self._states = {
+            schedule.name: QueueScheduleState(
+                nextRunAt=(
+                    schedule.cron.next_after(started_at)
+                    if schedule.cron is not None
+                    else started_at
+                )
+            )
+            for schedule in schedules
+        }
+
+    def run_once(self) -> list[str]:
+        enqueued_job_ids: list[str] = []
+        with self._run_lock:
+            now = self._now()
+            for schedule in self._schedules:
+                state = self._states[schedule.name]
+                if state.nextRunAt > now:
+                    continue
+
+                state.nextRunAt = self._get_next_run_at(schedule, now)
+                state.lastRunAt = now
+                try:
+                    state.lastOutcome = self._run_schedule(schedule, state)
+                except Exception as exc:
+                    state.lastOutcome = QueueScheduleOutcome.FAILED
+                    logger.warning(
+                        "event=queue_schedule_failed schedule={} endpoint={} error={}",
+                        schedule.name,
+                        schedule.endpoint_name,
+                        exc,
+                    )
+
+                QUEUE_SCHEDULE_RUNS_TOTAL.inc(schedule=schedule.name, outcome=state.lastOutcome)
+                if state.lastOutcome in (
+                    QueueScheduleOutcome.ENQUEUED,
+                    QueueScheduleOutcome.COALESCED,
+                ):
+                    enqueued_job_ids.append(state.lastJobId)
+
+        return enqueued_job_ids
+
+    def describe(self) -> list[dict[str, Any]]:
+        with self._run_lock:
+            return [
+                self._describe_schedule(schedule, self._states[schedule.name])
+                for schedule in self._schedules
+            ]
+
+    def start(self) -> None:
+        if not self._schedules:
+            return
+        if self._thread is not None and self._thread.is_alive():
+            return
+
+        self._stop_event.clear()
+        self._thread = Thread(target=self._run_loop, daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float | None = None) -> None:
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=timeout)
+            self._thread = None
+
+    def _run_schedule(
+        self,
+        schedule: QueueScheduleDefinition,
+        state: QueueScheduleState,
+    ) -> QueueScheduleOutcome:
+        if state.lastJobId is not None:
+            last_job = self._engine.get_check_status(state.lastJobId)
+            if last_job is not None and last_job.status not in TERMINAL_JOB_STATUSES:
+                return QueueScheduleOutcome.SKIPPED_PREVIOUS_RUN_ACTIVE
+            if last_job is not None and last_job.status == QueueJobStatus.COMPLETED:
+                state.completedWatermark = state.lastJobWatermark
+
+        factory = self._handlers.get(schedule.endpoint_name)
+        if factory is None:
+            raise ValueError(f"No job factory registered for {schedule.endpoint_name}")
+
+        watermark: object | None = None
+        probe = self._handlers.get_probe(schedule.endpoint_name)
+        if probe is not None:
+            watermark = probe(schedule.parameters)
+            if watermark is None or watermark == state.completedWatermark:
+                return QueueScheduleOutcome.SKIPPED_NO_NEW_WORK
+
+        result = self._engine.enqueue_job(replace(factory(schedule.parameters), coalesce=True))
+        state.lastJobId = result.jobId
+        state.lastJobWatermark = watermark
+        logger.info(
+            "event=queue_schedule_enqueued schedule={} endpoint={} job_id={} coalesced={}",
+            schedule.name,
+            schedule.endpoint_name,
+            result.jobId,
+            result.coalesced,
+        )
+        return QueueScheduleOutcome.COALESCED if result.coalesced else QueueScheduleOutcome.ENQUEUED
+
+    def _describe_schedule(
+        self,
+        schedule: QueueScheduleDefinition,
+        state: QueueScheduleState,
+    ) -> dict[str, Any]:
+        return {
+            "name": schedule.name,
+            "endpointName": schedule.endpoint_name,
+            "parameters": schedule.parameters,
+            "intervalSeconds": schedule.interval_seconds,
+            "cron": schedule.cron.expression if schedule.cron is not None else None,
+            "nextRunAt": state.nextRunAt.isoformat(),
+            "lastRunAt": state.lastRunAt.isoformat() if state.lastRunAt is not None else None,
+            "lastOutcome": state.lastOutcome,
+            "lastJobId": state.lastJobId,
+        }
+
+    def _get_next_run_at(self, schedule: QueueScheduleDefinition, now: datetime) -> datetime:
+        if schedule.cron is not None:
+            return schedule.cron.next_after(now)
+
+        return now + timedelta(seconds=schedule.interval_seconds or 0)
+
+    def _run_loop(self) -> None:
+        while True:
+            try:
+                self.run_once()
+            except Exception as exc:
+                logger.warning("event=queue_scheduler_failed error={}", exc)
+
+            if self._stop_event.wait(timeout=self._tick_seconds):
+                return
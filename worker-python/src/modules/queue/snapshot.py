@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping, Sequence
+from dataclasses import dataclass, field, replace
+from types import MappingProxyType
+
+from src.modules.queue.index import QueueJobIndex
+from src.modules.queue.job_logs import QueueJobLogPage, slice_job_log_page
+from src.modules.queue.listing import QueueJobListQuery, QueueJobPage, select_job_page
+from src.modules.queue.types import QueueJobRecord, QueueJobStatus
+
+
+@dataclass(frozen=True, slots=True)
+class QueueJobSnapshot:
+    """
+    Immutable read view of a queue store at one version.
+
+    Stores drop their snapshot on every mutation and build a new one under
+    their lock when it is next asked for, so a burst of writes costs one
+    build, readers of an unchanged store take it without locking or touching
+    disk, and the version always matches the jobs it describes. Job records carry no log lines. `logs` holds the lines
+    of the jobs whose logs the store has in memory and is `None` when it
+    keeps none (SQLite); callers check `has_logs_for` and read the lines of
+    any other job from the store.
+    """
+
+    version: str
+    index: QueueJobIndex = field(default_factory=QueueJobIndex)
+    logs: Mapping[str, Sequence[str]] | None = None
+
+    def has_logs_for(self, job_ids: Iterable[str]) -> bool:
+        if self.logs is None:
+            return False
+        return all(job_id in self.logs for job_id in job_ids)
+
+    def get_job(self, job_id: str, include_logs: bool = True) -> QueueJobRecord | None:
+        job = self.index.get(job_id)
+        return self._copy(job, include_logs) if job is not None else None
+
+    def get_latest_job_by_endpoint_name(
+        self,
+        endpoint_name: str,
+        include_logs: bool = True,
+    ) -> QueueJobRecord | None:
+        job = self.index.get_latest_by_endpoint_name(endpoint_name)
+        return self._copy(job, include_logs) if job is not None else None
+
+    def get_job_log_page(self, job_id: str, offset: int, limit: int) -> QueueJobLogPage | None:
+        if not self.has_logs_for((job_id,)) or self.index.get(job_id) is None:
+            return None
+        return slice_job_log_page(job_id, self.logs[job_id], offset, limit)
+
+    def count_jobs_by_status(self) -> dict[QueueJobStatus, int]:
+        return self.index.count_by_status()
+
+    def list_jobs(self, query: QueueJobListQuery) -> QueueJobPage:
+        selected, next_cursor = select_job_page(self.index.get_positioned(query.statuses), query)
+        return QueueJobPage(
+            jobs=[self._copy(job, query.includeLogs) for _, job in selected],
+            nextCursor=next_cursor,
+            version=self.version,
+        )
+
+    def _copy(self, job: QueueJobRecord, include_logs: bool) -> QueueJobRecord:
+        return replace(
+            job,
+            logs=list(self.logs.get(job.jobId, ())) if include_logs and self.logs is not None else [],
+            parameters=dict(job.parameters) if job.parameters is not None else None,
+            result=dict(job.result) if job.result is not None else None,
+            resumeCursor=dict(job.resumeCursor) if job.resumeCursor is not None else None,
+        )
+
+
+def build_queue_job_snapshot(
+    version: str,
+    index: QueueJobIndex,
+    logs: Mapping[str, Sequence[str]] | None = None,
+) -> QueueJobSnapshot:
+    return QueueJobSnapshot(
+        version=version,
+        index=index.copy(),
+        logs=MappingProxyType(dict(logs)) if logs is not None else None,
+    )
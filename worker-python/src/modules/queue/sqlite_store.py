@@ -0,0 +1,569 @@
+from __future__ import annotations
+
+import json
+import sqlite3
+from collections.abc import Callable, Iterable
+from dataclasses import asdict
+from pathlib import Path
+from threading import Lock
+from typing import Any
+
+from src.metrics import QUEUE_STORE_OPERATION_SECONDS, timed
+from src.modules.queue.errors import QueueStoreError
+from src.modules.queue.index import QueueJobIndex
+from src.modules.queue.job_ids import format_job_id, get_highest_job_sequence
+from src.modules.queue.job_logs import QueueJobLogPage
+from src.modules.queue.listing import QueueJobListQuery, QueueJobPage, encode_job_cursor
+from src.modules.queue.records import copy_job_record, parse_job_record
+from src.modules.queue.snapshot import QueueJobSnapshot, build_queue_job_snapshot
+from src.modules.queue.store import format_store_version, new_store_version_token
+from src.modules.queue.types import QueueJobRecord, QueueJobStatus
+
+
+SCHEMA_STATEMENTS = (
+    """
+    CREATE TABLE IF NOT EXISTS QueueJobs (
+        jobId TEXT PRIMARY KEY,
+        endpointName TEXT NOT NULL,
+        status TEXT NOT NULL,
+        createdAt TEXT NOT NULL,
+        startedAt TEXT,
+        endedAt TEXT,
+        failureReason TEXT,
+        parameters TEXT,
+        result TEXT,
+        resumeCursor TEXT,
+        priority TEXT,
+        coalesceKey TEXT
+    )
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS idx_queue_jobs_endpoint_created
+    ON QueueJobs (endpointName, createdAt)
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS idx_queue_jobs_status
+    ON QueueJobs (status)
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS QueueJobLogs (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        jobId TEXT NOT NULL REFERENCES QueueJobs (jobId) ON DELETE CASCADE,
+        line TEXT NOT NULL
+    )
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS idx_queue_job_logs_job
+    ON QueueJobLogs (jobId, id)
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS QueueJobSequence (
+        id INTEGER PRIMARY KEY CHECK (id = 1),
+        lastValue INTEGER NOT NULL
+    )
+    """,
+)
+
+LOG_LOOKUP_CHUNK_SIZE = 500
+JOB_COLUMNS = (
+    "jobId, endpointName, status, createdAt, startedAt, endedAt, "
+    "failureReason, parameters, result, resumeCursor, priority, coalesceKey"
+)
+JOB_INSERT_SQL = f"INSERT INTO QueueJobs ({JOB_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+# Columns added after the first release, created on open for older databases.
+MIGRATED_JOB_COLUMNS = (("resumeCursor", "TEXT"), ("priority", "TEXT"), ("coalesceKey", "TEXT"))
+
+
+def _timed_store_operation(operation: str):
+    return timed(QUEUE_STORE_OPERATION_SECONDS, backend="sqlite", operation=operation)
+
+
+def _encode_json_field(value: dict[str, Any] | None) -> str | None:
+    return json.dumps(value) if value is not None else None
+
+
+def _decode_json_field(value: str | None) -> object:
+    if value is None:
+        return None
+
+    try:
+        return json.loads(value)
+    except json.JSONDecodeError as exc:
+        raise QueueStoreError("Queue job store contains invalid JSON") from exc
+
+
+def _job_row_params(job: QueueJobRecord) -> tuple[Any, ...]:
+    return (
+        job.jobId,
+        job.endpointName,
+        job.status.value,
+        job.createdAt,
+        job.startedAt,
+        job.endedAt,
+        job.failureReason,
+        _encode_json_field(job.parameters),
+        _encode_json_field(job.result),
+        _encode_json_field(job.resumeCursor),
+        job.priority.value if job.priority is not None else None,
+        job.coalesceKey,
+    )
+
+
+class SqliteQueueJobStore:
+    """
+    SQLite-backed queue job store.
+
+    Jobs live in `QueueJobs` with indexes on `jobId`, `(endpointName, createdAt)`
+    and `status`, so status checks and latest-job lookups are indexed queries.
+    Log lines live in `QueueJobLogs`, which makes appending one line a single
+    row insert; updates insert only the lines they add. Job ids come from the single-row `QueueJobSequence` counter.
+    Listings page by `rowid` and only read `QueueJobLogs` when logs are asked
+    for. Like the JSON store, every job mutation bumps an in-memory version
+    and drops the current `QueueJobSnapshot`, which is rebuilt on demand.
+    The snapshot mirrors job records (positioned by `rowid`, so cursors match
+    `list_jobs`) but not log lines, which stay in `QueueJobLogs`.
+    """
+
+    def __init__(self, file_path: Path) -> None:
+        self._file_path = file_path
+        self._lock = Lock()
+        self._connection: sqlite3.Connection | None = None
+        self._version_token = new_store_version_token()
+        self._version = 0
+        self._index = QueueJobIndex()
+        self._snapshot: QueueJobSnapshot | None = None
+
+    @property
+    def file_path(self) -> Path:
+        return self._file_path
+
+    def ensure_initialized(self) -> None:
+        with self._lock:
+            self._get_connection_locked()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    @_timed_store_operation("get_jobs")
+    def get_jobs(self) -> list[QueueJobRecord]:
+        with self._lock:
+            rows = self._execute_locked(
+                f"SELECT {JOB_COLUMNS} FROM QueueJobs ORDER BY rowid"
+            ).fetchall()
+            return self._hydrate_jobs_locked(rows)
+
+    @_timed_store_operation("get_job_by_id")
+    def get_job_by_id(self, job_id: str) -> QueueJobRecord | None:
+        with self._lock:
+            row = self._execute_locked(
+                f"SELECT {JOB_COLUMNS} FROM QueueJobs WHERE jobId = ?",
+                (job_id,),
+            ).fetchone()
+            if row is None:
+                return None
+
+            return self._hydrate_jobs_locked([row])[0]
+
+    @_timed_store_operation("get_jobs_by_status")
+    def get_jobs_by_status(self, status: QueueJobStatus) -> list[QueueJobRecord]:
+        with self._lock:
+            rows = self._execute_locked(
+                f"SELECT {JOB_COLUMNS} FROM QueueJobs WHERE status = ? ORDER BY rowid",
+                (status.value,),
+            ).fetchall()
+            return self._hydrate_jobs_locked(rows)
+
+    @_timed_store_operation("count_jobs_by_status")
+    def count_jobs_by_status(self) -> dict[QueueJobStatus, int]:
+        with self._lock:
+            counts = {status: 0 for status in QueueJobStatus}
+            rows = self._execute_locked(
+                "SELECT status, COUNT(*) AS jobCount FROM QueueJobs GROUP BY status"
+            ).fetchall()
+            for row in rows:
+                counts[QueueJobStatus(row["status"])] = int(row["jobCount"])
+            return counts
+
+    @_timed_store_operation("list_jobs")
+    def list_jobs(self, query: QueueJobListQuery) -> QueueJobPage:
+        conditions: list[str] = []
+        params: list[Any] = []
+        if query.cursor is not None:
+            conditions.append("rowid > ?")
+            params.append(query.cursor)
+        if query.statuses:
+            conditions.append(f"status IN ({','.join('?' for _ in query.statuses)})")
+            params.extend(status.value for status in query.statuses)
+        if query.endpointName is not None:
+            conditions.append("endpointName = ?")
+            params.append(query.endpointName)
+        if query.createdAfter is not None:
+            conditions.append("createdAt >= ?")
+            params.append(query.createdAfter)
+        if query.createdBefore is not None:
+            conditions.append("createdAt < ?")
+            params.append(query.createdBefore)
+        if query.reportId is not None:
+            conditions.append(
+                "json_type(parameters, '$.reportId') = 'integer' "
+                "AND json_extract(parameters, '$.reportId') = ?"
+            )
+            params.append(query.reportId)
+
+        where_clause = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        limit_clause = ""
+        if query.limit is not None:
+            # One extra row tells whether another page exists.
+            limit_clause = "LIMIT ?"
+            params.append(query.limit + 1)
+
+        with self._lock:
+            rows = self._execute_locked(
+                f"SELECT rowid AS position, {JOB_COLUMNS} FROM QueueJobs "
+                f"{where_clause} ORDER BY rowid {limit_clause}",
+                tuple(params),
+            ).fetchall()
+            next_cursor = None
+            if query.limit is not None and len(rows) > query.limit:
+                rows = rows[: query.limit]
+                next_cursor = encode_job_cursor(int(rows[-1]["position"]))
+
+            return QueueJobPage(
+                jobs=self._hydrate_jobs_locked(rows, include_logs=query.includeLogs),
+                nextCursor=next_cursor,
+                version=format_store_version(self._version_token, self._version),
+            )
+
+    def get_version(self) -> str:
+        with self._lock:
+            return format_store_version(self._version_token, self._version)
+
+    def get_snapshot(self) -> QueueJobSnapshot:
+        snapshot = self._snapshot
+        if snapshot is None:
+            with self._lock:
+                self._get_connection_locked()
+                if self._snapshot is None:
+                    self._snapshot = self._build_snapshot_locked()
+                snapshot = self._snapshot
+        return snapshot
+
+    @_timed_store_operation("append_job")
+    def append_job(self, job: QueueJobRecord) -> None:
+        validated_job = parse_job_record(asdict(job))
+        with self._lock:
+            connection = self._get_connection_locked()
+            try:
+                with connection:
+                    cursor = connection.execute(JOB_INSERT_SQL, _job_row_params(validated_job))
+                    self._insert_logs_locked(validated_job.jobId, validated_job.logs)
+            except sqlite3.Error as exc:
+                raise QueueStoreError(f"Failed to write queue job store: {exc}") from exc
+            self._index.put(copy_job_record(validated_job, include_logs=False), cursor.lastrowid)
+            self._version += 1
+            self._invalidate_snapshot_locked()
+
+    @_timed_store_operation("update_job")
+    def update_job(
+        self,
+        job_id: str,
+        updater: Callable[[QueueJobRecord], QueueJobRecord],
+    ) -> QueueJobRecord | None:
+        with self._lock:
+            connection = self._get_connection_locked()
+            row = self._execute_locked(
+                f"SELECT {JOB_COLUMNS} FROM QueueJobs WHERE jobId = ?",
+                (job_id,),
+            ).fetchone()
+            if row is None:
+                return None
+
+            existing_job = self._hydrate_jobs_locked([row], include_logs=False)[0]
+            updated_job = updater(copy_job_record(existing_job))
+            validated_job = parse_job_record(asdict(updated_job))
+            if validated_job.jobId != job_id:
+                raise QueueStoreError("Queue job record jobId cannot change on update")
+
+            log_lines, validated_job.logs = validated_job.logs, []
+            try:
+                with connection:
+                    connection.execute(
+                        """
+                        UPDATE QueueJobs
+                        SET endpointName = ?, status = ?, createdAt = ?, startedAt = ?,
+                            endedAt = ?, failureReason = ?, parameters = ?, result = ?,
+                            resumeCursor = ?, priority = ?, coalesceKey = ?
+                        WHERE jobId = ?
+                        """,
+                        (*_job_row_params(validated_job)[1:], job_id),
+                    )
+                    self._insert_logs_locked(job_id, log_lines)
+            except sqlite3.Error as exc:
+                raise QueueStoreError(f"Failed to write queue job store: {exc}") from exc
+            self._index.put(copy_job_record(validated_job))
+            self._version += 1
+            self._invalidate_snapshot_locked()
+
+            return validated_job
+
+    @_timed_store_operation("append_job_log")
+    def append_job_log(self, job_id: str, message: str) -> bool:
+        with self._lock:
+            connection = self._get_connection_locked()
+            try:
+                with connection:
+                    cursor = connection.execute(
+                        """
+                        INSERT INTO QueueJobLogs (jobId, line)
+                        SELECT ?, ? WHERE EXISTS (SELECT 1 FROM QueueJobs WHERE jobId = ?)
+                        """,
+                        (job_id, message, job_id),
+                    )
+            except sqlite3.Error as exc:
+                raise QueueStoreError(f"Failed to write queue job store: {exc}") from exc
+
+            if cursor.rowcount > 0:
+                self._version += 1
+                self._invalidate_snapshot_locked()
+            return cursor.rowcount > 0
+
+    @_timed_store_operation("get_job_logs")
+    def get_job_logs(self, job_id: str, offset: int, limit: int) -> QueueJobLogPage | None:
+        with self._lock:
+            row = self._execute_locked(
+                """
+                SELECT (SELECT COUNT(*) FROM QueueJobLogs WHERE jobId = ?) AS total
+                FROM QueueJobs WHERE jobId = ?
+                """,
+                (job_id, job_id),
+            ).fetchone()
+            if row is None:
+                return None
+
+            start = min(offset, row["total"])
+            log_rows = self._execute_locked(
+                "SELECT line FROM QueueJobLogs WHERE jobId = ? ORDER BY id LIMIT ? OFFSET ?",
+                (job_id, limit, start),
+            ).fetchall()
+            return QueueJobLogPage(
+                jobId=job_id,
+                lines=[log_row["line"] for log_row in log_rows],
+                offset=start,
+                nextOffset=start + len(log_rows),
+                total=row["total"],
+            )
+
+    @_timed_store_operation("allocate_job_id")
+    def allocate_job_id(self) -> str:
+        with self._lock:
+            connection = self._get_connection_locked()
+            try:
+                with connection:
+                    row = connection.execute(
+                        """
+                        UPDATE QueueJobSequence
+                        SET lastValue = lastValue + 1
+                        WHERE id = 1
+                        RETURNING lastValue
+                        """
+                    ).fetchone()
+            except sqlite3.Error as exc:
+                raise QueueStoreError(f"Failed to write queue job store: {exc}") from exc
+
+            return format_job_id(int(row["lastValue"]))
+
+    @_timed_store_operation("remove_jobs")
+    def remove_jobs(self, job_ids: Iterable[str]) -> list[QueueJobRecord]:
+        unique_job_ids = list(dict.fromkeys(job_ids))
+        with self._lock:
+            connection = self._get_connection_locked()
+            removed_jobs: list[QueueJobRecord] = []
+            try:
+                with connection:
+                    for offset in range(0, len(unique_job_ids), LOG_LOOKUP_CHUNK_SIZE):
+                        chunk = unique_job_ids[offset : offset + LOG_LOOKUP_CHUNK_SIZE]
+                        placeholders = ",".join("?" for _ in chunk)
+                        rows = connection.execute(
+                            f"SELECT {JOB_COLUMNS} FROM QueueJobs WHERE jobId IN ({placeholders}) ORDER BY rowid",
+                            tuple(chunk),
+                        ).fetchall()
+                        removed_jobs.extend(self._hydrate_jobs_locked(rows))
+                        connection.execute(
+                            f"DELETE FROM QueueJobs WHERE jobId IN ({placeholders})",
+                            tuple(chunk),
+                        )
+            except sqlite3.Error as exc:
+                raise QueueStoreError(f"Failed to write queue job store: {exc}") from exc
+
+            if removed_jobs:
+                for removed_job in removed_jobs:
+                    self._index.remove(removed_job.jobId)
+                self._version += 1
+                self._invalidate_snapshot_locked()
+            return removed_jobs
+
+    @_timed_store_operation("get_latest_job_by_endpoint_name")
+    def get_latest_job_by_endpoint_name(self, endpoint_name: str) -> QueueJobRecord | None:
+        with self._lock:
+            row = self._execute_locked(
+                f"""
+                SELECT {JOB_COLUMNS}
+                FROM QueueJobs
+                WHERE endpointName = ?
+                ORDER BY createdAt DESC, rowid ASC
+                LIMIT 1
+                """,
+                (endpoint_name,),
+            ).fetchone()
+            if row is None:
+                return None
+
+            return self._hydrate_jobs_locked([row])[0]
+
+    @_timed_store_operation("replace_jobs")
+    def replace_jobs(self, jobs: list[QueueJobRecord]) -> None:
+        validated_jobs = [parse_job_record(asdict(job)) for job in jobs]
+        with self._lock:
+            connection = self._get_connection_locked()
+            try:
+                with connection:
+                    connection.execute("DELETE FROM QueueJobLogs")
+                    connection.execute("DELETE FROM QueueJobs")
+                    index = QueueJobIndex()
+                    for job in validated_jobs:
+                        cursor = connection.execute(JOB_INSERT_SQL, _job_row_params(job))
+                        self._insert_logs_locked(job.jobId, job.logs)
+                        index.put(copy_job_record(job, include_logs=False), cursor.lastrowid)
+                    # Never lower the sequence: ids of removed jobs may still be archived.
+                    connection.execute(
+                        "UPDATE QueueJobSequence SET lastValue = MAX(lastValue, ?) WHERE id = 1",
+                        (get_highest_job_sequence(job.jobId for job in validated_jobs),),
+                    )
+            except sqlite3.Error as exc:
+                raise QueueStoreError(f"Failed to write queue job store: {exc}") from exc
+            self._index = index
+            self._version += 1
+            self._invalidate_snapshot_locked()
+
+    def _get_connection_locked(self) -> sqlite3.Connection:
+        if self._connection is not None:
+            return self._connection
+
+        try:
+            self._file_path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(str(self._file_path), check_same_thread=False)
+            connection.row_factory = sqlite3.Row
+            connection.execute("PRAGMA journal_mode = WAL")
+            connection.execute("PRAGMA foreign_keys = ON")
+            with connection:
+                for statement in SCHEMA_STATEMENTS:
+                    connection.execute(statement)
+                self._migrate_job_columns(connection)
+                self._seed_sequence(connection)
+        except (OSError, sqlite3.Error) as exc:
+            raise QueueStoreError(f"Failed to open queue job store: {exc}") from exc
+
+        self._connection = connection
+        self._load_index_locked()
+        return connection
+
+    def _load_index_locked(self) -> None:
+        rows = self._execute_locked(
+            f"SELECT rowid AS position, {JOB_COLUMNS} FROM QueueJobs ORDER BY rowid"
+        ).fetchall()
+        index = QueueJobIndex()
+        for row, job in zip(rows, self._hydrate_jobs_locked(rows, include_logs=False)):
+            index.put(job, int(row["position"]))
+        self._index = index
+        self._invalidate_snapshot_locked()
+
+    def _invalidate_snapshot_locked(self) -> None:
+        # Rebuilt by the next get_snapshot, so writes never pay for a copy.
+        self._snapshot = None
+
+    def _build_snapshot_locked(self) -> QueueJobSnapshot:
+        return build_queue_job_snapshot(
+            format_store_version(self._version_token, self._version),
+            self._index,
+        )
+
+    def _migrate_job_columns(self, connection: sqlite3.Connection) -> None:
+        existing_columns = {
+            row["name"] for row in connection.execute("PRAGMA table_info(QueueJobs)")
+        }
+        for column_name, column_type in MIGRATED_JOB_COLUMNS:
+            if column_name not in existing_columns:
+                connection.execute(f"ALTER TABLE QueueJobs ADD COLUMN {column_name} {column_type}")
+
+    def _seed_sequence(self, connection: sqlite3.Connection) -> None:
+        if connection.execute("SELECT 1 FROM QueueJobSequence WHERE id = 1").fetchone():
+            return
+
+        job_ids = [row["jobId"] for row in connection.execute("SELECT jobId FROM QueueJobs")]
+        connection.execute(
+            "INSERT INTO QueueJobSequence (id, lastValue) VALUES (1, ?)",
+            (get_highest_job_sequence(job_ids),),
+        )
+
+    def _execute_locked(self, query: str, params: tuple[Any, ...] = ()) -> sqlite3.Cursor:
+        try:
+            return self._get_connection_locked().execute(query, params)
+        except sqlite3.Error as exc:
+            raise QueueStoreError(f"Failed to read queue job store: {exc}") from exc
+
+    def _hydrate_jobs_locked(
+        self,
+        rows: list[sqlite3.Row],
+        include_logs: bool = True,
+    ) -> list[QueueJobRecord]:
+        if not rows:
+            return []
+
+        job_ids = [row["jobId"] for row in rows]
+        logs_by_job_id: dict[str, list[str]] = {job_id: [] for job_id in job_ids}
+        for offset in range(0, len(job_ids) if include_logs else 0, LOG_LOOKUP_CHUNK_SIZE):
+            chunk = job_ids[offset : offset + LOG_LOOKUP_CHUNK_SIZE]
+            placeholders = ",".join("?" for _ in chunk)
+            log_rows = self._execute_locked(
+                f"SELECT jobId, line FROM QueueJobLogs WHERE jobId IN ({placeholders}) ORDER BY id",
+                tuple(chunk),
+            ).fetchall()
+            for log_row in log_rows:
+                logs_by_job_id[log_row["jobId"]].append(log_row["line"])
+
+        return [
+            parse_job_record(
+                {
+                    "jobId": row["jobId"],
+                    "endpointName": row["endpointName"],
+                    "status": row["status"],
+                    "createdAt": row["createdAt"],
+                    "startedAt": row["startedAt"],
+                    "endedAt": row["endedAt"],
+                    "failureReason": row["failureReason"],
+                    "logs": logs_by_job_id[row["jobId"]],
+                    "parameters": _decode_json_field(row["parameters"]),
+                    "result": _decode_json_field(row["result"]),
+                    "resumeCursor": _decode_json_field(row["resumeCursor"]),
+                    "priority": row["priority"],
+                    "coalesceKey": row["coalesceKey"],
+                }
+            )
+            for row in rows
+        ]
+
+    def _insert_logs_locked(self, job_id: str, lines: list[str]) -> None:
+        if not lines:
+            return
+
+        self._get_connection_locked().executemany(
+            "INSERT INTO QueueJobLogs (jobId, line) VALUES (?, ?)",
+            [(job_id, line) for line in lines],
+        )
+
+
+def create_sqlite_queue_job_store(file_path: Path) -> SqliteQueueJobStore:
+    return SqliteQueueJobStore(file_path=file_path)
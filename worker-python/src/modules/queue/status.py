@@ -2,7 +2,10 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
-from src.modules.queue.store import QueueJobStore
+from src.modules.queue.archive import QueueJobArchive
+from src.modules.queue.listing import QueueJobListQuery
+from src.modules.queue.snapshot import QueueJobSnapshot
+from src.modules.queue.store import QueueJobStoreBackend
 from src.modules.queue.types import QueueJobRecord, QueueJobStatus
 
 
@@ -20,34 +23,55 @@ class QueueStatusSummary:
 class QueueStatusView:
     summary: QueueStatusSummary
     runningJob: QueueJobRecord | None
+    runningJobs: list[QueueJobRecord]
     queuedJobs: list[QueueJobRecord]
 
 
 def summarize_queue_jobs(jobs: list[QueueJobRecord]) -> QueueStatusSummary:
+    counts = {status: 0 for status in QueueJobStatus}
+    for job in jobs:
+        counts[job.status] += 1
+
+    return summarize_status_counts(counts)
+
+
+def summarize_status_counts(counts: dict[QueueJobStatus, int]) -> QueueStatusSummary:
     return QueueStatusSummary(
-        totalJobs=len(jobs),
-        queued=len([job for job in jobs if job.status == QueueJobStatus.QUEUED]),
-        running=len([job for job in jobs if job.status == QueueJobStatus.RUNNING]),
-        completed=len([job for job in jobs if job.status == QueueJobStatus.COMPLETED]),
-        failed=len([job for job in jobs if job.status == QueueJobStatus.FAILED]),
-        canceled=len([job for job in jobs if job.status == QueueJobStatus.CANCELED]),
+        totalJobs=sum(counts.values()),
+        queued=counts.get(QueueJobStatus.QUEUED, 0),
+        running=counts.get(QueueJobStatus.RUNNING, 0),
+        completed=counts.get(QueueJobStatus.COMPLETED, 0),
+        failed=counts.get(QueueJobStatus.FAILED, 0),
+        canceled=counts.get(QueueJobStatus.CANCELED, 0),
     )
 
 
-def get_check_status_by_job_id(store: QueueJobStore, job_id: str) -> QueueJobRecord | None:
-    return store.get_job_by_id(job_id)
+def get_check_status_by_job_id(
+    store: QueueJobStoreBackend,
+    job_id: str,
+    archive: QueueJobArchive | None = None,
+) -> QueueJobRecord | None:
+    job = store.get_job_by_id(job_id)
+    if job is not None or archive is None:
+        return job
 
+    return archive.get_job_by_id(job_id)
 
-def get_queue_status(store: QueueJobStore) -> QueueStatusView:
-    jobs = store.get_jobs()
-    running_job = next(
-        (job for job in jobs if job.status == QueueJobStatus.RUNNING),
-        None,
-    )
-    queued_jobs = [job for job in jobs if job.status == QueueJobStatus.QUEUED]
+
+def get_queue_status(
+    store: QueueJobStoreBackend | QueueJobSnapshot,
+    include_logs: bool = True,
+) -> QueueStatusView:
+    running_jobs = store.list_jobs(
+        QueueJobListQuery(statuses=(QueueJobStatus.RUNNING,), includeLogs=include_logs)
+    ).jobs
+    queued_jobs = store.list_jobs(
+        QueueJobListQuery(statuses=(QueueJobStatus.QUEUED,), includeLogs=include_logs)
+    ).jobs
 
     return QueueStatusView(
-        summary=summarize_queue_jobs(jobs),
-        runningJob=running_job,
+        summary=summarize_status_counts(store.count_jobs_by_status()),
+        runningJob=running_jobs[0] if running_jobs else None,
+        runningJobs=running_jobs,
         queuedJobs=queued_jobs,
     )
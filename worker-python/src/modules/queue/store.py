@@ -2,71 +2,44 @@ from __future__ import annotations
 
 import json
 import os
-from collections.abc import Callable
-from dataclasses import asdict
+from collections.abc import Callable, Iterable
+from dataclasses import asdict, dataclass, replace
 from pathlib import Path
 from threading import Lock
+from typing import Protocol
+from uuid import uuid4
 
+from src.metrics import QUEUE_STORE_OPERATION_SECONDS, timed
 from src.modules.queue.errors import QueueStoreError
+from src.modules.queue.index import QueueJobIndex
+from src.modules.queue.job_ids import format_job_id, get_highest_job_sequence
+from src.modules.queue.job_logs import (
+    QueueJobLogPage,
+    QueueJobLogSegments,
+    QueueJobLogView,
+    resolve_job_log_directory,
+    slice_job_log_page,
+)
+from src.modules.queue.listing import QueueJobListQuery, QueueJobPage, select_job_page
+from src.modules.queue.records import copy_job_record, parse_job_record
+from src.modules.queue.snapshot import QueueJobSnapshot, build_queue_job_snapshot
 from src.modules.queue.types import QueueJobRecord, QueueJobStatus, QueueJobStoreData
 
 
-def _parse_job_status(value: object) -> QueueJobStatus:
-    if not isinstance(value, str):
-        raise QueueStoreError("Queue job record status is invalid")
-
-    try:
-        return QueueJobStatus(value)
-    except ValueError as exc:
-        raise QueueStoreError("Queue job record status is invalid") from exc
-
-
-def _parse_job_record(value: object) -> QueueJobRecord:
-    if not isinstance(value, dict):
-        raise QueueStoreError("Queue job record must be an object")
-
-    job_id = value.get("jobId")
-    endpoint_name = value.get("endpointName")
-    status = value.get("status")
-    created_at = value.get("createdAt")
-    started_at = value.get("startedAt")
-    ended_at = value.get("endedAt")
-    failure_reason = value.get("failureReason")
-    logs = value.get("logs", [])
-    parameters = value.get("parameters")
-    result = value.get("result")
-
-    if not isinstance(job_id, str) or job_id.strip() == "":
-        raise QueueStoreError("Queue job record jobId must be a non-empty string")
-    if not isinstance(endpoint_name, str) or endpoint_name.strip() == "":
-        raise QueueStoreError("Queue job record endpointName must be a non-empty string")
-    if not isinstance(created_at, str) or created_at.strip() == "":
-        raise QueueStoreError("Queue job record createdAt must be a non-empty string")
-    if started_at is not None and not isinstance(started_at, str):
-        raise QueueStoreError("Queue job record startedAt must be a string when provided")
-    if ended_at is not None and not isinstance(ended_at, str):
-        raise QueueStoreError("Queue job record endedAt must be a string when provided")
-    if failure_reason is not None and not isinstance(failure_reason, str):
-        raise QueueStoreError("Queue job record failureReason must be a string when provided")
-    if not isinstance(logs, list) or not all(isinstance(line, str) for line in logs):
-        raise QueueStoreError("Queue job record logs must be an array of strings")
-    if parameters is not None and not isinstance(parameters, dict):
-        raise QueueStoreError("Queue job record parameters must be an object when provided")
-    if result is not None and not isinstance(result, dict):
-        raise QueueStoreError("Queue job record result must be an object when provided")
-
-    return QueueJobRecord(
-        jobId=job_id,
-        endpointName=endpoint_name,
-        status=_parse_job_status(status),
-        createdAt=created_at,
-        startedAt=started_at,
-        endedAt=ended_at,
-        failureReason=failure_reason,
-        logs=logs,
-        parameters=parameters,
-        result=result,
-    )
+DEFAULT_JOURNAL_COMPACT_THRESHOLD = 1000
+JOURNAL_OP_PUT = "put"
+JOURNAL_OP_DELETE = "delete"
+
+
+@dataclass(slots=True)
+class QueueJournalEntry:
+    op: str
+    jobId: str
+    job: QueueJobRecord | None = None
+
+
+def _timed_store_operation(operation: str):
+    return timed(QUEUE_STORE_OPERATION_SECONDS, backend="json", operation=operation)
 
 
 def _parse_store_data(raw_value: object) -> QueueJobStoreData:
@@ -77,79 +50,449 @@ def _parse_store_data(raw_value: object) -> QueueJobStoreData:
     if not isinstance(raw_jobs, list):
         raise QueueStoreError("Queue job store must include jobs array")
 
-    return QueueJobStoreData(jobs=[_parse_job_record(raw_job) for raw_job in raw_jobs])
+    return QueueJobStoreData(jobs=[parse_job_record(raw_job) for raw_job in raw_jobs])
+
+
+class QueueJobStoreBackend(Protocol):
+    """
+    Storage contract shared by the JSON journal and SQLite queue stores.
+
+    Log lines are stored apart from job records. `update_job` hands the
+    updater the job without its log lines, and any lines in the record it
+    returns are appended to the job's log, so an update never re-reads or
+    re-writes earlier lines. `get_job_logs` pages through one job's log.
+    `get_snapshot` returns the current `QueueJobSnapshot`, for readers that
+    must not block; it only takes the store lock to build the snapshot, once
+    per version.
+    """
+
+    @property
+    def file_path(self) -> Path: ...
+
+    def ensure_initialized(self) -> None: ...
+
+    def get_jobs(self) -> list[QueueJobRecord]: ...
+
+    def get_job_by_id(self, job_id: str) -> QueueJobRecord | None: ...
+
+    def get_jobs_by_status(self, status: QueueJobStatus) -> list[QueueJobRecord]: ...
+
+    def count_jobs_by_status(self) -> dict[QueueJobStatus, int]: ...
+
+    def list_jobs(self, query: QueueJobListQuery) -> QueueJobPage: ...
+
+    def get_version(self) -> str: ...
+
+    def get_snapshot(self) -> QueueJobSnapshot: ...
+
+    def append_job(self, job: QueueJobRecord) -> None: ...
+
+    def update_job(
+        self,
+        job_id: str,
+        updater: Callable[[QueueJobRecord], QueueJobRecord],
+    ) -> QueueJobRecord | None: ...
+
+    def append_job_log(self, job_id: str, message: str) -> bool: ...
+
+    def get_job_logs(self, job_id: str, offset: int, limit: int) -> QueueJobLogPage | None: ...
+
+    def allocate_job_id(self) -> str: ...
+
+    def remove_jobs(self, job_ids: Iterable[str]) -> list[QueueJobRecord]: ...
+
+    def get_latest_job_by_endpoint_name(self, endpoint_name: str) -> QueueJobRecord | None: ...
+
+    def replace_jobs(self, jobs: list[QueueJobRecord]) -> None: ...
+
+
+def resolve_journal_path(file_path: Path) -> Path:
+    return file_path.with_name(f"{file_path.stem}.journal.jsonl")
+
+
+def resolve_sequence_path(file_path: Path) -> Path:
+    return file_path.with_name(f"{file_path.stem}.seq")
+
+
+def _parse_sequence_value(raw_text: str) -> int:
+    normalized_text = raw_text.strip()
+    if not normalized_text.isdigit():
+        raise QueueStoreError("Queue job sequence must be a non-negative integer")
+
+    return int(normalized_text)
+
+
+def new_store_version_token() -> str:
+    return uuid4().hex[:12]
+
+
+def format_store_version(token: str, version: int) -> str:
+    return f"{token}-{version}"
+
+
+def _parse_journal_entry(raw_value: object) -> QueueJournalEntry:
+    if not isinstance(raw_value, dict):
+        raise QueueStoreError("Queue job journal entry must be an object")
+
+    op = raw_value.get("op")
+    if op == JOURNAL_OP_PUT:
+        job = parse_job_record(raw_value.get("job"))
+        return QueueJournalEntry(op=op, jobId=job.jobId, job=job)
+    if op == JOURNAL_OP_DELETE:
+        job_id = raw_value.get("jobId")
+        if not isinstance(job_id, str) or job_id.strip() == "":
+            raise QueueStoreError("Queue job journal delete entry jobId is invalid")
+        return QueueJournalEntry(op=op, jobId=job_id)
+
+    raise QueueStoreError("Queue job journal entry op is invalid")
 
 
 class QueueJobStore:
-    def __init__(self, file_path: Path) -> None:
+    """
+    JSON-backed queue job store.
+
+    `queue-jobs.json` holds the last compacted snapshot. Every append or update
+    is written as one upsert record (removals as one delete record) to
+    `queue-jobs.journal.jsonl`, so mutations
+    cost a single appended line instead of a full-file rewrite. Log lines are
+    kept out of both files, in one append-only segment per job under
+    `queue-jobs-logs/`; an update that only adds log lines skips the journal. The snapshot
+    plus the journal tail are replayed once into an in-memory `QueueJobIndex`
+    when the store is first used; after that, reads are served from the index
+    and the files are only written for durability. The journal is folded back
+    into the snapshot once it reaches `compact_threshold` records.
+
+    Job ids are allocated from `queue-jobs.seq`, which holds the last issued
+    sequence number, so allocation never depends on how much history is kept.
+    The sequence only moves forward, even when `replace_jobs` clears the store.
+
+    Every job mutation bumps an in-memory version. The version is prefixed
+    with a token that is unique to this store instance, so a version seen
+    before a restart never matches one issued after it. Each mutation also
+    drops the current `QueueJobSnapshot`; the next `get_snapshot` builds one
+    for the new version. A job's log lines are read from its
+    segment file the first time they are needed and mirrored in memory from
+    then on; appends extend the mirrored list, and snapshot reads only see
+    jobs whose lines are already mirrored.
+    """
+
+    def __init__(
+        self,
+        file_path: Path,
+        compact_threshold: int = DEFAULT_JOURNAL_COMPACT_THRESHOLD,
+    ) -> None:
+        if compact_threshold <= 0:
+            raise ValueError("compact_threshold must be greater than 0")
+
         self._file_path = file_path
+        self._journal_path = resolve_journal_path(file_path)
+        self._sequence_path = resolve_sequence_path(file_path)
+        self._log_segments = QueueJobLogSegments(resolve_job_log_directory(file_path))
+        self._compact_threshold = compact_threshold
         self._lock = Lock()
+        self._index: QueueJobIndex | None = None
+        self._journal_entry_count = 0
+        self._last_sequence: int | None = None
+        self._version_token = new_store_version_token()
+        self._version = 0
+        self._logs: dict[str, list[str]] = {}
+        self._snapshot: QueueJobSnapshot | None = None
 
     @property
     def file_path(self) -> Path:
         return self._file_path
 
+    @property
+    def journal_path(self) -> Path:
+        return self._journal_path
+
+    @property
+    def sequence_path(self) -> Path:
+        return self._sequence_path
+
+    @property
+    def log_directory(self) -> Path:
+        return self._log_segments.directory
+
     def ensure_initialized(self) -> None:
         with self._lock:
             self._ensure_store_file()
+            self._load_locked()
 
+    @_timed_store_operation("get_jobs")
     def get_jobs(self) -> list[QueueJobRecord]:
         with self._lock:
-            return list(self._read_store_from_disk().jobs)
+            return [self._copy_with_logs_locked(job) for job in self._load_locked().values()]
 
+    @_timed_store_operation("get_job_by_id")
     def get_job_by_id(self, job_id: str) -> QueueJobRecord | None:
         with self._lock:
-            return next(
-                (job for job in self._read_store_from_disk().jobs if job.jobId == job_id),
-                None,
+            job = self._load_locked().get(job_id)
+            return self._copy_with_logs_locked(job) if job is not None else None
+
+    @_timed_store_operation("get_jobs_by_status")
+    def get_jobs_by_status(self, status: QueueJobStatus) -> list[QueueJobRecord]:
+        with self._lock:
+            return [
+                self._copy_with_logs_locked(job)
+                for job in self._load_locked().get_by_status(status)
+            ]
+
+    @_timed_store_operation("count_jobs_by_status")
+    def count_jobs_by_status(self) -> dict[QueueJobStatus, int]:
+        with self._lock:
+            return self._load_locked().count_by_status()
+
+    @_timed_store_operation("list_jobs")
+    def list_jobs(self, query: QueueJobListQuery) -> QueueJobPage:
+        with self._lock:
+            index = self._load_locked()
+            selected, next_cursor = select_job_page(
+                index.get_positioned(query.statuses),
+                query,
+            )
+            return QueueJobPage(
+                jobs=[
+                    self._copy_with_logs_locked(job, query.includeLogs) for _, job in selected
+                ],
+                nextCursor=next_cursor,
+                version=format_store_version(self._version_token, self._version),
             )
 
+    def get_version(self) -> str:
+        with self._lock:
+            return format_store_version(self._version_token, self._version)
+
+    def get_snapshot(self) -> QueueJobSnapshot:
+        snapshot = self._snapshot
+        if snapshot is None:
+            with self._lock:
+                self._load_locked()
+                if self._snapshot is None:
+                    self._snapshot = self._build_snapshot_locked()
+                snapshot = self._snapshot
+        return snapshot
+
+    @_timed_store_operation("append_job")
     def append_job(self, job: QueueJobRecord) -> None:
         with self._lock:
-            store_data = self._read_store_from_disk()
-            store_data.jobs.append(job)
-            self._write_store_to_disk(store_data)
-
+            index = self._load_locked()
+            validated_job = parse_job_record(asdict(job))
+            if index.get(validated_job.jobId) is not None:
+                raise QueueStoreError(f"Queue job already exists: {validated_job.jobId}")
+
+            log_lines, validated_job.logs = validated_job.logs, []
+            self._write_journal_entry_locked(validated_job)
+            index.put(validated_job)
+            self._log_segments.append(validated_job.jobId, log_lines)
+            self._logs[validated_job.jobId] = list(log_lines)
+            self._version += 1
+            self._invalidate_snapshot_locked()
+            self._compact_if_needed_locked()
+
+    @_timed_store_operation("update_job")
     def update_job(
         self,
         job_id: str,
         updater: Callable[[QueueJobRecord], QueueJobRecord],
     ) -> QueueJobRecord | None:
         with self._lock:
-            store_data = self._read_store_from_disk()
-            for index, existing_job in enumerate(store_data.jobs):
-                if existing_job.jobId != job_id:
-                    continue
+            index = self._load_locked()
+            existing_job = index.get(job_id)
+            if existing_job is None:
+                return None
 
-                updated_job = updater(existing_job)
-                validated_job = _parse_job_record(asdict(updated_job))
-                store_data.jobs[index] = validated_job
-                self._write_store_to_disk(store_data)
-                return validated_job
+            updated_job = updater(copy_job_record(existing_job))
+            validated_job = parse_job_record(asdict(updated_job))
+            if validated_job.jobId != job_id:
+                raise QueueStoreError("Queue job record jobId cannot change on update")
+
+            log_lines, validated_job.logs = validated_job.logs, []
+            if validated_job != existing_job:
+                self._write_journal_entry_locked(validated_job)
+                index.put(validated_job)
+            self._log_segments.append(job_id, log_lines)
+            mirrored_lines = self._logs.get(job_id)
+            if mirrored_lines is not None:
+                mirrored_lines.extend(log_lines)
+            self._version += 1
+            self._invalidate_snapshot_locked()
+            self._compact_if_needed_locked()
+            return copy_job_record(validated_job)
+
+    @_timed_store_operation("append_job_log")
+    def append_job_log(self, job_id: str, message: str) -> bool:
+        with self._lock:
+            if self._load_locked().get(job_id) is None:
+                return False
+
+            self._log_segments.append(job_id, [message])
+            mirrored_lines = self._logs.get(job_id)
+            if mirrored_lines is not None:
+                mirrored_lines.append(message)
+            self._version += 1
+            self._invalidate_snapshot_locked()
+            return True
+
+    @_timed_store_operation("get_job_logs")
+    def get_job_logs(self, job_id: str, offset: int, limit: int) -> QueueJobLogPage | None:
+        with self._lock:
+            if self._load_locked().get(job_id) is None:
+                return None
 
-            return None
+            return slice_job_log_page(job_id, self._get_logs_locked(job_id), offset, limit)
 
+    @_timed_store_operation("get_latest_job_by_endpoint_name")
     def get_latest_job_by_endpoint_name(self, endpoint_name: str) -> QueueJobRecord | None:
         with self._lock:
-            matching_jobs = [
-                job
-                for job in self._read_store_from_disk().jobs
-                if job.endpointName == endpoint_name
-            ]
-            if not matching_jobs:
-                return None
-
-            return max(matching_jobs, key=lambda job: job.createdAt)
+            job = self._load_locked().get_latest_by_endpoint_name(endpoint_name)
+            return self._copy_with_logs_locked(job) if job is not None else None
 
+    @_timed_store_operation("replace_jobs")
     def replace_jobs(self, jobs: list[QueueJobRecord]) -> None:
         with self._lock:
-            self._write_store_to_disk(QueueJobStoreData(jobs=list(jobs)))
+            validated_jobs = [parse_job_record(asdict(job)) for job in jobs]
+            self._log_segments.clear()
+            self._logs = {}
+            for validated_job in validated_jobs:
+                self._log_segments.append(validated_job.jobId, validated_job.logs)
+                self._logs[validated_job.jobId] = list(validated_job.logs)
+                validated_job.logs = []
+
+            # Never lower the sequence: ids of removed jobs may still be archived.
+            last_sequence = max(
+                self._load_sequence_locked(),
+                get_highest_job_sequence(job.jobId for job in validated_jobs),
+            )
+            self._index = QueueJobIndex(validated_jobs)
+            self._version += 1
+            self._invalidate_snapshot_locked()
+            self._compact_locked()
+            self._write_sequence_locked(last_sequence)
+
+    @_timed_store_operation("remove_jobs")
+    def remove_jobs(self, job_ids: Iterable[str]) -> list[QueueJobRecord]:
+        with self._lock:
+            index = self._load_locked()
+            existing_job_ids = [job_id for job_id in dict.fromkeys(job_ids) if index.get(job_id)]
+            if not existing_job_ids:
+                return []
+
+            self._write_journal_payloads_locked(
+                [{"op": JOURNAL_OP_DELETE, "jobId": job_id} for job_id in existing_job_ids]
+            )
+            removed_jobs = [
+                self._copy_with_logs_locked(index.remove(job_id)) for job_id in existing_job_ids
+            ]
+            self._log_segments.remove(existing_job_ids)
+            for job_id in existing_job_ids:
+                self._logs.pop(job_id, None)
+            self._version += 1
+            self._invalidate_snapshot_locked()
+            self._compact_if_needed_locked()
+            return removed_jobs
+
+    @_timed_store_operation("allocate_job_id")
+    def allocate_job_id(self) -> str:
+        with self._lock:
+            next_sequence = self._load_sequence_locked() + 1
+            self._write_sequence_locked(next_sequence)
+            return format_job_id(next_sequence)
+
+    def compact(self) -> None:
+        with self._lock:
+            self._load_locked()
+            self._compact_locked()
+
+    def _copy_with_logs_locked(
+        self,
+        job: QueueJobRecord,
+        include_logs: bool = True,
+    ) -> QueueJobRecord:
+        copied_job = copy_job_record(job)
+        if include_logs:
+            copied_job.logs = list(self._get_logs_locked(job.jobId))
+        return copied_job
+
+    def _get_logs_locked(self, job_id: str) -> list[str]:
+        lines = self._logs.get(job_id)
+        if lines is None:
+            lines = self._log_segments.read(job_id)
+            self._logs[job_id] = lines
+            self._invalidate_snapshot_locked()
+        return lines
 
     def _ensure_store_file(self) -> None:
         self._file_path.parent.mkdir(parents=True, exist_ok=True)
         if not self._file_path.exists():
             self._write_store_to_disk(QueueJobStoreData())
 
+    def _load_locked(self) -> QueueJobIndex:
+        if self._index is not None:
+            return self._index
+
+        index = QueueJobIndex(self._read_store_from_disk().jobs)
+        journal_entries, has_torn_tail = self._read_journal_from_disk()
+        for journal_entry in journal_entries:
+            if journal_entry.job is not None:
+                index.put(journal_entry.job)
+            else:
+                index.remove(journal_entry.jobId)
+
+        # Stores written before log segments existed keep logs inline; move
+        # them out once so later snapshots and journal records stay small.
+        inline_log_jobs = [job for job in index.values() if job.logs]
+        for job in inline_log_jobs:
+            if self._log_segments.count(job.jobId) == 0:
+                self._log_segments.append(job.jobId, job.logs)
+            index.put(replace(job, logs=[]))
+
+        self._index = index
+        self._logs = {}
+        self._invalidate_snapshot_locked()
+        self._journal_entry_count = len(journal_entries)
+        if has_torn_tail or inline_log_jobs:
+            self._compact_locked()
+        else:
+            self._compact_if_needed_locked()
+        return index
+
+    def _invalidate_snapshot_locked(self) -> None:
+        # Rebuilt by the next get_snapshot, so writes never pay for a copy.
+        self._snapshot = None
+
+    def _build_snapshot_locked(self) -> QueueJobSnapshot:
+        return build_queue_job_snapshot(
+            format_store_version(self._version_token, self._version),
+            self._index if self._index is not None else QueueJobIndex(),
+            {job_id: QueueJobLogView(lines) for job_id, lines in self._logs.items()},
+        )
+
+    def _load_sequence_locked(self) -> int:
+        if self._last_sequence is not None:
+            return self._last_sequence
+
+        persisted_sequence = 0
+        if self._sequence_path.exists():
+            try:
+                persisted_sequence = _parse_sequence_value(
+                    self._sequence_path.read_text(encoding="utf-8")
+                )
+            except OSError as exc:
+                raise QueueStoreError(f"Failed to read queue job sequence: {exc}") from exc
+
+        # Jobs written before the sequence file existed (or after a lost write)
+        # still reserve their ids, so seed from whichever is higher once.
+        stored_sequence = get_highest_job_sequence(
+            job.jobId for job in self._load_locked().values()
+        )
+        self._last_sequence = max(persisted_sequence, stored_sequence)
+        return self._last_sequence
+
+    def _write_sequence_locked(self, sequence: int) -> None:
+        self._write_text_atomically(self._sequence_path, f"{sequence}\n")
+        self._last_sequence = sequence
+
     def _read_store_from_disk(self) -> QueueJobStoreData:
         self._ensure_store_file()
 
@@ -163,20 +506,81 @@ class QueueJobStore:
 
         return _parse_store_data(parsed_value)
 
-    def _write_store_to_disk(self, store_data: QueueJobStoreData) -> None:
-        self._file_path.parent.mkdir(parents=True, exist_ok=True)
+    def _read_journal_from_disk(self) -> tuple[list[QueueJournalEntry], bool]:
+        if not self._journal_path.exists():
+            return [], False
 
-        temp_path = self._file_path.with_name(
-            f"{self._file_path.name}.{os.getpid()}.{id(self)}.tmp"
-        )
+        try:
+            raw_lines = self._journal_path.read_text(encoding="utf-8").splitlines()
+        except OSError as exc:
+            raise QueueStoreError(f"Failed to read queue job journal: {exc}") from exc
+
+        journal_entries: list[QueueJournalEntry] = []
+        for line_number, raw_line in enumerate(raw_lines, start=1):
+            if raw_line.strip() == "":
+                continue
+
+            try:
+                parsed_value = json.loads(raw_line)
+            except json.JSONDecodeError as exc:
+                # A torn final line is what an interrupted append leaves behind;
+                # anything earlier means the journal itself is corrupt.
+                if line_number == len(raw_lines):
+                    return journal_entries, True
+                raise QueueStoreError("Queue job journal contains invalid JSON") from exc
+
+            journal_entries.append(_parse_journal_entry(parsed_value))
+
+        return journal_entries, False
+
+    def _write_journal_entry_locked(self, job: QueueJobRecord) -> None:
+        self._write_journal_payloads_locked([{"op": JOURNAL_OP_PUT, "job": asdict(job)}])
+
+    def _write_journal_payloads_locked(self, payloads: list[dict[str, object]]) -> None:
+        self._journal_path.parent.mkdir(parents=True, exist_ok=True)
+        payload = "".join(json.dumps(entry) + "\n" for entry in payloads)
+
+        try:
+            with self._journal_path.open("a", encoding="utf-8") as journal_file:
+                journal_file.write(payload)
+        except OSError as exc:
+            raise QueueStoreError(f"Failed to write queue job journal: {exc}") from exc
+
+        self._journal_entry_count += len(payloads)
+
+    def _compact_if_needed_locked(self) -> None:
+        if self._journal_entry_count >= self._compact_threshold:
+            self._compact_locked()
+
+    def _compact_locked(self) -> None:
+        jobs = self._index.values() if self._index is not None else []
+        self._write_store_to_disk(QueueJobStoreData(jobs=jobs))
+
+        try:
+            self._journal_path.unlink(missing_ok=True)
+        except OSError as exc:
+            raise QueueStoreError(f"Failed to truncate queue job journal: {exc}") from exc
+
+        self._journal_entry_count = 0
+
+    def _write_store_to_disk(self, store_data: QueueJobStoreData) -> None:
         payload = json.dumps(asdict(store_data), indent=2) + "\n"
+        self._write_text_atomically(self._file_path, payload)
+
+    def _write_text_atomically(self, path: Path, payload: str) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        temp_path = path.with_name(f"{path.name}.{os.getpid()}.{id(self)}.tmp")
 
         try:
             temp_path.write_text(payload, encoding="utf-8")
-            temp_path.replace(self._file_path)
+            temp_path.replace(path)
         except OSError as exc:
             raise QueueStoreError(f"Failed to write queue job store: {exc}") from exc
 
 
-def create_queue_job_store(file_path: Path) -> QueueJobStore:
-    return QueueJobStore(file_path=file_path)
+def create_queue_job_store(
+    file_path: Path,
+    compact_threshold: int = DEFAULT_JOURNAL_COMPACT_THRESHOLD,
+) -> QueueJobStore:
+    return QueueJobStore(file_path=file_path, compact_threshold=compact_threshold)
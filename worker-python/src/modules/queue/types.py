@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from enum import StrEnum
+from typing import Any
 
 
 class QueueJobStatus(StrEnum):
@@ -12,6 +13,27 @@ class QueueJobStatus(StrEnum):
     CANCELED = "canceled"
 
 
+TERMINAL_JOB_STATUSES = (
+    QueueJobStatus.COMPLETED,
+    QueueJobStatus.FAILED,
+    QueueJobStatus.CANCELED,
+)
+
+
+class QueueJobPriority(StrEnum):
+    INTERACTIVE = "interactive"
+    NORMAL = "normal"
+    BULK = "bulk"
+
+
+# Highest priority first; the engine drains classes in this order.
+QUEUE_PRIORITY_ORDER = (
+    QueueJobPriority.INTERACTIVE,
+    QueueJobPriority.NORMAL,
+    QueueJobPriority.BULK,
+)
+
+
 @dataclass(slots=True)
 class QueueJobRecord:
     """
@@ -29,6 +51,11 @@ class QueueJobRecord:
     - failureReason
     - logs
     - parameters
+    - result
+    - resumeCursor: last checkpoint of an unfinished job, used to resume it
+      after a yield or a worker restart; cleared once the job finishes
+    - priority, coalesceKey: how an unfinished job was enqueued, so a worker
+      restart re-enqueues it the same way; cleared once the job finishes
     """
 
     jobId: str
@@ -41,6 +68,9 @@ class QueueJobRecord:
     logs: list[str] = field(default_factory=list)
     parameters: dict[str, str | int | float | bool | None] | None = None
     result: dict[str, str | int | float | bool | None] | None = None
+    resumeCursor: dict[str, Any] | None = None
+    priority: QueueJobPriority | None = None
+    coalesceKey: str | None = None
 
 
 @dataclass(slots=True)
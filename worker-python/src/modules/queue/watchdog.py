@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from enum import StrEnum
+from threading import Event, Lock, Thread
+from time import monotonic
+
+from loguru import logger
+
+from src.metrics import QUEUE_WATCHDOG_ACTIONS_TOTAL
+from src.modules.queue.config import QueueTimeoutPolicy
+from src.modules.queue.engine import ActiveJobHealth, GlobalQueueEngine
+
+
+class QueueJobExpireReason(StrEnum):
+    DEADLINE_EXCEEDED = "deadline_exceeded"
+    HEARTBEAT_TIMEOUT = "heartbeat_timeout"
+
+
+def get_expire_reason(
+    job: ActiveJobHealth,
+    policy: QueueTimeoutPolicy,
+    now: float,
+) -> QueueJobExpireReason | None:
+    timeout_seconds = policy.get_timeout_seconds(job.endpointName)
+    if timeout_seconds > 0 and now - job.startedAt > timeout_seconds:
+        return QueueJobExpireReason.DEADLINE_EXCEEDED
+    if (
+        policy.heartbeat_timeout_seconds > 0
+        and now - job.lastHeartbeatAt > policy.heartbeat_timeout_seconds
+    ):
+        return QueueJobExpireReason.HEARTBEAT_TIMEOUT
+
+    return None
+
+
+class QueueJobWatchdog:
+    """
+    Background watchdog that stops running jobs which overran or went silent.
+
+    A job that runs longer than its endpoint's deadline, or that has not
+    heartbeated within `heartbeat_timeout_seconds`, is canceled through the
+    engine. If it is still running `cancel_grace_seconds` later, the engine
+    abandons it: the job is marked failed, and a process job's worker is
+    terminated so its slot goes to the next pending job. The watchdog does
+    not start unless the policy sets a limit.
+    """
+
+    def __init__(
+        self,
+        engine: GlobalQueueEngine,
+        policy: QueueTimeoutPolicy,
+        clock: Callable[[], float] = monotonic,
+    ) -> None:
+        self._engine = engine
+        self._policy = policy
+        self._clock = clock
+        self._run_lock = Lock()
+        self._stop_event = Event()
+        self._thread: Thread | None = None
+
+    def run_once(self) -> list[str]:
+        handled_job_ids: list[str] = []
+        with self._run_lock:
+            now = self._clock()
+            for job in self._engine.get_active_job_health():
+                if job.expiredAt is None:
+                    reason = get_expire_reason(job, self._policy, now)
+                    if reason is None or not self._engine.expire_job(
+                        job.jobId,
+                        reason,
+                        expired_at=now,
+                    ):
+                        continue
+                    action = "cancel"
+                elif now - job.expiredAt >= self._policy.cancel_grace_seconds:
+                    if not self._engine.abandon_job(job.jobId):
+                        continue
+                    reason = job.expireReason
+                    action = "abandon"
+                else:
+                    continue
+
+                QUEUE_WATCHDOG_ACTIONS_TOTAL.inc(
+                    endpoint=job.endpointName,
+                    reason=reason,
+                    action=action,
+                )
+                logger.warning(
+                    "event=queue_watchdog_{} job_id={} endpoint={} reason={}",
+                    action,
+                    job.jobId,
+                    job.endpointName,
+                    reason,
+                )
+                handled_job_ids.append(job.jobId)
+
+        return handled_job_ids
+
+    def start(self) -> None:
+        if not self._policy.enabled:
+            return
+        if self._thread is not None and self._thread.is_alive():
+            return
+
+        self._stop_event.clear()
+        self._thread = Thread(target=self._run_loop, daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float | None = None) -> None:
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=timeout)
+            self._thread = None
+
+    def _run_loop(self) -> None:
+        while True:
+            try:
+                self.run_once()
+            except Exception as exc:
+                logger.warning("event=queue_watchdog_failed error={}", exc)
+
+            if self._stop_event.wait(timeout=self._policy.interval_seconds):
+                return
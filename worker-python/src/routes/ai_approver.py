@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from typing import Any
+
 from fastapi import APIRouter
 from fastapi.responses import JSONResponse
 from loguru import logger
@@ -14,9 +16,14 @@ from src.modules.queue.engine import (
     EnqueueJobInput,
     QueueExecutionContext,
     QueueJobCanceledError,
+    QueueJobYieldedError,
+)
+from src.modules.queue.global_queue import (
+    global_queue_engine,
+    global_queue_handlers,
+    global_queue_store,
 )
-from src.modules.queue.global_queue import global_queue_engine, global_queue_store
-from src.modules.queue.types import QueueJobRecord
+from src.modules.queue.types import QueueJobPriority
 
 
 router = APIRouter(prefix="/ai-approver", tags=["ai-approver"])
@@ -33,6 +40,7 @@ class AiApproverStartRequest(BaseModel):
     limit: int = Field(default=10, gt=0)
     requireStateAssignment: bool = True
     stateIds: list[int] | None = None
+    priority: QueueJobPriority = QueueJobPriority.NORMAL
 
 
 class AiApproverReviewPageStartRequest(BaseModel):
@@ -40,50 +48,33 @@ class AiApproverReviewPageStartRequest(BaseModel):
 
     articleId: int = Field(gt=0)
     promptVersionId: int = Field(gt=0)
+    priority: QueueJobPriority = QueueJobPriority.INTERACTIVE
 
 
-def _append_job_log(job_id: str, event: str, **fields: object) -> None:
+def _append_job_log(context: QueueExecutionContext, event: str, **fields: object) -> None:
     field_suffix = " ".join(f"{key}={value}" for key, value in fields.items())
-    message = f"event={event} job_id={job_id}"
+    message = f"event={event} job_id={context.jobId}"
     if field_suffix:
         message = f"{message} {field_suffix}"
-    queue_store.update_job(
-        job_id,
-        lambda job: QueueJobRecord(
-            jobId=job.jobId,
-            endpointName=job.endpointName,
-            status=job.status,
-            createdAt=job.createdAt,
-            startedAt=job.startedAt,
-            endedAt=job.endedAt,
-            failureReason=job.failureReason,
-            logs=[*job.logs, message],
-            parameters=job.parameters,
-            result=job.result,
-        ),
-    )
+    context.append_log(message)
     logger.info(message)
 
 
-def _update_job_result_fields(job_id: str, fields: dict[str, str | int | float | bool | None]) -> None:
-    queue_store.update_job(
-        job_id,
-        lambda job: QueueJobRecord(
-            jobId=job.jobId,
-            endpointName=job.endpointName,
-            status=job.status,
-            createdAt=job.createdAt,
-            startedAt=job.startedAt,
-            endedAt=job.endedAt,
-            failureReason=job.failureReason,
-            logs=job.logs,
-            parameters=job.parameters,
-            result={
-                **(job.result or {}),
-                **fields,
-            },
-        ),
-    )
+def _accumulate_score_counts(
+    totals: dict[str, object],
+    summary: dict[str, object],
+) -> dict[str, int]:
+    return {
+        "promptCount": int(summary["promptCount"]),
+        "articleCount": int(totals.get("articleCount", 0)) + int(summary["articleCount"]),
+        "attemptCount": int(totals.get("attemptCount", 0)) + int(summary["attemptCount"]),
+        "usagePromptTokens": int(totals.get("usagePromptTokens", 0))
+        + int(summary["usage"]["prompt_tokens"]),
+        "usageCompletionTokens": int(totals.get("usageCompletionTokens", 0))
+        + int(summary["usage"]["completion_tokens"]),
+        "usageTotalTokens": int(totals.get("usageTotalTokens", 0))
+        + int(summary["usage"]["total_tokens"]),
+    }
 
 
 def create_ai_approver_runner(
@@ -92,72 +83,92 @@ def create_ai_approver_runner(
     state_ids: list[int] | None,
 ):
     def _run(context: QueueExecutionContext) -> None:
-        _append_job_log(context.jobId, "job_started", limit=limit)
+        # A resumed run, after a yield or a restart, carries the remaining limit
+        # and the totals of earlier runs.
+        totals = dict(context.resumeCursor or {})
+        remaining_limit = int(totals.pop("remainingLimit", limit))
+        if context.resumeCursor is not None:
+            _append_job_log(context, "job_resumed", limit=remaining_limit)
+        else:
+            _append_job_log(context, "job_started", limit=limit)
         repository: AiApproverRepository | None = None
 
+        def _save_checkpoint(progress: dict[str, object]) -> None:
+            # Scored articles are already stored, so a restart only needs the counts.
+            # Checkpoints are written every `checkpoint_interval` articles; one that
+            # lags only lets a restarted run score a few articles past its limit.
+            if int(progress["articleCount"]) % config.checkpoint_interval != 0:
+                return
+            context.save_checkpoint(
+                {
+                    **_accumulate_score_counts(totals, progress),
+                    "remainingLimit": remaining_limit - int(progress["articleCount"]),
+                }
+            )
+
         try:
             config = AiApproverConfig.from_env()
             repository = AiApproverRepository(config)
             client = AiApproverOpenAIClient(config)
             orchestrator = AiApproverOrchestrator(repository, client)
             summary = orchestrator.run_score(
-                limit=limit,
+                limit=remaining_limit,
                 require_state_assignment=require_state_assignment,
                 state_ids=state_ids,
                 job_id=context.jobId,
                 should_cancel=context.is_cancel_requested,
+                should_yield=context.is_yield_requested,
+                on_article_scored=_save_checkpoint,
             )
         except AiApproverConfigError as exc:
-            _update_job_result_fields(
-                context.jobId,
+            context.update_result(
                 {
                     "exitCode": 1,
                     "error": str(exc),
                     "stderr": str(exc),
                     "stdout": "",
                     "statusText": "failed",
-                },
+                }
             )
-            _append_job_log(context.jobId, "job_failed", limit=limit)
+            _append_job_log(context, "job_failed", limit=limit)
             raise
         except Exception as exc:
             message = str(exc)
-            _update_job_result_fields(
-                context.jobId,
+            context.update_result(
                 {
                     "exitCode": 1,
                     "error": message,
                     "stderr": message,
                     "stdout": "",
                     "statusText": "cancelled" if context.is_cancel_requested() else "failed",
-                },
+                }
             )
             if context.is_cancel_requested() or "cancelled" in message.lower():
-                _append_job_log(context.jobId, "job_cancelled", limit=limit)
+                _append_job_log(context, "job_cancelled", limit=limit)
                 raise QueueJobCanceledError() from exc
-            _append_job_log(context.jobId, "job_failed", limit=limit)
+            _append_job_log(context, "job_failed", limit=limit)
             raise
         finally:
             if repository is not None:
                 repository.close()
 
-        _update_job_result_fields(
-            context.jobId,
+        counts = _accumulate_score_counts(totals, summary)
+        if summary.get("yielded"):
+            next_limit = remaining_limit - int(summary["articleCount"])
+            _append_job_log(context, "job_yielded", limit=next_limit)
+            raise QueueJobYieldedError({**counts, "remainingLimit": next_limit})
+
+        context.update_result(
             {
                 "exitCode": 0,
                 "error": None,
                 "stderr": "",
                 "stdout": "AI approver processed in worker-python",
                 "statusText": "completed",
-                "promptCount": int(summary["promptCount"]),
-                "articleCount": int(summary["articleCount"]),
-                "attemptCount": int(summary["attemptCount"]),
-                "usagePromptTokens": int(summary["usage"]["prompt_tokens"]),
-                "usageCompletionTokens": int(summary["usage"]["completion_tokens"]),
-                "usageTotalTokens": int(summary["usage"]["total_tokens"]),
-            },
+                **counts,
+            }
         )
-        _append_job_log(context.jobId, "job_completed", limit=limit)
+        _append_job_log(context, "job_completed", limit=limit)
 
     return _run
 
@@ -168,7 +179,7 @@ def create_review_page_ai_approver_runner(
 ):
     def _run(context: QueueExecutionContext) -> None:
         _append_job_log(
-            context.jobId,
+            context,
             "job_started",
             article_id=article_id,
             prompt_version_id=prompt_version_id,
@@ -187,18 +198,17 @@ def create_review_page_ai_approver_runner(
                 should_cancel=context.is_cancel_requested,
             )
         except AiApproverConfigError as exc:
-            _update_job_result_fields(
-                context.jobId,
+            context.update_result(
                 {
                     "exitCode": 1,
                     "error": str(exc),
                     "stderr": str(exc),
                     "stdout": "",
                     "statusText": "failed",
-                },
+                }
             )
             _append_job_log(
-                context.jobId,
+                context,
                 "job_failed",
                 article_id=article_id,
                 prompt_version_id=prompt_version_id,
@@ -206,26 +216,25 @@ def create_review_page_ai_approver_runner(
             raise
         except Exception as exc:
             message = str(exc)
-            _update_job_result_fields(
-                context.jobId,
+            context.update_result(
                 {
                     "exitCode": 1,
                     "error": message,
                     "stderr": message,
                     "stdout": "",
                     "statusText": "cancelled" if context.is_cancel_requested() else "failed",
-                },
+                }
             )
             if context.is_cancel_requested() or "cancelled" in message.lower():
                 _append_job_log(
-                    context.jobId,
+                    context,
                     "job_cancelled",
                     article_id=article_id,
                     prompt_version_id=prompt_version_id,
                 )
                 raise QueueJobCanceledError() from exc
             _append_job_log(
-                context.jobId,
+                context,
                 "job_failed",
                 article_id=article_id,
                 prompt_version_id=prompt_version_id,
@@ -235,8 +244,7 @@ def create_review_page_ai_approver_runner(
             if repository is not None:
                 repository.close()
 
-        _update_job_result_fields(
-            context.jobId,
+        context.update_result(
             {
                 "exitCode": 0,
                 "error": None,
@@ -250,10 +258,10 @@ def create_review_page_ai_approver_runner(
                 "usageCompletionTokens": int(summary["usage"]["completion_tokens"]),
                 "usageTotalTokens": int(summary["usage"]["total_tokens"]),
                 "contentSource": summary["contentSource"],
-            },
+            }
         )
         _append_job_log(
-            context.jobId,
+            context,
             "job_completed",
             article_id=article_id,
             prompt_version_id=prompt_version_id,
@@ -262,24 +270,91 @@ def create_review_page_ai_approver_runner(
     return _run
 
 
-@router.post("/start-job", status_code=202)
-def start_ai_approver_job(body: AiApproverStartRequest) -> JSONResponse:
+def build_ai_approver_job_input(
+    limit: int,
+    require_state_assignment: bool,
+    state_ids: list[int] | None,
+    priority: QueueJobPriority = QueueJobPriority.NORMAL,
+) -> EnqueueJobInput:
     parameters: dict[str, object] = {
-        "limit": body.limit,
-        "requireStateAssignment": body.requireStateAssignment,
+        "limit": limit,
+        "requireStateAssignment": require_state_assignment,
     }
-    if body.stateIds is not None:
-        parameters["stateIds"] = body.stateIds
+    if state_ids is not None:
+        parameters["stateIds"] = state_ids
+
+    return EnqueueJobInput(
+        endpointName=AI_APPROVER_ENDPOINT_NAME,
+        run=create_ai_approver_runner(limit, require_state_assignment, state_ids),
+        parameters=parameters,
+        priority=priority,
+        preemptible=True,
+    )
 
+
+def build_review_page_ai_approver_job_input(
+    article_id: int,
+    prompt_version_id: int,
+    priority: QueueJobPriority = QueueJobPriority.INTERACTIVE,
+) -> EnqueueJobInput:
+    return EnqueueJobInput(
+        endpointName=AI_APPROVER_REVIEW_PAGE_ENDPOINT_NAME,
+        run=create_review_page_ai_approver_runner(article_id, prompt_version_id),
+        parameters={
+            "articleId": article_id,
+            "promptVersionId": prompt_version_id,
+        },
+        priority=priority,
+    )
+
+
+def build_ai_approver_job_from_parameters(parameters: dict[str, Any]) -> EnqueueJobInput:
+    request = AiApproverStartRequest.model_validate(parameters)
+    return build_ai_approver_job_input(
+        request.limit,
+        request.requireStateAssignment,
+        request.stateIds,
+    )
+
+
+def build_review_page_ai_approver_job_from_parameters(
+    parameters: dict[str, Any],
+) -> EnqueueJobInput:
+    request = AiApproverReviewPageStartRequest.model_validate(parameters)
+    return build_review_page_ai_approver_job_input(request.articleId, request.promptVersionId)
+
+
+def probe_ai_approver_work(parameters: dict[str, Any]) -> tuple[int, int] | None:
+    request = AiApproverStartRequest.model_validate(parameters)
+    repository = AiApproverRepository(AiApproverConfig.from_env())
+    try:
+        return repository.get_eligible_article_watermark(
+            require_state_assignment=request.requireStateAssignment,
+            state_ids=request.stateIds,
+        )
+    finally:
+        repository.close()
+
+
+global_queue_handlers.register(
+    AI_APPROVER_ENDPOINT_NAME,
+    build_ai_approver_job_from_parameters,
+    probe=probe_ai_approver_work,
+)
+global_queue_handlers.register(
+    AI_APPROVER_REVIEW_PAGE_ENDPOINT_NAME,
+    build_review_page_ai_approver_job_from_parameters,
+)
+
+
+@router.post("/start-job", status_code=202)
+def start_ai_approver_job(body: AiApproverStartRequest) -> JSONResponse:
     result = queue_engine.enqueue_job(
-        EnqueueJobInput(
-            endpointName=AI_APPROVER_ENDPOINT_NAME,
-            run=create_ai_approver_runner(
-                body.limit,
-                body.requireStateAssignment,
-                body.stateIds,
-            ),
-            parameters=parameters,
+        build_ai_approver_job_input(
+            body.limit,
+            body.requireStateAssignment,
+            body.stateIds,
+            priority=body.priority,
         )
     )
 
@@ -298,16 +373,10 @@ def start_review_page_ai_approver_job(
     body: AiApproverReviewPageStartRequest,
 ) -> JSONResponse:
     result = queue_engine.enqueue_job(
-        EnqueueJobInput(
-            endpointName=AI_APPROVER_REVIEW_PAGE_ENDPOINT_NAME,
-            run=create_review_page_ai_approver_runner(
-                body.articleId,
-                body.promptVersionId,
-            ),
-            parameters={
-                "articleId": body.articleId,
-                "promptVersionId": body.promptVersionId,
-            },
+        build_review_page_ai_approver_job_input(
+            body.articleId,
+            body.promptVersionId,
+            priority=body.priority,
         )
     )
 
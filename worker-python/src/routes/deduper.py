@@ -1,31 +1,84 @@
 from __future__ import annotations
 
-from fastapi import APIRouter
-from fastapi.responses import JSONResponse
-
+from datetime import datetime
+
+from fastapi import APIRouter, Header, Query
+from fastapi.responses import JSONResponse, Response
+
+from src.modules.queue.listing import (
+    MAX_JOB_LIST_LIMIT,
+    QueueJobListQuery,
+    etag_matches,
+    format_created_at_bound,
+    format_etag,
+    parse_job_cursor,
+)
+from src.modules.queue.types import QueueJobPriority, QueueJobStatus
 from src.services.job_manager import JobStatus, job_manager, utc_now_iso
 
 router = APIRouter(prefix="/deduper", tags=["deduper"])
 
 
 @router.get("/jobs", status_code=201)
-def create_deduper_job() -> dict:
-    return job_manager.enqueue_deduper_job()
+def create_deduper_job(
+    priority: QueueJobPriority = Query(default=QueueJobPriority.NORMAL),
+    coalesce: bool = Query(default=False),
+) -> dict:
+    return job_manager.enqueue_deduper_job(priority=priority, coalesce=coalesce)
 
 
 @router.get("/jobs/reportId/{report_id}", status_code=201)
-def create_deduper_job_by_report_id(report_id: int) -> dict:
-    return job_manager.enqueue_deduper_job(report_id=report_id)
+def create_deduper_job_by_report_id(
+    report_id: int,
+    priority: QueueJobPriority = Query(default=QueueJobPriority.NORMAL),
+    coalesce: bool = Query(default=False),
+) -> dict:
+    return job_manager.enqueue_deduper_job(
+        report_id=report_id,
+        priority=priority,
+        coalesce=coalesce,
+    )
 
 
 @router.get("/jobs/list")
-def get_jobs() -> dict:
-    return {"jobs": job_manager.list_jobs()}
+async def get_jobs(
+    status: list[QueueJobStatus] | None = Query(default=None),
+    created_after: datetime | None = Query(default=None, alias="createdAfter"),
+    created_before: datetime | None = Query(default=None, alias="createdBefore"),
+    report_id: int | None = Query(default=None, alias="reportId"),
+    cursor: str | None = Query(default=None),
+    limit: int | None = Query(default=None, ge=1, le=MAX_JOB_LIST_LIMIT),
+    if_none_match: str | None = Header(default=None),
+) -> Response:
+    try:
+        cursor_position = parse_job_cursor(cursor)
+    except ValueError as exc:
+        return JSONResponse({"error": str(exc)}, status_code=400)
+
+    etag = format_etag(await job_manager.get_jobs_version_async())
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+
+    listing = await job_manager.list_jobs_async(
+        QueueJobListQuery(
+            statuses=tuple(status or ()),
+            createdAfter=format_created_at_bound(created_after),
+            createdBefore=format_created_at_bound(created_before),
+            reportId=report_id,
+            cursor=cursor_position,
+            limit=limit,
+        )
+    )
+    return JSONResponse(
+        {"jobs": listing["jobs"], "nextCursor": listing["nextCursor"]},
+        status_code=200,
+        headers={"ETag": format_etag(listing["version"])},
+    )
 
 
 @router.get("/jobs/{job_id}")
-def get_job_status(job_id: str) -> JSONResponse:
-    job = job_manager.get_job(job_id)
+async def get_job_status(job_id: str) -> JSONResponse:
+    job = await job_manager.get_job_async(job_id)
     if job is None:
         return JSONResponse({"error": "Job not found"}, status_code=404)
 
@@ -0,0 +1,13 @@
+from __future__ import annotations
+
+from fastapi import APIRouter
+from fastapi.responses import Response
+
+from src.metrics import PROMETHEUS_CONTENT_TYPE, metrics
+
+router = APIRouter(tags=["metrics"])
+
+
+@router.get("/metrics")
+def get_metrics() -> Response:
+    return Response(content=metrics.render(), media_type=PROMETHEUS_CONTENT_TYPE)
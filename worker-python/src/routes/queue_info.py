@@ -1,16 +1,40 @@
 from __future__ import annotations
 
+import json
+from collections.abc import AsyncIterator
 from dataclasses import asdict, is_dataclass
+from datetime import datetime
 
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, Header, HTTPException, Query
 from fastapi.encoders import jsonable_encoder
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response, StreamingResponse
 
 from src.modules.queue.engine import CancelJobResult
-from src.modules.queue.global_queue import global_queue_engine
+from src.modules.queue.events import QueueJobEventType
+from src.modules.queue.global_queue import global_queue_engine, global_queue_scheduler
+from src.modules.queue.job_logs import DEFAULT_JOB_LOG_LIMIT, MAX_JOB_LOG_LIMIT
+from src.modules.queue.listing import (
+    DEFAULT_JOB_LIST_LIMIT,
+    MAX_JOB_LIST_LIMIT,
+    QueueJobListQuery,
+    etag_matches,
+    format_created_at_bound,
+    format_etag,
+    parse_job_cursor,
+    parse_job_fields,
+    project_job,
+)
+from src.modules.queue.status import QueueStatusView
+from src.modules.queue.types import TERMINAL_JOB_STATUSES, QueueJobStatus
 
 router = APIRouter(prefix="/queue-info", tags=["queue-info"])
 queue_engine = global_queue_engine
+queue_scheduler = global_queue_scheduler
+STREAM_KEEPALIVE_SECONDS = 15.0
+DEFAULT_WAIT_TIMEOUT_SECONDS = 30.0
+MAX_WAIT_TIMEOUT_SECONDS = 120.0
+STREAM_HEADERS = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+TERMINAL_STATUS_VALUES = frozenset(status.value for status in TERMINAL_JOB_STATUSES)
 
 
 def _to_jsonable(value: object) -> object:
@@ -20,13 +44,74 @@ def _to_jsonable(value: object) -> object:
     return jsonable_encoder(value)
 
 
+def _project_queue_status_view(
+    queue_status_view: QueueStatusView,
+    job_fields: tuple[str, ...] | None,
+) -> object:
+    if job_fields is None:
+        return _to_jsonable(queue_status_view)
+
+    running_job = queue_status_view.runningJob
+    return _to_jsonable(
+        {
+            "summary": queue_status_view.summary,
+            "runningJob": project_job(running_job, job_fields) if running_job is not None else None,
+            "runningJobs": [project_job(job, job_fields) for job in queue_status_view.runningJobs],
+            "queuedJobs": [project_job(job, job_fields) for job in queue_status_view.queuedJobs],
+        }
+    )
+
+
+def _format_sse(event_name: str, payload: object, event_id: int | None = None) -> str:
+    lines = [] if event_id is None else [f"id: {event_id}"]
+    lines.append(f"event: {event_name}")
+    lines.append(f"data: {json.dumps(_to_jsonable(payload))}")
+    return "\n".join(lines) + "\n\n"
+
+
+def _parse_last_event_id(last_event_id: str | None) -> int | None:
+    if last_event_id is None or not last_event_id.strip().isdigit():
+        return None
+
+    return int(last_event_id.strip())
+
+
+async def _stream_events(
+    since: int,
+    job_id: str | None = None,
+    endpoint_name: str | None = None,
+) -> AsyncIterator[str]:
+    while True:
+        events = await queue_engine.events.wait_for_events_async(
+            since,
+            job_id=job_id,
+            timeout=STREAM_KEEPALIVE_SECONDS,
+        )
+        if not events:
+            yield ": keepalive\n\n"
+            continue
+
+        for event in events:
+            since = event.sequence
+            if endpoint_name is not None and event.endpointName != endpoint_name:
+                continue
+
+            yield _format_sse(event.type.value, event, event.sequence)
+            if (
+                job_id is not None
+                and event.type == QueueJobEventType.STATUS
+                and event.status in TERMINAL_STATUS_VALUES
+            ):
+                return
+
+
 @router.get("/check-status/{job_id}")
-def check_status(job_id: str) -> JSONResponse:
+async def check_status(job_id: str) -> JSONResponse:
     normalized_job_id = job_id.strip()
     if normalized_job_id == "":
         raise HTTPException(status_code=400, detail="jobId route parameter is required")
 
-    job = queue_engine.get_check_status(normalized_job_id)
+    job = await queue_engine.get_check_status_async(normalized_job_id)
     if job is None:
         return JSONResponse({"error": f"Job not found: {normalized_job_id}"}, status_code=404)
 
@@ -34,21 +119,133 @@ def check_status(job_id: str) -> JSONResponse:
 
 
 @router.get("/latest-job")
-def latest_job(endpoint_name: str | None = Query(default=None, alias="endpointName")) -> JSONResponse:
+async def latest_job(
+    endpoint_name: str | None = Query(default=None, alias="endpointName"),
+) -> JSONResponse:
     if endpoint_name is None or endpoint_name.strip() == "":
         return JSONResponse(
             {"error": "endpointName query parameter is required"},
             status_code=400,
         )
 
-    job = queue_engine.get_latest_job_by_endpoint_name(endpoint_name.strip())
+    job = await queue_engine.get_latest_job_by_endpoint_name_async(endpoint_name.strip())
     return JSONResponse({"job": _to_jsonable(job)}, status_code=200)
 
 
+@router.get("/logs/{job_id}")
+async def job_logs(
+    job_id: str,
+    offset: int = Query(default=0, ge=0),
+    limit: int = Query(default=DEFAULT_JOB_LOG_LIMIT, ge=1, le=MAX_JOB_LOG_LIMIT),
+) -> JSONResponse:
+    normalized_job_id = job_id.strip()
+    if normalized_job_id == "":
+        raise HTTPException(status_code=400, detail="jobId route parameter is required")
+
+    page = await queue_engine.get_job_logs_async(normalized_job_id, offset, limit)
+    if page is None:
+        return JSONResponse({"error": f"Job not found: {normalized_job_id}"}, status_code=404)
+
+    return JSONResponse(_to_jsonable(page), status_code=200)
+
+
+@router.get("/schedules")
+async def schedules() -> JSONResponse:
+    return JSONResponse({"schedules": _to_jsonable(queue_scheduler.describe())}, status_code=200)
+
+
+@router.get("/wait/{job_id}")
+async def wait_for_job(
+    job_id: str,
+    timeout: float = Query(default=DEFAULT_WAIT_TIMEOUT_SECONDS, ge=0, le=MAX_WAIT_TIMEOUT_SECONDS),
+    since: QueueJobStatus | None = Query(default=None),
+) -> JSONResponse:
+    normalized_job_id = job_id.strip()
+    if normalized_job_id == "":
+        raise HTTPException(status_code=400, detail="jobId route parameter is required")
+
+    result = await queue_engine.wait_for_job_change_async(
+        normalized_job_id,
+        since=since,
+        timeout=timeout,
+    )
+    if result is None:
+        return JSONResponse({"error": f"Job not found: {normalized_job_id}"}, status_code=404)
+
+    return JSONResponse(
+        {"job": _to_jsonable(result.job), "changed": result.changed},
+        status_code=200,
+    )
+
+
 @router.get("/queue-status")
-def queue_status() -> JSONResponse:
-    queue_status_view = queue_engine.get_queue_status_view()
-    return JSONResponse(_to_jsonable(queue_status_view), status_code=200)
+async def queue_status(
+    fields: str | None = Query(default=None),
+    if_none_match: str | None = Header(default=None),
+) -> Response:
+    try:
+        job_fields = parse_job_fields(fields)
+    except ValueError as exc:
+        return JSONResponse({"error": str(exc)}, status_code=400)
+
+    # Read the version first, so a change made while building the view is
+    # never hidden behind an ETag that already covers it.
+    etag = format_etag(await queue_engine.get_store_version_async())
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+
+    include_logs = job_fields is None or "logs" in job_fields
+    queue_status_view = await queue_engine.get_queue_status_view_async(include_logs=include_logs)
+    return JSONResponse(
+        _project_queue_status_view(queue_status_view, job_fields),
+        status_code=200,
+        headers={"ETag": etag},
+    )
+
+
+@router.get("/jobs")
+async def list_jobs(
+    status: list[QueueJobStatus] | None = Query(default=None),
+    endpoint_name: str | None = Query(default=None, alias="endpointName"),
+    created_after: datetime | None = Query(default=None, alias="createdAfter"),
+    created_before: datetime | None = Query(default=None, alias="createdBefore"),
+    report_id: int | None = Query(default=None, alias="reportId"),
+    cursor: str | None = Query(default=None),
+    limit: int = Query(default=DEFAULT_JOB_LIST_LIMIT, ge=1, le=MAX_JOB_LIST_LIMIT),
+    fields: str | None = Query(default=None),
+    if_none_match: str | None = Header(default=None),
+) -> Response:
+    try:
+        job_fields = parse_job_fields(fields)
+        cursor_position = parse_job_cursor(cursor)
+    except ValueError as exc:
+        return JSONResponse({"error": str(exc)}, status_code=400)
+
+    etag = format_etag(await queue_engine.get_store_version_async())
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+
+    normalized_endpoint_name = endpoint_name.strip() if endpoint_name else None
+    page = await queue_engine.list_jobs_async(
+        QueueJobListQuery(
+            statuses=tuple(status or ()),
+            endpointName=normalized_endpoint_name or None,
+            createdAfter=format_created_at_bound(created_after),
+            createdBefore=format_created_at_bound(created_before),
+            reportId=report_id,
+            cursor=cursor_position,
+            limit=limit,
+            includeLogs=job_fields is None or "logs" in job_fields,
+        )
+    )
+    return JSONResponse(
+        {
+            "jobs": _to_jsonable([project_job(job, job_fields) for job in page.jobs]),
+            "nextCursor": page.nextCursor,
+        },
+        status_code=200,
+        headers={"ETag": format_etag(page.version)},
+    )
 
 
 @router.post("/cancel-job/{job_id}")
@@ -62,3 +259,52 @@ def cancel_job(job_id: str) -> JSONResponse:
         return JSONResponse({"error": f"Job not found: {normalized_job_id}"}, status_code=404)
 
     return JSONResponse(_to_jsonable(result), status_code=200)
+
+
+@router.get("/stream/{job_id}")
+async def stream_job(
+    job_id: str,
+    last_event_id: str | None = Header(default=None),
+) -> Response:
+    normalized_job_id = job_id.strip()
+    if normalized_job_id == "":
+        raise HTTPException(status_code=400, detail="jobId route parameter is required")
+
+    resume_sequence = _parse_last_event_id(last_event_id)
+    since = queue_engine.events.last_sequence if resume_sequence is None else resume_sequence
+    job = await queue_engine.get_check_status_async(normalized_job_id)
+    if job is None:
+        return JSONResponse({"error": f"Job not found: {normalized_job_id}"}, status_code=404)
+
+    async def generate() -> AsyncIterator[str]:
+        if resume_sequence is None:
+            yield _format_sse("snapshot", {"job": job}, since)
+            if job.status in TERMINAL_JOB_STATUSES:
+                return
+
+        async for chunk in _stream_events(since, job_id=normalized_job_id):
+            yield chunk
+
+    return StreamingResponse(generate(), media_type="text/event-stream", headers=STREAM_HEADERS)
+
+
+@router.get("/stream")
+async def stream_queue(
+    endpoint_name: str | None = Query(default=None, alias="endpointName"),
+    last_event_id: str | None = Header(default=None),
+) -> StreamingResponse:
+    normalized_endpoint_name = endpoint_name.strip() if endpoint_name else None
+    resume_sequence = _parse_last_event_id(last_event_id)
+    since = queue_engine.events.last_sequence if resume_sequence is None else resume_sequence
+    queue_status_view = (
+        None if resume_sequence is not None else await queue_engine.get_queue_status_view_async()
+    )
+
+    async def generate() -> AsyncIterator[str]:
+        if queue_status_view is not None:
+            yield _format_sse("snapshot", queue_status_view, since)
+
+        async for chunk in _stream_events(since, endpoint_name=normalized_endpoint_name or None):
+            yield chunk
+
+    return StreamingResponse(generate(), media_type="text/event-stream", headers=STREAM_HEADERS)
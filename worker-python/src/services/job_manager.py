@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import os
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from datetime import datetime, timezone
 from enum import StrEnum
 from pathlib import Path
@@ -9,15 +9,21 @@ from typing import Any
 
 from loguru import logger
 
-from src.modules.deduper.config import DeduperConfig
-from src.modules.deduper.errors import DeduperProcessorError
+from src.modules.deduper.job import create_deduper_orchestrator, run_deduper_job
 from src.modules.deduper.orchestrator import DeduperOrchestrator
 from src.modules.deduper.repository import DeduperRepository
-from src.modules.queue.engine import EnqueueJobInput, GlobalQueueEngine, QueueExecutionContext, QueueJobCanceledError
-from src.modules.queue.global_queue import global_queue_engine, global_queue_store
-from src.modules.queue.status import summarize_queue_jobs
-from src.modules.queue.store import QueueJobStore
-from src.modules.queue.types import QueueJobRecord, QueueJobStatus
+from src.modules.deduper.types import PipelineStep
+from src.modules.queue.engine import EnqueueJobInput, GlobalQueueEngine, QueueExecutionContext
+from src.modules.queue.global_queue import (
+    global_queue_engine,
+    global_queue_handlers,
+    global_queue_store,
+)
+from src.modules.queue.listing import QueueJobListQuery, QueueJobPage
+from src.modules.queue.process_pool import QueueProcessTarget
+from src.modules.queue.status import summarize_status_counts
+from src.modules.queue.store import QueueJobStoreBackend
+from src.modules.queue.types import QueueJobPriority, QueueJobRecord, QueueJobStatus
 
 
 class JobStatus(StrEnum):
@@ -50,35 +56,43 @@ class JobRecord:
 
 class JobManager:
     DEDUPER_ENDPOINT_NAME = "/deduper/start-job"
+    DEDUPER_JOB_TARGET = "src.modules.deduper.job:run_deduper_job"
+    # Once the load step has finished, a repeated request needs its own run.
+    DEDUPER_COALESCE_UNTIL_STAGE = PipelineStep.STATES.value
 
     def __init__(
         self,
         queue_engine: GlobalQueueEngine = global_queue_engine,
-        queue_store: QueueJobStore = global_queue_store,
+        queue_store: QueueJobStoreBackend = global_queue_store,
     ) -> None:
         self.queue_engine = queue_engine
         self.queue_store = queue_store
         self.logger = logger
 
-    def enqueue_deduper_job(self, report_id: int | None = None) -> dict[str, str | int]:
-        parameters: dict[str, str | int | float | bool | None] | None = None
-        if report_id is not None:
-            parameters = {"reportId": report_id}
-
+    def enqueue_deduper_job(
+        self,
+        report_id: int | None = None,
+        priority: QueueJobPriority = QueueJobPriority.NORMAL,
+        coalesce: bool = False,
+    ) -> dict[str, str | int | bool]:
         result = self.queue_engine.enqueue_job(
-            EnqueueJobInput(
-                endpointName=self.DEDUPER_ENDPOINT_NAME,
-                run=self._build_deduper_runner(report_id),
-                parameters=parameters,
-            )
+            self._build_deduper_job_input(report_id, priority=priority, coalesce=coalesce)
         )
 
         return {
             "jobId": result.jobId,
             "status": result.status,
+            "coalesced": result.coalesced,
             **({"reportId": report_id} if report_id is not None else {}),
         }
 
+    def build_deduper_job_from_parameters(self, parameters: dict[str, Any]) -> EnqueueJobInput:
+        report_id = parameters.get("reportId")
+        if isinstance(report_id, bool) or not isinstance(report_id, int | None):
+            raise ValueError("reportId must be an integer")
+
+        return self._build_deduper_job_input(report_id)
+
     def get_job(self, job_id: str) -> JobRecord | None:
         queue_job = self.queue_engine.get_check_status(job_id)
         if queue_job is None:
@@ -86,16 +100,46 @@ class JobManager:
 
         return self._map_queue_job_to_job_record(queue_job)
 
-    def list_jobs(self) -> list[dict[str, Any]]:
-        return [
-            {
-                "jobId": job.jobId,
-                "status": job.status.value,
-                "createdAt": job.createdAt,
-                **({"reportId": job.parameters["reportId"]} if job.parameters and "reportId" in job.parameters else {}),
-            }
-            for job in self.queue_store.get_jobs()
-        ]
+    async def get_job_async(self, job_id: str) -> JobRecord | None:
+        queue_job = await self.queue_engine.get_check_status_async(job_id)
+        if queue_job is None:
+            return None
+
+        return self._map_queue_job_to_job_record(queue_job)
+
+    def list_jobs(self, query: QueueJobListQuery | None = None) -> dict[str, Any]:
+        return self._map_job_page(
+            self.queue_store.list_jobs(replace(query or QueueJobListQuery(), includeLogs=False))
+        )
+
+    async def list_jobs_async(self, query: QueueJobListQuery | None = None) -> dict[str, Any]:
+        # No logs are listed, so the store snapshot answers without a thread.
+        return self._map_job_page(
+            self.queue_store.get_snapshot().list_jobs(
+                replace(query or QueueJobListQuery(), includeLogs=False)
+            )
+        )
+
+    def get_jobs_version(self) -> str:
+        return self.queue_store.get_version()
+
+    async def get_jobs_version_async(self) -> str:
+        return self.queue_store.get_snapshot().version
+
+    def _map_job_page(self, page: QueueJobPage) -> dict[str, Any]:
+        return {
+            "jobs": [
+                {
+                    "jobId": job.jobId,
+                    "status": job.status.value,
+                    "createdAt": job.createdAt,
+                    **({"reportId": job.parameters["reportId"]} if job.parameters and "reportId" in job.parameters else {}),
+                }
+                for job in page.jobs
+            ],
+            "nextCursor": page.nextCursor,
+            "version": page.version,
+        }
 
     def cancel_job(self, job_id: str) -> tuple[bool, str]:
         result = self.queue_engine.cancel_job(job_id)
@@ -115,8 +159,7 @@ class JobManager:
             if path_to_database and name_db
             else None
         )
-        jobs = self.queue_store.get_jobs()
-        queue_summary = summarize_queue_jobs(jobs)
+        queue_summary = summarize_status_counts(self.queue_store.count_jobs_by_status())
 
         checks: dict[str, Any] = {
             "status": "healthy",
@@ -146,10 +189,11 @@ class JobManager:
     def cancel_all_active_jobs(self) -> list[str]:
         cancelled_jobs: list[str] = []
 
-        for job in self.queue_store.get_jobs():
-            if job.status not in {QueueJobStatus.QUEUED, QueueJobStatus.RUNNING}:
-                continue
-
+        active_jobs = [
+            *self.queue_store.get_jobs_by_status(QueueJobStatus.QUEUED),
+            *self.queue_store.get_jobs_by_status(QueueJobStatus.RUNNING),
+        ]
+        for job in active_jobs:
             success, _message = self.cancel_job(job.jobId)
             if success:
                 cancelled_jobs.append(job.jobId)
@@ -175,126 +219,36 @@ class JobManager:
         self.queue_store.replace_jobs([])
 
     def _create_orchestrator(self) -> tuple[DeduperOrchestrator, DeduperRepository]:
-        config = DeduperConfig.from_env()
-        repository = DeduperRepository(config)
-        orchestrator = DeduperOrchestrator(repository, config)
-        return orchestrator, repository
+        return create_deduper_orchestrator()
 
-    def _build_deduper_runner(self, report_id: int | None):
-        def _run(context: QueueExecutionContext) -> None:
-            self._append_job_log(context.jobId, "job_started", report_id)
-            orchestrator, repository = self._create_orchestrator()
-
-            try:
-                summary = orchestrator.run_analyze_fast(
-                    report_id=report_id,
-                    should_cancel=context.is_cancel_requested,
-                )
-            except DeduperProcessorError as exc:
-                self._update_job_result(
-                    context.jobId,
-                    exit_code=1,
-                    stdout="",
-                    stderr=str(exc),
-                    error=str(exc),
-                )
-                self._append_job_log(context.jobId, "job_cancelled", report_id)
-                raise QueueJobCanceledError() from exc
-            except Exception as exc:
-                self._update_job_result(
-                    context.jobId,
-                    exit_code=1,
-                    stdout="",
-                    stderr=str(exc),
-                    error=str(exc),
-                )
-                self._append_job_log(context.jobId, f"job_failed error={exc}", report_id)
-                raise
-            finally:
-                repository.close()
-
-            if summary.status == "cancelled" or context.is_cancel_requested():
-                self._update_job_result(
-                    context.jobId,
-                    exit_code=1,
-                    stdout="",
-                    stderr="Pipeline cancelled",
-                    error="Pipeline cancelled",
-                )
-                self._append_job_log(context.jobId, "job_cancelled", report_id)
-                raise QueueJobCanceledError()
-
-            if summary.status != "completed":
-                self._update_job_result(
-                    context.jobId,
-                    exit_code=1,
-                    stdout="",
-                    stderr="deduper_failed",
-                    error="deduper_failed",
-                )
-                self._append_job_log(context.jobId, "job_failed", report_id)
-                raise RuntimeError("deduper_failed")
-
-            self._update_job_result(
-                context.jobId,
-                exit_code=0,
-                stdout="Deduper processed in-process inside worker-python",
-                stderr="",
-                error=None,
-            )
-            self._append_job_log(context.jobId, "job_completed", report_id)
-
-        return _run
+    def _build_deduper_job_input(
+        self,
+        report_id: int | None,
+        priority: QueueJobPriority = QueueJobPriority.NORMAL,
+        coalesce: bool = False,
+    ) -> EnqueueJobInput:
+        parameters: dict[str, str | int | float | bool | None] | None = None
+        if report_id is not None:
+            parameters = {"reportId": report_id}
 
-    def _append_job_log(self, job_id: str, event: str, report_id: int | None = None) -> None:
-        message = f"{utc_now_iso()} event={event} job_id={job_id} report_id={report_id}"
-
-        self.queue_store.update_job(
-            job_id,
-            lambda job: QueueJobRecord(
-                jobId=job.jobId,
-                endpointName=job.endpointName,
-                status=job.status,
-                createdAt=job.createdAt,
-                startedAt=job.startedAt,
-                endedAt=job.endedAt,
-                failureReason=job.failureReason,
-                logs=[*job.logs, message],
-                parameters=job.parameters,
-                result=job.result,
+        return EnqueueJobInput(
+            endpointName=self.DEDUPER_ENDPOINT_NAME,
+            run=self._build_deduper_runner(report_id),
+            parameters=parameters,
+            processTarget=QueueProcessTarget(
+                callablePath=self.DEDUPER_JOB_TARGET,
+                kwargs={"report_id": report_id},
             ),
+            priority=priority,
+            coalesce=coalesce,
+            coalesceUntilStage=self.DEDUPER_COALESCE_UNTIL_STAGE,
         )
-        self.logger.info(message)
 
-    def _update_job_result(
-        self,
-        job_id: str,
-        *,
-        exit_code: int,
-        stdout: str,
-        stderr: str,
-        error: str | None,
-    ) -> None:
-        self.queue_store.update_job(
-            job_id,
-            lambda job: QueueJobRecord(
-                jobId=job.jobId,
-                endpointName=job.endpointName,
-                status=job.status,
-                createdAt=job.createdAt,
-                startedAt=job.startedAt,
-                endedAt=job.endedAt,
-                failureReason=job.failureReason,
-                logs=job.logs,
-                parameters=job.parameters,
-                result={
-                    "exitCode": exit_code,
-                    "stdout": stdout,
-                    "stderr": stderr,
-                    "error": error,
-                },
-            ),
-        )
+    def _build_deduper_runner(self, report_id: int | None):
+        def _run(context: QueueExecutionContext) -> None:
+            run_deduper_job(context, report_id, create_orchestrator=self._create_orchestrator)
+
+        return _run
 
     def _map_queue_job_to_job_record(self, queue_job: QueueJobRecord) -> JobRecord:
         result = queue_job.result or {}
@@ -321,3 +275,7 @@ class JobManager:
 
 
 job_manager = JobManager()
+global_queue_handlers.register(
+    JobManager.DEDUPER_ENDPOINT_NAME,
+    job_manager.build_deduper_job_from_parameters,
+)
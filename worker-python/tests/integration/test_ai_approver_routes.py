@@ -163,3 +163,52 @@ def test_main_import_fails_when_ai_approver_env_missing(
 
     monkeypatch.setenv("OPENAI_API_KEY", "test-openai-key")
     importlib.reload(main_module)
+
+
+@pytest.mark.integration
+def test_ai_approver_runner_checkpoints_every_interval(monkeypatch: pytest.MonkeyPatch) -> None:
+    from src.modules.queue.context import QueueExecutionContext
+    from src.routes import ai_approver as ai_approver_routes
+
+    monkeypatch.setenv("AI_APPROVER_CHECKPOINT_INTERVAL", "10")
+
+    class FakeOrchestrator:
+        def __init__(self, repository, client) -> None:
+            pass
+
+        def run_score(self, limit: int, on_article_scored, **kwargs) -> dict[str, object]:
+            usage = {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0}
+            for article_count in range(1, limit + 1):
+                on_article_scored(
+                    {"promptCount": 1, "articleCount": article_count, "attemptCount": 0, "usage": usage}
+                )
+            return {"promptCount": 1, "articleCount": limit, "attemptCount": 0, "usage": usage}
+
+    class RecordingReporter:
+        def __init__(self) -> None:
+            self.checkpoints: list[dict[str, object]] = []
+
+        def append_log(self, message: str) -> None:
+            pass
+
+        def update_result(self, fields) -> None:
+            pass
+
+        def save_checkpoint(self, cursor) -> None:
+            self.checkpoints.append(cursor)
+
+    monkeypatch.setattr(ai_approver_routes, "AiApproverRepository", lambda config: None)
+    monkeypatch.setattr(ai_approver_routes, "AiApproverOpenAIClient", lambda config: None)
+    monkeypatch.setattr(ai_approver_routes, "AiApproverOrchestrator", FakeOrchestrator)
+    reporter = RecordingReporter()
+
+    ai_approver_routes.create_ai_approver_runner(25, True, None)(
+        QueueExecutionContext(
+            jobId="0001",
+            endpointName=ai_approver_routes.AI_APPROVER_ENDPOINT_NAME,
+            cancelEvent=Event(),
+            reporter=reporter,
+        )
+    )
+
+    assert [checkpoint["remainingLimit"] for checkpoint in reporter.checkpoints] == [15, 5]
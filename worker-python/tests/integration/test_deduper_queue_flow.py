@@ -1,7 +1,5 @@
 from __future__ import annotations
 
-import json
-
 import pytest
 
 from src.modules.queue.engine import GlobalQueueEngine
@@ -30,7 +28,15 @@ def test_deduper_job_queue_flow_persists_and_is_visible_via_queue_info(
             return None
 
     class _FakeOrchestrator:
-        def run_analyze_fast(self, report_id=None, should_cancel=None):
+        def run_analyze_fast(
+            self,
+            report_id=None,
+            should_cancel=None,
+            clear_first=True,
+            on_step_start=None,
+            skip_steps=(),
+            on_step_complete=None,
+        ):
             assert report_id == 42
             assert should_cancel is not None
             return _FakeSummary()
@@ -60,10 +66,8 @@ def test_deduper_job_queue_flow_persists_and_is_visible_via_queue_info(
     assert latest_job["jobId"] == job_id
     assert latest_job["status"] == "completed"
 
-    persisted = json.loads(
-        (tmp_path / "worker-python" / "queue-jobs.json").read_text(encoding="utf-8")
-    )
-    assert persisted["jobs"][0]["jobId"] == job_id
-    assert persisted["jobs"][0]["endpointName"] == test_job_manager.DEDUPER_ENDPOINT_NAME
-    assert persisted["jobs"][0]["parameters"]["reportId"] == 42
-    assert persisted["jobs"][0]["result"]["exitCode"] == 0
+    persisted_jobs = QueueJobStore(tmp_path / "worker-python" / "queue-jobs.json").get_jobs()
+    assert persisted_jobs[0].jobId == job_id
+    assert persisted_jobs[0].endpointName == test_job_manager.DEDUPER_ENDPOINT_NAME
+    assert persisted_jobs[0].parameters["reportId"] == 42
+    assert persisted_jobs[0].result["exitCode"] == 0
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import asyncio
+import json
 from threading import Event
 from time import sleep
 
@@ -135,3 +137,256 @@ def test_cancel_job_returns_404_for_unknown_job(
 
     assert response.status_code == 404
     assert response.json()["error"] == "Job not found: 9999"
+
+
+def _read_sse_events(response) -> list[tuple[str, dict]]:
+    events: list[tuple[str, dict]] = []
+    event_name = None
+    for line in response.iter_lines():
+        if line.startswith("event: "):
+            event_name = line.removeprefix("event: ")
+        elif line.startswith("data: "):
+            events.append((event_name, json.loads(line.removeprefix("data: "))))
+    return events
+
+
+@pytest.mark.integration
+def test_stream_job_pushes_progress_until_terminal_status(
+    client, queue_engine_override: GlobalQueueEngine
+) -> None:
+    release_event = Event()
+
+    def reporting_job(context) -> None:
+        release_event.wait(timeout=1)
+        context.append_log("event=job_started")
+        context.update_result({"processed": 3})
+
+    result = queue_engine_override.enqueue_job(
+        EnqueueJobInput(endpointName="/deduper/start-job", run=reporting_job)
+    )
+
+    with client.stream("GET", f"/queue-info/stream/{result.jobId}") as response:
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        release_event.set()
+        events = _read_sse_events(response)
+
+    assert events[0][0] == "snapshot"
+    assert events[0][1]["job"]["jobId"] == result.jobId
+    assert ("log", "event=job_started") in [(name, body.get("line")) for name, body in events]
+    assert ("result", {"processed": 3}) in [(name, body.get("fields")) for name, body in events]
+    assert events[-1][0] == "status"
+    assert events[-1][1]["status"] == "completed"
+
+
+@pytest.mark.integration
+def test_stream_job_returns_snapshot_for_finished_job_and_404_for_unknown(
+    client, queue_engine_override: GlobalQueueEngine
+) -> None:
+    result = queue_engine_override.enqueue_job(
+        EnqueueJobInput(endpointName="/deduper/start-job", run=lambda context: None)
+    )
+    assert queue_engine_override.on_idle(timeout=1) is True
+
+    with client.stream("GET", f"/queue-info/stream/{result.jobId}") as response:
+        events = _read_sse_events(response)
+
+    assert [name for name, _body in events] == ["snapshot"]
+    assert events[0][1]["job"]["status"] == "completed"
+    assert client.get("/queue-info/stream/9999").status_code == 404
+
+
+@pytest.mark.integration
+def test_stream_queue_events_filter_by_endpoint(
+    monkeypatch: pytest.MonkeyPatch, queue_engine_override: GlobalQueueEngine
+) -> None:
+    from src.routes import queue_info as queue_info_routes
+
+    monkeypatch.setattr(queue_info_routes, "STREAM_KEEPALIVE_SECONDS", 0.05)
+    since = queue_engine_override.events.last_sequence
+    queue_engine_override.enqueue_job(
+        EnqueueJobInput(endpointName="/deduper/start-job", run=lambda context: None)
+    )
+    scorer_result = queue_engine_override.enqueue_job(
+        EnqueueJobInput(endpointName="/location-scorer/start-job", run=lambda context: None)
+    )
+
+    streamed: list[dict] = []
+
+    async def collect() -> None:
+        async for chunk in queue_info_routes._stream_events(
+            since,
+            endpoint_name="/location-scorer/start-job",
+        ):
+            if chunk.startswith(":"):
+                continue
+            streamed.append(json.loads(chunk.split("data: ", 1)[1]))
+            if streamed[-1]["status"] == "completed":
+                break
+
+    asyncio.run(collect())
+
+    assert {event["jobId"] for event in streamed} == {scorer_result.jobId}
+    assert [event["status"] for event in streamed] == ["queued", "running", "completed"]
+    assert queue_engine_override.on_idle(timeout=1) is True
+
+
+@pytest.mark.integration
+def test_wait_returns_when_job_leaves_since_status(
+    client, queue_engine_override: GlobalQueueEngine
+) -> None:
+    release_event = Event()
+    result = queue_engine_override.enqueue_job(
+        EnqueueJobInput(endpointName="/deduper/start-job", run=lambda context: release_event.wait(timeout=1))
+    )
+
+    timed_out = client.get(f"/queue-info/wait/{result.jobId}", params={"timeout": 0.05, "since": "running"})
+    assert timed_out.status_code == 200
+    assert timed_out.json()["changed"] is False
+    assert timed_out.json()["job"]["status"] == "running"
+
+    release_event.set()
+    response = client.get(f"/queue-info/wait/{result.jobId}", params={"timeout": 1, "since": "running"})
+
+    assert response.status_code == 200
+    assert response.json()["changed"] is True
+    assert response.json()["job"]["status"] == "completed"
+    assert client.get("/queue-info/wait/9999", params={"timeout": 0}).status_code == 404
+    assert client.get(f"/queue-info/wait/{result.jobId}", params={"timeout": 500}).status_code == 422
+
+
+@pytest.mark.integration
+def test_jobs_listing_pages_filters_projects_and_honors_etag(
+    client, queue_engine_override: GlobalQueueEngine
+) -> None:
+    for endpoint_name in ("/deduper/start-job", "/location-scorer/start-job", "/deduper/start-job"):
+        queue_engine_override.enqueue_job(EnqueueJobInput(endpointName=endpoint_name, run=lambda context: None))
+        assert queue_engine_override.on_idle(timeout=1) is True
+
+    first_page = client.get("/queue-info/jobs", params={"limit": 1, "fields": "jobId,status"})
+    assert first_page.status_code == 200
+    assert first_page.json()["jobs"] == [{"jobId": "0001", "status": "completed"}]
+    second_page = client.get(
+        "/queue-info/jobs",
+        params={"limit": 5, "cursor": first_page.json()["nextCursor"], "endpointName": "/deduper/start-job"},
+    )
+    assert [job["jobId"] for job in second_page.json()["jobs"]] == ["0003"]
+    assert second_page.json()["nextCursor"] is None
+    assert "logs" in second_page.json()["jobs"][0]
+
+    etag = first_page.headers["ETag"]
+    not_modified = client.get("/queue-info/jobs", headers={"If-None-Match": etag})
+    assert not_modified.status_code == 304
+    assert not_modified.content == b""
+
+    queue_engine_override.enqueue_job(EnqueueJobInput(endpointName="/deduper/start-job", run=lambda context: None))
+    assert queue_engine_override.on_idle(timeout=1) is True
+    assert client.get("/queue-info/jobs", headers={"If-None-Match": etag}).status_code == 200
+
+    assert client.get("/queue-info/jobs", params={"fields": "jobId,secret"}).status_code == 400
+    assert client.get("/queue-info/jobs", params={"cursor": "abc"}).status_code == 400
+
+
+@pytest.mark.integration
+def test_queue_status_projects_fields_and_honors_etag(
+    client, queue_engine_override: GlobalQueueEngine
+) -> None:
+    release_event = Event()
+    result = queue_engine_override.enqueue_job(
+        EnqueueJobInput(endpointName="/deduper/start-job", run=lambda context: release_event.wait(timeout=1))
+    )
+    for _ in range(100):
+        if queue_engine_override.get_check_status(result.jobId).status == "running":
+            break
+        sleep(0.01)
+
+    response = client.get("/queue-info/queue-status", params={"fields": "jobId,status"})
+    not_modified = client.get(
+        "/queue-info/queue-status",
+        headers={"If-None-Match": response.headers["ETag"]},
+    )
+    release_event.set()
+    assert queue_engine_override.on_idle(timeout=1) is True
+
+    assert response.status_code == 200
+    assert response.json()["runningJob"] == {"jobId": result.jobId, "status": "running"}
+    assert response.json()["summary"]["running"] == 1
+    assert not_modified.status_code == 304
+    assert (
+        client.get("/queue-info/queue-status", headers={"If-None-Match": response.headers["ETag"]}).status_code
+        == 200
+    )
+
+
+@pytest.mark.integration
+def test_metrics_endpoint_exposes_queue_metrics(client, queue_engine_override: GlobalQueueEngine) -> None:
+    queue_engine_override.enqueue_job(
+        EnqueueJobInput(endpointName="/metrics-route-test/start-job", run=lambda context: None)
+    )
+    assert queue_engine_override.on_idle(timeout=1) is True
+
+    response = client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    assert "# TYPE worker_queue_job_wait_seconds histogram" in response.text
+    assert (
+        'worker_queue_jobs_finished_total{endpoint="/metrics-route-test/start-job",status="completed"} 1.0'
+        in response.text
+    )
+    assert 'worker_queue_store_operation_seconds_count{backend="json",operation="update_job"}' in response.text
+
+
+@pytest.mark.integration
+def test_schedules_lists_configured_schedules(
+    client,
+    monkeypatch: pytest.MonkeyPatch,
+    queue_engine_override: GlobalQueueEngine,
+) -> None:
+    from src.modules.queue.config import QueueScheduleDefinition
+    from src.modules.queue.cron import CronSchedule
+    from src.modules.queue.handlers import QueueJobHandlerRegistry
+    from src.modules.queue.scheduler import QueueScheduler
+    from src.routes import queue_info as queue_info_routes
+
+    scheduler = QueueScheduler(
+        queue_engine_override,
+        QueueJobHandlerRegistry(),
+        [
+            QueueScheduleDefinition(
+                name="nightly-deduper",
+                endpoint_name="/deduper/start-job",
+                cron=CronSchedule.parse("30 2 * * *"),
+            )
+        ],
+    )
+    monkeypatch.setattr(queue_info_routes, "queue_scheduler", scheduler)
+
+    response = client.get("/queue-info/schedules")
+
+    assert response.status_code == 200
+    (schedule,) = response.json()["schedules"]
+    assert schedule["name"] == "nightly-deduper"
+    assert schedule["cron"] == "30 2 * * *"
+    assert schedule["nextRunAt"].endswith("02:30:00+00:00")
+    assert schedule["lastOutcome"] is None
+
+
+@pytest.mark.integration
+def test_job_logs_pages_by_offset(client, queue_engine_override: GlobalQueueEngine) -> None:
+    def _run(context) -> None:
+        for index in range(5):
+            context.append_log(f"event=step index={index}")
+
+    result = queue_engine_override.enqueue_job(EnqueueJobInput(endpointName="/deduper/start-job", run=_run))
+    assert queue_engine_override.on_idle(timeout=1) is True
+
+    first_page = client.get(f"/queue-info/logs/{result.jobId}", params={"limit": 2}).json()
+    assert first_page["lines"] == ["event=step index=0", "event=step index=1"]
+    assert first_page["nextOffset"] == 2
+    tail = client.get(f"/queue-info/logs/{result.jobId}", params={"offset": first_page["total"]}).json()
+    assert tail["lines"] == []
+    assert tail["nextOffset"] == first_page["total"]
+
+    assert client.get("/queue-info/logs/9999").status_code == 404
+    assert client.get(f"/queue-info/logs/{result.jobId}", params={"offset": -1}).status_code == 422
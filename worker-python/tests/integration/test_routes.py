@@ -1,5 +1,6 @@
 import pytest
 import sqlite3
+from threading import Event
 
 from src.modules.queue.engine import GlobalQueueEngine
 from src.modules.queue.store import QueueJobStore
@@ -226,3 +227,87 @@ def test_deduper_job_is_visible_through_queue_info_latest_job(
 
     assert response.status_code == 200
     assert response.json()["job"]["jobId"] == create_response.json()["jobId"]
+
+
+@pytest.mark.integration
+def test_create_job_by_report_id_coalesces_duplicate_requests(
+    client,
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path,
+) -> None:
+    from src.routes import deduper as deduper_routes
+
+    test_job_manager = _create_job_manager(tmp_path)
+    release_event = Event()
+    monkeypatch.setattr(
+        test_job_manager,
+        "_build_deduper_runner",
+        lambda report_id: lambda context: release_event.wait(timeout=1),
+    )
+    monkeypatch.setattr(deduper_routes, "job_manager", test_job_manager)
+
+    blocker_response = client.get("/deduper/jobs")
+    first_response = client.get("/deduper/jobs/reportId/10", params={"coalesce": "true"})
+    duplicate_response = client.get("/deduper/jobs/reportId/10", params={"coalesce": "true"})
+    separate_response = client.get("/deduper/jobs/reportId/10")
+
+    assert blocker_response.json()["coalesced"] is False
+    assert first_response.json()["coalesced"] is False
+    assert duplicate_response.status_code == 201
+    assert duplicate_response.json() == {
+        "jobId": first_response.json()["jobId"],
+        "status": "queued",
+        "coalesced": True,
+        "reportId": 10,
+    }
+    assert separate_response.json()["jobId"] != first_response.json()["jobId"]
+
+    release_event.set()
+    assert test_job_manager.queue_engine.on_idle(timeout=2) is True
+
+
+@pytest.mark.integration
+def test_job_list_pages_filters_and_honors_etag(
+    client,
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path,
+) -> None:
+    from src.modules.queue.types import QueueJobRecord, QueueJobStatus
+    from src.routes import deduper as deduper_routes
+
+    test_job_manager = _create_job_manager(tmp_path)
+    monkeypatch.setattr(deduper_routes, "job_manager", test_job_manager)
+    for job_id, report_id in (("0001", 4), ("0002", 5), ("0003", 4)):
+        test_job_manager.queue_store.append_job(
+            QueueJobRecord(
+                jobId=job_id,
+                endpointName=test_job_manager.DEDUPER_ENDPOINT_NAME,
+                status=QueueJobStatus.COMPLETED,
+                createdAt=f"2026-03-15T00:0{job_id[-1]}:00+00:00",
+                logs=["event=job_completed"],
+                parameters={"reportId": report_id},
+            )
+        )
+
+    full_response = client.get("/deduper/jobs/list")
+    first_page = client.get("/deduper/jobs/list", params={"reportId": 4, "limit": 1})
+    second_page = client.get(
+        "/deduper/jobs/list",
+        params={"reportId": 4, "limit": 1, "cursor": first_page.json()["nextCursor"]},
+    )
+
+    assert [job["jobId"] for job in full_response.json()["jobs"]] == ["0001", "0002", "0003"]
+    assert full_response.json()["nextCursor"] is None
+    assert first_page.json()["jobs"] == [
+        {"jobId": "0001", "status": "completed", "createdAt": "2026-03-15T00:01:00+00:00", "reportId": 4}
+    ]
+    assert [job["jobId"] for job in second_page.json()["jobs"]] == ["0003"]
+    assert second_page.json()["nextCursor"] is None
+    assert (
+        client.get("/deduper/jobs/list", params={"createdAfter": "2026-03-15T00:02:00Z"}).json()["jobs"][0]["jobId"]
+        == "0002"
+    )
+    assert (
+        client.get("/deduper/jobs/list", headers={"If-None-Match": full_response.headers["ETag"]}).status_code
+        == 304
+    )
@@ -161,3 +161,33 @@ def test_run_single_score_inserts_failed_row_on_client_error() -> None:
             "job_id": "job-3",
         }
     ]
+
+
+def test_run_score_yields_between_articles() -> None:
+    class BatchRepository(FakeRepository):
+        def get_active_prompt_versions(self):
+            return [{"id": 3, "promptInMarkdown": "{articleTitle}"}, {"id": 4, "promptInMarkdown": "{articleTitle}"}]
+
+        def get_eligible_articles(self, **kwargs):
+            return [{"id": 11, "title": "One"}, {"id": 12, "title": "Two"}]
+
+    repository = BatchRepository()
+    orchestrator = AiApproverOrchestrator(
+        repository,
+        FakeClient(response={"payload": {"score": 0.5, "reason": "Relevant"}, "usage": {"total_tokens": 3}}),
+    )
+
+    summary = orchestrator.run_score(
+        limit=10,
+        require_state_assignment=True,
+        state_ids=None,
+        job_id="0001",
+        should_cancel=lambda: False,
+        should_yield=lambda: True,
+    )
+
+    assert summary["yielded"] is True
+    assert summary["articleCount"] == 1
+    assert summary["attemptCount"] == 2
+    assert summary["usage"]["total_tokens"] == 6
+    assert {call["article_id"] for call in repository.insert_calls} == {11}
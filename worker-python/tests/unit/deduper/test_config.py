@@ -4,6 +4,7 @@ import pytest
 
 from src.modules.deduper.config import DeduperConfig
 from src.modules.deduper.errors import DeduperConfigError
+from src.modules.deduper.types import BlockingRule, LoadMode
 
 
 @pytest.mark.unit
@@ -25,6 +26,7 @@ def test_config_from_env_success(monkeypatch: pytest.MonkeyPatch) -> None:
     assert config.sqlite_path == os.path.join("/tmp/db", "news.db")
     assert config.cache_max_entries > 0
     assert config.checkpoint_interval > 0
+    assert config.load_mode == LoadMode.PYTHON
 
 
 @pytest.mark.unit
@@ -56,6 +58,50 @@ def test_config_invalid_bool(monkeypatch: pytest.MonkeyPatch) -> None:
         DeduperConfig.from_env()
 
 
+@pytest.mark.unit
+def test_config_invalid_load_mode(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("PATH_DATABASE", "/tmp/db")
+    monkeypatch.setenv("NAME_DB", "news.db")
+    monkeypatch.setenv("DEDUPER_LOAD_MODE", "pandas")
+
+    with pytest.raises(DeduperConfigError, match="DEDUPER_LOAD_MODE must be one of: sql, python"):
+        DeduperConfig.from_env()
+
+
+@pytest.mark.unit
+def test_config_blocking(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("PATH_DATABASE", "/tmp/db")
+    monkeypatch.setenv("NAME_DB", "news.db")
+    monkeypatch.setenv("DEDUPER_BLOCKING_ENABLED", "true")
+    monkeypatch.setenv("DEDUPER_BLOCKING_RULES", "state, host")
+    monkeypatch.setenv("DEDUPER_LOAD_MODE", "sql")
+
+    config = DeduperConfig.from_env()
+    assert config.blocking_enabled is True
+    assert config.blocking_rules == (BlockingRule.STATE, BlockingRule.HOST)
+
+    assert config.simhash_max_distance == 3
+
+    monkeypatch.setenv("DEDUPER_SIMHASH_MAX_DISTANCE", "64")
+    with pytest.raises(DeduperConfigError, match="DEDUPER_SIMHASH_MAX_DISTANCE must be < 64"):
+        DeduperConfig.from_env()
+    monkeypatch.delenv("DEDUPER_SIMHASH_MAX_DISTANCE")
+
+    monkeypatch.setenv("DEDUPER_BLOCKING_RULES", "state,zipcode")
+    with pytest.raises(DeduperConfigError, match="DEDUPER_BLOCKING_RULES"):
+        DeduperConfig.from_env()
+
+    monkeypatch.setenv("DEDUPER_BLOCKING_RULES", "state")
+    monkeypatch.setenv("DEDUPER_LOAD_MODE", "python")
+    with pytest.raises(DeduperConfigError, match="requires DEDUPER_LOAD_MODE=sql"):
+        DeduperConfig.from_env()
+
+    # The Python load is the default, so blocking must opt in to SQL explicitly.
+    monkeypatch.delenv("DEDUPER_LOAD_MODE")
+    with pytest.raises(DeduperConfigError, match="requires DEDUPER_LOAD_MODE=sql"):
+        DeduperConfig.from_env()
+
+
 @pytest.mark.unit
 def test_startup_env_validation(monkeypatch: pytest.MonkeyPatch) -> None:
     from src.modules.deduper.config import validate_startup_env
@@ -7,12 +7,24 @@ from pathlib import Path
 import pytest
 
 from src.modules.deduper.config import DeduperConfig
+from src.modules.deduper.fingerprints import ArticleFingerprintStore, compare_fingerprint_pairs
 from src.modules.deduper.processors.content_hash import ContentHashProcessor
 from src.modules.deduper.processors.embedding import EmbeddingProcessor
 from src.modules.deduper.processors.load import LoadProcessor
 from src.modules.deduper.processors.states import StatesProcessor
 from src.modules.deduper.processors.url_check import UrlCheckProcessor
 from src.modules.deduper.repository import DeduperRepository
+from src.modules.deduper.simhash_index import SimhashBandIndex
+from src.modules.deduper.types import BlockingRule, LoadMode
+from src.modules.deduper.utils import simhash_batch
+from src.modules.deduper.utils.text_norm import (
+    hamming_distance,
+    normalize_text,
+    similarity_from_hamming,
+    simhash_band_values,
+    simhash_from_normalized,
+    stable_token_hash,
+)
 
 
 class _FakeSentenceTransformer:
@@ -187,6 +199,210 @@ def test_load_processor_csv_mode(repo_and_config) -> None:
     assert rows[0]["c"] == 6
 
 
+@pytest.mark.unit
+def test_load_processor_sql_mode_matches_python_mode(repo_and_config) -> None:
+    repository, config = repo_and_config
+    pair_query = """
+        SELECT articleIdNew, articleIdApproved, reportId, sameArticleIdFlag,
+               articleNewState, articleApprovedState, sameStateFlag,
+               urlCheck, contentHash, embeddingSearch
+        FROM ArticleDuplicateAnalyses
+        ORDER BY articleIdNew, articleIdApproved
+    """
+
+    config.load_mode = LoadMode.PYTHON
+    python_summary = LoadProcessor(repository, config).execute(report_id=10)
+    python_rows = repository.execute_query(pair_query)
+
+    config.load_mode = LoadMode.SQL
+    sql_summary = LoadProcessor(repository, config).execute(report_id=10)
+    sql_rows = repository.execute_query(pair_query)
+
+    assert sql_summary == python_summary
+    assert sql_rows == python_rows
+    assert len(sql_rows) == 6
+    assert sum(row["sameArticleIdFlag"] for row in sql_rows) == 2
+
+
+@pytest.mark.unit
+def test_load_processor_blocking_prunes_pairs(repo_and_config) -> None:
+    repository, config = repo_and_config
+    config.load_mode = LoadMode.SQL
+    config.blocking_enabled = True
+    pair_query = """
+        SELECT articleIdNew, articleIdApproved
+        FROM ArticleDuplicateAnalyses
+        ORDER BY articleIdNew, articleIdApproved
+    """
+
+    # Articles 1 and 2 are both in CA; article 3 is in NY.
+    config.blocking_rules = (BlockingRule.STATE,)
+    summary = LoadProcessor(repository, config).execute(report_id=10)
+    assert summary["processed"] == 4
+    assert summary["total_pairs"] == 6
+    assert summary["pruned_pairs"] == 2
+    pairs = [tuple(row.values()) for row in repository.execute_query(pair_query)]
+    assert pairs == [(1, 1), (1, 2), (2, 1), (2, 2)]
+
+    # Published one day apart: article 1 reaches article 2, article 2 reaches both.
+    config.blocking_rules = (BlockingRule.DATE,)
+    config.blocking_date_window_days = 1
+    LoadProcessor(repository, config).execute(report_id=10)
+    pairs = [tuple(row.values()) for row in repository.execute_query(pair_query)]
+    assert pairs == [(1, 1), (1, 2), (2, 1), (2, 2), (2, 3)]
+
+    # Titles normalize to nothing, so only each article's own id matches.
+    config.blocking_rules = (BlockingRule.FINGERPRINT,)
+    summary = LoadProcessor(repository, config).execute(report_id=10)
+    pairs = [tuple(row.values()) for row in repository.execute_query(pair_query)]
+    assert summary["processed"] == 2
+    assert pairs == [(1, 1), (2, 2)]
+
+    config.blocking_rules = (BlockingRule.HOST,)
+    summary = LoadProcessor(repository, config).execute(report_id=10)
+    assert summary["pruned_pairs"] == 0
+
+
+@pytest.mark.unit
+def test_simhash_bands_find_every_pair_within_distance() -> None:
+    # Fixed value: the token hash must not change between processes.
+    assert stable_token_hash("budget") == 11792448668507846533
+
+    simhash = stable_token_hash("council")
+    # Four bands: any three flipped bits leave at least one band untouched.
+    for flipped_bits in ((0,), (5, 40), (1, 17, 33), (15, 16, 47)):
+        other = simhash
+        for bit in flipped_bits:
+            other ^= 1 << bit
+        assert hamming_distance(simhash, other) == len(flipped_bits)
+        assert any(
+            left == right
+            for left, right in zip(simhash_band_values(simhash, 4), simhash_band_values(other, 4))
+        )
+
+    assert simhash_band_values((1 << 64) - 1, 5) == [2**13 - 1] * 4 + [2**12 - 1]
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("use_numpy", [True, False])
+def test_batch_simhash_matches_scalar(monkeypatch: pytest.MonkeyPatch, use_numpy: bool) -> None:
+    if not use_numpy:
+        monkeypatch.setattr(simhash_batch, "np", None)
+    # Small chunks so documents are split across several bit matrices.
+    monkeypatch.setattr(simhash_batch, "MAX_TOKENS_PER_CHUNK", 7)
+    contents = [
+        normalize_text(text)
+        for text in (
+            "Council approves the new budget",
+            "",
+            "budget budget budget council",
+            "Storm closes schools across the region on Monday morning",
+            "   ",
+            "a b c d e f g h i j k l m n o p",
+        )
+    ]
+    simhashes = simhash_batch.simhashes_from_normalized(contents)
+    assert simhashes == [simhash_from_normalized(content) for content in contents]
+
+    left, right = simhashes[:-1], simhashes[1:]
+    assert simhash_batch.hamming_similarities(left, right) == [
+        similarity_from_hamming(hamming_distance(a, b)) for a, b in zip(left, right)
+    ]
+    assert simhash_batch.content_similarities(
+        [simhashes[0], 0, simhashes[0], 0, simhashes[0]],
+        [simhashes[2], 0, simhashes[2], simhashes[0], simhashes[2]],
+        [False, False, False, True, True],
+        [False, False, False, False, True],
+        [False, False, True, False, False],
+    ) == [similarity_from_hamming(hamming_distance(simhashes[0], simhashes[2])), 0.0, 1.0, 0.0, 1.0]
+
+
+@pytest.mark.unit
+def test_simhash_index_syncs_incrementally(repo_and_config) -> None:
+    repository, config = repo_and_config
+    index = SimhashBandIndex(repository, config)
+
+    assert index.sync() == {"indexed": 3, "removed": 0}
+    assert index.sync() == {"indexed": 0, "removed": 0}
+    band_rows = repository.execute_query("SELECT COUNT(*) AS c FROM DeduperSimhashBands")
+    assert band_rows[0]["c"] == 3 * index.bands
+
+    conn = repository.get_connection()
+    conn.execute("UPDATE ArticleApproveds SET isApproved = 0 WHERE articleId = 3")
+    conn.execute(
+        "INSERT INTO ArticleApproveds(articleId, isApproved, headlineForPdfReport, textForPdfReport) "
+        "VALUES(4, 1, 'Weather report', 'Heavy rain expected this weekend.')"
+    )
+    conn.commit()
+    # One DeduperSimhashes row plus one row per band.
+    assert index.sync() == {"indexed": 1, "removed": 1 + index.bands}
+
+    config.simhash_max_distance = 5
+    assert SimhashBandIndex(repository, config).sync() == {"indexed": 3, "removed": 0}
+
+
+@pytest.mark.unit
+def test_simhash_index_reindexes_edited_articles(repo_and_config) -> None:
+    repository, config = repo_and_config
+    config.blocking_enabled = True
+    config.blocking_rules = (BlockingRule.SIMHASH,)
+    index = SimhashBandIndex(repository, config)
+    assert index.sync() == {"indexed": 3, "removed": 0}
+
+    # Article 3 is rewritten into a copy of articles 1 and 2.
+    conn = repository.get_connection()
+    conn.execute(
+        "UPDATE ArticleApproveds SET headlineForPdfReport = 'Major update announced', "
+        "textForPdfReport = 'The city council approved the same budget today.' WHERE articleId = 3"
+    )
+    conn.commit()
+    assert index.sync() == {"indexed": 1, "removed": 0}
+    assert index.sync() == {"indexed": 0, "removed": 0}
+
+    fingerprint = index.fingerprints.get_fingerprints(
+        [
+            {
+                "articleId": 3,
+                "headline": "Major update announced",
+                "text": "The city council approved the same budget today.",
+            }
+        ]
+    )[3]
+    band_rows = repository.execute_query(
+        "SELECT band, bandValue FROM DeduperSimhashBands WHERE articleId = 3"
+    )
+    assert {f"band:{row['band']}:{row['bandValue']}" for row in band_rows} == set(
+        index.get_band_keys(fingerprint)
+    )
+
+    LoadProcessor(repository, config).execute(report_id=10)
+    pairs = repository.execute_query(
+        "SELECT articleIdNew, articleIdApproved FROM ArticleDuplicateAnalyses WHERE articleIdApproved = 3"
+    )
+    assert sorted(row["articleIdNew"] for row in pairs) == [1, 2]
+
+
+@pytest.mark.unit
+def test_load_processor_simhash_blocking(repo_and_config) -> None:
+    repository, config = repo_and_config
+    config.load_mode = LoadMode.SQL
+    config.blocking_enabled = True
+    config.blocking_rules = (BlockingRule.SIMHASH,)
+
+    summary = LoadProcessor(repository, config).execute(report_id=10)
+
+    # Articles 1 and 2 have the same content; article 3 is unrelated.
+    pairs = [
+        tuple(row.values())
+        for row in repository.execute_query(
+            "SELECT articleIdNew, articleIdApproved FROM ArticleDuplicateAnalyses "
+            "ORDER BY articleIdNew, articleIdApproved"
+        )
+    ]
+    assert pairs == [(1, 1), (1, 2), (2, 1), (2, 2)]
+    assert summary["pruned_pairs"] == 2
+
+
 @pytest.mark.unit
 def test_states_processor_updates_flags(repo_and_config) -> None:
     repository, config = repo_and_config
@@ -228,24 +444,17 @@ def test_content_hash_processor_and_golden_cases(repo_and_config) -> None:
         Path("tests/fixtures/deduper/golden_cases.json").read_text(encoding="utf-8")
     )["content_cases"]
 
-    exact = processor._compare_content_with_details(
-        cases[0]["headline_new"],
-        cases[0]["text_new"],
-        cases[0]["headline_approved"],
-        cases[0]["text_approved"],
-        1,
-        2,
+    # Golden pairs go through the same fingerprint store and batch comparison as the stage.
+    pair_ids = [(1, 2), (11, 22)]
+    fingerprints = ArticleFingerprintStore(repository).get_fingerprints(
+        {"articleId": article_id, "headline": case[f"headline_{side}"], "text": case[f"text_{side}"]}
+        for case, article_ids in zip(cases, pair_ids)
+        for side, article_id in zip(("new", "approved"), article_ids)
     )
-    assert exact == cases[0]["expected"]
-
-    loose = processor._compare_content_with_details(
-        cases[1]["headline_new"],
-        cases[1]["text_new"],
-        cases[1]["headline_approved"],
-        cases[1]["text_approved"],
-        11,
-        22,
+    exact, loose = compare_fingerprint_pairs(
+        [(fingerprints[new_id], fingerprints[approved_id]) for new_id, approved_id in pair_ids]
     )
+    assert exact == cases[0]["expected"]
     assert loose <= cases[1]["expected_max"]
 
 
@@ -293,4 +502,41 @@ def test_content_hash_cache_bounded(repo_and_config) -> None:
     processor = ContentHashProcessor(repository, config)
     processor.execute()
 
-    assert len(processor.norm_cache) <= config.cache_max_entries
+    assert len(processor.fingerprint_cache) <= config.cache_max_entries
+
+
+@pytest.mark.unit
+def test_content_fingerprints_persist_until_content_changes(
+    repo_and_config,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    from src.modules.deduper import fingerprints as fingerprints_mod
+
+    repository, config = repo_and_config
+    computed: list[int] = []
+    fingerprint_articles = fingerprints_mod.fingerprint_articles
+
+    def counting_fingerprint_articles(articles):
+        computed.extend(article["articleId"] for article in articles)
+        return fingerprint_articles(articles)
+
+    monkeypatch.setattr(fingerprints_mod, "fingerprint_articles", counting_fingerprint_articles)
+
+    LoadProcessor(repository, config).execute(report_id=10)
+    first = ContentHashProcessor(repository, config).execute()
+    assert sorted(computed) == [1, 2, 3]
+    assert first["exact_match_count"] == 4
+
+    # A fresh run reuses the stored fingerprints.
+    computed.clear()
+    LoadProcessor(repository, config).execute(report_id=10)
+    assert ContentHashProcessor(repository, config).execute() == first
+    assert computed == []
+
+    conn = repository.get_connection()
+    conn.execute("UPDATE ArticleApproveds SET textForPdfReport = 'Snow closed the roads.' WHERE articleId = 2")
+    conn.commit()
+    LoadProcessor(repository, config).execute(report_id=10)
+    second = ContentHashProcessor(repository, config).execute()
+    assert computed == [2]
+    assert second["exact_match_count"] == 2
@@ -135,6 +135,15 @@ def test_repository_healthcheck(repo: DeduperRepository) -> None:
     assert repo.healthcheck() is True
 
 
+@pytest.mark.unit
+def test_repository_waits_for_concurrent_writers(repo: DeduperRepository) -> None:
+    conn = repo.get_connection()
+
+    # The database is shared with other clients, so its journal mode is left alone.
+    assert conn.execute("PRAGMA journal_mode").fetchone()[0] != "wal"
+    assert conn.execute("PRAGMA busy_timeout").fetchone()[0] == 30_000
+
+
 @pytest.mark.unit
 def test_report_and_approved_queries(repo: DeduperRepository) -> None:
     assert repo.get_article_ids_by_report_id(10) == [1, 2]
@@ -251,3 +260,24 @@ def test_clear_all_analysis_data(repo: DeduperRepository) -> None:
 
     remaining = repo.execute_query("SELECT COUNT(*) AS c FROM ArticleDuplicateAnalyses")
     assert remaining[0]["c"] == 0
+
+
+@pytest.mark.unit
+def test_simhash_index_contents_use_the_first_approved_row(repo: DeduperRepository) -> None:
+    conn = repo.get_connection()
+    conn.execute(
+        "INSERT INTO ArticleApproveds(articleId, isApproved, headlineForPdfReport, textForPdfReport) "
+        "VALUES(1, 1, 'H1 revised', 'Text one revised')"
+    )
+    conn.commit()
+    repo.ensure_simhash_index_schema()
+
+    rows = repo.get_approved_article_contents_for_simhash_index(limit=10)
+
+    assert [(row["articleId"], row["headline"], row["text"]) for row in rows] == [
+        (1, "H1", "Text one"),
+        (2, "H2", "Text two"),
+    ]
+    assert repo.get_approved_article_contents_for_simhash_index(limit=10, after_id=1)[0][
+        "articleId"
+    ] == 2
@@ -85,3 +85,25 @@ def test_classify_processor_cancellation(
             ],
             should_cancel=lambda: True,
         )
+
+
+@pytest.mark.unit
+def test_classify_processor_yields_at_checkpoint(
+    monkeypatch: pytest.MonkeyPatch,
+    config: LocationScorerConfig,
+) -> None:
+    monkeypatch.setattr(classify_module, "_CLASSIFIER", None)
+    monkeypatch.setattr(classify_module, "_get_classifier", lambda: _FakeClassifier())
+
+    result = ClassifyProcessor(_Repo(), config).execute(
+        [
+            {"id": 1, "title": "Texas drought", "description": "Dry weather continues"},
+            {"id": 2, "title": "California storm", "description": "Heavy rains"},
+            {"id": 3, "title": "Berlin summit", "description": "Leaders met"},
+        ],
+        should_yield=lambda: True,
+    )
+
+    assert result["yielded"] is True
+    assert result["processed"] == 1
+    assert [score["article_id"] for score in result["scores"]] == [1]
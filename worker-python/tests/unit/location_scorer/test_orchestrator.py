@@ -78,12 +78,19 @@ def test_run_score_success(monkeypatch: pytest.MonkeyPatch, config: LocationScor
     monkeypatch.setattr(orch_mod, "ClassifyProcessor", _ClassifyProc)
     monkeypatch.setattr(orch_mod, "WriteProcessor", _WriteProc)
 
-    summary = orchestrator.run_score(limit=25)
+    remaining_limits: list[int | None] = []
+    summary = orchestrator.run_score(
+        limit=25,
+        on_progress=lambda current: remaining_limits.append(current.remaining_limit),
+    )
 
     assert summary.mode == LocationScorerRunMode.SCORE
     assert summary.limit == 25
     assert summary.status == "completed"
     assert [step.step.value for step in summary.steps] == ["load", "classify", "write"]
+    # The write step's progress carries what a restarted run still has to score.
+    assert remaining_limits[-1] == 23
+    assert remaining_limits[0] is None
 
 
 @pytest.mark.unit
@@ -101,6 +108,31 @@ def test_run_score_cancelled(monkeypatch: pytest.MonkeyPatch, config: LocationSc
         orchestrator.run_score(should_cancel=lambda: True)
 
 
+@pytest.mark.unit
+def test_run_score_yielded_writes_partial_scores(
+    monkeypatch: pytest.MonkeyPatch,
+    config: LocationScorerConfig,
+) -> None:
+    from src.modules.location_scorer import orchestrator as orch_mod
+
+    class _YieldingClassifyProc(_ClassifyProc):
+        def execute(self, articles, **kwargs):
+            assert kwargs["should_yield"]() is True
+            return {**super().execute(articles), "skipped": 1, "yielded": True}
+
+    orchestrator = LocationScorerOrchestrator(_Repo(), config)
+
+    monkeypatch.setattr(orch_mod, "LoadProcessor", _LoadProc)
+    monkeypatch.setattr(orch_mod, "ClassifyProcessor", _YieldingClassifyProc)
+    monkeypatch.setattr(orch_mod, "WriteProcessor", _WriteProc)
+
+    summary = orchestrator.run_score(limit=25, should_yield=lambda: True)
+
+    assert summary.status == "yielded"
+    assert summary.remaining_limit == 22
+    assert [step.step.value for step in summary.steps] == ["load", "classify", "write"]
+
+
 @pytest.mark.unit
 def test_check_ready(config: LocationScorerConfig) -> None:
     orchestrator = LocationScorerOrchestrator(_Repo(), config)
@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+from time import sleep
+
+from src.modules.queue.context import (
+    QueueExecutionContext,
+    QueueJobCanceledError,
+    QueueJobYieldedError,
+)
+
+
+def report_and_complete(context: QueueExecutionContext, label: str) -> None:
+    context.append_log(f"event=job_started label={label}")
+    context.update_result({"label": label, "exitCode": 0})
+
+
+def wait_for_cancel(context: QueueExecutionContext) -> None:
+    context.append_log("event=waiting")
+    while not context.is_cancel_requested():
+        sleep(0.01)
+    raise QueueJobCanceledError()
+
+
+def yield_until_resumed(context: QueueExecutionContext) -> None:
+    if context.resumeCursor is not None:
+        context.append_log(f"event=job_resumed offset={context.resumeCursor['offset']}")
+        return
+
+    context.append_log("event=waiting")
+    while not context.is_yield_requested():
+        sleep(0.01)
+    raise QueueJobYieldedError({"offset": 5})
+
+
+def fail(context: QueueExecutionContext) -> None:
+    raise RuntimeError("process_job_failed")
+
+
+def record_metric(context: QueueExecutionContext, rows: int) -> None:
+    from src.metrics import PIPELINE_STEP_ROWS_TOTAL
+
+    PIPELINE_STEP_ROWS_TOTAL.inc(rows, pipeline="process_pool_test", step="record")
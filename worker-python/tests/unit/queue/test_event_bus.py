@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+import asyncio
+from threading import Event, Thread
+from time import sleep
+
+import pytest
+
+from src.modules.queue.engine import EnqueueJobInput, GlobalQueueEngine
+from src.modules.queue.events import QueueEventBus, QueueJobEventType
+from src.modules.queue.store import QueueJobStore
+from src.modules.queue.types import QueueJobRecord, QueueJobStatus
+
+
+def _build_job(job_id: str, status: QueueJobStatus = QueueJobStatus.QUEUED) -> QueueJobRecord:
+    return QueueJobRecord(
+        jobId=job_id,
+        endpointName="/deduper/start-job",
+        status=status,
+        createdAt="2026-03-15T00:00:00Z",
+    )
+
+
+@pytest.mark.unit
+def test_event_bus_returns_events_after_sequence_and_drops_oldest() -> None:
+    bus = QueueEventBus(max_events=3)
+    bus.publish_status(_build_job("0001"))
+    bus.publish_log("0002", "/deduper/start-job", "event=job_started")
+    bus.publish_result("0001", "/deduper/start-job", {"exitCode": 0})
+    bus.publish_status(_build_job("0001", QueueJobStatus.COMPLETED))
+
+    assert bus.last_sequence == 4
+    assert [event.sequence for event in bus.get_events_since(0)] == [2, 3, 4]
+    assert [event.sequence for event in bus.get_events_since(2, job_id="0001")] == [3, 4]
+    assert bus.get_events_since(4) == []
+
+
+@pytest.mark.unit
+def test_event_bus_wait_blocks_until_matching_event() -> None:
+    bus = QueueEventBus()
+
+    def publish_later() -> None:
+        sleep(0.05)
+        bus.publish_log("0002", "/deduper/start-job", "event=other_job")
+        sleep(0.05)
+        bus.publish_log("0001", "/deduper/start-job", "event=job_started")
+
+    Thread(target=publish_later, daemon=True).start()
+    events = bus.wait_for_events(0, job_id="0001", timeout=1)
+
+    assert [event.line for event in events] == ["event=job_started"]
+    assert bus.wait_for_events(bus.last_sequence, timeout=0.01) == []
+
+
+@pytest.mark.unit
+def test_event_bus_async_wait_wakes_on_publish_from_another_thread() -> None:
+    bus = QueueEventBus()
+
+    def publish_later() -> None:
+        sleep(0.05)
+        bus.publish_log("0002", "/deduper/start-job", "event=other_job")
+        sleep(0.05)
+        bus.publish_log("0001", "/deduper/start-job", "event=job_started")
+
+    async def wait_for_job_events() -> list:
+        Thread(target=publish_later, daemon=True).start()
+        return await bus.wait_for_events_async(0, job_id="0001", timeout=1)
+
+    events = asyncio.run(wait_for_job_events())
+
+    assert [event.line for event in events] == ["event=job_started"]
+    assert asyncio.run(bus.wait_for_events_async(bus.last_sequence, timeout=0.01)) == []
+
+
+@pytest.mark.unit
+def test_event_bus_async_wait_skips_scanned_events_for_other_jobs(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    bus = QueueEventBus()
+    for _ in range(50):
+        bus.publish_log("0002", "/deduper/start-job", "event=other_job")
+    scanned_since: list[int] = []
+    get_events_since_locked = bus._get_events_since_locked
+
+    def record_scan(since: int, job_id: str | None) -> list:
+        scanned_since.append(since)
+        return get_events_since_locked(since, job_id)
+
+    monkeypatch.setattr(bus, "_get_events_since_locked", record_scan)
+
+    def publish_later() -> None:
+        sleep(0.05)
+        bus.publish_log("0002", "/deduper/start-job", "event=other_job")
+        sleep(0.05)
+        bus.publish_log("0001", "/deduper/start-job", "event=job_started")
+
+    async def wait_for_job_events() -> list:
+        Thread(target=publish_later, daemon=True).start()
+        return await bus.wait_for_events_async(0, job_id="0001", timeout=1)
+
+    events = asyncio.run(wait_for_job_events())
+
+    assert [event.line for event in events] == ["event=job_started"]
+    assert scanned_since == [0, 50, 51]
+
+
+@pytest.mark.unit
+def test_engine_async_wait_returns_on_status_change(tmp_path) -> None:
+    engine = GlobalQueueEngine(QueueJobStore(tmp_path / "worker-python" / "queue-jobs.json"))
+    release_event = Event()
+    result = engine.enqueue_job(
+        EnqueueJobInput(endpointName="/deduper/start-job", run=lambda context: release_event.wait(1))
+    )
+
+    async def wait_for_completion():
+        running = await engine.wait_for_job_change_async(
+            result.jobId,
+            since=QueueJobStatus.QUEUED,
+            timeout=1,
+        )
+        release_event.set()
+        completed = await engine.wait_for_job_change_async(
+            result.jobId,
+            since=QueueJobStatus.RUNNING,
+            timeout=1,
+        )
+        return running, completed
+
+    running, completed = asyncio.run(wait_for_completion())
+
+    assert running.changed is True
+    assert completed.changed is True
+    assert completed.job.status == QueueJobStatus.COMPLETED
+    assert asyncio.run(engine.wait_for_job_change_async("9999", timeout=0.01)) is None
+    assert engine.on_idle(timeout=1) is True
+
+
+@pytest.mark.unit
+def test_engine_publishes_status_log_and_result_events(tmp_path) -> None:
+    engine = GlobalQueueEngine(QueueJobStore(tmp_path / "worker-python" / "queue-jobs.json"))
+
+    def run_job(context) -> None:
+        context.append_log("event=job_started")
+        context.update_result({"exitCode": 0})
+
+    result = engine.enqueue_job(EnqueueJobInput(endpointName="/deduper/start-job", run=run_job))
+    assert engine.on_idle(timeout=1) is True
+
+    events = engine.events.get_events_since(0, job_id=result.jobId)
+    assert [(event.type, event.status or event.line or event.fields) for event in events] == [
+        (QueueJobEventType.STATUS, "queued"),
+        (QueueJobEventType.STATUS, "running"),
+        (QueueJobEventType.LOG, "event=job_started"),
+        (QueueJobEventType.RESULT, {"exitCode": 0}),
+        (QueueJobEventType.STATUS, "completed"),
+    ]
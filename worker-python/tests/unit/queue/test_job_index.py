@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+from dataclasses import replace
+
+import pytest
+
+from src.modules.queue.index import QueueJobIndex
+from src.modules.queue.types import QueueJobRecord, QueueJobStatus
+
+
+def _build_job(
+    job_id: str,
+    endpoint_name: str = "/deduper/start-job",
+    created_at: str = "2026-03-15T00:00:00Z",
+    status: QueueJobStatus = QueueJobStatus.QUEUED,
+) -> QueueJobRecord:
+    return QueueJobRecord(
+        jobId=job_id,
+        endpointName=endpoint_name,
+        status=status,
+        createdAt=created_at,
+    )
+
+
+@pytest.mark.unit
+def test_job_index_tracks_status_membership_across_updates() -> None:
+    index = QueueJobIndex([_build_job("0001"), _build_job("0002")])
+
+    index.put(replace(_build_job("0001"), status=QueueJobStatus.RUNNING))
+
+    assert [job.jobId for job in index.get_by_status(QueueJobStatus.QUEUED)] == ["0002"]
+    assert [job.jobId for job in index.get_by_status(QueueJobStatus.RUNNING)] == ["0001"]
+    assert index.count_by_status()[QueueJobStatus.QUEUED] == 1
+    assert index.count_by_status()[QueueJobStatus.RUNNING] == 1
+    assert len(index) == 2
+
+
+@pytest.mark.unit
+def test_job_index_keeps_store_order_for_status_reads() -> None:
+    index = QueueJobIndex(
+        [
+            _build_job("0001", status=QueueJobStatus.RUNNING),
+            _build_job("0002"),
+            _build_job("0003", status=QueueJobStatus.RUNNING),
+        ]
+    )
+
+    index.put(_build_job("0001"))
+    index.put(_build_job("0003"))
+
+    assert [job.jobId for job in index.get_by_status(QueueJobStatus.QUEUED)] == [
+        "0001",
+        "0002",
+        "0003",
+    ]
+
+
+@pytest.mark.unit
+def test_job_index_tracks_latest_job_per_endpoint() -> None:
+    index = QueueJobIndex(
+        [
+            _build_job("0001", created_at="2026-03-15T00:00:00Z"),
+            _build_job("0002", created_at="2026-03-15T00:00:02Z"),
+            _build_job("0003", endpoint_name="/ai-approver/start-job"),
+            _build_job("0004", created_at="2026-03-15T00:00:02Z"),
+        ]
+    )
+
+    latest_job = index.get_latest_by_endpoint_name("/deduper/start-job")
+    assert latest_job is not None
+    assert latest_job.jobId == "0002"
+    assert index.get_latest_by_endpoint_name("/missing") is None
+
+    index.put(_build_job("0002", created_at="2026-03-14T00:00:00Z"))
+
+    latest_job = index.get_latest_by_endpoint_name("/deduper/start-job")
+    assert latest_job is not None
+    assert latest_job.jobId == "0004"
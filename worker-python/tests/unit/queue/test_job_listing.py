@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+from dataclasses import replace
+
+import pytest
+
+from src.modules.queue.listing import (
+    QueueJobListQuery,
+    etag_matches,
+    parse_job_cursor,
+    parse_job_fields,
+    project_job,
+)
+from src.modules.queue.sqlite_store import SqliteQueueJobStore
+from src.modules.queue.store import QueueJobStore, QueueJobStoreBackend
+from src.modules.queue.types import QueueJobRecord, QueueJobStatus
+
+
+def _build_job(
+    job_id: str,
+    status: QueueJobStatus = QueueJobStatus.COMPLETED,
+    endpoint_name: str = "/deduper/start-job",
+    created_at: str = "2026-03-15T00:00:00+00:00",
+    report_id: int | None = None,
+) -> QueueJobRecord:
+    return QueueJobRecord(
+        jobId=job_id,
+        endpointName=endpoint_name,
+        status=status,
+        createdAt=created_at,
+        logs=[f"event=job_started job_id={job_id}"],
+        parameters={"reportId": report_id} if report_id is not None else None,
+    )
+
+
+@pytest.fixture(params=["json", "sqlite"])
+def store(request, tmp_path) -> QueueJobStoreBackend:
+    if request.param == "sqlite":
+        job_store: QueueJobStoreBackend = SqliteQueueJobStore(tmp_path / "queue-jobs.sqlite3")
+    else:
+        job_store = QueueJobStore(tmp_path / "queue-jobs.json")
+    job_store.ensure_initialized()
+    job_store.append_job(_build_job("0001", created_at="2026-03-15T00:00:00+00:00", report_id=7))
+    job_store.append_job(_build_job("0002", QueueJobStatus.FAILED, created_at="2026-03-15T01:00:00+00:00"))
+    job_store.append_job(
+        _build_job("0003", endpoint_name="/location-scorer/start-job", created_at="2026-03-15T02:00:00+00:00")
+    )
+    job_store.append_job(_build_job("0004", QueueJobStatus.QUEUED, created_at="2026-03-15T03:00:00+00:00", report_id=7))
+    return job_store
+
+
+@pytest.mark.unit
+def test_list_jobs_pages_with_cursor(store: QueueJobStoreBackend) -> None:
+    first_page = store.list_jobs(QueueJobListQuery(limit=3))
+    second_page = store.list_jobs(QueueJobListQuery(cursor=parse_job_cursor(first_page.nextCursor), limit=3))
+
+    assert [job.jobId for job in first_page.jobs] == ["0001", "0002", "0003"]
+    assert first_page.nextCursor is not None
+    assert [job.jobId for job in second_page.jobs] == ["0004"]
+    assert second_page.nextCursor is None
+    assert store.list_jobs(QueueJobListQuery(limit=4)).nextCursor is None
+
+
+@pytest.mark.unit
+def test_list_jobs_applies_filters_and_skips_logs(store: QueueJobStoreBackend) -> None:
+    def list_ids(**filters) -> list[str]:
+        return [job.jobId for job in store.list_jobs(QueueJobListQuery(**filters)).jobs]
+
+    assert list_ids(statuses=(QueueJobStatus.FAILED, QueueJobStatus.QUEUED)) == ["0002", "0004"]
+    assert list_ids(endpointName="/location-scorer/start-job") == ["0003"]
+    assert list_ids(
+        createdAfter="2026-03-15T01:00:00+00:00",
+        createdBefore="2026-03-15T03:00:00+00:00",
+    ) == ["0002", "0003"]
+    assert list_ids(reportId=7) == ["0001", "0004"]
+    assert list_ids(reportId=7, statuses=(QueueJobStatus.COMPLETED,), limit=1) == ["0001"]
+
+    assert store.list_jobs(QueueJobListQuery(limit=1)).jobs[0].logs == ["event=job_started job_id=0001"]
+    assert store.list_jobs(QueueJobListQuery(limit=1, includeLogs=False)).jobs[0].logs == []
+
+
+@pytest.mark.unit
+def test_store_version_changes_only_on_job_mutations(store: QueueJobStoreBackend) -> None:
+    version = store.get_version()
+
+    store.allocate_job_id()
+    store.list_jobs(QueueJobListQuery())
+    assert store.get_version() == version
+
+    store.append_job_log("0004", "event=job_progress")
+    assert store.get_version() != version
+    assert store.list_jobs(QueueJobListQuery()).version == store.get_version()
+
+
+@pytest.mark.unit
+def test_snapshot_matches_store_and_is_swapped_on_mutation(store: QueueJobStoreBackend) -> None:
+    snapshot = store.get_snapshot()
+    first_page = snapshot.list_jobs(QueueJobListQuery(limit=3, includeLogs=False))
+
+    assert snapshot.version == store.get_version()
+    assert [job.jobId for job in first_page.jobs] == ["0001", "0002", "0003"]
+    # Snapshot cursors page the store listing the same way.
+    assert [
+        job.jobId
+        for job in store.list_jobs(QueueJobListQuery(cursor=parse_job_cursor(first_page.nextCursor))).jobs
+    ] == ["0004"]
+    assert snapshot.get_latest_job_by_endpoint_name("/deduper/start-job").jobId == "0004"
+    assert snapshot.count_jobs_by_status() == store.count_jobs_by_status()
+
+    store.update_job(
+        "0004",
+        lambda job: replace(job, status=QueueJobStatus.RUNNING, logs=["event=job_progress"]),
+    )
+    store.remove_jobs(["0001"])
+    latest = store.get_snapshot()
+
+    assert snapshot.get_job("0004").status == QueueJobStatus.QUEUED
+    assert snapshot.get_job("0001") is not None
+    assert latest.version == store.get_version() != snapshot.version
+    assert latest.get_job("0004").status == QueueJobStatus.RUNNING
+    assert latest.get_job("0001") is None
+    if latest.has_logs_for(("0004",)):
+        assert latest.get_job("0004").logs == store.get_job_by_id("0004").logs
+        assert latest.get_job_log_page("0004", 1, 10).lines == ["event=job_progress"]
+    else:
+        assert latest.get_job("0004").logs == []
+
+
+@pytest.mark.unit
+def test_snapshot_is_built_once_per_version_on_read(
+    store: QueueJobStoreBackend,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    builds: list[str] = []
+    build_snapshot = store._build_snapshot_locked
+    monkeypatch.setattr(
+        store,
+        "_build_snapshot_locked",
+        lambda: builds.append(store._version) or build_snapshot(),
+    )
+
+    for _ in range(5):
+        store.append_job_log("0004", "event=job_progress")
+    assert builds == []
+
+    snapshot = store.get_snapshot()
+    assert store.get_snapshot() is snapshot
+    assert snapshot.version == store.get_version()
+    assert len(builds) == 1
+
+
+@pytest.mark.unit
+def test_listing_helpers_parse_and_project() -> None:
+    job = _build_job("0001", report_id=7)
+
+    assert parse_job_fields(None) is None
+    assert parse_job_fields("jobId, status,jobId") == ("jobId", "status")
+    with pytest.raises(ValueError, match="Unknown job fields: secret"):
+        parse_job_fields("jobId,secret")
+    with pytest.raises(ValueError):
+        parse_job_cursor("abc")
+
+    assert project_job(job, ("jobId", "status")) == {"jobId": "0001", "status": QueueJobStatus.COMPLETED}
+    assert etag_matches('W/"abc-1", "abc-2"', '"abc-2"') is True
+    assert etag_matches('"abc-1"', '"abc-2"') is False
+    assert etag_matches(None, '"abc-2"') is False
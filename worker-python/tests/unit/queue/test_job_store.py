@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import json
+from dataclasses import asdict
 
 import pytest
 
@@ -69,9 +70,10 @@ def test_job_store_update_job_persists_changes(tmp_path) -> None:
     assert updated_job.status == QueueJobStatus.RUNNING
     assert updated_job.startedAt == "2026-03-15T00:01:00Z"
 
-    persisted = json.loads(store.file_path.read_text(encoding="utf-8"))
-    assert persisted["jobs"][0]["status"] == "running"
-    assert persisted["jobs"][0]["startedAt"] == "2026-03-15T00:01:00Z"
+    reloaded_job = QueueJobStore(store.file_path).get_job_by_id("0001")
+    assert reloaded_job is not None
+    assert reloaded_job.status == QueueJobStatus.RUNNING
+    assert reloaded_job.startedAt == "2026-03-15T00:01:00Z"
 
 
 @pytest.mark.unit
@@ -96,3 +98,206 @@ def test_job_store_invalid_json_raises_queue_store_error(tmp_path) -> None:
 
     with pytest.raises(QueueStoreError, match="Queue job store contains invalid JSON"):
         store.get_jobs()
+
+
+@pytest.mark.unit
+def test_job_store_appends_journal_entries_without_rewriting_snapshot(tmp_path) -> None:
+    store = QueueJobStore(tmp_path / "worker-python" / "queue-jobs.json")
+    store.ensure_initialized()
+
+    store.append_job(_build_job("0001"))
+    store.update_job(
+        "0001",
+        lambda existing_job: QueueJobRecord(
+            jobId=existing_job.jobId,
+            endpointName=existing_job.endpointName,
+            status=QueueJobStatus.RUNNING,
+            createdAt=existing_job.createdAt,
+        ),
+    )
+
+    assert json.loads(store.file_path.read_text(encoding="utf-8")) == {"jobs": []}
+    journal_lines = store.journal_path.read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)["job"]["status"] for line in journal_lines] == ["queued", "running"]
+
+
+@pytest.mark.unit
+def test_job_store_replays_snapshot_and_journal_after_restart(tmp_path) -> None:
+    store_path = tmp_path / "worker-python" / "queue-jobs.json"
+    store = QueueJobStore(store_path)
+    store.ensure_initialized()
+    store.append_job(_build_job("0001"))
+    store.compact()
+    store.append_job(_build_job("0002"))
+
+    restarted_store = QueueJobStore(store_path)
+
+    assert [job.jobId for job in restarted_store.get_jobs()] == ["0001", "0002"]
+
+
+@pytest.mark.unit
+def test_job_store_compacts_journal_into_snapshot_at_threshold(tmp_path) -> None:
+    store = QueueJobStore(tmp_path / "worker-python" / "queue-jobs.json", compact_threshold=2)
+    store.ensure_initialized()
+
+    store.append_job(_build_job("0001"))
+    store.append_job(_build_job("0002"))
+
+    persisted = json.loads(store.file_path.read_text(encoding="utf-8"))
+    assert [job["jobId"] for job in persisted["jobs"]] == ["0001", "0002"]
+    assert store.journal_path.exists() is False
+
+
+@pytest.mark.unit
+def test_job_store_ignores_torn_final_journal_line(tmp_path) -> None:
+    store_path = tmp_path / "worker-python" / "queue-jobs.json"
+    store = QueueJobStore(store_path)
+    store.ensure_initialized()
+    store.append_job(_build_job("0001"))
+    with store.journal_path.open("a", encoding="utf-8") as journal_file:
+        journal_file.write('{"op": "put", "job": {"jobId": "00')
+
+    restarted_store = QueueJobStore(store_path)
+    restarted_store.append_job(_build_job("0002"))
+
+    assert [job.jobId for job in QueueJobStore(store_path).get_jobs()] == ["0001", "0002"]
+
+
+@pytest.mark.unit
+def test_job_store_invalid_journal_line_raises_queue_store_error(tmp_path) -> None:
+    store_path = tmp_path / "worker-python" / "queue-jobs.json"
+    store = QueueJobStore(store_path)
+    store.ensure_initialized()
+    store.append_job(_build_job("0001"))
+    journal_text = store.journal_path.read_text(encoding="utf-8")
+    store.journal_path.write_text("{not-json\n" + journal_text, encoding="utf-8")
+
+    with pytest.raises(QueueStoreError, match="Queue job journal contains invalid JSON"):
+        QueueJobStore(store_path).get_jobs()
+
+
+@pytest.mark.unit
+def test_job_store_allocates_job_ids_from_persisted_sequence(tmp_path) -> None:
+    store_path = tmp_path / "worker-python" / "queue-jobs.json"
+    store = QueueJobStore(store_path)
+    store.ensure_initialized()
+    store.append_job(_build_job("0007"))
+
+    assert store.allocate_job_id() == "0008"
+    assert store.allocate_job_id() == "0009"
+    assert store.sequence_path.read_text(encoding="utf-8").strip() == "9"
+
+    restarted_store = QueueJobStore(store_path)
+    assert restarted_store.allocate_job_id() == "0010"
+
+
+@pytest.mark.unit
+def test_job_store_replace_jobs_keeps_sequence_monotonic(tmp_path) -> None:
+    store_path = tmp_path / "worker-python" / "queue-jobs.json"
+    store = QueueJobStore(store_path)
+    store.allocate_job_id()
+    store.allocate_job_id()
+
+    store.replace_jobs([])
+    assert store.allocate_job_id() == "0003"
+
+    store.replace_jobs([_build_job("0042")])
+    assert store.allocate_job_id() == "0043"
+    store.replace_jobs([_build_job("0007")])
+    assert QueueJobStore(store_path).allocate_job_id() == "0044"
+
+
+@pytest.mark.unit
+def test_job_store_keeps_logs_in_per_job_segments(tmp_path) -> None:
+    store = QueueJobStore(tmp_path / "worker-python" / "queue-jobs.json")
+    store.ensure_initialized()
+    store.append_job(_build_job("0001"))
+    journal_line_count = len(store.journal_path.read_text(encoding="utf-8").splitlines())
+
+    assert store.append_job_log("0001", "event=job_started") is True
+    store.update_job(
+        "0001",
+        lambda existing_job: QueueJobRecord(
+            jobId=existing_job.jobId,
+            endpointName=existing_job.endpointName,
+            status=existing_job.status,
+            createdAt=existing_job.createdAt,
+            logs=[*existing_job.logs, "line\nwith newline", "event=step"],
+        ),
+    )
+    assert store.append_job_log("9999", "event=orphan") is False
+
+    assert len(store.journal_path.read_text(encoding="utf-8").splitlines()) == journal_line_count
+    assert (store.log_directory / "0001.log").exists()
+    with (store.log_directory / "0001.log").open("a", encoding="utf-8") as segment:
+        segment.write('"torn')
+
+    reloaded_store = QueueJobStore(store.file_path)
+    assert reloaded_store.get_job_by_id("0001").logs == [
+        "event=job_started",
+        "line\nwith newline",
+        "event=step",
+    ]
+    page = reloaded_store.get_job_logs("0001", offset=1, limit=1)
+    assert page.lines == ["line\nwith newline"]
+    assert (page.offset, page.nextOffset, page.total) == (1, 2, 3)
+    assert reloaded_store.get_job_logs("0001", offset=10, limit=5).lines == []
+    assert reloaded_store.get_job_logs("9999", offset=0, limit=5) is None
+
+    reloaded_store.remove_jobs(["0001"])
+    assert not (store.log_directory / "0001.log").exists()
+
+
+@pytest.mark.unit
+def test_job_store_reads_each_log_segment_once(tmp_path, monkeypatch) -> None:
+    store = QueueJobStore(tmp_path / "worker-python" / "queue-jobs.json")
+    store.ensure_initialized()
+    store.append_job(_build_job("0001"))
+    store.append_job(_build_job("0002"))
+    store.append_job_log("0001", "event=job_started")
+
+    reloaded_store = QueueJobStore(store.file_path)
+    segment_reads: list[str] = []
+    read_segment = reloaded_store._log_segments.read
+    monkeypatch.setattr(
+        reloaded_store._log_segments,
+        "read",
+        lambda job_id, *args: segment_reads.append(job_id) or read_segment(job_id, *args),
+    )
+
+    reloaded_store.ensure_initialized()
+    assert segment_reads == []
+    assert reloaded_store.get_job_by_id("0001").logs == ["event=job_started"]
+    assert reloaded_store.append_job_log("0001", "event=step") is True
+    assert reloaded_store.append_job_log("0002", "event=job_started") is True
+    snapshot = reloaded_store.get_snapshot()
+    assert reloaded_store.append_job_log("0001", "event=job_completed") is True
+
+    assert reloaded_store.get_job_by_id("0001").logs == [
+        "event=job_started",
+        "event=step",
+        "event=job_completed",
+    ]
+    assert reloaded_store.get_job_logs("0001", offset=1, limit=5).lines == [
+        "event=step",
+        "event=job_completed",
+    ]
+    assert segment_reads == ["0001"]
+    # Snapshots keep the lines they were taken with; unmirrored jobs are left to the store.
+    assert snapshot.get_job("0001").logs == ["event=job_started", "event=step"]
+    assert not snapshot.has_logs_for(("0002",))
+    assert reloaded_store.get_job_by_id("0002").logs == ["event=job_started"]
+
+
+@pytest.mark.unit
+def test_job_store_moves_inline_logs_into_segments_on_load(tmp_path) -> None:
+    store_path = tmp_path / "worker-python" / "queue-jobs.json"
+    store_path.parent.mkdir(parents=True)
+    legacy_job = asdict(_build_job("0001"))
+    legacy_job["logs"] = ["event=job_started", "event=job_completed"]
+    store_path.write_text(json.dumps({"jobs": [legacy_job]}), encoding="utf-8")
+
+    store = QueueJobStore(store_path)
+
+    assert store.get_job_by_id("0001").logs == ["event=job_started", "event=job_completed"]
+    assert json.loads(store_path.read_text(encoding="utf-8"))["jobs"][0]["logs"] == []
@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+from time import monotonic, sleep
+
+import pytest
+
+from src.modules.queue.config import QueueConcurrencyPolicy
+from src.modules.queue.engine import EnqueueJobInput, GlobalQueueEngine
+from src.modules.queue.process_pool import QueueProcessPool, QueueProcessTarget
+from src.modules.queue.store import QueueJobStore
+from src.modules.queue.types import QueueJobPriority, QueueJobStatus
+
+
+PROCESS_ENDPOINT_NAME = "/location-scorer/start-job"
+
+
+@pytest.fixture
+def process_engine(tmp_path):
+    pool = QueueProcessPool([PROCESS_ENDPOINT_NAME], size=1)
+    engine = GlobalQueueEngine(
+        QueueJobStore(tmp_path / "worker-python" / "queue-jobs.json"),
+        concurrency=QueueConcurrencyPolicy(max_workers=2),
+        process_pool=pool,
+    )
+    yield engine
+    pool.shutdown()
+
+
+def _fail_in_thread(context) -> None:
+    raise AssertionError("process endpoints must not run in the engine thread")
+
+
+@pytest.mark.unit
+def test_process_pool_streams_logs_and_results_to_store(process_engine) -> None:
+    first = process_engine.enqueue_job(
+        EnqueueJobInput(
+            endpointName=PROCESS_ENDPOINT_NAME,
+            run=_fail_in_thread,
+            processTarget=QueueProcessTarget(
+                "tests.unit.queue.process_targets:report_and_complete",
+                {"label": "first"},
+            ),
+        )
+    )
+    second = process_engine.enqueue_job(
+        EnqueueJobInput(
+            endpointName=PROCESS_ENDPOINT_NAME,
+            run=_fail_in_thread,
+            processTarget=QueueProcessTarget("tests.unit.queue.process_targets:fail"),
+        )
+    )
+
+    assert process_engine.on_idle(timeout=30) is True
+
+    completed_job = process_engine.get_check_status(first.jobId)
+    assert completed_job is not None
+    assert completed_job.status == QueueJobStatus.COMPLETED
+    assert completed_job.logs == ["event=job_started label=first"]
+    assert completed_job.result == {"label": "first", "exitCode": 0}
+
+    failed_job = process_engine.get_check_status(second.jobId)
+    assert failed_job is not None
+    assert failed_job.status == QueueJobStatus.FAILED
+    assert failed_job.failureReason == "process_job_failed"
+
+
+@pytest.mark.unit
+def test_process_pool_propagates_cancel_to_worker_process(process_engine) -> None:
+    result = process_engine.enqueue_job(
+        EnqueueJobInput(
+            endpointName=PROCESS_ENDPOINT_NAME,
+            run=_fail_in_thread,
+            processTarget=QueueProcessTarget("tests.unit.queue.process_targets:wait_for_cancel"),
+        )
+    )
+
+    deadline = monotonic() + 30
+    while monotonic() < deadline:
+        job = process_engine.get_check_status(result.jobId)
+        if job is not None and job.logs:
+            break
+        sleep(0.05)
+
+    assert process_engine.cancel_job(result.jobId).outcome == "cancel_requested"
+    assert process_engine.on_idle(timeout=30) is True
+
+    canceled_job = process_engine.get_check_status(result.jobId)
+    assert canceled_job is not None
+    assert canceled_job.status == QueueJobStatus.CANCELED
+
+
+@pytest.mark.unit
+def test_process_pool_forwards_yield_and_resume_cursor(process_engine) -> None:
+    bulk_job = process_engine.enqueue_job(
+        EnqueueJobInput(
+            endpointName=PROCESS_ENDPOINT_NAME,
+            run=_fail_in_thread,
+            processTarget=QueueProcessTarget("tests.unit.queue.process_targets:yield_until_resumed"),
+            priority=QueueJobPriority.BULK,
+            preemptible=True,
+        )
+    )
+
+    deadline = monotonic() + 30
+    while monotonic() < deadline:
+        job = process_engine.get_check_status(bulk_job.jobId)
+        if job is not None and job.logs:
+            break
+        sleep(0.05)
+
+    interactive_job = process_engine.enqueue_job(
+        EnqueueJobInput(
+            endpointName=PROCESS_ENDPOINT_NAME,
+            run=_fail_in_thread,
+            processTarget=QueueProcessTarget(
+                "tests.unit.queue.process_targets:report_and_complete",
+                {"label": "interactive"},
+            ),
+            priority=QueueJobPriority.INTERACTIVE,
+        )
+    )
+
+    assert process_engine.on_idle(timeout=30) is True
+
+    resumed_job = process_engine.get_check_status(bulk_job.jobId)
+    assert resumed_job is not None
+    assert resumed_job.status == QueueJobStatus.COMPLETED
+    assert resumed_job.logs == ["event=waiting", "event=job_resumed offset=5"]
+    assert resumed_job.endedAt > process_engine.get_check_status(interactive_job.jobId).endedAt
+
+
+@pytest.mark.unit
+def test_process_pool_merges_worker_metrics_into_parent(process_engine) -> None:
+    from src.metrics import PIPELINE_STEP_ROWS_TOTAL
+
+    labels = {"pipeline": "process_pool_test", "step": "record"}
+    rows_before = PIPELINE_STEP_ROWS_TOTAL.value(**labels)
+    for _ in range(2):
+        process_engine.enqueue_job(
+            EnqueueJobInput(
+                endpointName=PROCESS_ENDPOINT_NAME,
+                run=_fail_in_thread,
+                processTarget=QueueProcessTarget(
+                    "tests.unit.queue.process_targets:record_metric",
+                    {"rows": 3},
+                ),
+            )
+        )
+
+    assert process_engine.on_idle(timeout=30) is True
+    assert PIPELINE_STEP_ROWS_TOTAL.value(**labels) == rows_before + 6
@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+from threading import Event
+from time import monotonic, sleep
+
+import pytest
+
+from src.modules.queue.engine import EnqueueJobInput, GlobalQueueEngine
+from src.modules.queue.progress import BufferedJobReporter
+from src.modules.queue.store import QueueJobStore
+from src.modules.queue.types import QueueJobRecord, QueueJobStatus
+
+
+class _CountingStore(QueueJobStore):
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.update_count = 0
+
+    def update_job(self, job_id, updater):
+        self.update_count += 1
+        return super().update_job(job_id, updater)
+
+
+def _create_store(tmp_path) -> _CountingStore:
+    store = _CountingStore(tmp_path / "worker-python" / "queue-jobs.json")
+    store.append_job(
+        QueueJobRecord(
+            jobId="0001",
+            endpointName="/location-scorer/start-job",
+            status=QueueJobStatus.RUNNING,
+            createdAt="2026-03-15T00:00:00Z",
+        )
+    )
+    return store
+
+
+@pytest.mark.unit
+def test_buffered_reporter_coalesces_updates_within_interval(tmp_path) -> None:
+    store = _create_store(tmp_path)
+    clock = [100.0]
+    reporter = BufferedJobReporter(store, "0001", flush_interval_seconds=5, clock=lambda: clock[0])
+
+    reporter.append_log("event=job_started")
+    for processed in range(20):
+        reporter.update_result({"currentStepProcessed": processed})
+        reporter.append_log(f"event=progress processed={processed}")
+
+    assert store.update_count == 1
+    assert store.get_job_by_id("0001").logs == ["event=job_started"]
+
+    clock[0] += 5
+    reporter.update_result({"currentStep": "write"})
+
+    job = store.get_job_by_id("0001")
+    assert store.update_count == 2
+    assert len(job.logs) == 21
+    assert job.result == {"currentStepProcessed": 19, "currentStep": "write"}
+
+    reporter.flush()
+    assert store.update_count == 2
+
+
+@pytest.mark.unit
+def test_buffered_reporter_timer_flushes_trailing_updates(tmp_path) -> None:
+    store = _create_store(tmp_path)
+    reporter = BufferedJobReporter(store, "0001", flush_interval_seconds=0.05)
+
+    reporter.append_log("event=job_started")
+    reporter.append_log("event=progress")
+
+    deadline = monotonic() + 1
+    while monotonic() < deadline and len(store.get_job_by_id("0001").logs) < 2:
+        sleep(0.01)
+
+    assert store.get_job_by_id("0001").logs == ["event=job_started", "event=progress"]
+    assert store.update_count == 2
+
+
+@pytest.mark.unit
+def test_buffered_reporter_writes_checkpoints_immediately(tmp_path) -> None:
+    store = _create_store(tmp_path)
+    clock = [100.0]
+    reporter = BufferedJobReporter(store, "0001", flush_interval_seconds=5, clock=lambda: clock[0])
+
+    reporter.append_log("event=job_started")
+    reporter.append_log("event=progress")
+    reporter.save_checkpoint({"remainingLimit": 4})
+
+    job = store.get_job_by_id("0001")
+    assert store.update_count == 2
+    assert job.logs == ["event=job_started", "event=progress"]
+    assert job.resumeCursor == {"remainingLimit": 4}
+
+    reporter.append_log("event=more_progress")
+    reporter.flush()
+    assert store.get_job_by_id("0001").resumeCursor == {"remainingLimit": 4}
+
+
+@pytest.mark.unit
+def test_engine_flushes_buffered_progress_before_terminal_status(tmp_path) -> None:
+    store = _CountingStore(tmp_path / "worker-python" / "queue-jobs.json")
+    engine = GlobalQueueEngine(store, progress_flush_interval_seconds=60)
+    finished_event = Event()
+
+    def chatty_job(context) -> None:
+        for index in range(50):
+            context.append_log(f"event=progress index={index}")
+            context.update_result({"processed": index})
+        finished_event.set()
+
+    result = engine.enqueue_job(EnqueueJobInput(endpointName="/location-scorer/start-job", run=chatty_job))
+
+    assert engine.on_idle(timeout=1) is True
+    job = engine.get_check_status(result.jobId)
+    assert finished_event.is_set()
+    assert job.status == QueueJobStatus.COMPLETED
+    assert len(job.logs) == 50
+    assert job.result == {"processed": 49}
+    assert store.update_count <= 4
@@ -4,7 +4,19 @@ from pathlib import Path
 
 import pytest
 
-from src.modules.queue.config import resolve_queue_jobs_path, validate_queue_startup_env
+from src.modules.queue.config import (
+    QueueStoreBackend,
+    resolve_queue_concurrency_policy,
+    resolve_queue_journal_compact_threshold,
+    resolve_queue_process_endpoints,
+    resolve_queue_progress_flush_interval_seconds,
+    resolve_queue_retention_policy,
+    resolve_queue_schedules,
+    resolve_queue_store_backend,
+    resolve_queue_timeout_policy,
+    resolve_queue_jobs_path,
+    validate_queue_startup_env,
+)
 from src.modules.queue.errors import QueueConfigError
 
 
@@ -32,3 +44,183 @@ def test_validate_queue_startup_env_missing_path_utiltities(
 
     with pytest.raises(QueueConfigError, match="PATH_UTILTIES is required"):
         validate_queue_startup_env()
+
+
+@pytest.mark.unit
+def test_resolve_queue_journal_compact_threshold(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("QUEUE_JOURNAL_COMPACT_THRESHOLD", raising=False)
+    assert resolve_queue_journal_compact_threshold() == 1000
+
+    monkeypatch.setenv("QUEUE_JOURNAL_COMPACT_THRESHOLD", "25")
+    assert resolve_queue_journal_compact_threshold() == 25
+
+    monkeypatch.setenv("QUEUE_JOURNAL_COMPACT_THRESHOLD", "0")
+    with pytest.raises(QueueConfigError, match="QUEUE_JOURNAL_COMPACT_THRESHOLD must be > 0"):
+        resolve_queue_journal_compact_threshold()
+
+
+@pytest.mark.unit
+def test_resolve_queue_store_backend(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("QUEUE_STORE_BACKEND", raising=False)
+    assert resolve_queue_store_backend() == QueueStoreBackend.JSON
+
+    monkeypatch.setenv("QUEUE_STORE_BACKEND", "SQLite")
+    assert resolve_queue_store_backend() == QueueStoreBackend.SQLITE
+
+    monkeypatch.setenv("QUEUE_STORE_BACKEND", "redis")
+    with pytest.raises(QueueConfigError, match="QUEUE_STORE_BACKEND must be one of: json, sqlite"):
+        resolve_queue_store_backend()
+
+
+@pytest.mark.unit
+def test_resolve_queue_retention_policy(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("QUEUE_RETENTION_MAX_AGE_HOURS", "12")
+    monkeypatch.setenv("QUEUE_RETENTION_MAX_JOBS_PER_ENDPOINT", "5")
+
+    policy = resolve_queue_retention_policy()
+
+    assert policy.max_age_hours == 12
+    assert policy.max_jobs_per_endpoint == 5
+    assert policy.failed_max_age_hours == 0
+    assert policy.enabled
+
+    monkeypatch.setenv("QUEUE_RETENTION_FAILED_MAX_AGE_HOURS", "-1")
+    with pytest.raises(QueueConfigError, match="QUEUE_RETENTION_FAILED_MAX_AGE_HOURS must be >= 0"):
+        resolve_queue_retention_policy()
+
+
+@pytest.mark.unit
+def test_queue_retention_is_disabled_by_default(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("QUEUE_RETENTION_MAX_AGE_HOURS", raising=False)
+    monkeypatch.delenv("QUEUE_RETENTION_FAILED_MAX_AGE_HOURS", raising=False)
+    monkeypatch.delenv("QUEUE_RETENTION_MAX_JOBS_PER_ENDPOINT", raising=False)
+
+    assert not resolve_queue_retention_policy().enabled
+
+
+@pytest.mark.unit
+def test_resolve_queue_concurrency_policy(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("QUEUE_MAX_WORKERS", "4")
+    monkeypatch.setenv("QUEUE_ENDPOINT_CONCURRENCY", "/ai-approver/review-page/start-job=2")
+    monkeypatch.setenv(
+        "QUEUE_EXCLUSIVE_GROUPS",
+        "/deduper/start-job,/location-scorer/start-job;/ai-approver/start-job",
+    )
+
+    policy = resolve_queue_concurrency_policy()
+
+    assert policy.max_workers == 4
+    assert policy.get_endpoint_limit("/ai-approver/review-page/start-job") == 2
+    assert policy.get_endpoint_limit("/deduper/start-job") == 1
+    assert policy.exclusive_groups == [
+        frozenset({"/deduper/start-job", "/location-scorer/start-job"}),
+        frozenset({"/ai-approver/start-job"}),
+    ]
+
+    # Unset keeps the AI approver endpoints apart; an empty value opts out.
+    monkeypatch.delenv("QUEUE_EXCLUSIVE_GROUPS")
+    assert resolve_queue_concurrency_policy().exclusive_groups == [
+        frozenset({"/ai-approver/start-job", "/ai-approver/review-page/start-job"}),
+    ]
+    monkeypatch.setenv("QUEUE_EXCLUSIVE_GROUPS", "")
+    assert resolve_queue_concurrency_policy().exclusive_groups == []
+
+    monkeypatch.delenv("QUEUE_MAX_WORKERS")
+    assert resolve_queue_concurrency_policy().max_workers == 1
+
+    monkeypatch.setenv("QUEUE_ENDPOINT_CONCURRENCY", "/deduper/start-job")
+    with pytest.raises(QueueConfigError, match="QUEUE_ENDPOINT_CONCURRENCY entries"):
+        resolve_queue_concurrency_policy()
+
+
+@pytest.mark.unit
+def test_resolve_queue_process_endpoints(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("QUEUE_PROCESS_ENDPOINTS", raising=False)
+    assert resolve_queue_process_endpoints() == frozenset()
+
+    monkeypatch.setenv("QUEUE_PROCESS_ENDPOINTS", "/deduper/start-job, /location-scorer/start-job")
+    assert resolve_queue_process_endpoints() == frozenset(
+        {"/deduper/start-job", "/location-scorer/start-job"}
+    )
+
+
+@pytest.mark.unit
+def test_resolve_queue_progress_flush_interval_seconds(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("QUEUE_PROGRESS_FLUSH_INTERVAL_SECONDS", raising=False)
+    assert resolve_queue_progress_flush_interval_seconds() == 1.0
+
+    monkeypatch.setenv("QUEUE_PROGRESS_FLUSH_INTERVAL_SECONDS", "0.25")
+    assert resolve_queue_progress_flush_interval_seconds() == 0.25
+
+    monkeypatch.setenv("QUEUE_PROGRESS_FLUSH_INTERVAL_SECONDS", "-1")
+    with pytest.raises(QueueConfigError, match=">= 0"):
+        resolve_queue_progress_flush_interval_seconds()
+
+
+@pytest.mark.unit
+def test_resolve_queue_schedules(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("QUEUE_SCHEDULES", raising=False)
+    assert resolve_queue_schedules() == []
+
+    monkeypatch.setenv(
+        "QUEUE_SCHEDULES",
+        '[{"endpointName": "/location-scorer/start-job", "intervalSeconds": 600,'
+        ' "parameters": {"limit": 500}},'
+        ' {"name": "nightly-deduper", "endpointName": "/deduper/start-job", "cron": "30 2 * * *"}]',
+    )
+    interval_schedule, cron_schedule = resolve_queue_schedules()
+    assert interval_schedule.name == "/location-scorer/start-job"
+    assert interval_schedule.interval_seconds == 600
+    assert interval_schedule.parameters == {"limit": 500}
+    assert cron_schedule.name == "nightly-deduper"
+    assert cron_schedule.cron is not None
+    assert cron_schedule.cron.expression == "30 2 * * *"
+
+    monkeypatch.setenv(
+        "QUEUE_SCHEDULES",
+        '[{"endpointName": "/deduper/start-job", "intervalSeconds": 60, "cron": "* * * * *"}]',
+    )
+    with pytest.raises(QueueConfigError, match="exactly one of"):
+        resolve_queue_schedules()
+
+    monkeypatch.setenv(
+        "QUEUE_SCHEDULES",
+        '[{"endpointName": "/deduper/start-job", "cron": "61 * * * *"}]',
+    )
+    with pytest.raises(QueueConfigError, match="invalid cron"):
+        resolve_queue_schedules()
+
+
+@pytest.mark.unit
+def test_resolve_queue_timeout_policy(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("QUEUE_JOB_TIMEOUT_SECONDS", "0")
+    monkeypatch.setenv("QUEUE_JOB_TIMEOUTS", "/ai-approver/start-job=1800")
+    monkeypatch.setenv("QUEUE_JOB_HEARTBEAT_TIMEOUT_SECONDS", "120")
+    monkeypatch.delenv("QUEUE_JOB_CANCEL_GRACE_SECONDS", raising=False)
+
+    policy = resolve_queue_timeout_policy()
+
+    assert policy.get_timeout_seconds("/ai-approver/start-job") == 1800
+    assert policy.get_timeout_seconds("/deduper/start-job") == 0
+    assert policy.heartbeat_timeout_seconds == 120
+    assert policy.cancel_grace_seconds == 60
+
+    monkeypatch.setenv("QUEUE_JOB_HEARTBEAT_TIMEOUT_SECONDS", "-1")
+    with pytest.raises(QueueConfigError, match="QUEUE_JOB_HEARTBEAT_TIMEOUT_SECONDS"):
+        resolve_queue_timeout_policy()
+
+
+@pytest.mark.unit
+def test_queue_watchdog_is_disabled_by_default(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("QUEUE_JOB_TIMEOUT_SECONDS", raising=False)
+    monkeypatch.delenv("QUEUE_JOB_TIMEOUTS", raising=False)
+    monkeypatch.delenv("QUEUE_JOB_HEARTBEAT_TIMEOUT_SECONDS", raising=False)
+
+    policy = resolve_queue_timeout_policy()
+
+    assert policy.get_timeout_seconds("/deduper/start-job") == 0
+    assert policy.heartbeat_timeout_seconds == 0
+    assert not policy.enabled
+
+    monkeypatch.setenv("QUEUE_JOB_TIMEOUTS", "/ai-approver/start-job=1800")
+    assert resolve_queue_timeout_policy().enabled
@@ -1,12 +1,22 @@
 from __future__ import annotations
 
-from threading import Event
+import asyncio
+from threading import Event, Thread
+from time import monotonic, sleep
 
 import pytest
 
-from src.modules.queue.engine import EnqueueJobInput, GlobalQueueEngine
+from src.modules.queue.config import QueueConcurrencyPolicy
+from src.modules.queue.engine import (
+    EnqueueJobInput,
+    GlobalQueueEngine,
+    QueueJobYieldedError,
+    build_coalesce_key,
+)
+from src.modules.queue.handlers import QueueJobHandlerRegistry
+from src.modules.queue.listing import QueueJobListQuery
 from src.modules.queue.store import QueueJobStore
-from src.modules.queue.types import QueueJobRecord, QueueJobStatus
+from src.modules.queue.types import QueueJobPriority, QueueJobRecord, QueueJobStatus
 
 
 def _create_engine(tmp_path) -> GlobalQueueEngine:
@@ -87,3 +97,498 @@ def test_queue_engine_recovers_incomplete_jobs_after_restart(tmp_path) -> None:
     assert recovered_job is not None
     assert recovered_job.status == QueueJobStatus.FAILED
     assert recovered_job.failureReason == "worker_restarted_before_completion"
+
+
+@pytest.mark.unit
+def test_queue_engine_resumes_incomplete_jobs_from_registered_handlers(tmp_path) -> None:
+    store = QueueJobStore(tmp_path / "worker-python" / "queue-jobs.json")
+    store.ensure_initialized()
+    for job_id, endpoint_name, status, resume_cursor in (
+        ("0001", "/location-scorer/start-job", QueueJobStatus.QUEUED, None),
+        ("0002", "/location-scorer/start-job", QueueJobStatus.RUNNING, {"remainingLimit": 3}),
+        ("0003", "/unregistered/start-job", QueueJobStatus.RUNNING, None),
+    ):
+        store.append_job(
+            QueueJobRecord(
+                jobId=job_id,
+                endpointName=endpoint_name,
+                status=status,
+                createdAt="2026-03-15T00:00:00Z",
+                parameters={"limit": 5},
+                resumeCursor=resume_cursor,
+            )
+        )
+
+    runs: list[tuple[str, dict | None]] = []
+
+    def build_job(parameters) -> EnqueueJobInput:
+        def run_job(context) -> None:
+            runs.append((context.jobId, context.resumeCursor))
+            context.save_checkpoint({"remainingLimit": 0})
+
+        return EnqueueJobInput(
+            endpointName="/location-scorer/start-job",
+            run=run_job,
+            parameters=parameters,
+        )
+
+    handlers = QueueJobHandlerRegistry()
+    handlers.register("/location-scorer/start-job", build_job)
+    engine = GlobalQueueEngine(store, handlers=handlers)
+
+    assert store.get_job_by_id("0002").status == QueueJobStatus.RUNNING
+    assert engine.recover_incomplete_jobs() == ["0002", "0001"]
+    assert engine.on_idle(timeout=1) is True
+
+    assert runs == [("0002", {"remainingLimit": 3}), ("0001", None)]
+    resumed_job = engine.get_check_status("0002")
+    assert resumed_job.status == QueueJobStatus.COMPLETED
+    assert resumed_job.resumeCursor is None
+    assert any("event=job_recovered previous_status=running" in line for line in resumed_job.logs)
+    unregistered_job = engine.get_check_status("0003")
+    assert unregistered_job.status == QueueJobStatus.FAILED
+    assert unregistered_job.failureReason == "worker_restarted_before_completion"
+
+
+@pytest.mark.unit
+def test_queue_engine_recovery_keeps_priority_and_coalesce_key(tmp_path) -> None:
+    store = QueueJobStore(tmp_path / "worker-python" / "queue-jobs.json")
+    store.ensure_initialized()
+    parameters = {"limit": 5}
+    store.append_job(
+        QueueJobRecord(
+            jobId="0001",
+            endpointName="/location-scorer/start-job",
+            status=QueueJobStatus.QUEUED,
+            createdAt="2026-03-15T00:00:00Z",
+            parameters=parameters,
+            priority=QueueJobPriority.INTERACTIVE,
+            coalesceKey=build_coalesce_key("/location-scorer/start-job", parameters),
+        )
+    )
+    release_event = Event()
+
+    def build_job(job_parameters) -> EnqueueJobInput:
+        return EnqueueJobInput(
+            endpointName="/location-scorer/start-job",
+            run=lambda context: release_event.wait(timeout=1),
+            parameters=job_parameters,
+            coalesceUntilStage="write",
+        )
+
+    handlers = QueueJobHandlerRegistry()
+    handlers.register("/location-scorer/start-job", build_job)
+    engine = GlobalQueueEngine(store, handlers=handlers)
+
+    assert engine.recover_incomplete_jobs() == ["0001"]
+    duplicate = engine.enqueue_job(
+        EnqueueJobInput(
+            endpointName="/location-scorer/start-job",
+            run=lambda context: None,
+            parameters=parameters,
+            coalesce=True,
+        )
+    )
+
+    assert duplicate.coalesced is True
+    assert duplicate.jobId == "0001"
+    assert engine.get_check_status("0001").priority == QueueJobPriority.INTERACTIVE
+
+    release_event.set()
+    assert engine.on_idle(timeout=1) is True
+    finished_job = engine.get_check_status("0001")
+    assert finished_job.status == QueueJobStatus.COMPLETED
+    assert finished_job.priority is None
+    assert finished_job.coalesceKey is None
+
+
+def _create_concurrent_engine(tmp_path, **policy_kwargs) -> GlobalQueueEngine:
+    return GlobalQueueEngine(
+        QueueJobStore(tmp_path / "worker-python" / "queue-jobs.json"),
+        concurrency=QueueConcurrencyPolicy(**policy_kwargs),
+    )
+
+
+@pytest.mark.unit
+def test_queue_engine_runs_different_endpoints_concurrently(tmp_path) -> None:
+    release_event = Event()
+    engine = _create_concurrent_engine(tmp_path, max_workers=3)
+
+    def blocking_job(context) -> None:
+        release_event.wait(timeout=1)
+
+    deduper_job = engine.enqueue_job(EnqueueJobInput(endpointName="/deduper/start-job", run=blocking_job))
+    second_deduper_job = engine.enqueue_job(
+        EnqueueJobInput(endpointName="/deduper/start-job", run=blocking_job)
+    )
+    approver_job = engine.enqueue_job(
+        EnqueueJobInput(endpointName="/ai-approver/review-page/start-job", run=lambda context: None)
+    )
+
+    completed_job = _wait_for_status(engine, approver_job.jobId, QueueJobStatus.COMPLETED)
+
+    assert completed_job.status == QueueJobStatus.COMPLETED
+    assert engine.get_running_job_ids() == [deduper_job.jobId]
+    assert engine.get_check_status(second_deduper_job.jobId).status == QueueJobStatus.QUEUED
+
+    release_event.set()
+    assert engine.on_idle(timeout=1) is True
+
+
+@pytest.mark.unit
+def test_queue_engine_exclusive_group_serializes_members(tmp_path) -> None:
+    release_event = Event()
+    engine = _create_concurrent_engine(
+        tmp_path,
+        max_workers=3,
+        exclusive_groups=[frozenset({"/deduper/start-job", "/location-scorer/start-job"})],
+    )
+
+    def blocking_job(context) -> None:
+        release_event.wait(timeout=1)
+
+    deduper_job = engine.enqueue_job(EnqueueJobInput(endpointName="/deduper/start-job", run=blocking_job))
+    scorer_job = engine.enqueue_job(
+        EnqueueJobInput(endpointName="/location-scorer/start-job", run=lambda context: None)
+    )
+    approver_job = engine.enqueue_job(
+        EnqueueJobInput(endpointName="/ai-approver/start-job", run=lambda context: None)
+    )
+
+    _wait_for_status(engine, approver_job.jobId, QueueJobStatus.COMPLETED)
+    assert engine.get_check_status(scorer_job.jobId).status == QueueJobStatus.QUEUED
+
+    cancel_result = engine.cancel_job(deduper_job.jobId)
+    release_event.set()
+    assert engine.on_idle(timeout=1) is True
+
+    assert cancel_result.outcome == "cancel_requested"
+    assert engine.get_check_status(deduper_job.jobId).status == QueueJobStatus.CANCELED
+    assert engine.get_check_status(scorer_job.jobId).status == QueueJobStatus.COMPLETED
+
+
+def _wait_for_status(engine: GlobalQueueEngine, job_id: str, status: QueueJobStatus) -> QueueJobRecord:
+    deadline = monotonic() + 1
+    while monotonic() < deadline:
+        job = engine.get_check_status(job_id)
+        if job is not None and job.status == status:
+            return job
+        sleep(0.01)
+
+    pytest.fail(f"Job {job_id} never reached {status}")
+
+
+def _enqueue_recorded(engine: GlobalQueueEngine, order: list[str], label: str, priority) -> str:
+    def run_job(context) -> None:
+        order.append(label)
+
+    return engine.enqueue_job(
+        EnqueueJobInput(endpointName="/deduper/start-job", run=run_job, priority=priority)
+    ).jobId
+
+
+@pytest.mark.unit
+def test_queue_engine_runs_higher_priority_jobs_first(tmp_path) -> None:
+    release_event = Event()
+    order: list[str] = []
+    engine = _create_concurrent_engine(tmp_path, max_workers=1)
+    engine.enqueue_job(
+        EnqueueJobInput(
+            endpointName="/deduper/start-job",
+            run=lambda context: release_event.wait(timeout=1),
+        )
+    )
+
+    _enqueue_recorded(engine, order, "bulk", QueueJobPriority.BULK)
+    canceled_job_id = _enqueue_recorded(engine, order, "canceled", QueueJobPriority.INTERACTIVE)
+    _enqueue_recorded(engine, order, "normal", QueueJobPriority.NORMAL)
+    _enqueue_recorded(engine, order, "interactive", QueueJobPriority.INTERACTIVE)
+    assert engine.cancel_job(canceled_job_id).outcome == "canceled"
+
+    release_event.set()
+    assert engine.on_idle(timeout=1) is True
+
+    assert order == ["interactive", "normal", "bulk"]
+
+
+@pytest.mark.unit
+def test_queue_engine_starvation_guard_lets_bulk_jobs_through(tmp_path) -> None:
+    release_event = Event()
+    order: list[str] = []
+    engine = _create_concurrent_engine(tmp_path, max_workers=1, max_priority_bypasses=2)
+    engine.enqueue_job(
+        EnqueueJobInput(
+            endpointName="/deduper/start-job",
+            run=lambda context: release_event.wait(timeout=1),
+        )
+    )
+
+    _enqueue_recorded(engine, order, "bulk", QueueJobPriority.BULK)
+    for index in range(4):
+        _enqueue_recorded(engine, order, f"interactive-{index}", QueueJobPriority.INTERACTIVE)
+
+    release_event.set()
+    assert engine.on_idle(timeout=1) is True
+
+    assert order == ["interactive-0", "interactive-1", "bulk", "interactive-2", "interactive-3"]
+
+
+@pytest.mark.unit
+def test_queue_engine_preempts_bulk_job_and_resumes_from_cursor(tmp_path) -> None:
+    order: list[str] = []
+    cursors: list[dict | None] = []
+    started_event = Event()
+    engine = _create_concurrent_engine(tmp_path, max_workers=1)
+
+    def bulk_job(context) -> None:
+        cursors.append(context.resumeCursor)
+        started_event.set()
+        if context.resumeCursor is not None:
+            order.append("bulk-resumed")
+            return
+        while not context.is_yield_requested():
+            sleep(0.01)
+        order.append("bulk-yielded")
+        raise QueueJobYieldedError({"remainingLimit": 7})
+
+    bulk_job_id = engine.enqueue_job(
+        EnqueueJobInput(
+            endpointName="/location-scorer/start-job",
+            run=bulk_job,
+            priority=QueueJobPriority.BULK,
+            preemptible=True,
+        )
+    ).jobId
+    assert started_event.wait(timeout=1) is True
+    _enqueue_recorded(engine, order, "interactive", QueueJobPriority.INTERACTIVE)
+
+    assert engine.on_idle(timeout=1) is True
+    assert order == ["bulk-yielded", "interactive", "bulk-resumed"]
+    assert cursors == [None, {"remainingLimit": 7}]
+    assert engine.get_check_status(bulk_job_id).status == QueueJobStatus.COMPLETED
+
+
+@pytest.mark.unit
+def test_queue_engine_does_not_preempt_non_preemptible_jobs(tmp_path) -> None:
+    release_event = Event()
+    yield_requests: list[bool] = []
+    engine = _create_concurrent_engine(tmp_path, max_workers=1)
+
+    def bulk_job(context) -> None:
+        release_event.wait(timeout=1)
+        yield_requests.append(context.is_yield_requested())
+
+    engine.enqueue_job(
+        EnqueueJobInput(
+            endpointName="/deduper/start-job",
+            run=bulk_job,
+            priority=QueueJobPriority.BULK,
+        )
+    )
+    interactive_job_id = _enqueue_recorded(engine, [], "interactive", QueueJobPriority.INTERACTIVE)
+
+    release_event.set()
+    assert engine.on_idle(timeout=1) is True
+    assert yield_requests == [False]
+    assert engine.get_check_status(interactive_job_id).status == QueueJobStatus.COMPLETED
+
+
+@pytest.mark.unit
+def test_queue_engine_coalesces_identical_queued_jobs(tmp_path) -> None:
+    release_event = Event()
+    engine = _create_concurrent_engine(tmp_path, max_workers=1)
+    engine.enqueue_job(
+        EnqueueJobInput(
+            endpointName="/deduper/start-job",
+            run=lambda context: release_event.wait(timeout=1),
+        )
+    )
+
+    def enqueue(parameters: dict, coalesce: bool = True):
+        return engine.enqueue_job(
+            EnqueueJobInput(
+                endpointName="/deduper/start-job",
+                run=lambda context: None,
+                parameters=parameters,
+                coalesce=coalesce,
+            )
+        )
+
+    first = enqueue({"reportId": 7, "mode": "fast"})
+    duplicate = enqueue({"mode": "fast", "reportId": 7})
+    other_report = enqueue({"reportId": 8, "mode": "fast"})
+    opted_out = enqueue({"reportId": 7, "mode": "fast"}, coalesce=False)
+
+    assert duplicate.jobId == first.jobId
+    assert duplicate.coalesced is True
+    assert duplicate.status == "queued"
+    assert other_report.jobId != first.jobId
+    assert opted_out.jobId != first.jobId
+
+    assert engine.cancel_job(first.jobId).outcome == "canceled"
+    after_cancel = enqueue({"reportId": 7, "mode": "fast"})
+    assert after_cancel.jobId != first.jobId
+    assert after_cancel.coalesced is False
+
+    release_event.set()
+    assert engine.on_idle(timeout=1) is True
+
+
+@pytest.mark.unit
+def test_queue_engine_coalesces_running_job_until_stage(tmp_path) -> None:
+    stage_event = Event()
+    release_event = Event()
+    engine = _create_concurrent_engine(tmp_path, max_workers=1)
+
+    def staged_job(context) -> None:
+        context.enter_stage("load")
+        stage_event.wait(timeout=1)
+        context.enter_stage("write")
+        release_event.wait(timeout=1)
+
+    def enqueue():
+        return engine.enqueue_job(
+            EnqueueJobInput(
+                endpointName="/location-scorer/start-job",
+                run=staged_job,
+                parameters={"limit": 5},
+                coalesce=True,
+                coalesceUntilStage="write",
+            )
+        )
+
+    first = enqueue()
+    _wait_for_status(engine, first.jobId, QueueJobStatus.RUNNING)
+    during_load = enqueue()
+    assert during_load.jobId == first.jobId
+    assert during_load.status == "running"
+
+    stage_event.set()
+    deadline = monotonic() + 1
+    second = enqueue()
+    while second.jobId == first.jobId and monotonic() < deadline:
+        sleep(0.01)
+        second = enqueue()
+
+    assert second.jobId != first.jobId
+    assert second.status == "queued"
+    release_event.set()
+    assert engine.on_idle(timeout=1) is True
+
+
+@pytest.mark.unit
+def test_wait_for_job_change_wakes_on_status_transition(tmp_path) -> None:
+    release_event = Event()
+    engine = _create_engine(tmp_path)
+    result = engine.enqueue_job(
+        EnqueueJobInput(endpointName="/deduper/start-job", run=lambda context: release_event.wait(timeout=1))
+    )
+    _wait_for_status(engine, result.jobId, QueueJobStatus.RUNNING)
+
+    timed_out = engine.wait_for_job_change(result.jobId, timeout=0.05)
+    assert timed_out is not None
+    assert timed_out.changed is False
+    assert timed_out.job.status == QueueJobStatus.RUNNING
+
+    Thread(target=lambda: (sleep(0.05), release_event.set()), daemon=True).start()
+    started_at = monotonic()
+    changed = engine.wait_for_job_change(result.jobId, since=QueueJobStatus.RUNNING, timeout=1)
+
+    assert changed is not None
+    assert changed.changed is True
+    assert changed.job.status == QueueJobStatus.COMPLETED
+    assert monotonic() - started_at < 0.5
+    assert engine.wait_for_job_change(result.jobId, timeout=1).changed is False
+    assert engine.wait_for_job_change("9999", timeout=0) is None
+    assert engine._status_waiters == {}
+
+
+@pytest.mark.unit
+def test_slow_waiter_lookup_does_not_block_status_publication(tmp_path, monkeypatch) -> None:
+    engine = _create_engine(tmp_path)
+    result = engine.enqueue_job(
+        EnqueueJobInput(endpointName="/deduper/start-job", run=lambda context: None)
+    )
+    assert engine.on_idle(timeout=1) is True
+    job = engine.get_check_status(result.jobId)
+
+    lookup_started = Event()
+    release_lookup = Event()
+    get_check_status = engine.get_check_status
+
+    def slow_get_check_status(job_id: str):
+        lookup_started.set()
+        release_lookup.wait(timeout=1)
+        return get_check_status(job_id)
+
+    monkeypatch.setattr(engine, "get_check_status", slow_get_check_status)
+    waiter = Thread(
+        target=engine.wait_for_job_change,
+        args=(result.jobId,),
+        kwargs={"timeout": 0},
+        daemon=True,
+    )
+    waiter.start()
+    assert lookup_started.wait(timeout=1) is True
+
+    published = Thread(target=engine._publish_status, args=(job,), daemon=True)
+    published.start()
+    published.join(timeout=0.5)
+    assert not published.is_alive()
+
+    release_lookup.set()
+    waiter.join(timeout=1)
+    assert engine._status_waiters == {}
+
+
+@pytest.mark.unit
+def test_async_reads_are_served_from_the_store_snapshot(tmp_path, monkeypatch) -> None:
+    engine = _create_engine(tmp_path)
+    result = engine.enqueue_job(
+        EnqueueJobInput(endpointName="/deduper/start-job", run=lambda context: context.append_log("event=step"))
+    )
+    assert engine.on_idle(timeout=1) is True
+
+    async def no_thread(*args, **kwargs):
+        raise AssertionError("snapshot reads must not hop to a worker thread")
+
+    monkeypatch.setattr(asyncio, "to_thread", no_thread)
+
+    async def read_all():
+        return (
+            await engine.get_check_status_async(result.jobId),
+            await engine.get_latest_job_by_endpoint_name_async("/deduper/start-job"),
+            await engine.get_job_logs_async(result.jobId, 0, 10),
+            await engine.get_queue_status_view_async(),
+            await engine.list_jobs_async(QueueJobListQuery()),
+            await engine.get_store_version_async(),
+        )
+
+    job, latest, logs, status_view, page, version = asyncio.run(read_all())
+
+    assert job == engine.get_check_status(result.jobId)
+    assert latest == job
+    assert logs.lines == job.logs
+    assert status_view.summary.completed == 1
+    assert [listed.jobId for listed in page.jobs] == [result.jobId]
+    assert version == engine.get_store_version() == page.version
+
+
+@pytest.mark.unit
+def test_engine_records_wait_run_and_finished_metrics(tmp_path) -> None:
+    from src.metrics import QUEUE_JOB_RUN_SECONDS, QUEUE_JOB_WAIT_SECONDS, QUEUE_JOBS_FINISHED_TOTAL
+
+    endpoint_name = "/metrics-test/start-job"
+    engine = _create_engine(tmp_path)
+
+    def run_failing_job(context) -> None:
+        raise RuntimeError("metrics_failed")
+
+    engine.enqueue_job(EnqueueJobInput(endpointName=endpoint_name, run=lambda context: None))
+    engine.enqueue_job(EnqueueJobInput(endpointName=endpoint_name, run=run_failing_job))
+
+    assert engine.on_idle(timeout=1) is True
+    assert QUEUE_JOB_WAIT_SECONDS.count(endpoint=endpoint_name) == 2
+    assert QUEUE_JOB_RUN_SECONDS.count(endpoint=endpoint_name) == 2
+    assert QUEUE_JOBS_FINISHED_TOTAL.value(endpoint=endpoint_name, status="completed") == 1
+    assert QUEUE_JOBS_FINISHED_TOTAL.value(endpoint=endpoint_name, status="failed") == 1
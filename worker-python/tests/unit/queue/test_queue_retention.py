@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+import pytest
+
+from src.modules.queue.archive import QueueJobArchive
+from src.modules.queue.config import QueueRetentionPolicy
+from src.modules.queue.engine import GlobalQueueEngine
+from src.modules.queue.retention import QueueRetentionCompactor, select_jobs_to_prune
+from src.modules.queue.sqlite_store import SqliteQueueJobStore
+from src.modules.queue.store import QueueJobStore
+from src.modules.queue.types import QueueJobRecord, QueueJobStatus
+
+
+NOW = datetime(2026, 3, 20, tzinfo=timezone.utc)
+
+
+def _build_job(
+    job_id: str,
+    created_at: str,
+    status: QueueJobStatus = QueueJobStatus.COMPLETED,
+    endpoint_name: str = "/deduper/start-job",
+) -> QueueJobRecord:
+    return QueueJobRecord(
+        jobId=job_id,
+        endpointName=endpoint_name,
+        status=status,
+        createdAt=created_at,
+        endedAt=created_at,
+    )
+
+
+@pytest.mark.unit
+def test_select_jobs_to_prune_applies_age_count_and_failed_rules() -> None:
+    policy = QueueRetentionPolicy(max_age_hours=48, failed_max_age_hours=240, max_jobs_per_endpoint=2)
+    jobs = [
+        _build_job("0001", "2026-03-01T00:00:00+00:00"),
+        _build_job("0002", "2026-03-12T00:00:00+00:00", status=QueueJobStatus.FAILED),
+        _build_job("0003", "2026-03-19T00:00:00+00:00"),
+        _build_job("0004", "2026-03-19T01:00:00+00:00"),
+        _build_job("0005", "2026-03-19T02:00:00+00:00"),
+        _build_job("0006", "2026-03-19T03:00:00+00:00", status=QueueJobStatus.RUNNING),
+        _build_job("0007", "2026-03-01T00:00:00+00:00", endpoint_name="/ai-approver/start-job"),
+    ]
+
+    pruned_job_ids = sorted(job.jobId for job in select_jobs_to_prune(jobs, policy, NOW))
+
+    # 0001 is past max age, 0003 is beyond the per-endpoint count, 0002 is a
+    # failed job still inside its longer window, and 0007 is its endpoint's latest.
+    assert pruned_job_ids == ["0001", "0003"]
+
+
+@pytest.mark.unit
+def test_select_jobs_to_prune_keeps_everything_under_the_default_policy() -> None:
+    jobs = [
+        _build_job("0001", "2020-01-01T00:00:00+00:00"),
+        _build_job("0002", "2020-01-02T00:00:00+00:00", status=QueueJobStatus.FAILED),
+        *(_build_job(f"{n:04d}", "2026-03-19T00:00:00+00:00") for n in range(3, 300)),
+    ]
+
+    assert select_jobs_to_prune(jobs, QueueRetentionPolicy(), NOW) == []
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("store_kind", ["json", "sqlite"])
+def test_retention_compactor_archives_pruned_jobs_for_check_status(
+    tmp_path,
+    store_kind: str,
+) -> None:
+    if store_kind == "json":
+        store = QueueJobStore(tmp_path / "worker-python" / "queue-jobs.json")
+    else:
+        store = SqliteQueueJobStore(tmp_path / "worker-python" / "queue-jobs.sqlite3")
+    store.replace_jobs(
+        [
+            _build_job("0001", "2026-03-01T00:00:00+00:00"),
+            _build_job("0002", "2026-03-19T00:00:00+00:00"),
+        ]
+    )
+    archive = QueueJobArchive(tmp_path / "worker-python" / "queue-archive")
+    compactor = QueueRetentionCompactor(
+        store,
+        archive,
+        QueueRetentionPolicy(max_age_hours=48),
+        now=lambda: NOW,
+    )
+
+    assert compactor.run_once() == 1
+    assert compactor.run_once() == 0
+
+    assert [job.jobId for job in store.get_jobs()] == ["0002"]
+    engine = GlobalQueueEngine(store, archive=archive)
+    archived_job = engine.get_check_status("0001")
+    assert archived_job is not None
+    assert archived_job.status == QueueJobStatus.COMPLETED
+    assert engine.get_check_status("0099") is None
+
+
+@pytest.mark.unit
+def test_json_store_removals_survive_restart(tmp_path) -> None:
+    store_path = tmp_path / "worker-python" / "queue-jobs.json"
+    store = QueueJobStore(store_path)
+    store.append_job(_build_job("0001", "2026-03-01T00:00:00+00:00"))
+    store.append_job(_build_job("0002", "2026-03-02T00:00:00+00:00"))
+
+    removed_jobs = store.remove_jobs(["0001", "0404"])
+
+    assert [job.jobId for job in removed_jobs] == ["0001"]
+    restarted_store = QueueJobStore(store_path)
+    assert [job.jobId for job in restarted_store.get_jobs()] == ["0002"]
+    assert restarted_store.allocate_job_id() == "0003"
+
+
+@pytest.mark.unit
+def test_archive_rotates_segments_and_drops_oldest(tmp_path) -> None:
+    archive = QueueJobArchive(tmp_path / "queue-archive", segment_max_jobs=2, max_segments=2)
+
+    archive.archive_jobs(
+        [_build_job(f"{number:04d}", "2026-03-01T00:00:00+00:00") for number in range(1, 6)]
+    )
+
+    assert [path.name for path in archive.get_segment_paths()] == [
+        "queue-jobs-archive-000002.jsonl",
+        "queue-jobs-archive-000003.jsonl",
+    ]
+    assert archive.get_job_by_id("0001") is None
+    assert archive.get_job_by_id("0004") is not None
+
+    restarted_archive = QueueJobArchive(tmp_path / "queue-archive", segment_max_jobs=2, max_segments=2)
+    restarted_archive.archive_jobs([_build_job("0006", "2026-03-01T00:00:00+00:00")])
+    assert len(restarted_archive.get_segment_paths()) == 2
+    assert restarted_archive.get_job_by_id("0006") is not None
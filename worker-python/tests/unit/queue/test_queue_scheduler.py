@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from threading import Event
+
+import pytest
+
+from src.modules.queue.config import QueueScheduleDefinition
+from src.modules.queue.cron import CronSchedule
+from src.modules.queue.engine import EnqueueJobInput, GlobalQueueEngine
+from src.modules.queue.handlers import QueueJobHandlerRegistry
+from src.modules.queue.scheduler import QueueScheduleOutcome, QueueScheduler
+from src.modules.queue.store import QueueJobStore
+from src.modules.queue.types import QueueJobStatus
+
+
+START = datetime(2026, 3, 20, 12, 0, tzinfo=timezone.utc)
+
+
+@pytest.mark.unit
+def test_cron_schedule_next_after() -> None:
+    nightly = CronSchedule.parse("30 2 * * *")
+    assert nightly.next_after(START) == datetime(2026, 3, 21, 2, 30, tzinfo=timezone.utc)
+
+    every_fifteen = CronSchedule.parse("*/15 * * * *")
+    assert every_fifteen.next_after(START) == datetime(2026, 3, 20, 12, 15, tzinfo=timezone.utc)
+
+    # 2026-03-20 is a Friday; weekdays only, so the next run is Monday.
+    weekdays = CronSchedule.parse("0 6 * * 1-5")
+    assert weekdays.next_after(datetime(2026, 3, 21, 0, 0, tzinfo=timezone.utc)) == datetime(
+        2026, 3, 23, 6, 0, tzinfo=timezone.utc
+    )
+
+    # Both day fields restricted: either one matches, as in cron.
+    first_or_sunday = CronSchedule.parse("0 0 1 * 0")
+    assert first_or_sunday.next_after(START) == datetime(2026, 3, 22, 0, 0, tzinfo=timezone.utc)
+
+    with pytest.raises(ValueError):
+        CronSchedule.parse("0 24 * * *")
+    with pytest.raises(ValueError):
+        CronSchedule.parse("0 0 * *")
+
+
+@pytest.mark.unit
+def test_scheduler_skips_runs_until_probe_reports_new_work(tmp_path) -> None:
+    engine = GlobalQueueEngine(QueueJobStore(tmp_path / "worker-python" / "queue-jobs.json"))
+    clock = [START]
+    watermark: list[object | None] = [(3, 103)]
+    release_event = Event()
+    runs: list[dict] = []
+
+    def build_job(parameters) -> EnqueueJobInput:
+        def run_job(context) -> None:
+            runs.append(parameters)
+            release_event.wait(timeout=1)
+
+        return EnqueueJobInput(endpointName="/location-scorer/start-job", run=run_job)
+
+    handlers = QueueJobHandlerRegistry()
+    handlers.register(
+        "/location-scorer/start-job",
+        build_job,
+        probe=lambda parameters: watermark[0],
+    )
+    scheduler = QueueScheduler(
+        engine,
+        handlers,
+        [
+            QueueScheduleDefinition(
+                name="location-scorer",
+                endpoint_name="/location-scorer/start-job",
+                parameters={"limit": 50},
+                interval_seconds=60,
+            )
+        ],
+        now=lambda: clock[0],
+    )
+
+    def tick(seconds: int = 60) -> str | None:
+        clock[0] += timedelta(seconds=seconds)
+        scheduler.run_once()
+        return scheduler.describe()[0]["lastOutcome"]
+
+    first_job_ids = scheduler.run_once()
+    assert len(first_job_ids) == 1
+    # Not due yet, so the outcome of the first run stands.
+    assert tick(30) == QueueScheduleOutcome.ENQUEUED
+    assert tick(30) == QueueScheduleOutcome.SKIPPED_PREVIOUS_RUN_ACTIVE
+
+    release_event.set()
+    assert engine.on_idle(timeout=1) is True
+    assert engine.get_check_status(first_job_ids[0]).status == QueueJobStatus.COMPLETED
+
+    assert tick() == QueueScheduleOutcome.SKIPPED_NO_NEW_WORK
+    watermark[0] = None
+    assert tick() == QueueScheduleOutcome.SKIPPED_NO_NEW_WORK
+
+    watermark[0] = (1, 104)
+    assert tick() == QueueScheduleOutcome.ENQUEUED
+    assert engine.on_idle(timeout=1) is True
+    assert runs == [{"limit": 50}, {"limit": 50}]
@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+from threading import Event
+from time import monotonic
+
+import pytest
+
+from src.modules.queue.config import QueueTimeoutPolicy
+from src.modules.queue.context import QueueJobCanceledError
+from src.modules.queue.engine import EnqueueJobInput, GlobalQueueEngine
+from src.modules.queue.store import QueueJobStore
+from src.modules.queue.types import QueueJobStatus
+from src.modules.queue.watchdog import QueueJobExpireReason, QueueJobWatchdog
+
+
+def wait_for_status(engine: GlobalQueueEngine, job_id: str, status: QueueJobStatus) -> None:
+    job = engine.get_check_status(job_id)
+    while job is not None and job.status != status:
+        job = engine.wait_for_job_change(job_id, job.status, timeout=1).job
+    assert job is not None and job.status == status
+
+
+@pytest.mark.unit
+def test_watchdog_abandons_hung_thread_job_and_frees_its_slot_on_return(tmp_path) -> None:
+    engine = GlobalQueueEngine(QueueJobStore(tmp_path / "worker-python" / "queue-jobs.json"))
+    offset = [0.0]
+    watchdog = QueueJobWatchdog(
+        engine,
+        QueueTimeoutPolicy(
+            default_timeout_seconds=600,
+            heartbeat_timeout_seconds=0,
+            cancel_grace_seconds=30,
+        ),
+        clock=lambda: monotonic() + offset[0],
+    )
+    started_event = Event()
+    release_event = Event()
+    returned_event = Event()
+    runs: list[str] = []
+
+    def hang(context) -> None:
+        # Ignores cancellation, like a blocking call with no timeout.
+        started_event.set()
+        release_event.wait(timeout=5)
+        context.append_log("late line")
+        context.update_result({"late": True})
+        returned_event.set()
+
+    hung = engine.enqueue_job(EnqueueJobInput(endpointName="/ai-approver/start-job", run=hang))
+    assert started_event.wait(timeout=1)
+    follower = engine.enqueue_job(
+        EnqueueJobInput(endpointName="/deduper/start-job", run=lambda context: runs.append("ran"))
+    )
+
+    assert watchdog.run_once() == []
+    offset[0] = 601
+    assert watchdog.run_once() == [hung.jobId]
+    assert engine.get_check_status(hung.jobId).status == QueueJobStatus.RUNNING
+    # Still inside the cancel grace period.
+    assert watchdog.run_once() == []
+
+    offset[0] = 632
+    assert watchdog.run_once() == [hung.jobId]
+    hung_job = engine.get_check_status(hung.jobId)
+    assert hung_job.status == QueueJobStatus.FAILED
+    assert hung_job.failureReason == QueueJobExpireReason.DEADLINE_EXCEEDED
+
+    # The handler thread is still running, so it keeps its slot.
+    assert watchdog.run_once() == []
+    assert engine.get_check_status(follower.jobId).status == QueueJobStatus.QUEUED
+    assert engine.get_running_job_ids() == []
+
+    release_event.set()
+    assert returned_event.wait(timeout=1)
+    wait_for_status(engine, follower.jobId, QueueJobStatus.COMPLETED)
+    assert runs == ["ran"]
+    assert engine.on_idle(timeout=1) is True
+    hung_job = engine.get_check_status(hung.jobId)
+    assert hung_job.status == QueueJobStatus.FAILED
+    assert hung_job.result is None
+    assert hung_job.logs[-1] == "event=job_abandoned"
+
+
+@pytest.mark.unit
+def test_watchdog_cancels_job_that_stops_heartbeating(tmp_path) -> None:
+    engine = GlobalQueueEngine(QueueJobStore(tmp_path / "worker-python" / "queue-jobs.json"))
+    offset = [0.0]
+    watchdog = QueueJobWatchdog(
+        engine,
+        QueueTimeoutPolicy(
+            default_timeout_seconds=0,
+            heartbeat_timeout_seconds=120,
+            cancel_grace_seconds=30,
+        ),
+        clock=lambda: monotonic() + offset[0],
+    )
+    started_event = Event()
+
+    def stall(context) -> None:
+        started_event.set()
+        context.cancelEvent.wait(timeout=5)
+        if context.is_cancel_requested():
+            raise QueueJobCanceledError()
+
+    result = engine.enqueue_job(EnqueueJobInput(endpointName="/deduper/start-job", run=stall))
+    assert started_event.wait(timeout=1)
+
+    offset[0] = 121
+    assert watchdog.run_once() == [result.jobId]
+    assert engine.on_idle(timeout=1) is True
+
+    job = engine.get_check_status(result.jobId)
+    assert job.status == QueueJobStatus.FAILED
+    assert job.failureReason == QueueJobExpireReason.HEARTBEAT_TIMEOUT
+    assert "event=job_expired reason=heartbeat_timeout" in job.logs
+    assert watchdog.run_once() == []
@@ -0,0 +1,184 @@
+from __future__ import annotations
+
+import sqlite3
+
+import pytest
+
+from src.modules.queue.engine import EnqueueJobInput, GlobalQueueEngine
+from src.modules.queue.sqlite_store import SqliteQueueJobStore
+from src.modules.queue.status import get_queue_status
+from src.modules.queue.types import QueueJobRecord, QueueJobStatus
+
+
+def _build_job(
+    job_id: str,
+    endpoint_name: str = "/deduper/start-job",
+    created_at: str = "2026-03-15T00:00:00Z",
+    status: QueueJobStatus = QueueJobStatus.QUEUED,
+) -> QueueJobRecord:
+    return QueueJobRecord(
+        jobId=job_id,
+        endpointName=endpoint_name,
+        status=status,
+        createdAt=created_at,
+    )
+
+
+def _create_store(tmp_path) -> SqliteQueueJobStore:
+    store = SqliteQueueJobStore(tmp_path / "worker-python" / "queue-jobs.sqlite3")
+    store.ensure_initialized()
+    return store
+
+
+@pytest.mark.unit
+def test_sqlite_store_append_update_and_reload(tmp_path) -> None:
+    store = _create_store(tmp_path)
+    store.append_job(_build_job("0001"))
+
+    updated_job = store.update_job(
+        "0001",
+        lambda job: QueueJobRecord(
+            jobId=job.jobId,
+            endpointName=job.endpointName,
+            status=QueueJobStatus.COMPLETED,
+            createdAt=job.createdAt,
+            endedAt="2026-03-15T00:05:00Z",
+            parameters={"reportId": 7},
+            result={"exitCode": 0},
+        ),
+    )
+    store.close()
+
+    reloaded_job = SqliteQueueJobStore(store.file_path).get_job_by_id("0001")
+
+    assert updated_job is not None
+    assert reloaded_job is not None
+    assert reloaded_job.status == QueueJobStatus.COMPLETED
+    assert reloaded_job.parameters == {"reportId": 7}
+    assert reloaded_job.result == {"exitCode": 0}
+    assert store.update_job("9999", lambda job: job) is None
+
+
+@pytest.mark.unit
+def test_sqlite_store_appends_logs_as_child_rows(tmp_path) -> None:
+    store = _create_store(tmp_path)
+    store.append_job(_build_job("0001"))
+
+    assert store.append_job_log("0001", "event=job_started") is True
+    assert store.append_job_log("0001", "event=job_completed") is True
+    assert store.append_job_log("9999", "event=orphan") is False
+    store.close()
+
+    connection = sqlite3.connect(str(store.file_path))
+    log_rows = connection.execute("SELECT jobId, line FROM QueueJobLogs ORDER BY id").fetchall()
+    connection.close()
+
+    assert log_rows == [("0001", "event=job_started"), ("0001", "event=job_completed")]
+    reloaded_store = SqliteQueueJobStore(store.file_path)
+    reloaded_job = reloaded_store.get_job_by_id("0001")
+    assert reloaded_job is not None
+    assert reloaded_job.logs == ["event=job_started", "event=job_completed"]
+    page = reloaded_store.get_job_logs("0001", offset=1, limit=10)
+    assert page.lines == ["event=job_completed"]
+    assert (page.offset, page.nextOffset, page.total) == (1, 2, 2)
+    assert reloaded_store.get_job_logs("9999", offset=0, limit=10) is None
+
+
+@pytest.mark.unit
+def test_sqlite_store_latest_job_and_status_queries(tmp_path) -> None:
+    store = _create_store(tmp_path)
+    store.append_job(_build_job("0001", created_at="2026-03-15T00:00:00Z", status=QueueJobStatus.COMPLETED))
+    store.append_job(
+        _build_job("0002", "/location-scorer/start-job", "2026-03-15T00:01:00Z", QueueJobStatus.RUNNING)
+    )
+    store.append_job(_build_job("0003", created_at="2026-03-15T00:02:00Z"))
+
+    latest_job = store.get_latest_job_by_endpoint_name("/deduper/start-job")
+    queue_status = get_queue_status(store)
+
+    assert latest_job is not None
+    assert latest_job.jobId == "0003"
+    assert store.get_latest_job_by_endpoint_name("/ai-approver/start-job") is None
+    assert queue_status.summary.totalJobs == 3
+    assert queue_status.summary.completed == 1
+    assert queue_status.runningJob is not None
+    assert queue_status.runningJob.jobId == "0002"
+    assert [job.jobId for job in queue_status.queuedJobs] == ["0003"]
+
+
+@pytest.mark.unit
+def test_sqlite_store_backs_queue_engine_lifecycle(tmp_path) -> None:
+    store = _create_store(tmp_path)
+    engine = GlobalQueueEngine(store)
+
+    result = engine.enqueue_job(
+        EnqueueJobInput(endpointName="/deduper/start-job", run=lambda context: None)
+    )
+
+    assert engine.on_idle(timeout=1) is True
+    completed_job = engine.get_check_status(result.jobId)
+    assert completed_job is not None
+    assert completed_job.status == QueueJobStatus.COMPLETED
+
+
+@pytest.mark.unit
+def test_sqlite_store_allocates_job_ids_across_restarts(tmp_path) -> None:
+    store = _create_store(tmp_path)
+
+    assert store.allocate_job_id() == "0001"
+    assert store.allocate_job_id() == "0002"
+    store.close()
+
+    restarted_store = _create_store(tmp_path)
+    assert restarted_store.allocate_job_id() == "0003"
+
+    restarted_store.replace_jobs([_build_job("0042")])
+    assert restarted_store.allocate_job_id() == "0043"
+    restarted_store.replace_jobs([])
+    assert restarted_store.allocate_job_id() == "0044"
+
+
+@pytest.mark.unit
+def test_sqlite_store_adds_resume_cursor_column_to_existing_database(tmp_path) -> None:
+    file_path = tmp_path / "worker-python" / "queue-jobs.sqlite3"
+    file_path.parent.mkdir(parents=True)
+    connection = sqlite3.connect(file_path)
+    connection.execute(
+        """
+        CREATE TABLE QueueJobs (
+            jobId TEXT PRIMARY KEY,
+            endpointName TEXT NOT NULL,
+            status TEXT NOT NULL,
+            createdAt TEXT NOT NULL,
+            startedAt TEXT,
+            endedAt TEXT,
+            failureReason TEXT,
+            parameters TEXT,
+            result TEXT
+        )
+        """
+    )
+    connection.execute(
+        "INSERT INTO QueueJobs (jobId, endpointName, status, createdAt) VALUES (?, ?, ?, ?)",
+        ("0001", "/deduper/start-job", "running", "2026-03-15T00:00:00Z"),
+    )
+    connection.commit()
+    connection.close()
+
+    store = SqliteQueueJobStore(file_path)
+    assert store.get_job_by_id("0001").resumeCursor is None
+
+    store.update_job(
+        "0001",
+        lambda job: QueueJobRecord(
+            jobId=job.jobId,
+            endpointName=job.endpointName,
+            status=job.status,
+            createdAt=job.createdAt,
+            resumeCursor={"completedSteps": ["load"]},
+        ),
+    )
+    store.close()
+
+    reloaded_job = SqliteQueueJobStore(file_path).get_job_by_id("0001")
+    assert reloaded_job.resumeCursor == {"completedSteps": ["load"]}
@@ -70,7 +70,15 @@ def test_run_deduper_job_uses_in_process_orchestrator(
             return None
 
     class _FakeOrchestrator:
-        def run_analyze_fast(self, report_id=None, should_cancel=None):
+        def run_analyze_fast(
+            self,
+            report_id=None,
+            should_cancel=None,
+            clear_first=True,
+            on_step_start=None,
+            skip_steps=(),
+            on_step_complete=None,
+        ):
             assert report_id == 42
             assert should_cancel is not None
             return _FakeSummary()
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import pytest
+
+from src.metrics import MetricsRegistry, timed
+
+
+@pytest.mark.unit
+def test_registry_renders_counters_and_cumulative_histograms() -> None:
+    registry = MetricsRegistry()
+    jobs = registry.counter("jobs_total", "Jobs seen.", ("endpoint",))
+    latency = registry.histogram("latency_seconds", "Latency.", ("endpoint",), buckets=(0.1, 1.0))
+
+    jobs.inc(endpoint='/deduper/"start"')
+    jobs.inc(2, endpoint='/deduper/"start"')
+    latency.observe(0.1, endpoint="/a")
+    latency.observe(0.5, endpoint="/a")
+    latency.observe(5.0, endpoint="/a")
+
+    rendered = registry.render().splitlines()
+
+    assert rendered[:3] == [
+        "# HELP jobs_total Jobs seen.",
+        "# TYPE jobs_total counter",
+        'jobs_total{endpoint="/deduper/\\"start\\""} 3.0',
+    ]
+    assert rendered[5:] == [
+        'latency_seconds_bucket{endpoint="/a",le="0.1"} 1',
+        'latency_seconds_bucket{endpoint="/a",le="1.0"} 2',
+        'latency_seconds_bucket{endpoint="/a",le="+Inf"} 3',
+        'latency_seconds_sum{endpoint="/a"} 5.6',
+        'latency_seconds_count{endpoint="/a"} 3',
+    ]
+
+
+@pytest.mark.unit
+def test_registry_drain_and_merge_move_deltas_between_registries() -> None:
+    worker = MetricsRegistry()
+    parent = MetricsRegistry()
+    worker_rows = worker.counter("rows_total", "Rows.", ("step",))
+    worker_seconds = worker.histogram("step_seconds", "Step time.", ("step",), buckets=(1.0,))
+    parent_rows = parent.counter("rows_total", "Rows.", ("step",))
+    parent_seconds = parent.histogram("step_seconds", "Step time.", ("step",), buckets=(1.0,))
+
+    worker_rows.inc(4, step="load")
+    worker_seconds.observe(0.5, step="load")
+    parent_rows.inc(1, step="load")
+
+    parent.merge(worker.drain())
+
+    assert worker.drain() == {}
+    assert worker_rows.value(step="load") == 0
+    assert parent_rows.value(step="load") == 5
+    assert parent_seconds.count(step="load") == 1
+
+
+@pytest.mark.unit
+def test_metrics_reject_unknown_labels_and_time_decorated_calls() -> None:
+    registry = MetricsRegistry()
+    calls = registry.counter("calls_total", "Calls.", ("operation",))
+    latency = registry.histogram("call_seconds", "Call time.", ("operation",))
+
+    @timed(latency, operation="load")
+    def load() -> str:
+        return "loaded"
+
+    assert load() == "loaded"
+    assert latency.count(operation="load") == 1
+    with pytest.raises(ValueError):
+        calls.inc(endpoint="/deduper")
+    with pytest.raises(ValueError):
+        calls.inc(-1, operation="load")
+    with pytest.raises(ValueError):
+        registry.counter("calls_total", "Calls.")